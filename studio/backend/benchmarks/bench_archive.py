@@ -0,0 +1,96 @@
+"""Archiving a folder: what the process holds as the archive grows, in resident memory.
+
+    cd studio/backend && python -m benchmarks.bench_archive --total-gb 10 --object-mb 64
+
+Seeds one folder beneath the library root with `--total-gb` of synthetic
+objects, `--object-mb` each, the way confirmed uploads leave them — a row with
+`size` and bytes behind its key — and then reads `archive.stream` to the end,
+throwing the bytes away as a client writing them to disk would. Resident memory
+is sampled ten times along the way, at each tenth of the bytes, and once more at
+the end.
+
+The claim is that the samples are **flat**: the archive holds one chunk at a
+time, so what it holds at the last gigabyte is what it held at the first.
+`growth_mb` is the last sample less the first, and is the number to read.
+
+Two things about the stand-in decide what the absolute numbers mean. moto
+answers a `GetObject` by building the whole object in memory before botocore
+sees a byte of it, so the floor here is one object — which is why the objects
+are many and moderate rather than few and large; S3 itself streams. And moto
+keeps the bucket in temporary files once an object passes a few megabytes, so
+`--total-gb 10` needs that much free space under `$TMPDIR` and none of it in
+memory. Resident memory is read from `/proc/self/status`, so this runs on Linux.
+"""
+
+import argparse
+import json
+import resource
+
+from benchmarks.standin import ROOT, clock, standin
+from studio_core import config
+from studio_core.services import archive, catalog
+
+MB = 1024 * 1024
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    raise RuntimeError("no VmRSS in /proc/self/status")
+
+
+def _seed(bucket, total_bytes: int, object_bytes: int) -> dict:
+    folder = catalog.create_node(ROOT, "export", catalog.KIND_FOLDER)
+    body = b"\0" * object_bytes
+    for index in range(max(1, total_bytes // object_bytes)):
+        created = catalog.create_node(
+            folder["node_id"], f"clip-{index:05d}.mp4", catalog.KIND_FILE, size=object_bytes
+        )
+        bucket.put_object(Bucket=config.media_bucket(), Key=created["blob_key"], Body=body)
+    return catalog.node(folder["node_id"])
+
+
+def _drain(planned: dict, total_bytes: int) -> tuple[int, list[dict]]:
+    """Read the whole stream, sampling resident memory at each tenth of it."""
+    sent, samples, mark = 0, [], 0
+    for block in archive.stream(planned):
+        sent += len(block)
+        if sent >= mark:
+            samples.append({"sent_mb": round(sent / MB), "rss_mb": _rss_mb()})
+            mark += total_bytes // 10
+    samples.append({"sent_mb": round(sent / MB), "rss_mb": _rss_mb()})
+    return sent, samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--total-gb", type=float, default=10)
+    parser.add_argument("--object-mb", type=int, default=64)
+    args = parser.parse_args()
+    total_bytes = int(args.total_gb * 1024 * MB)
+
+    with standin() as (_table, bucket):
+        folder = _seed(bucket, total_bytes, args.object_mb * MB)
+        planned = archive.plan(folder)
+        (sent, samples), seconds = clock(_drain, planned, total_bytes)
+
+    report = {
+        "total_gb": args.total_gb,
+        "object_mb": args.object_mb,
+        "chunk_mb": archive.CHUNK_BYTES / MB,
+        "members": len(planned["members"]),
+        "archive_mb": round(sent / MB),
+        "seconds": round(seconds, 1),
+        "samples": samples,
+        "growth_mb": round(samples[-1]["rss_mb"] - samples[0]["rss_mb"], 1),
+        # Since the process started, seeding included: the one `body` above is
+        # in it, and so is moto's copy of each object it served.
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
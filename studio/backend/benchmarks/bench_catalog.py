@@ -0,0 +1,268 @@
+"""The catalog's reads and writes at library sizes, by round trips, capacity and time.
+
+    cd studio/backend && python -m benchmarks.bench_catalog --nodes 1000,10000,100000
+    cd studio/backend && python -m benchmarks.bench_catalog --nodes 1000 --check
+    cd studio/backend && python -m benchmarks.bench_catalog --write-baseline
+
+For each size and each of `SHAPES`, seeds a library whose `top/` folder holds
+that many nodes — folders included, both items of each written with
+`BatchWriteItem` — and an empty `elsewhere/` beside it, and runs:
+
+    children          top/'s by-parent items
+    branch            every row beneath top/, as the reel reads it
+    subtree           the same, as a move or a delete reads it
+    descendants       the same again, streamed and keys only, as an archive counts it
+    recent            the library newest-first, as the root reel reads it
+    create_numbered   `NUMBERED` files all called take.mp4, into one folder
+    move_node         top/ under elsewhere/
+    delete_node       top/ and everything in it
+
+Each reports `round_trips` — every API call, one per page and per attempt, as
+`standin.CallCounter` counts them — `read_units` and `write_units` as
+`standin.CapacityMeter` estimates them, and `seconds`. The first three are the
+numbers that carry to AWS and are what `--check` and `tests/test_bench_catalog`
+compare; seconds are moto's and are compared only when asked (`--timed`).
+
+**The baseline is `catalog_baseline.json` beside this file**, written by
+`--write-baseline` at every size the run covered. `--check` compares a run to
+it and exits non-zero when any counted number grew by more than `--tolerance`
+(`STUDIO_BENCH_TOLERANCE`, default 10%). A change that is *meant* to cost more
+rewrites the baseline in the same commit, and the diff of that file is the
+review of the cost.
+
+The shapes:
+
+    flat    every node a file directly in top/ — one partition, one long folder
+    bushy   ten folders of ten folders, the files spread over the hundred leaves
+    deep    a chain of `DEEP_LEVELS` folders, the files spread along it
+
+Transactions run one at a time here (`STUDIO_TRANSACTION_WORKERS=1`): moto is
+not safe to write from two threads, and a count does not depend on the
+concurrency. `standin.no_rollback` spares the move and the delete moto's
+per-transaction table copy, for the reason `bench_transactions` gives; numbering
+is run before the library is seeded, for the reason `run` gives.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from benchmarks.standin import (
+    LIBRARY,
+    ROOT,
+    CallCounter,
+    CapacityMeter,
+    clock,
+    no_rollback,
+    node_items,
+    put_items,
+    standin,
+)
+from studio_core.services import catalog
+
+BASELINE = Path(__file__).with_name("catalog_baseline.json")
+
+SHAPES = ("flat", "bushy", "deep")
+OPERATIONS = (
+    "children", "branch", "subtree", "descendants", "recent", "create_numbered", "move_node",
+    "delete_node",
+)
+
+# What `compare` holds a run to, and what it only reports.
+COUNTED = ("round_trips", "read_units", "write_units")
+TIMED = ("seconds",)
+
+BUSHY_FANOUT = 10
+DEEP_LEVELS = 32
+NUMBERED = 10
+TAKES = "node-bench-takes"
+
+DEFAULT_TOLERANCE = 0.10
+
+
+def tolerance() -> float:
+    """How much a counted number may grow before it is a regression, as a fraction."""
+    return float(os.environ.get("STUDIO_BENCH_TOLERANCE", str(DEFAULT_TOLERANCE)))
+
+
+@contextlib.contextmanager
+def _environment(**values: str):
+    """Set these variables for the length of a run, and put back what was there."""
+    before = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in before.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _folders(shape: str, top: str) -> list[tuple[str, str]]:
+    """`(folder_id, parent_id)` for every folder beneath top/, parents first."""
+    if shape == "flat":
+        return []
+    if shape == "deep":
+        chain = [f"node-bench-deep-{level:03d}" for level in range(DEEP_LEVELS)]
+        return list(zip(chain, [top, *chain[:-1]]))
+    upper = [f"node-bench-upper-{index:02d}" for index in range(BUSHY_FANOUT)]
+    lower = [
+        (f"node-bench-lower-{index:02d}-{inner:02d}", parent)
+        for index, parent in enumerate(upper)
+        for inner in range(BUSHY_FANOUT)
+    ]
+    return [(folder, top) for folder in upper] + lower
+
+
+def _seed(table, nodes: int, shape: str) -> tuple[str, str]:
+    """top/ holding `nodes` nodes in `shape`, and elsewhere/ beside it; their ids."""
+    top, elsewhere = "node-bench-top", "node-bench-elsewhere"
+    paths = {ROOT: f"/{ROOT}/"}
+    items = node_items(top, ROOT, "top", "folder", paths[ROOT])
+    items += node_items(elsewhere, ROOT, "elsewhere", "folder", paths[ROOT])
+    paths[top] = f"{paths[ROOT]}{top}/"
+
+    folders = _folders(shape, top)
+    for index, (folder, parent) in enumerate(folders):
+        items += node_items(folder, parent, f"shoot-{index:04d}", "folder", paths[parent])
+        paths[folder] = f"{paths[parent]}{folder}/"
+
+    # Files go where the shape keeps them: the leaves of a bushy tree, every
+    # link of a deep one, top/ itself when flat.
+    holders = (
+        [folder for folder, _parent in folders if "lower" in folder]
+        if shape == "bushy"
+        else [folder for folder, _parent in folders] or [top]
+    )
+    for index in range(max(0, nodes - 1 - len(folders))):
+        holder = holders[index % len(holders)]
+        items += node_items(
+            f"node-bench-{index:06d}", holder, f"still-{index:06d}.png", "file", paths[holder]
+        )
+    put_items(table, items)
+    return top, elsewhere
+
+
+def _numbered(table, count: int) -> list[dict]:
+    """`count` files all called take.mp4 into takes/, a folder of their own."""
+    put_items(table, node_items(TAKES, ROOT, "takes", "folder", f"/{ROOT}/"))
+    return [
+        catalog.create_numbered(TAKES, "take.mp4", catalog.KIND_FILE) for _ in range(count)
+    ]
+
+
+def _measured(counter: CallCounter, meter: CapacityMeter, operation) -> dict:
+    counter.reset()
+    meter.reset()
+    _result, seconds = clock(operation)
+    return {
+        "round_trips": counter.total(),
+        "read_units": round(meter.read, 1),
+        "write_units": round(meter.write, 1),
+        "seconds": round(seconds, 3),
+    }
+
+
+def run(nodes: int, shape: str, numbered: int = NUMBERED) -> dict:
+    """Every operation once, on a fresh library of this size and shape."""
+    cap = nodes * 2 + numbered
+    with _environment(
+        STUDIO_MAX_FOLDER_OBJECTS=str(cap), STUDIO_TRANSACTION_WORKERS="1"
+    ), standin() as (table, _bucket):
+        counter, meter = CallCounter(), CapacityMeter()
+        # First, while the library is one folder. What numbering costs does not
+        # depend on the size of the library, but any cancelled transaction is
+        # undone by moto copying every table, which at a hundred thousand nodes
+        # would be the whole run.
+        report = {"create_numbered": _measured(counter, meter, lambda: _numbered(table, numbered))}
+
+        top, elsewhere = _seed(table, nodes, shape)
+        below = catalog.child_path(catalog.node(top))
+        for name, operation in (
+            ("children", lambda: catalog.children(top)),
+            ("branch", lambda: catalog.branch(LIBRARY, below, cap)),
+            ("subtree", lambda: catalog.subtree(LIBRARY, below)),
+            (
+                "descendants",
+                lambda: sum(1 for _ in catalog.descendants(LIBRARY, below, keys_only=True)),
+            ),
+            ("recent", lambda: catalog.recent(LIBRARY, cap)),
+        ):
+            report[name] = _measured(counter, meter, operation)
+        with no_rollback():
+            report["move_node"] = _measured(
+                counter, meter, lambda: catalog.move_node(top, elsewhere)
+            )
+            report["delete_node"] = _measured(counter, meter, lambda: catalog.delete_node(top))
+        return {name: report[name] for name in OPERATIONS}
+
+
+def measure(sizes: list[int], shapes: tuple[str, ...] = SHAPES) -> dict:
+    """`run` over every size and shape, keyed the way the baseline is."""
+    return {str(nodes): {shape: run(nodes, shape) for shape in shapes} for nodes in sizes}
+
+
+def load_baseline(path: Path = BASELINE) -> dict:
+    return json.loads(path.read_text())
+
+
+def compare(baseline: dict, report: dict, *, tolerance: float, timed: bool = False) -> list[str]:
+    """Every number in `report` that grew past its baseline by more than `tolerance`.
+
+    Only the sizes, shapes and operations both hold are compared, so a quick
+    run at one size checks that size and says nothing of the others. A number
+    that shrank is never a regression; rewrite the baseline to keep the gain.
+    """
+    metrics = COUNTED + (TIMED if timed else ())
+    regressions = []
+    for nodes, shapes in report.items():
+        for shape, operations in shapes.items():
+            for operation, measured in operations.items():
+                expected = baseline.get(nodes, {}).get(shape, {}).get(operation)
+                if expected is None:
+                    continue
+                for metric in metrics:
+                    allowed = expected[metric] * (1 + tolerance)
+                    if measured[metric] > allowed:
+                        regressions.append(
+                            f"{nodes} {shape} {operation}: {metric} {measured[metric]} "
+                            f"> {expected[metric]} (+{tolerance:.0%})"
+                        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", default="1000,10000,100000",
+                        help="comma-separated library sizes")
+    parser.add_argument("--shapes", default=",".join(SHAPES))
+    parser.add_argument("--write-baseline", action="store_true",
+                        help=f"record this run as {BASELINE.name}")
+    parser.add_argument("--check", action="store_true",
+                        help=f"compare this run to {BASELINE.name}")
+    parser.add_argument("--tolerance", type=float, default=tolerance())
+    parser.add_argument("--timed", action="store_true", help="hold seconds to the baseline too")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.nodes.split(",")]
+    report = measure(sizes, tuple(args.shapes.split(",")))
+    print(json.dumps(report, indent=2))
+
+    if args.write_baseline:
+        BASELINE.write_text(json.dumps(report, indent=2) + "\n")
+    if args.check:
+        regressions = compare(
+            load_baseline(), report, tolerance=args.tolerance, timed=args.timed
+        )
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
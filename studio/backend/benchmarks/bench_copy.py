@@ -0,0 +1,88 @@
+"""Copying a file: what one copy costs when it shares its blob, against copying bytes.
+
+    cd studio/backend && python -m benchmarks.bench_copy --size-mb 64 --copies 20
+
+Uploads one `--size-mb` video beneath the library root the way a confirmed
+upload leaves it — a row with `size` and `content_type`, and bytes behind its
+key — and a `copies` folder, then copies the video into that folder `--copies`
+times through `manage.copy_objects`, twice:
+
+* **`before`** — the blob has no `BLOB#` count, as every row written before the
+  counts existed does, so each copy is a `HeadObject`, a `CopyObject` and the
+  two transactions that mint and then finish the new row.
+* **`after`** — the blob is counted, so each copy is one transaction: the new
+  row's two items and `refs + 1`.
+
+`calls` is every request the clients sent per copy, by operation, and
+`bytes_copied` is what S3 was asked to duplicate in total — the column that is
+`copies × size` before and nothing after, and that a 2 GB video makes the whole
+story. The timings are moto's, for the reason `standin` gives; moto copies an
+object by duplicating it in memory, so the `before` times do grow with the
+size, only far more gently than S3's server-side copy of a real 2 GB object.
+"""
+
+import argparse
+import json
+
+from benchmarks.standin import LIBRARY, ROOT, CallCounter, clock, standin, timings
+from studio_core import config
+from studio_core.services import catalog, manage
+
+
+def _seed(table, bucket, size_mb: int) -> dict:
+    video = catalog.create_node(ROOT, "clip.mp4", catalog.KIND_FILE)
+    bucket.put_object(
+        Bucket=config.media_bucket(),
+        Key=video["blob_key"],
+        Body=b"\0" * (size_mb * 1024 * 1024),
+        ContentType="video/mp4",
+    )
+    catalog.set_blob(
+        video["node_id"],
+        video["blob_key"],
+        size=size_mb * 1024 * 1024,
+        content_type="video/mp4",
+    )
+    catalog.create_node(ROOT, "copies", catalog.KIND_FOLDER)
+    return video
+
+
+def _run(size_mb: int, copies: int, *, before: bool) -> dict:
+    with standin() as (table, bucket):
+        video = _seed(table, bucket, size_mb)
+        if before:
+            # What every row written before the counts looks like.
+            table.delete_item(
+                TableName=config.catalog_table(),
+                Key={"pk": {"S": f"BLOB#{video['blob_key']}"}, "sk": {"S": "META"}},
+            )
+        counter = CallCounter()
+        times = []
+        for _ in range(copies):
+            _result, seconds = clock(manage.copy_objects, LIBRARY, ["clip.mp4"], "copies/")
+            times.append(seconds)
+        calls = {name: count / copies for name, count in sorted(counter.calls.items())}
+        return {
+            "calls_per_copy": calls,
+            "bytes_copied": counter.calls["CopyObject"] * size_mb * 1024 * 1024,
+            **timings(times),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--copies", type=int, default=20)
+    args = parser.parse_args()
+
+    report = {
+        "size_mb": args.size_mb,
+        "copies": args.copies,
+        "before": _run(args.size_mb, args.copies, before=True),
+        "after": _run(args.size_mb, args.copies, before=False),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Previews: how fast they are made, and what a reel page weighs with and without them.
+
+    cd studio/backend && python -m benchmarks.bench_derived --images 60 --videos 10
+
+Seeds one folder with `--images` photographs — noisy JPEGs at
+`--image-size`, which compress about as badly as a camera's do, so the
+originals weigh what real ones weigh — and `--videos` clips of
+`--video-seconds` made by the same ffmpeg that renders posters. Then
+`derived.produce` is run over every row, one at a time, as a `derive` job runs
+them, and timed per kind: `per_second` is the throughput of one worker.
+
+Then one reel page of `--page-size` is read, and the bytes its tiles would fetch
+are added up twice: every original, which is what a tile drew before this, and
+every preview, which is what `preview_url` points at now. `ratio` is the one to
+read.
+
+ffmpeg reads each clip from a local file rather than a presigned URL, since moto
+serves no HTTP to range over; in prod it reads the index and one frame's worth
+of the object, so the video number here is the decode's cost without the
+network's. The image number includes moto handing over the whole original,
+which is what `GetObject` does in prod too.
+"""
+
+import argparse
+import io
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+
+import imageio_ffmpeg
+from PIL import Image
+
+from benchmarks.standin import LIBRARY, ROOT, clock, standin
+from studio_core import config
+from studio_core.clients.aws import s3
+from studio_core.services import browse, catalog, derived
+
+MB = 1024 * 1024
+
+
+def _photo(width: int, height: int, seed: int) -> bytes:
+    noise = Image.effect_noise((width, height), 40 + seed % 20).convert("RGB")
+    tint = Image.new("RGB", (width, height), (seed * 37 % 256, 90, 160))
+    out = io.BytesIO()
+    Image.blend(noise, tint, 0.5).save(out, "JPEG", quality=92)
+    return out.getvalue()
+
+
+def _clip(directory: Path, index: int, seconds: float) -> Path:
+    path = directory / f"clip-{index:03d}.mp4"
+    subprocess.run(
+        [
+            imageio_ffmpeg.get_ffmpeg_exe(),
+            "-v", "error",
+            "-f", "lavfi",
+            "-i", f"testsrc2=duration={seconds}:size=1920x1080:rate=24",
+            "-pix_fmt", "yuv420p",
+            str(path),
+        ],
+        check=True,
+    )
+    return path
+
+
+def _stored(bucket, folder_id: str, name: str, body: bytes) -> dict:
+    created = catalog.create_node(folder_id, name, catalog.KIND_FILE, size=len(body))
+    bucket.put_object(Bucket=config.media_bucket(), Key=created["blob_key"], Body=body)
+    return catalog.node(created["node_id"])
+
+
+def _throughput(records: list[dict]) -> dict:
+    made, seconds = clock(lambda: [derived.produce(record) for record in records])
+    return {
+        "count": len(records),
+        "rendered": sum(1 for width in made if width),
+        "seconds": round(seconds, 2),
+        "per_second": round(len(records) / seconds, 1) if seconds else None,
+    }
+
+
+def _page_bytes(bucket, folder_id: str, page_size: int) -> dict:
+    items = browse.reel_items(LIBRARY, node_id=folder_id, page_size=page_size)["items"]
+    originals = previews = 0
+    for item in items:
+        record = catalog.node(item["id"])
+        originals += record["size"]
+        key = s3.derived_key(record["blob_key"], record["preview"]) if record.get("preview") else None
+        previews += (
+            bucket.head_object(Bucket=config.media_bucket(), Key=key)["ContentLength"]
+            if key
+            else record["size"]
+        )
+    return {
+        "tiles": len(items),
+        "originals_mb": round(originals / MB, 2),
+        "previews_mb": round(previews / MB, 2),
+        "ratio": round(originals / previews, 1) if previews else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=60)
+    parser.add_argument("--videos", type=int, default=10)
+    parser.add_argument("--image-size", default="4000x3000")
+    parser.add_argument("--video-seconds", type=float, default=5)
+    parser.add_argument("--page-size", type=int, default=60)
+    args = parser.parse_args()
+    width, height = (int(side) for side in args.image_size.split("x"))
+
+    with standin() as (_table, bucket), tempfile.TemporaryDirectory() as scratch:
+        folder = catalog.create_node(ROOT, "shoot", catalog.KIND_FOLDER)
+        images = [
+            _stored(bucket, folder["node_id"], f"frame-{index:04d}.jpg", _photo(width, height, index))
+            for index in range(args.images)
+        ]
+        clips = {}
+        videos = []
+        for index in range(args.videos):
+            path = _clip(Path(scratch), index, args.video_seconds)
+            record = _stored(bucket, folder["node_id"], path.name, path.read_bytes())
+            clips[record["blob_key"]] = str(path)
+            videos.append(record)
+        derived._video_source = clips.__getitem__
+
+        report = {
+            "image_size": args.image_size,
+            "video_seconds": args.video_seconds,
+            "images": _throughput(images),
+            "videos": _throughput(videos),
+            "reel_page": _page_bytes(bucket, folder["node_id"], args.page_size),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Token verification per request: a full RS256 check every time against the claims cache.
+
+    cd studio/backend && python -m benchmarks.bench_identity
+
+No network and no moto. A 2048-bit key is generated here and the JWKS lookup
+is stubbed to return its public half, as `tests/test_identity.py` does, so the
+only cost measured is `caller_sub`'s own: parsing, the signature check and the
+claim checks when cold, and a digest and a dict lookup when warm. Unlike the
+catalog benchmarks this one's wall time *is* the prod number, give or take the
+Lambda's CPU share, because nothing it does leaves the process.
+"""
+
+import argparse
+import datetime as dt
+import json
+import os
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from benchmarks.standin import clock, timings
+from studio_core.services import identity
+
+POOL_ID = "us-east-1_BENCHPOOL"
+CLIENT_ID = "bench-client"
+
+
+def _header(key) -> str:
+    now = dt.datetime.now(tz=dt.timezone.utc)
+    token = jwt.encode(
+        {
+            "sub": "sub-bench",
+            "iss": f"https://cognito-idp.us-east-1.amazonaws.com/{POOL_ID}",
+            "aud": CLIENT_ID,
+            "token_use": "id",
+            "iat": now,
+            "exp": now + dt.timedelta(hours=1),
+        },
+        key,
+        algorithm="RS256",
+    )
+    return f"Bearer {token}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    os.environ["STUDIO_COGNITO_USER_POOL_ID"] = POOL_ID
+    os.environ["STUDIO_COGNITO_CLIENT_ID"] = CLIENT_ID
+    os.environ["AWS_REGION"] = "us-east-1"
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public = key.public_key()
+
+    class _Key:
+        key = public
+
+    class _Client:
+        def get_signing_key_from_jwt(self, token):
+            jwt.get_unverified_header(token)
+            return _Key()
+
+    identity.jwks_client = _Client
+    header = _header(key)
+
+    report = {}
+    for label, forget in (("verify_every_request", True), ("claims_cache", False)):
+        identity.reset_claims_cache()
+        samples = []
+        for _ in range(args.requests):
+            if forget:
+                identity.reset_claims_cache()
+            _, seconds = clock(identity.caller_sub, header)
+            samples.append(seconds)
+        report[label] = timings(samples)
+    report["speedup_mean"] = round(
+        report["verify_every_request"]["mean_ms"] / report["claims_cache"]["mean_ms"], 1
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
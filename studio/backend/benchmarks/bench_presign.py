@@ -0,0 +1,137 @@
+"""Presigning: signatures per second, and S3 calls per reel page, with and without the cache.
+
+    cd studio/backend && python -m benchmarks.bench_presign --nodes 2000
+
+Seeds `--nodes` finished image uploads beneath the library root the way
+`bench_reel_pages` does — every row carrying `size` and `content_type`, as a
+confirmed upload's does — and puts bytes behind the first page of them so a
+`HeadObject` has something to answer. Then three measurements, each once as the
+service was before (`STUDIO_PRESIGN_CACHE_ENTRIES=0`, and a HEAD before every
+re-sign) and once as it is:
+
+* **`sign`** — `s3.presign` over every node's blob, twice. Reported as
+  signatures per second over the second pass, which is the pass a cache
+  changes: the first signs everything either way.
+* **`reel_page`** — one page of `browse.reel_items`, `--samples` times.
+  `s3_calls` is every request the S3 client sent (none, either way — signing
+  is local, and this column is here to say so), `signatures` is how many HMAC
+  chains the page cost on average, and the timings are the page's.
+* **`resign_page`** — `browse.asset_url` for every item on that page, which is
+  what a grid re-signing its tiles asks for. `s3_calls` is the `HeadObject`s:
+  one per tile before, none for a row that already says what it holds.
+
+The counts are the numbers that carry to AWS; the timings are moto's and this
+machine's, for the reason `standin` gives, and for `sign` they are close to the
+real thing because signing never leaves the process.
+"""
+
+import argparse
+import json
+import os
+
+from benchmarks.bench_reel_pages import PAGE_SIZE
+from benchmarks.bench_reel_pages import _seed as _seed_reel
+from benchmarks.standin import LIBRARY, CallCounter, clock, standin, timings
+from studio_core import config
+from studio_core.clients.aws import s3
+from studio_core.services import browse
+
+
+class _Signatures:
+    """The real signer, counting what it signs."""
+
+    def __init__(self):
+        self.count = 0
+        real = s3.client()
+        self._sign = real.generate_presigned_url
+        real.generate_presigned_url = self._counted
+
+    def _counted(self, *args, **kwargs):
+        self.count += 1
+        return self._sign(*args, **kwargs)
+
+
+def _blob_keys(nodes: int) -> list[str]:
+    return [f"blobs/node-bench-{index:06d}" for index in range(nodes)]
+
+
+def _sign(nodes: int) -> dict:
+    blob_keys = _blob_keys(nodes)
+    for blob_key in blob_keys:
+        s3.presign(blob_key)
+    _result, seconds = clock(lambda: [s3.presign(blob_key) for blob_key in blob_keys])
+    return {"presigns": nodes, "seconds": round(seconds, 4), "per_s": round(nodes / seconds)}
+
+
+def _reel_page(counter: CallCounter, signatures: _Signatures, samples: int) -> dict:
+    counter.reset()
+    signatures.count = 0
+    times = []
+    for _ in range(samples):
+        _page, seconds = clock(browse.reel_items, LIBRARY, None, None, PAGE_SIZE)
+        times.append(seconds)
+    s3_calls = sum(count for name, count in counter.calls.items() if name.endswith("Object"))
+    return {
+        "s3_calls": s3_calls / samples,
+        "signatures": signatures.count / samples,
+        **timings(times),
+    }
+
+
+def _resign_page(counter: CallCounter, page: list[dict]) -> dict:
+    counter.reset()
+    _result, seconds = clock(
+        lambda: [browse.asset_url(LIBRARY, None, None, node_id=item["id"]) for item in page]
+    )
+    return {
+        "tiles": len(page),
+        "s3_calls": counter.calls["HeadObject"],
+        "seconds": round(seconds, 4),
+    }
+
+
+def _run(nodes: int, samples: int, *, before: bool) -> dict:
+    os.environ["STUDIO_PRESIGN_CACHE_ENTRIES"] = "0" if before else "10000"
+    with standin() as (table, bucket):
+        _seed_reel(table, nodes)
+        page = browse.reel_items(LIBRARY, None, None, PAGE_SIZE)["items"]
+        for item in page:
+            bucket.put_object(
+                Bucket=config.media_bucket(),
+                Key=f"blobs/{item['id']}",
+                Body=b"x" * 1024,
+                ContentType="image/png",
+            )
+        counter, signatures = CallCounter(), _Signatures()
+        recorded = browse._recorded_blob
+        if before:
+            # What `asset_url` did before: ask S3 whatever the row says.
+            browse._recorded_blob = lambda record: None
+        try:
+            return {
+                "sign": _sign(nodes),
+                "reel_page": _reel_page(counter, signatures, samples),
+                "resign_page": _resign_page(counter, page),
+            }
+        finally:
+            browse._recorded_blob = recorded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ["STUDIO_MAX_FOLDER_OBJECTS"] = str(args.nodes * 2)
+    report = {
+        "nodes": args.nodes,
+        "page_size": PAGE_SIZE,
+        "before": _run(args.nodes, args.samples, before=True),
+        "after": _run(args.nodes, args.samples, before=False),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
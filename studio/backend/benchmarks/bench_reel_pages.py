@@ -0,0 +1,151 @@
+"""Reel pages by depth: the offset cursor against the keyset cursor.
+
+    cd studio/backend && python -m benchmarks.bench_reel_pages --nodes 50000
+
+Seeds one library with `--nodes` finished image uploads directly beneath its
+root — both items of each node, written with `BatchWriteItem` because
+`create_node` would spend the run's whole budget on transactions — and then
+asks each reel for the page at a handful of depths. `STUDIO_MAX_FOLDER_OBJECTS`
+is raised to the library's size so the offset reel can reach its last page at
+all; past the default it truncates, which is the other half of why the keyset
+reel exists.
+
+Reported per depth: `rows_read`, the `ScannedCount` summed over that one
+page's queries, the `Query` calls it took, and wall time. The offset reel reads
+the whole library for every page — its cost is the library's size, and past
+the cap it stops reaching the end at all. The keyset reel reads from its
+position and stops at the first DynamoDB page that fills it, so its cost is at
+most one 1 MB page wherever the position is; that shape, not the milliseconds,
+is what carries over to AWS. (With a `Limit` it would be nearer one reel page;
+`catalog.recent_page` says why there is none.) Keyset pages past the first are
+reached by walking from page one, since its cursor cannot be made up, and only
+the page at the depth is measured.
+"""
+
+import argparse
+import datetime as dt
+import json
+import os
+
+from benchmarks.standin import LIBRARY, ROOT, CallCounter, clock, standin, timings
+from studio_core import config
+from studio_core.clients.aws import dynamodb
+from studio_core.services import browse
+
+PAGE_SIZE = 60
+BATCH_WRITE_ITEMS = 25
+
+_SEED_START = dt.datetime(2026, 8, 20, tzinfo=dt.timezone.utc)
+
+
+def _seed(table, nodes: int) -> None:
+    items = []
+    for index in range(nodes):
+        node_id = f"node-bench-{index:06d}"
+        name = f"still-{index:06d}.png"
+        created = (_SEED_START + dt.timedelta(seconds=index)).isoformat(timespec="microseconds")
+        items.append(
+            {
+                "pk": {"S": f"NODE#{node_id}"},
+                "sk": {"S": "META"},
+                "node_id": {"S": node_id},
+                "lib": {"S": LIBRARY},
+                "parent_id": {"S": ROOT},
+                "name": {"S": name},
+                "kind": {"S": "file"},
+                "path": {"S": "/"},
+                "blob_key": {"S": f"blobs/{node_id}"},
+                "size": {"N": "1024"},
+                "content_type": {"S": "image/png"},
+                "created_at": {"S": created},
+                "updated_at": {"S": created},
+            }
+        )
+        items.append(
+            {
+                "pk": {"S": f"NODE#{ROOT}"},
+                "sk": {"S": f"NAME#{name}"},
+                "node_id": {"S": node_id},
+                "lib": {"S": LIBRARY},
+                "kind": {"S": "file"},
+                "path": {"S": "/"},
+                "created_at": {"S": created},
+            }
+        )
+    for start in range(0, len(items), BATCH_WRITE_ITEMS):
+        table.batch_write_item(
+            RequestItems={
+                config.catalog_table(): [
+                    {"PutRequest": {"Item": item}}
+                    for item in items[start : start + BATCH_WRITE_ITEMS]
+                ]
+            }
+        )
+
+
+class _Scanned:
+    """`ScannedCount` summed over every `Query` response since the last reset."""
+
+    def __init__(self):
+        self.rows = 0
+        dynamodb.client().meta.events.register("after-call.dynamodb.Query", self._count)
+
+    def _count(self, parsed, **_kwargs):
+        self.rows += parsed.get("ScannedCount", 0)
+
+
+def _offset_page(depth: int) -> dict:
+    return browse.reel_items(LIBRARY, None, str(depth * PAGE_SIZE), PAGE_SIZE)
+
+
+def _keyset_cursor(depth: int) -> str | None:
+    cursor = None
+    for _ in range(depth):
+        cursor = browse.reel_items(LIBRARY, None, cursor, PAGE_SIZE, pagination="keyset")[
+            "next_cursor"
+        ]
+    return cursor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=50000)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ["STUDIO_MAX_FOLDER_OBJECTS"] = str(args.nodes * 2)
+    pages = args.nodes // PAGE_SIZE
+    depths = sorted({0, 1, pages // 10, pages // 2, max(0, pages - 1)})
+
+    report = {"nodes": args.nodes, "page_size": PAGE_SIZE, "offset": {}, "keyset": {}}
+    with standin() as (table, _bucket):
+        _seed(table, args.nodes)
+        counter, scanned = CallCounter(), _Scanned()
+        for depth in depths:
+            cursor = _keyset_cursor(depth)
+            for label, read in (
+                ("offset", lambda: _offset_page(depth)),
+                (
+                    "keyset",
+                    lambda: browse.reel_items(
+                        LIBRARY, None, cursor, PAGE_SIZE, pagination="keyset"
+                    ),
+                ),
+            ):
+                samples = []
+                counter.reset()
+                scanned.rows = 0
+                for _ in range(args.samples):
+                    page, seconds = clock(read)
+                    assert len(page["items"]) == PAGE_SIZE or depth == depths[-1], (label, depth)
+                    samples.append(seconds)
+                report[label][depth] = {
+                    "rows_read": scanned.rows // args.samples,
+                    "queries": counter.calls["Query"] / args.samples,
+                    **timings(samples),
+                }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
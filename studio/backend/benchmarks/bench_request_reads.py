@@ -0,0 +1,78 @@
+"""DynamoDB calls per authenticated request, cold and warm.
+
+    cd studio/backend && python -m benchmarks.bench_request_reads
+
+Drives real requests through `create_app()` against the stand-in, with only
+the token check stubbed, and reports how many catalog calls each route makes
+and of which kind. The `cold` run turns both per-process caches off
+(`STUDIO_MEMBERSHIP_TTL_SECONDS=0`, `STUDIO_NODE_CACHE_TTL_SECONDS=0`) and the
+`warm` run leaves them at their defaults, so the difference between the two is
+what the caches save; `node_cache` reports its own hits and misses alongside.
+
+What to expect: every library-scoped route makes exactly one `Query` on
+`USER#<sub>` when cold — the hook's, reused by the route through
+`g.memberships` — and, past the first request, none when warm. Whatever
+`Query` count remains on a warm listing is the listing's own.
+"""
+
+import argparse
+import json
+import os
+
+from benchmarks.standin import OWNER, ROOT, CallCounter, clock, standin, timings
+from studio_core.app_factory import create_app
+from studio_core.services import catalog, identity, node_cache
+
+ROUTES = (
+    f"/api/nodes/{ROOT}",
+    f"/api/nodes?parent={ROOT}",
+    f"/api/tree?node={ROOT}",
+    "/api/resolve?path=folder-0",
+    "/api/libraries",
+)
+
+
+def _run(requests: int, ttl: str, files: int) -> dict:
+    os.environ["STUDIO_MEMBERSHIP_TTL_SECONDS"] = ttl
+    os.environ["STUDIO_NODE_CACHE_TTL_SECONDS"] = ttl
+    results = {}
+    with standin():
+        for index in range(files):
+            catalog.create_node(ROOT, f"folder-{index}", catalog.KIND_FOLDER)
+        identity.caller_sub = lambda _header: OWNER
+        client = create_app().test_client()
+        counter = CallCounter()
+
+        for route in ROUTES:
+            counter.reset()
+            node_cache.reset()
+            samples = []
+            for _ in range(requests):
+                response, seconds = clock(client.get, route)
+                assert response.status_code == 200, (route, response.get_json())
+                samples.append(seconds)
+            results[route] = {
+                "calls_per_request": {
+                    name: round(count / requests, 2) for name, count in counter.calls.items()
+                },
+                "node_cache": node_cache.stats(),
+                **timings(samples),
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--children", type=int, default=20)
+    args = parser.parse_args()
+
+    report = {
+        "cold": _run(args.requests, "0", args.children),
+        "warm": _run(args.requests, "5", args.children),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Subtree moves and deletes: transactions one at a time against several in flight.
+
+    cd studio/backend && python -m benchmarks.bench_transactions --nodes 1000,10000,50000
+
+For each size, seeds one folder holding `--folders` subfolders with the files
+split evenly between them — both items of each node, written with
+`BatchWriteItem` for the reason `bench_reel_pages` gives — then moves that
+folder under a sibling and deletes it, once with `STUDIO_TRANSACTION_WORKERS=1`
+and once with `--workers`. Each run gets a fresh stand-in, so both measure the
+same tree. `STUDIO_MAX_FOLDER_OBJECTS` is raised past the tree's size so
+`subtree` reads all of it.
+
+**The round trip is simulated, and it has to be.** moto answers a transaction
+in this process, under the GIL, with no network in between, so two of them in
+flight take exactly as long as two in a row — and its `transact_write_items`
+deep-copies the whole table to roll back with, which is not safe to run from
+two threads at all. The client handed to `catalog` here therefore serialises
+moto's half and sleeps `--latency-ms` *outside* the lock before each
+`TransactWriteItems`, standing in for the wire. What is reported —
+`transactions`, and `items_per_s` over both items of every node written — is
+then the shape that carries to AWS: sequential time grows with transactions ×
+round trip, concurrent time divides that by the workers until one depth of a
+delete has fewer chunks than there are workers. A `--latency-ms 0` run is
+moto's own cost and says nothing about concurrency.
+
+moto's own work still costs tens of milliseconds a transaction even so, and
+being serialised it does not shrink with workers, so `moto_s` reports it and
+`wire_items_per_s` is the rate with it taken out — the time spent waiting on
+the simulated round trips and reading the subtree. That column is the one to
+compare between `workers=1` and `workers=N`.
+
+That rollback copy is also why `standin.no_rollback` exists. It is a copy of every
+table per transaction — a second per transaction at ten thousand nodes, which
+would bury the round trips being measured — so for the length of a run moto is
+told to skip it. Nothing here is meant to be cancelled; a run that was would
+leave a half-written table, and the report would be wrong rather than slow.
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+
+from benchmarks.standin import (
+    ROOT,
+    CallCounter,
+    clock,
+    no_rollback,
+    node_items,
+    put_items,
+    standin,
+)
+from studio_core.clients.aws import dynamodb
+from studio_core.services import catalog
+
+def _seed(table, nodes: int, folders: int) -> tuple[str, str]:
+    """`doomed/` of `nodes` nodes and an empty `elsewhere/` beside it; their ids."""
+    top, elsewhere = "node-bench-doomed", "node-bench-elsewhere"
+    items = node_items(top, ROOT, "doomed", "folder", f"/{ROOT}/")
+    items += node_items(elsewhere, ROOT, "elsewhere", "folder", f"/{ROOT}/")
+    below = f"/{ROOT}/{top}/"
+    files = nodes - 1 - folders
+    for folder_index in range(folders):
+        folder = f"node-bench-folder-{folder_index:04d}"
+        items += node_items(folder, top, f"shoot-{folder_index:04d}", "folder", below)
+        for index in range(folder_index, files, folders):
+            items += node_items(
+                f"node-bench-{index:06d}", folder, f"still-{index:06d}.png", "file",
+                f"{below}{folder}/",
+            )
+    put_items(table, items)
+    return top, elsewhere
+
+
+class _Wire:
+    """The real client, with a round trip's wait before each transaction.
+
+    The wait is outside the lock and moto's work inside it: waits overlap the
+    way network round trips do, and moto's table is only ever copied by one
+    thread at a time.
+    """
+
+    def __init__(self, real, latency: float):
+        self._real, self._latency = real, latency
+        self._lock = threading.Lock()
+        self.moto_seconds = 0.0
+
+    def transact_write_items(self, **kwargs):
+        time.sleep(self._latency)
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                return self._real.transact_write_items(**kwargs)
+            finally:
+                self.moto_seconds += time.perf_counter() - started
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+def _run(nodes: int, folders: int, workers: int, latency: float) -> dict:
+    os.environ["STUDIO_TRANSACTION_WORKERS"] = str(workers)
+    with standin() as (table, _bucket), no_rollback():
+        top, elsewhere = _seed(table, nodes, folders)
+        counter = CallCounter()
+        wire = _Wire(dynamodb.client(), latency)
+        real_client = dynamodb.client
+        dynamodb.client = lambda: wire
+        try:
+            report = {}
+            for label, operation in (
+                ("move", lambda: catalog.move_node(top, elsewhere)),
+                ("delete", lambda: catalog.delete_node(top)),
+            ):
+                counter.reset()
+                wire.moto_seconds = 0.0
+                _result, seconds = clock(operation)
+                written = nodes * 2
+                report[label] = {
+                    "transactions": counter.calls["TransactWriteItems"],
+                    "seconds": round(seconds, 3),
+                    "moto_s": round(wire.moto_seconds, 3),
+                    "items_per_s": round(written / seconds),
+                    "wire_items_per_s": round(written / max(seconds - wire.moto_seconds, 1e-6)),
+                }
+            return report
+        finally:
+            dynamodb.client = real_client
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", default="1000,10000,50000",
+                        help="comma-separated subtree sizes")
+    parser.add_argument("--folders", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.nodes.split(",")]
+    os.environ["STUDIO_MAX_FOLDER_OBJECTS"] = str(max(sizes) * 2)
+    latency = args.latency_ms / 1000
+    report = {"latency_ms": args.latency_ms, "folders": args.folders, "runs": {}}
+    for nodes in sizes:
+        report["runs"][nodes] = {
+            f"workers={workers}": _run(nodes, args.folders, workers, latency)
+            for workers in (1, args.workers)
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
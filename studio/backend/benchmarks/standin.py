@@ -0,0 +1,361 @@
+"""A local stand-in for the catalog table and the media bucket, and a call counter.
+
+Every benchmark here runs against moto rather than against AWS, and that decides
+what they can say. **Latency against moto is not DynamoDB latency** — it is the
+cost of this process marshalling, unmarshalling and walking its own in-memory
+table — so the number worth reading is the *count* of round trips and the shape
+of how it grows, and wall time is only comparable between two runs of the same
+script on the same machine. A change that halves the calls per request halves
+them in prod too; a change that halves the milliseconds here may do nothing
+there.
+
+The table is declared the way `infra/modules/catalog` declares it and the way
+`tests/conftest.py` does, and is repeated rather than imported from the suite:
+a benchmark importing a conftest would run its module-level setup, and would
+make the suite's fixture a thing two callers have to agree about.
+"""
+
+import contextlib
+import copy
+import math
+import os
+import statistics
+import time
+from collections import Counter
+
+# Credentials and region must exist before boto3 and moto are imported, for the
+# reason `tests/conftest.py` gives.
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("STUDIO_MEDIA_BUCKET", "studio-bench-media")
+os.environ.setdefault("STUDIO_CATALOG_TABLE", "studio-bench-catalog")
+os.environ["STUDIO_MEDIA_ROOT_PREFIX"] = ""
+
+import boto3  # noqa: E402
+from moto import mock_dynamodb, mock_s3  # noqa: E402
+from moto.dynamodb import models as moto_dynamodb  # noqa: E402
+
+from studio_core import config  # noqa: E402
+from studio_core.clients.aws import dynamodb, s3  # noqa: E402
+from studio_core.services import catalog, node_cache  # noqa: E402
+
+LIBRARY = "lib-bench"
+ROOT = "node-bench-root"
+OWNER = "sub-bench-owner"
+
+_SEED_TIME = "2026-08-19T12:00:00.000000+00:00"
+
+# `BatchWriteItem` takes twenty-five items and no more.
+BATCH_WRITE_ITEMS = 25
+
+
+def _create_table(client) -> None:
+    client.create_table(
+        TableName=config.catalog_table(),
+        BillingMode="PAY_PER_REQUEST",
+        KeySchema=[
+            {"AttributeName": "pk", "KeyType": "HASH"},
+            {"AttributeName": "sk", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "pk", "AttributeType": "S"},
+            {"AttributeName": "sk", "AttributeType": "S"},
+            {"AttributeName": "lib", "AttributeType": "S"},
+            {"AttributeName": "path", "AttributeType": "S"},
+            {"AttributeName": "created_at", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "by-sk",
+                "KeySchema": [
+                    {"AttributeName": "sk", "KeyType": "HASH"},
+                    {"AttributeName": "pk", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": catalog.BY_PATH_INDEX,
+                "KeySchema": [
+                    {"AttributeName": "lib", "KeyType": "HASH"},
+                    {"AttributeName": "path", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": catalog.BY_RECENT_INDEX,
+                "KeySchema": [
+                    {"AttributeName": "lib", "KeyType": "HASH"},
+                    {"AttributeName": "created_at", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+        ],
+    )
+    seed = [
+        {
+            "pk": {"S": f"LIB#{LIBRARY}"},
+            "sk": {"S": "META"},
+            "name": {"S": "Bench"},
+            "root_node": {"S": ROOT},
+            "created_at": {"S": _SEED_TIME},
+        },
+        {
+            "pk": {"S": f"USER#{OWNER}"},
+            "sk": {"S": f"LIB#{LIBRARY}"},
+            "role": {"S": "owner"},
+            "created_at": {"S": _SEED_TIME},
+        },
+        {
+            "pk": {"S": f"NODE#{ROOT}"},
+            "sk": {"S": "META"},
+            "node_id": {"S": ROOT},
+            "lib": {"S": LIBRARY},
+            "name": {"S": "Bench"},
+            "kind": {"S": "folder"},
+            "path": {"S": "/"},
+            "created_at": {"S": _SEED_TIME},
+            "updated_at": {"S": _SEED_TIME},
+        },
+    ]
+    for item in seed:
+        client.put_item(TableName=config.catalog_table(), Item=item)
+
+
+@contextlib.contextmanager
+def standin():
+    """A fresh table and bucket holding one library, its root and its owner.
+
+    Yields the raw DynamoDB and S3 clients, for a benchmark that seeds rows
+    faster than `catalog.create_node` would write them.
+    """
+    with mock_dynamodb(), mock_s3():
+        dynamodb.reset_client()
+        s3.reset_client()
+        catalog.reset_membership_cache()
+        node_cache.reset()
+        table = boto3.client("dynamodb", region_name=config.aws_region())
+        bucket = boto3.client("s3", region_name=config.aws_region())
+        _create_table(table)
+        bucket.create_bucket(Bucket=config.media_bucket())
+        try:
+            yield table, bucket
+        finally:
+            dynamodb.reset_client()
+            s3.reset_client()
+            catalog.reset_membership_cache()
+            node_cache.reset()
+
+
+def node_items(
+    node_id: str,
+    parent_id: str,
+    name: str,
+    kind: str,
+    path: str,
+    *,
+    created_at: str = "2026-08-20T00:00:00.000000+00:00",
+) -> list[dict]:
+    """A node's record and its by-parent item, as `catalog` would have written them."""
+    shared = {
+        "node_id": {"S": node_id},
+        "lib": {"S": LIBRARY},
+        "kind": {"S": kind},
+        "path": {"S": path},
+        "created_at": {"S": created_at},
+        "updated_at": {"S": created_at},
+    }
+    if kind == "file":
+        shared.update(
+            {
+                "blob_key": {"S": f"blobs/{node_id}"},
+                "size": {"N": "1024"},
+                "content_type": {"S": "image/png"},
+            }
+        )
+    return [
+        {
+            "pk": {"S": f"NODE#{node_id}"},
+            "sk": {"S": "META"},
+            "parent_id": {"S": parent_id},
+            "name": {"S": name},
+            **shared,
+        },
+        {"pk": {"S": f"NODE#{parent_id}"}, "sk": {"S": f"NAME#{name}"}, **shared},
+    ]
+
+
+def put_items(table, items: list[dict]) -> None:
+    """Write raw items with `BatchWriteItem`, which seeds far faster than `create_node`."""
+    for start in range(0, len(items), BATCH_WRITE_ITEMS):
+        table.batch_write_item(
+            RequestItems={
+                config.catalog_table(): [
+                    {"PutRequest": {"Item": item}}
+                    for item in items[start : start + BATCH_WRITE_ITEMS]
+                ]
+            }
+        )
+
+
+@contextlib.contextmanager
+def no_rollback():
+    """moto's `transact_write_items` without the table copy it takes to undo with.
+
+    That copy is of every table, once per transaction — a second each at ten
+    thousand nodes — and would bury whatever a benchmark of subtree writes is
+    measuring. Nothing run under this is meant to be cancelled; one that was
+    would leave a half-written table, and the report would be wrong rather
+    than slow.
+    """
+
+    def deepcopy(value, memo=None):
+        if isinstance(value, dict) and all(
+            isinstance(table, moto_dynamodb.Table) for table in value.values()
+        ):
+            return value
+        return copy.deepcopy(value, memo)
+
+    moto_dynamodb.copy = type("copy", (), {"deepcopy": staticmethod(deepcopy)})
+    try:
+        yield
+    finally:
+        moto_dynamodb.copy = copy
+
+
+class CallCounter:
+    """Every API call the service's own clients make, by operation name.
+
+    Registered on `before-call`, which fires once per HTTP request botocore
+    sends — so a paginated query is counted once per page, and a retried call
+    once per attempt. That is the number a bill and a latency budget are made
+    of.
+    """
+
+    def __init__(self):
+        self.calls: Counter[str] = Counter()
+        dynamodb.client().meta.events.register("before-call.dynamodb", self._count)
+        s3.client().meta.events.register("before-call.s3", self._count)
+
+    def _count(self, model, **_kwargs):
+        self.calls[model.name] += 1
+
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+    def reset(self) -> None:
+        self.calls.clear()
+
+
+def _value_bytes(value: dict) -> int:
+    """One attribute value's size by DynamoDB's rules, near enough to bill by."""
+    (kind, inner), = value.items()
+    if kind == "S":
+        return len(inner.encode())
+    if kind == "B":
+        return len(inner)
+    if kind == "N":
+        return len(inner.lstrip("-").replace(".", "")) // 2 + 1
+    if kind in ("SS", "NS", "BS"):
+        return sum(_value_bytes({kind[0]: member}) for member in inner)
+    if kind == "L":
+        return 3 + sum(1 + _value_bytes(member) for member in inner)
+    if kind == "M":
+        return 3 + sum(1 + len(name.encode()) + _value_bytes(v) for name, v in inner.items())
+    return 1
+
+
+def item_bytes(item: dict | None) -> int:
+    """A raw item's size, the number both kinds of capacity unit are counted in."""
+    return sum(len(name.encode()) + _value_bytes(value) for name, value in (item or {}).items())
+
+
+def _reads(size: int, consistent: bool) -> float:
+    return math.ceil(max(size, 1) / 4096) * (1.0 if consistent else 0.5)
+
+
+def _writes(size: int) -> float:
+    return float(math.ceil(max(size, 1) / 1024))
+
+
+class CapacityMeter:
+    """The read and write units the service's DynamoDB calls would be billed.
+
+    **Worked out here rather than asked for**, because moto answers
+    `ReturnConsumedCapacity` with a constant whatever was read. So each call's
+    units are counted from what it carried, by DynamoDB's published rules: a
+    read unit per 4 KB, halved for an eventually consistent read, a write unit
+    per 1 KB, both doubled inside a transaction. A query is billed on what it
+    returned, scaled up by `ScannedCount` when a filter dropped rows; an update
+    or a delete, whose item this never sees, is billed at one unit — every item
+    in this table is under a kilobyte. Within those two approximations the
+    numbers are what a bill would say, which is what makes them worth a
+    baseline.
+    """
+
+    def __init__(self):
+        self.read = self.write = 0.0
+        events = dynamodb.client().meta.events
+        events.register("provide-client-params.dynamodb", self._remember)
+        events.register("after-call.dynamodb", self._bill)
+
+    @staticmethod
+    def _remember(params, context, **_kwargs):
+        context["standin_params"] = params
+
+    def _bill(self, parsed, model, context, **_kwargs):
+        params = context.get("standin_params", {})
+        name = model.name
+        consistent = bool(params.get("ConsistentRead")) and "IndexName" not in params
+        if name == "GetItem":
+            self.read += _reads(item_bytes(parsed.get("Item")), consistent)
+        elif name in ("Query", "Scan"):
+            items = parsed.get("Items", [])
+            returned = sum(item_bytes(item) for item in items)
+            if items and parsed.get("ScannedCount", 0) > len(items):
+                returned = returned * parsed["ScannedCount"] // len(items)
+            self.read += _reads(returned, consistent)
+        elif name == "BatchGetItem":
+            for table, items in parsed.get("Responses", {}).items():
+                strong = params["RequestItems"][table].get("ConsistentRead", False)
+                self.read += sum(_reads(item_bytes(item), strong) for item in items)
+        elif name == "TransactGetItems":
+            self.read += 2 * sum(
+                _reads(item_bytes(answer.get("Item")), True)
+                for answer in parsed.get("Responses", [])
+            )
+        elif name == "PutItem":
+            self.write += _writes(item_bytes(params.get("Item")))
+        elif name in ("UpdateItem", "DeleteItem"):
+            self.write += 1.0
+        elif name == "BatchWriteItem":
+            for requests in params.get("RequestItems", {}).values():
+                self.write += sum(
+                    _writes(item_bytes(request.get("PutRequest", {}).get("Item")))
+                    for request in requests
+                )
+        elif name == "TransactWriteItems":
+            self.write += 2 * sum(
+                _writes(item_bytes(step.get("Put", {}).get("Item")))
+                for step in params.get("TransactItems", [])
+            )
+
+    def reset(self) -> None:
+        self.read = self.write = 0.0
+
+
+def timings(samples: list[float]) -> dict:
+    """p50, p99 and mean of a list of seconds, in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+def clock(fn, *args, **kwargs):
+    """`fn(*args, **kwargs)` and the seconds it took."""
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
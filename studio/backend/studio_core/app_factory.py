@@ -17,6 +17,7 @@ from studio_core.errors import (
     ValidationError,
 )
 from studio_core.routes.browse import bp as browse_bp
+from studio_core.routes.jobs import bp as jobs_bp
 from studio_core.routes.libraries import bp as libraries_bp
 from studio_core.routes.manage import bp as manage_bp
 from studio_core.routes.nodes import bp as nodes_bp
@@ -136,7 +137,7 @@ class ApiPathMiddleware:
         return self.app(environ, start_response)
 
 
-def _resolve_library(sub: str, requested: str | None) -> str:
+def _resolve_library(memberships: list[dict], requested: str | None) -> str:
     """Which library this request is about, or a refusal saying why not.
 
     Three cases, in the order they are cheap to be sure of:
@@ -152,11 +153,10 @@ def _resolve_library(sub: str, requested: str | None) -> str:
       nothing outside this function knows, and every one of them would
       eventually write a node into the wrong library.
 
-    The membership read is one query on one partition (`USER#<sub>`), which is
-    what makes doing it per request affordable — see `catalog.libraries_for`.
+    The membership rows are the caller's, read once by `resolve_caller` and
+    handed in rather than read here, so the same rows that chose the library
+    are the ones every route below authorises against — see `g.memberships`.
     """
-    memberships = catalog.libraries_for(sub)
-
     if requested:
         if not any(membership["lib"] == requested for membership in memberships):
             raise ForbiddenError(f"You are not a member of {requested}.")
@@ -219,6 +219,9 @@ def create_app() -> Flask:
     # path where `nodes` takes an id, and #313 retires the first.
     app.register_blueprint(nodes_bp)
     app.register_blueprint(manage_bp)
+    # A job is the tail of a `manage` request that was too large to answer
+    # inline, and is polled by id; see `routes/jobs.py`.
+    app.register_blueprint(jobs_bp)
 
     @app.before_request
     def handle_preflight():
@@ -239,6 +242,15 @@ def create_app() -> Flask:
         exists, so an unscoped route reads a library of `None` instead of raising
         `AttributeError` three frames down, in a route that never mentioned `g`.
 
+        **`g.memberships` is the rows the library was resolved from**, kept so
+        that no route reads them a second time: `routes/nodes` authorises every
+        node against them, and before they were kept here each of those requests
+        queried `USER#<sub>` twice. It is `None` on an unscoped path for the same
+        reason `g.library` is — nothing was read, and `routes/libraries` asks for
+        itself. `catalog.libraries_for` remembers the rows across requests too,
+        so a warm container answers most requests with no membership query at
+        all.
+
         **OPTIONS is tested for again**, even though `handle_preflight` above
         already answers every preflight and Flask stops at the first
         `before_request` to return something. That short-circuit is an ordering
@@ -255,11 +267,12 @@ def create_app() -> Flask:
         if request.method == "OPTIONS" or request.path in UNAUTHENTICATED_PATHS:
             return None
         g.caller_sub = identity.caller_sub(request.headers.get("Authorization"))
-        g.library = (
-            None
-            if request.path in LIBRARY_UNSCOPED_PATHS
-            else _resolve_library(g.caller_sub, request.headers.get(LIBRARY_HEADER))
-        )
+        if request.path in LIBRARY_UNSCOPED_PATHS:
+            g.memberships = None
+            g.library = None
+            return None
+        g.memberships = catalog.libraries_for(g.caller_sub)
+        g.library = _resolve_library(g.memberships, request.headers.get(LIBRARY_HEADER))
         return None
 
     # The message is deliberately coarse and never carries the token — see
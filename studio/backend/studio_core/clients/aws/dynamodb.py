@@ -53,7 +53,13 @@ def client():
         _client = boto3.client(
             "dynamodb",
             region_name=config.aws_region(),
-            config=Config(retries={"max_attempts": 3}),
+            # A subtree write keeps `transaction_workers` transactions in
+            # flight from one process, and a pool smaller than that makes the
+            # extra threads queue for a socket instead of for DynamoDB.
+            config=Config(
+                retries={"max_attempts": 3},
+                max_pool_connections=max(10, config.transaction_workers()),
+            ),
         )
     return _client
 
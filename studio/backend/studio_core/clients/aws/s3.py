@@ -24,8 +24,13 @@ What is left is bytes, and four things bound them:
 * **`copy` and `put_text` cannot bring an object in from outside.** A copy's
   source is already in this bucket, and `put_text` overwrites a file the caller
   has already proved is a text node with bytes behind it.
+* **`put_derived` writes only under `DERIVED_PREFIX`**, a key it composes from
+  a node's `blob_key` itself, and only bytes this service rendered from that
+  blob.
 * **`presign_put` is the one exception, and it is bounded at signing time** —
   one key, one exact length, one content type, once. See its docstring.
+  `presign_part` is the same exception for an object too large for one PUT:
+  one part of one upload into one key, at one exact length.
 * Deletes are explicit and bounded (`config.max_bulk_keys`,
   `config.max_folder_objects`); nothing in this service deletes by wildcard.
 
@@ -38,6 +43,10 @@ refuses a node with no blob.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
 
 import boto3
 from botocore.config import Config
@@ -48,8 +57,24 @@ from studio_core.errors import NotFoundError, UpstreamError
 
 logger = logging.getLogger(__name__)
 
+# A cached GET URL is handed out again only while it has at least this long
+# left to run. Two minutes is longer than any page takes to draw its tiles from
+# the URLs it was given, and a URL that dies anyway is re-signed through
+# `/api/asset` the way one always has been.
+SIGNED_URL_MARGIN_SECONDS = 120
+
+# Where `services.derived` keeps its reduced copies: `derived/<blob_key>/<width>.jpg`.
+# Under no prefix `studio catalog gc` collects by reference, and collected by
+# it instead once no row names the blob a copy was made of.
+DERIVED_PREFIX = "derived/"
+
 _client = None
 
+# (bucket, key, content-disposition) -> (url, monotonic time it expires), in
+# least-recently-used order. See `presign_expiring`.
+_signed: OrderedDict[tuple[str, str, str | None], tuple[str, float]] = OrderedDict()
+_signed_lock = threading.Lock()
+
 
 def client():
     """Lazily built, module-cached S3 client.
@@ -69,9 +94,11 @@ def client():
 
 
 def reset_client():
-    """Drop the cached client. Tests use this between moto mocks."""
+    """Drop the cached client, and every URL it signed. Tests use this between moto mocks."""
     global _client
     _client = None
+    with _signed_lock:
+        _signed.clear()
 
 
 def copy(source_key: str, dest_key: str) -> None:
@@ -80,10 +107,10 @@ def copy(source_key: str, dest_key: str) -> None:
     **It used to be the first half of a rename**, and of a move, and of a folder
     rename — one call per key, followed by a delete. Those are transactions now
     (#316), so the one caller left is `services.manage.copy_objects`, which is
-    the only operation in the service that is *supposed* to duplicate bytes. Each
-    copy gets its own object rather than a second row on one key: `delete_node`
-    does not ask whether a blob is still referenced, so a shared key would mean
-    deleting one copy destroys the other's. Copy-on-write is #334.
+    the only operation in the service that is *supposed* to duplicate bytes —
+    and it does so only for a source whose blob the catalog has no `BLOB#`
+    count for. A counted blob is shared by its copies instead, and this call is
+    never made.
 
     Server-side, so a 200 MB video never travels through the Lambda.
     """
@@ -148,11 +175,73 @@ def put_text(key: str, body: bytes, content_type: str) -> None:
         raise UpstreamError("Could not save the file") from exc
 
 
-def presign(key: str, *, disposition: str = "inline", filename: str | None = None) -> str:
-    """A presigned GET URL for one object.
+def derived_key(blob_key: str, width: int) -> str:
+    """Where the `width`-wide reduced copy of a blob is kept: its key, and its width."""
+    return f"{DERIVED_PREFIX}{blob_key}/{width}.jpg"
+
+
+def put_derived(blob_key: str, width: int, body: bytes, *, source_size: int) -> None:
+    """Store a reduced copy of a blob, marked with the size of the bytes it was made of.
+
+    The mark is what `derived_source_size` reads back: a blob confirmed again
+    under the same key is new bytes at the old address, and a copy made of the
+    old ones must not be taken for one made of these.
+    """
+    key = derived_key(blob_key, width)
+    try:
+        client().put_object(
+            Bucket=config.media_bucket(),
+            Key=key,
+            Body=body,
+            ContentType="image/jpeg",
+            Metadata={"source-size": str(source_size)},
+        )
+    except ClientError as exc:
+        logger.warning("PutObject failed for %s: %s", key, exc)
+        raise UpstreamError("Could not store a preview") from exc
+
 
-    Purely local signing — no network call — so presigning every file in a
-    listing costs nothing.
+def derived_source_size(blob_key: str, width: int) -> int | None:
+    """The source size a stored copy was made from, or `None` when there is none."""
+    try:
+        metadata = head(derived_key(blob_key, width))
+    except NotFoundError:
+        return None
+    size = metadata.get("Metadata", {}).get("source-size")
+    return int(size) if size and size.isdigit() else None
+
+
+def presign(
+    key: str, *, disposition: str = "inline", filename: str | None = None, fresh: bool = False
+) -> str:
+    """A presigned GET URL for one object. `presign_expiring` without the expiry."""
+    return presign_expiring(key, disposition=disposition, filename=filename, fresh=fresh)[0]
+
+
+def presign_expiring(
+    key: str, *, disposition: str = "inline", filename: str | None = None, fresh: bool = False
+) -> tuple[str, int]:
+    """A presigned GET URL for one object, and how many seconds it has left.
+
+    Purely local signing — no network call — but not free: a listing of a few
+    hundred files is a few hundred HMAC chains, and a grid that is scrolled,
+    polled or reopened asked for the same few hundred again seconds later. So a
+    URL signed here is **kept and handed out again** until it is within
+    `SIGNED_URL_MARGIN_SECONDS` of expiring, up to `config.presign_cache_entries`
+    of them, per process. The expiry returned is what the URL actually has
+    left, which for a reused one is less than `config.presign_ttl_seconds`.
+
+    The cache is keyed by the object *and* the `response-content-disposition`
+    signed into the URL, since an attachment download of a file and an inline
+    tile of it are two different URLs; the filename is part of that header, so
+    a rename is a different entry rather than a stale one.
+
+    **`fresh=True` signs regardless and replaces what was cached.** It is for
+    the routes a client calls *because* a URL stopped working — `/api/asset` and
+    `download-url`. A URL dies with the credentials that signed it, not only at
+    its `ExpiresIn`, and handing back the cached one there would hand back the
+    URL that had just failed. Replacing the entry means the next listing hands
+    out the new one too.
 
     `disposition="attachment"` is what makes a download actually download: the
     URL points at S3, so it is cross-origin to the app, and a cross-origin
@@ -163,15 +252,32 @@ def presign(key: str, *, disposition: str = "inline", filename: str | None = Non
     if disposition == "attachment":
         name = (filename or key.rsplit("/", 1)[-1]).replace('"', "")
         params["ResponseContentDisposition"] = f'attachment; filename="{name}"'
+    cached_as = (params["Bucket"], key, params.get("ResponseContentDisposition"))
+
+    now = time.monotonic()
+    if not fresh:
+        with _signed_lock:
+            hit = _signed.get(cached_as)
+            if hit is not None and hit[1] - now > SIGNED_URL_MARGIN_SECONDS:
+                _signed.move_to_end(cached_as)
+                return hit[0], int(hit[1] - now)
 
+    ttl = config.presign_ttl_seconds()
     try:
-        return client().generate_presigned_url(
-            "get_object", Params=params, ExpiresIn=config.presign_ttl_seconds()
-        )
+        url = client().generate_presigned_url("get_object", Params=params, ExpiresIn=ttl)
     except ClientError as exc:
         logger.warning("Presign failed for %s: %s", key, exc)
         raise UpstreamError("Could not sign a media URL") from exc
 
+    entries = config.presign_cache_entries()
+    if entries:
+        with _signed_lock:
+            _signed[cached_as] = (url, now + ttl)
+            _signed.move_to_end(cached_as)
+            while len(_signed) > entries:
+                _signed.popitem(last=False)
+    return url, ttl
+
 
 def presign_put(key: str, *, content_length: int, content_type: str) -> str:
     """A presigned PUT for exactly one key, length and content type.
@@ -186,8 +292,9 @@ def presign_put(key: str, *, content_length: int, content_type: str) -> str:
     length is not merely bounded, it is fixed at signing time.
 
     The key is likewise signed, so a URL issued for one object cannot be
-    redirected at another. There is no wildcard and no multipart grant; the
-    caller gets one object, one size, one type, once.
+    redirected at another. There is no wildcard; the caller gets one object,
+    one size, one type, once. An object past a single PUT goes through
+    `presign_part` instead.
 
     Local signing, no network call — the same as `presign`.
     """
@@ -207,6 +314,96 @@ def presign_put(key: str, *, content_length: int, content_type: str) -> str:
         raise UpstreamError("Could not sign an upload URL") from exc
 
 
+def create_multipart(key: str, *, content_type: str) -> str:
+    """Open a multipart upload into one key, and return its upload id."""
+    try:
+        response = client().create_multipart_upload(
+            Bucket=config.media_bucket(), Key=key, ContentType=content_type
+        )
+    except ClientError as exc:
+        logger.warning("CreateMultipartUpload failed for %s: %s", key, exc)
+        raise UpstreamError("Could not start the upload") from exc
+    return response["UploadId"]
+
+
+def presign_part(key: str, upload_id: str, part_number: int, *, content_length: int) -> str:
+    """A presigned PUT for one part of one multipart upload.
+
+    Bound the way `presign_put` is: the key, the upload, the part number and
+    the exact length are all signed, so a URL for part 3 writes part 3 of this
+    upload at this length or nothing. Local signing, no network call.
+    """
+    try:
+        return client().generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": config.media_bucket(),
+                "Key": key,
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+                "ContentLength": content_length,
+            },
+            ExpiresIn=config.upload_ttl_seconds(),
+        )
+    except ClientError as exc:
+        logger.warning("Presign part failed for %s: %s", key, exc)
+        raise UpstreamError("Could not sign an upload URL") from exc
+
+
+def list_parts(key: str, upload_id: str) -> list[dict]:
+    """Every part of an upload S3 holds, as `{number, etag, size}`, in part order.
+
+    Raises `NotFoundError` for an upload S3 no longer knows — completed,
+    aborted, or expired by the bucket's lifecycle rule.
+    """
+    parts = []
+    try:
+        for page in client().get_paginator("list_parts").paginate(
+            Bucket=config.media_bucket(), Key=key, UploadId=upload_id
+        ):
+            parts.extend(
+                {"number": part["PartNumber"], "etag": part["ETag"], "size": part["Size"]}
+                for part in page.get("Parts", [])
+            )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") == "NoSuchUpload":
+            raise NotFoundError(upload_id) from exc
+        logger.warning("ListParts failed for %s: %s", key, exc)
+        raise UpstreamError("Could not read the upload") from exc
+    return parts
+
+
+def complete_multipart(key: str, upload_id: str, parts: list[dict]) -> None:
+    """Join `parts`, as `list_parts` returned them, into the object at `key`."""
+    try:
+        client().complete_multipart_upload(
+            Bucket=config.media_bucket(),
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [{"PartNumber": part["number"], "ETag": part["etag"]} for part in parts]
+            },
+        )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") == "NoSuchUpload":
+            raise NotFoundError(upload_id) from exc
+        logger.warning("CompleteMultipartUpload failed for %s: %s", key, exc)
+        raise UpstreamError("Could not finish the upload") from exc
+
+
+def abort_multipart(key: str, upload_id: str) -> None:
+    """Throw away an upload's parts. One S3 no longer knows is already gone."""
+    try:
+        client().abort_multipart_upload(
+            Bucket=config.media_bucket(), Key=key, UploadId=upload_id
+        )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") == "NoSuchUpload":
+            return
+        logger.warning("AbortMultipartUpload failed for %s: %s", key, exc)
+        raise UpstreamError("Could not abandon the upload") from exc
+
+
 def head(key: str) -> dict:
     try:
         return client().head_object(Bucket=config.media_bucket(), Key=key)
@@ -228,3 +425,21 @@ def get_body(key: str, max_bytes: int) -> bytes:
         raise UpstreamError("Could not read the object") from exc
 
     return response["Body"].read(max_bytes)
+
+
+def stream(key: str, chunk_bytes: int) -> tuple[int, Iterator[bytes]]:
+    """An object's length, and its bytes as they arrive, `chunk_bytes` at a time.
+
+    The length is `GetObject`'s own, so a caller that writes it ahead of the
+    bytes — `services.archive` does, into a tar header — promises exactly what
+    follows. Nothing past one chunk is held.
+    """
+    try:
+        response = client().get_object(Bucket=config.media_bucket(), Key=key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            raise NotFoundError(key) from exc
+        logger.warning("GetObject failed for %s: %s", key, exc)
+        raise UpstreamError("Could not read the object") from exc
+
+    return response["ContentLength"], response["Body"].iter_chunks(chunk_bytes)
@@ -0,0 +1,48 @@
+"""Thin boto3 wrapper over the job queue.
+
+One operation, because the API only ever posts to the queue: the worker Lambda
+is handed its messages by the event source mapping and never receives them
+itself. The body is JSON so a message is readable in the console when a job
+needs looking at.
+"""
+
+import json
+import logging
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from studio_core import config
+from studio_core.errors import UpstreamError
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+
+def client():
+    """Lazily built, module-cached SQS client, region pinned for the reason S3's is."""
+    global _client
+    if _client is None:
+        _client = boto3.client(
+            "sqs",
+            region_name=config.aws_region(),
+            config=Config(retries={"max_attempts": 3}),
+        )
+    return _client
+
+
+def reset_client():
+    """Drop the cached client. Tests use this between moto mocks."""
+    global _client
+    _client = None
+
+
+def send(queue_url: str, body: dict) -> None:
+    """Post one message."""
+    try:
+        client().send_message(QueueUrl=queue_url, MessageBody=json.dumps(body))
+    except ClientError as exc:
+        logger.warning("SendMessage to %s failed: %s", queue_url, exc)
+        raise UpstreamError("Could not queue the job") from exc
@@ -74,22 +74,68 @@ def presign_ttl_seconds():
     return int(os.environ.get("STUDIO_PRESIGN_TTL_SECONDS", "900"))
 
 
+def presign_cache_entries():
+    """How many signed GET URLs one process keeps to hand out again.
+
+    Signing is local, but it is an HMAC chain and a URL build per object, and a
+    reel or a folder of a few hundred stills paid it for every one of them on
+    every request — the same objects, signed again a second after the last time.
+    `clients.aws.s3.presign` keeps what it signed until shortly before it
+    expires; this bounds how many it keeps. `0` turns the cache off, which is
+    what `benchmarks/bench_presign` measures against.
+    """
+    return max(0, int(os.environ.get("STUDIO_PRESIGN_CACHE_ENTRIES", "10000")))
+
+
+def max_presign_nodes():
+    """How many nodes one `POST /api/presign/batch` may ask to have signed.
+
+    The bound on how many records a single request makes the Lambda read and
+    sign, the way `max_resolve_paths` bounds a resolve. Five hundred is a reel
+    page several times over; a client with more sends two requests, and two
+    halves of a batch of signatures are two correct answers.
+    """
+    return int(os.environ.get("STUDIO_MAX_PRESIGN_NODES", "500"))
+
+
 def max_text_bytes():
     """Size cap for the read-only text/JSON viewer endpoint."""
     return int(os.environ.get("STUDIO_MAX_TEXT_BYTES", str(1024 * 1024)))
 
 
 def max_upload_bytes():
-    """The largest body an upload may declare — 5 GiB, S3's single-PUT ceiling.
+    """The largest body a single-PUT upload may declare — 5 GiB, S3's ceiling.
 
     Not a policy number: it is the point past which a single `PutObject` is
-    impossible and multipart would be required, and there is deliberately no
-    multipart grant. Declaring it at signing time means an oversized upload is
-    refused by the signature rather than discovered after the bytes have moved.
+    impossible. Anything larger goes through the multipart routes, which are
+    bounded by `max_multipart_bytes` instead. Declaring it at signing time
+    means an oversized upload is refused by the signature rather than
+    discovered after the bytes have moved.
     """
     return int(os.environ.get("STUDIO_MAX_UPLOAD_BYTES", str(5 * 1024**3)))
 
 
+def max_multipart_bytes():
+    """The largest object a multipart upload may declare — 5 TiB, S3's own ceiling.
+
+    Like `max_upload_bytes`, the storage's limit rather than a policy. A lower
+    number here is how a deployment would make one.
+    """
+    return int(os.environ.get("STUDIO_MAX_MULTIPART_BYTES", str(5 * 1024**4)))
+
+
+def multipart_part_bytes():
+    """How large each part of a multipart upload is, unless the object needs larger.
+
+    64 MiB: a rendered video of a few gigabytes is a few dozen parts, each
+    small enough that a failure costs seconds of re-sending rather than the
+    whole file, and large enough that the per-part request is noise. S3 wants
+    at least 5 MiB for every part but the last and at most 10,000 parts, so an
+    object past 640 GiB gets parts of `size / 10,000` instead.
+    """
+    return int(os.environ.get("STUDIO_MULTIPART_PART_BYTES", str(64 * 1024**2)))
+
+
 def upload_ttl_seconds():
     """How long an upload URL is signed for. Shorter than a read URL.
 
@@ -117,6 +163,18 @@ def max_bulk_keys():
     return int(os.environ.get("STUDIO_MAX_BULK_KEYS", "1000"))
 
 
+def max_resolve_paths():
+    """How many name paths one `POST /api/resolve/batch` may ask about.
+
+    Not a DynamoDB limit — the walk chunks each level into batches of 100 on
+    its own — but the bound on how many keys a single request can make the
+    Lambda hold and read. A thousand is well past any folder the pipeline
+    resolves in one go, and a caller with more can send two requests; unlike a
+    bulk delete, a resolve split in half is two correct answers.
+    """
+    return int(os.environ.get("STUDIO_MAX_RESOLVE_PATHS", "1000"))
+
+
 def max_folder_objects():
     """How many nodes one subtree operation will touch, and now also the reel's.
 
@@ -134,10 +192,115 @@ def max_folder_objects():
     over S3 *objects* — the reel enumerates rows now (#310), so there is one
     number for how much of a subtree this service will hold in memory rather than
     two that had drifted an order of magnitude apart.
+
+    What only *visits* a branch — an archive, the count that decides whether a
+    folder delete is a job — reads `catalog.descendants` and is bounded by
+    nothing here.
     """
     return int(os.environ.get("STUDIO_MAX_FOLDER_OBJECTS", "2000"))
 
 
+def max_archive_bytes():
+    """The most an archive may carry in bytes, or `0` for no cap.
+
+    A Lambda behind API Gateway cannot stream a response: Mangum collects the
+    body and Lambda refuses one past 6 MB, so there the default is a little
+    under that and `services.archive.plan` refuses a folder past it up front.
+    Anywhere else the body streams and the default is no cap at all.
+    """
+    default = str(5 * 1024 * 1024) if in_lambda() else "0"
+    return int(os.environ.get("STUDIO_MAX_ARCHIVE_BYTES", default))
+
+
+def derive_previews():
+    """Whether a listing that meets a media row with no preview asks for one.
+
+    On by default. Off, every tile is the original as it always was, and
+    nothing is rendered; the suite turns it off so a listing under test does
+    not start background work that moves the folder it is listing.
+    """
+    return os.environ.get("STUDIO_DERIVE_PREVIEWS", "1") not in ("", "0")
+
+
+def max_preview_source_bytes():
+    """The largest image `services.derived` will decode to make a preview of.
+
+    A decode holds the whole image, and a worker renders one at a time, so this
+    is the memory a single preview may cost. A larger image keeps its original
+    as its preview. Videos are not bounded by it: ffmpeg reads the frame it
+    wants by range, not the file.
+    """
+    return int(os.environ.get("STUDIO_MAX_PREVIEW_SOURCE_BYTES", str(64 * 1024 * 1024)))
+
+
+def membership_ttl_seconds():
+    """How long a caller's membership rows are reused before being read again.
+
+    Short, because the only writer of a membership is `scripts/add-member.sh`,
+    which runs outside this process and so cannot tell it to forget anything.
+    Whatever this is set to is how long a grant takes to be noticed by a warm
+    container — and, since there is no revoke script yet, how long a revoke
+    would. `0` turns the cache off.
+    """
+    return int(os.environ.get("STUDIO_MEMBERSHIP_TTL_SECONDS", "30"))
+
+
+def node_cache_ttl_seconds():
+    """How long a catalog item read by this process is reused before being read again.
+
+    Shorter than the membership TTL, because far more writes this one: a rename,
+    a move or an upload made through another container cannot tell this one to
+    forget, so this is how long such a write can take to show here — a stale
+    name in a listing, or a freshly confirmed upload still reported as
+    unfinished. Writes made by *this* process are forgotten at once, whatever
+    the value. `0` turns the cache off.
+    """
+    return int(os.environ.get("STUDIO_NODE_CACHE_TTL_SECONDS", "5"))
+
+
+def transaction_workers():
+    """How many `TransactWriteItems` one subtree write keeps in flight at once.
+
+    A move or delete of a large folder is one transaction per fifty nodes, and
+    each is a round trip that mostly waits. Run one after another, a twenty
+    thousand node delete is four hundred of them back to back; this many at a
+    time divides that. Bounded because they all land on one library's
+    partitions, and past a handful the extra ones only come back as throttles
+    and conflicts to retry. `1` is the old sequential behaviour.
+    """
+    return max(1, int(os.environ.get("STUDIO_TRANSACTION_WORKERS", "8")))
+
+
+def job_threshold():
+    """How big a bulk write gets before it is handed to a job instead of run inline.
+
+    Counted in nodes: the files named by a bulk move, copy or delete, or the
+    subtree under a folder delete. Below it the route answers 200 with the
+    result, as it always did; above it, 202 with a job to poll, because a
+    selection that size is a transaction per node and the request's clock —
+    API Gateway gives up at 29 seconds whatever the Lambda's own timeout says —
+    is no longer a safe place to run it.
+    """
+    return int(os.environ.get("STUDIO_JOB_THRESHOLD", "200"))
+
+
+def job_queue_url():
+    """The SQS queue a job is posted to for the worker Lambda, or `None`.
+
+    Unset means the in-process runner, which is what the dev server and the
+    suite use. In a Lambda that runner is not safe — the container is frozen
+    the moment the response is returned, and a thread still working freezes
+    with it — so `services.jobs.available` answers no there, and the bulk
+    routes stay inline until a queue is configured.
+    """
+    return os.environ.get("STUDIO_JOB_QUEUE_URL") or None
+
+
+def in_lambda():
+    """Whether this process is a Lambda container, by the variable Lambda always sets."""
+    return bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
+
+
 def cognito_user_pool_id():
     """The pool whose issuer and signing keys a caller's token is checked against.
 
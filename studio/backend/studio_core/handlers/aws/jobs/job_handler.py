@@ -0,0 +1,31 @@
+"""AWS Lambda entrypoint for the job worker.
+
+The same image as the API, with `CMD` overridden to this handler. It is handed
+SQS messages by an event source mapping, each naming one job, and calls
+`services.jobs.run` on it with a deadline short of the invocation's own timeout
+— so a long job checkpoints and re-queues itself instead of being killed
+between a chunk and its checkpoint.
+
+A message is only deleted when this returns, so an exception leaves it for the
+queue to deliver again. That is safe for the reason `services.jobs` gives:
+every chunk survives being done twice.
+"""
+
+import json
+import logging
+import time
+
+from studio_core.services import jobs
+
+logging.getLogger().setLevel(logging.INFO)
+
+# What is left of the invocation when a run stops taking new chunks: one chunk's
+# worth of transactions, a checkpoint and a `SendMessage`, with room to spare.
+DEADLINE_MARGIN_SECONDS = 30
+
+
+def handler(event, context):
+    for message in event.get("Records", []):
+        job_id = json.loads(message["body"])["job_id"]
+        remaining = context.get_remaining_time_in_millis() / 1000
+        jobs.run(job_id, deadline=time.monotonic() + remaining - DEADLINE_MARGIN_SECONDS)
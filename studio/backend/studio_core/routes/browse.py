@@ -23,6 +23,7 @@ reads shared material, which has no node to address.
 
 from flask import Blueprint, g, jsonify, request
 
+from studio_core.routes.conditional import tagged, unchanged
 from studio_core.services import browse
 
 bp = Blueprint("browse", __name__, url_prefix="/api")
@@ -35,30 +36,33 @@ def health():
 
 @bp.get("/tree")
 def tree():
-    """Immediate contents of one folder."""
-    return jsonify(
-        browse.list_folder(
+    """Immediate contents of one folder; a 304 when `If-None-Match` still names them."""
+    return tagged(
+        *browse.tagged_folder(
             g.library,
             request.args.get("prefix"),
             request.args.get("sort"),
             node_id=request.args.get("node"),
+            unchanged=unchanged,
         )
-    ), 200
+    )
 
 
 @bp.get("/reel")
 def reel():
-    """Images and videos beneath a folder, recursively and paginated."""
-    return jsonify(
-        browse.reel_items(
+    """Images and videos beneath a folder, recursively and paginated; conditional like `/tree`."""
+    return tagged(
+        *browse.tagged_reel(
             g.library,
             request.args.get("prefix"),
             request.args.get("cursor"),
             request.args.get("page_size"),
             request.args.get("sort"),
             node_id=request.args.get("node"),
+            pagination=request.args.get("pagination"),
+            unchanged=unchanged,
         )
-    ), 200
+    )
 
 
 @bp.get("/asset")
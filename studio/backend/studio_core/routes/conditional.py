@@ -0,0 +1,40 @@
+"""Conditional GET for the listing routes: a weak `ETag` out, `If-None-Match` in.
+
+Not a blueprint. `routes/browse.py` and `routes/nodes.py` both list folders, and
+the two halves of a revalidation — what is sent with a 200, and what a 304 is —
+have to agree between them or a client that learned a tag from one route is
+never answered by it.
+
+**Weak, because the body is not byte-for-byte repeatable.** A listing's URLs
+are signed per process and re-signed near expiry, so two 200s for one
+unchanged folder can differ in every `url` while meaning the same listing —
+which is exactly what RFC 9110 says a weak validator is for. `If-None-Match` is
+compared weakly as well, as the RFC requires of it.
+
+**`private, no-cache`**, so a browser keeps the body and asks every time rather
+than answering from its cache unasked: the question is cheap — one consistent
+read of the folder's record — and a listing served without asking is the stale
+grid this exists to prevent. `private` because the body is one member's view of
+one library, and nothing between the browser and the API may share it.
+"""
+
+from flask import Response, jsonify, request
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def unchanged(tag: str) -> bool:
+    """Whether the caller already holds the response this tag names."""
+    return request.if_none_match.contains_weak(tag)
+
+
+def tagged(tag: str, body: dict | list | None) -> tuple[Response, int]:
+    """The 200 carrying `body` and its tag, or the 304 when `body` is `None`.
+
+    `None` is what `services.browse` hands back when `unchanged` said yes, and
+    a 304 carries the tag again, as the RFC asks, and no body.
+    """
+    response = Response(status=304) if body is None else jsonify(body)
+    response.set_etag(tag, weak=True)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response, response.status_code
@@ -0,0 +1,28 @@
+"""Polling a bulk write that became a job.
+
+`routes/manage` answers 202 with a `job` and a `Location` naming this route
+when a bulk move, copy or delete is too large to run inside the request; see
+`services.jobs` for what a job is and who runs it. This is the other half:
+read the job back until its `status` is `done` or `failed`.
+
+**A job in another library is a 404, not a 403.** Unlike a library id, a job id
+is never listed anywhere — the only way to hold one is to have been handed it
+by the 202 — so there is no "you are not a member" to tell anybody, and
+answering 403 would confirm to a stranger that the id they guessed is real.
+"""
+
+from flask import Blueprint, g, jsonify
+
+from studio_core.errors import NotFoundError
+from studio_core.services import catalog, jobs
+
+bp = Blueprint("jobs", __name__, url_prefix="/api")
+
+
+@bp.get("/jobs/<job_id>")
+def get_job(job_id):
+    """One job's progress: `status`, `done` of `total`, and the counts so far."""
+    record = catalog.job(job_id)
+    if record["lib"] != g.library:
+        raise NotFoundError(job_id)
+    return jsonify(jobs.view(record)), 200
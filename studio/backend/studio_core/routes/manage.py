@@ -44,6 +44,12 @@ saving a text file is `PATCH /api/text` rather than the `PUT` you might expect:
 PATCH is already allowed everywhere, PUT is allowed nowhere, and the difference
 between the two verbs here is worth less than a four-file agreement to keep in
 step. Add PUT properly if a future route genuinely wants it.
+
+**The four bulk routes can answer 202.** Past `config.job_threshold` nodes a
+bulk move, copy or delete is handed to `services.jobs` once it has been checked,
+and the response carries a `job` to poll at `GET /api/jobs/<id>` in place of
+the counts. Everything that would have refused the request still refuses it
+here, synchronously; `_answer` is the one place the status is chosen.
 """
 
 from flask import Blueprint, g, jsonify, request
@@ -64,6 +70,13 @@ def _body() -> dict:
     return payload if isinstance(payload, dict) else {}
 
 
+def _answer(result: dict, status: int):
+    """The inline status, or 202 with a `Location` when the work became a job."""
+    if "job" not in result:
+        return jsonify(result), status
+    return jsonify(result), 202, {"Location": f"/api/jobs/{result['job']['job_id']}"}
+
+
 @bp.post("/folder")
 def create_folder():
     """Create an empty folder under a prefix. One row, no objects."""
@@ -101,9 +114,12 @@ def move_objects():
     exists to stay distinct from.
     """
     payload = _body()
-    return jsonify(
-        manage.move_objects(g.library, payload.get("keys"), payload.get("destination"))
-    ), 200
+    return _answer(
+        manage.move_objects(
+            g.library, payload.get("keys"), payload.get("destination"), caller=g.caller_sub
+        ),
+        200,
+    )
 
 
 @bp.post("/folder/move")
@@ -124,9 +140,12 @@ def copy_objects():
     that distinguishes it from the move beside it.
     """
     payload = _body()
-    return jsonify(
-        manage.copy_objects(g.library, payload.get("keys"), payload.get("destination"))
-    ), 201
+    return _answer(
+        manage.copy_objects(
+            g.library, payload.get("keys"), payload.get("destination"), caller=g.caller_sub
+        ),
+        201,
+    )
 
 
 @bp.patch("/text")
@@ -147,11 +166,11 @@ def delete_objects():
     `?key=` parameters — runs into URL length limits on exactly the case this
     exists for, which is a grid selection of a few hundred files.
     """
-    return jsonify(manage.delete_objects(g.library, _body().get("keys"))), 200
+    return _answer(manage.delete_objects(g.library, _body().get("keys"), caller=g.caller_sub), 200)
 
 
 @bp.delete("/folder")
 def delete_folder():
     """Delete a folder and everything beneath it."""
     prefix = _body().get("prefix") or request.args.get("prefix")
-    return jsonify(manage.delete_folder(g.library, prefix)), 200
+    return _answer(manage.delete_folder(g.library, prefix, caller=g.caller_sub), 200)
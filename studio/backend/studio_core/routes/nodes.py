@@ -60,6 +60,12 @@ record is what names the library. Deliberate, and cheap: an id nobody was given
 cannot be guessed, so the difference between "no such node" and "not yours" is
 information an attacker has no way to reach.
 
+`POST /api/resolve/batch` is the read route that takes a body, and it is a
+read: it walks many name paths at once for a caller that would otherwise call
+`/api/resolve` in a loop, and it answers under the same three rules.
+`POST /api/presign/batch` is the other, and the same argument: it is
+`download-url` for many ids at once.
+
 ## What comes from `before_request` (#351)
 
 `g.caller_sub` and `g.library` are set on every request before any route here
@@ -69,21 +75,23 @@ a library from — reads `g.library`, which is the hook's three cases resolved:
 the `X-Studio-Library` header, a sole membership, or a refusal. Having a second
 description of that rule here is how the two would drift apart.
 
-`_memberships` is still a read per request, because the hook keeps only the
-library it resolved and not the rows it resolved it from. That is one query on
-one partition (`USER#<sub>`), and it is the check the *node* is authorised
-against — `g.library` answers a different question, and is not a substitute for
-it.
+`_memberships` reads `g.memberships` — the rows the hook resolved the library
+from — rather than querying `USER#<sub>` again. It used to be a second read per
+request, because the hook kept only the library and not the rows. The rows are
+still the check the *node* is authorised against: `g.library` answers a
+different question, and is not a substitute for them.
 """
 
 import logging
+import urllib.parse
 
-from flask import Blueprint, g, jsonify, request
+from flask import Blueprint, Response, g, jsonify, request
 
 from studio_core import config
 from studio_core.clients.aws import s3
-from studio_core.errors import ForbiddenError, NotFoundError, ValidationError
-from studio_core.services import catalog
+from studio_core.errors import ConflictError, ForbiddenError, NotFoundError, ValidationError
+from studio_core.routes.conditional import tagged, unchanged
+from studio_core.services import archive, catalog, derived
 
 logger = logging.getLogger(__name__)
 
@@ -135,11 +143,17 @@ def _memberships() -> dict[str, str]:
     memberships` reads the same either way. One read answers both questions, and
     a second helper that queried again for the role would be a second
     description of who the caller is.
+
+    **The rows are `before_request`'s**, not a fresh query: the hook already
+    read them to resolve `g.library`, and reading them again here was the
+    second membership query every node route used to pay. The fallback read is
+    for a path the hook left unscoped — none of this file's routes are, but a
+    helper that assumed so would fail with `TypeError` on the day one was.
     """
-    return {
-        membership["lib"]: membership["role"]
-        for membership in catalog.libraries_for(g.caller_sub)
-    }
+    rows = g.get("memberships")
+    if rows is None:
+        rows = g.memberships = catalog.libraries_for(g.caller_sub)
+    return {membership["lib"]: membership["role"] for membership in rows}
 
 
 def _member_of(lib: str, memberships: dict[str, str]) -> None:
@@ -170,19 +184,23 @@ def _owner_of(lib: str, memberships: dict[str, str]) -> None:
 def list_nodes():
     """The children of one folder, name-ascending.
 
-    **One query plus a batched read, and the batch is the interesting part.**
-    `catalog.children` reads the by-parent items, whose projection is
-    `node_id, lib, kind, path, created_at` — no `size`, no `content_type`. Those
-    are fetched with `catalog.records`, which is `ceil(n / 100)` more round
-    trips. Widening the projection instead would make this one query and put a
-    mutable copy of every file's metadata on a second item, which every rename
-    and every text edit would then have to keep in step (#309).
+    **One query.** `catalog.listing` reads the by-parent items, which carry
+    `size`, `content_type` and `updated_at` beside `kind` and `created_at`, so
+    nothing is fetched after it. This used to be that query plus
+    `ceil(n / 100)` batched reads of the records (#309), for want of those
+    fields; the catalog now keeps them in step on the by-parent item instead.
 
     A bare array, like `/api/libraries`, and folders and files interleaved
     rather than split: `kind` already distinguishes them, and a client that wants
     folders first is sorting a list it has, not asking for a different shape. The
     order is free — DynamoDB returns a partition sorted by sort key, and the sort
     key is the name.
+
+    **Conditional.** The tag is the parent's id and its `rev`, which the read
+    below already fetched, so a caller sending it back in `If-None-Match` gets a
+    304 for the price of that read and no query at all. Nothing else shapes a
+    bare array of records — no URL, no name path — so, unlike `/api/tree`'s, it
+    needs nothing more.
     """
     parent_id = request.args.get("parent")
     if not parent_id:
@@ -197,26 +215,10 @@ def list_nodes():
     parent = catalog.node(parent_id)
     _member_of(parent["lib"], memberships)
 
-    entries = catalog.children(parent_id)
-    full = catalog.records([entry["node_id"] for entry in entries])
-
-    views = []
-    for entry in entries:
-        record = full.get(entry["node_id"])
-        if record is None:
-            # A folder listing a child whose record is not there. Reported from
-            # the projection rather than dropped, for the reason
-            # `routes/libraries.py` gives about a dangling membership: a node
-            # hidden here is a node that still exists and can still be opened by
-            # id. Logged because every write in `services.catalog` is a
-            # transaction over both halves, so one half alone means a row was
-            # written by hand.
-            logger.warning(
-                "Folder %s lists a child with no record: %s", parent_id, entry["node_id"]
-            )
-            record = entry
-        views.append(_view(record))
-    return jsonify(views), 200
+    tag = f"{parent_id}.{catalog.listing_rev(parent)}"
+    if unchanged(tag):
+        return tagged(tag, None)
+    return tagged(tag, [_view(record) for record in catalog.listing(parent_id)])
 
 
 @bp.get("/nodes/<node_id>")
@@ -275,6 +277,82 @@ def resolve():
     return jsonify(_view(catalog.node(node_id))), 200
 
 
+@bp.post("/resolve/batch")
+def resolve_batch():
+    """Many name paths at once, walked together a level at a time.
+
+    **`/api/resolve` costs a `GetItem` per segment, and a caller with many
+    paths paid that per path.** Twenty files in one run folder, four segments
+    deep, was eighty reads that asked the same three questions twenty times
+    over. Here the paths are split into segments and the walk is over their
+    common prefixes — a trie, held as a dict from prefix to node id — so each
+    distinct prefix is asked about once, and every prefix of one length is
+    asked about in one `catalog.children_named`. N sibling paths of depth d
+    cost d batched reads plus one `catalog.records` for the answers, not
+    N × d `GetItem`s.
+
+    Same rules as `/api/resolve`, by construction rather than by copy: the walk
+    starts at the root of `g.library`, every step is a child of the step
+    before, and so nothing is membership-checked again; empty segments are
+    ignored; an empty path is the root; and the answer is the full record
+    through `_view`.
+
+    **A missing path does not fail the batch.** One request answering for many
+    paths has to be able to say "this one is not there" without discarding the
+    rest, so each answer is `{"path", "node"}` and a miss is `node: null` with
+    `missing` naming the walk up to the first absent segment — the text the
+    single route's 404 carries. Answers come back in the order asked, one per
+    path, duplicates included, so a caller can zip them.
+    """
+    paths = _body().get("paths")
+    if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        raise ValidationError("paths must be a list of strings")
+    if len(paths) > config.max_resolve_paths():
+        raise ValidationError(
+            f"A batch may resolve at most {config.max_resolve_paths()} paths; "
+            f"this one names {len(paths)}."
+        )
+
+    segments = {path: tuple(part for part in path.split("/") if part) for path in paths}
+    # Prefix of segments -> the node it names. The empty prefix is the root, and
+    # a prefix that is absent after its level was asked is a miss.
+    resolved: dict[tuple[str, ...], str] = {(): catalog.library(g.library)["root_node"]}
+
+    deepest = max((len(parts) for parts in segments.values()), default=0)
+    for level in range(1, deepest + 1):
+        asked = {
+            parts[:level]
+            for parts in segments.values()
+            if len(parts) >= level and parts[: level - 1] in resolved
+        }
+        if not asked:
+            break
+        found = catalog.children_named([(resolved[prefix[:-1]], prefix[-1]) for prefix in asked])
+        for prefix in asked:
+            entry = found.get((resolved[prefix[:-1]], prefix[-1]))
+            if entry is not None:
+                resolved[prefix] = entry["node_id"]
+
+    full = catalog.records([resolved[parts] for parts in segments.values() if parts in resolved])
+
+    answers = []
+    for path in paths:
+        parts = segments[path]
+        record = full.get(resolved[parts]) if parts in resolved else None
+        if record is not None:
+            answers.append({"path": path, "node": _view(record)})
+            continue
+        # The shortest prefix that did not resolve; the whole path when every
+        # segment did and only the record was gone, which `/api/resolve` would
+        # also have answered with a 404.
+        reached = next(
+            (depth for depth in range(1, len(parts) + 1) if parts[:depth] not in resolved),
+            len(parts),
+        )
+        answers.append({"path": path, "node": None, "missing": "/".join(parts[:reached])})
+    return jsonify(answers), 200
+
+
 def _body() -> dict:
     """The JSON body, or an empty dict.
 
@@ -454,12 +532,11 @@ def delete_node(node_id: str):
     broken tile in the grid, which is the failure a user sees. So if the second
     half fails, what is left is the harmless kind of inconsistent.
 
-    **This is safe only while no two rows share a `blob_key`.**
-    `catalog.delete_node` says so itself and declines to answer whether a blob
-    is still referenced — there is no index on `blob_key` and the question is
-    not cheap. Nothing creates a shared key today: copy-on-write copies are
-    #334, in the Deferred milestone. **#334 has to revisit this**, because the
-    day a copy shares a key, deleting one row here deletes the other's bytes.
+    **Only the blobs nothing names any more are deleted.** A copy made through
+    `manage.copy_objects` shares its source's key, and `catalog.delete_node`
+    counts those references in the same transactions that remove the rows, so
+    the `blob_keys` it hands back are the ones this delete took the last
+    reference to. Deleting one of two copies leaves the bytes for the other.
 
     The subtree bound is `catalog.subtree`'s and it refuses rather than
     truncates — a half-finished delete reporting success is precisely what a
@@ -493,7 +570,9 @@ def download_url(node_id: str):
     outlives them by nothing. So `list_nodes` deliberately hands out no URLs at
     all, and a client re-signs here when one stops working — the behaviour
     `config.presign_ttl_seconds` documents and the frontend already relies on
-    for `/api/asset`.
+    for `/api/asset`. "Fresh" is literal: `s3.presign_expiring` keeps what it
+    signed for listings, and this passes `fresh=True` so a client re-signing a
+    URL that died is not handed the same one back.
 
     `disposition=attachment` is what makes a download download. The URL points at
     S3, so it is cross-origin to the app, and a cross-origin `<a download>` is
@@ -517,27 +596,195 @@ def download_url(node_id: str):
     if disposition not in ("inline", "attachment"):
         raise ValidationError("disposition must be 'inline' or 'attachment'")
 
-    # `head` before signing, so a record pointing at a blob that is not there is
-    # a clean 404 here rather than a URL that only fails once the browser follows
-    # it. The same order `browse.asset_url` uses, for the same reason.
-    metadata = s3.head(blob_key)
-    url = s3.presign(blob_key, disposition=disposition, filename=record["name"])
+    # Off the record when it carries both, and from a `head` only when it does
+    # not — `browse.asset_url`'s rule, for its reason: a row has `size` because
+    # `confirm-upload` read it from this same object, or a write put those
+    # bytes itself, so the HEAD that used to run here on every call was asking
+    # S3 a question the row had already answered. A placeholder still gets it,
+    # and with it the clean 404 rather than a URL that fails in the browser.
+    if "size" in record and record.get("content_type"):
+        size, content_type = record["size"], record["content_type"]
+    else:
+        metadata = s3.head(blob_key)
+        size, content_type = metadata.get("ContentLength", 0), metadata.get("ContentType")
+    url, expires_in = s3.presign_expiring(
+        blob_key, disposition=disposition, filename=record["name"], fresh=True
+    )
 
     return jsonify(
         {
             "id": node_id,
             "name": record["name"],
             "url": url,
-            "expires_in": config.presign_ttl_seconds(),
-            # From S3 rather than from the record: the object is the thing being
-            # fetched, and a row whose `size` drifted from the bytes would send a
-            # client a number the download then contradicts.
-            "size": metadata.get("ContentLength", 0),
-            "content_type": metadata.get("ContentType"),
+            "expires_in": expires_in,
+            "size": size,
+            "content_type": content_type,
         }
     ), 200
 
 
+@bp.get("/nodes/<node_id>/archive")
+def archive_node(node_id: str):
+    """A folder and everything beneath it as one tar stream, manifest last.
+
+    **Decided before it answers, streamed after.** `archive.plan` raises
+    anything that would refuse the request — a file, an archive past what this
+    deployment can carry — while there is still a status to send. There is no
+    cap on how many files; the branch is read as the stream reaches it. Past that point the body is
+    written as S3 hands the bytes over, one chunk held at a time; see
+    `services/archive.py`.
+
+    Named for the folder, with the UTF-8 form beside a plain one, because a
+    header is Latin-1 and a folder name is whatever a person typed.
+    """
+    memberships = _memberships()
+    record = catalog.node(node_id)
+    _member_of(record["lib"], memberships)
+
+    planned = archive.plan(record)
+    filename = f"{record['name']}.tar"
+    plain = filename.encode("ascii", "replace").decode().replace('"', "")
+    return Response(
+        archive.stream(planned),
+        status=200,
+        mimetype="application/x-tar",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{plain}"; '
+                f"filename*=UTF-8''{urllib.parse.quote(filename)}"
+            )
+        },
+    )
+
+
+DESCENDANTS_PAGE = 1000
+
+
+@bp.get("/nodes/<node_id>/descendants")
+def list_descendants(node_id: str):
+    """Everything beneath a folder, flattened, a page at a time.
+
+    **`GET /api/nodes` is a folder; a walk of a project was a request per
+    folder.** The pipeline's `walk_files` descended one listing at a time, so a
+    project of four hundred runs was four hundred round trips made one after
+    another. This is one `by-path` read per page — `catalog.descendants_page`
+    — and the page holds every kind of node at every depth, parents before
+    what they hold.
+
+    Each entry is `_view` plus `path`: the **name** path from this folder down,
+    `run-1/output/a.png`. Not the catalog's `path`, which is ancestor ids and
+    stays behind `_view` for the reason `VIEW_FIELDS` gives. A page names its
+    rows from the folders it holds; a row whose folders came on an earlier page
+    has them looked up, a hundred to a read. One whose folder has gone since —
+    moved out between two pages — is left out, as an archive leaves it out.
+
+    `{"nodes": [...], "next_cursor": ...}` — `next_cursor` back as `cursor`
+    for the next page, and `None` at the end, as `/api/reel` says it. A page
+    ends between folders (`descendants_page` says why), so `page_size` is where
+    it may stop rather than what it holds.
+    """
+    memberships = _memberships()
+    record = catalog.node(node_id)
+    _member_of(record["lib"], memberships)
+    if record["kind"] != catalog.KIND_FOLDER:
+        raise ValidationError("only a folder has descendants")
+
+    raw = request.args.get("page_size")
+    try:
+        want = int(raw) if raw not in (None, "") else DESCENDANTS_PAGE
+    except ValueError:
+        raise ValidationError("page_size must be an integer") from None
+    if want <= 0:
+        raise ValidationError("page_size must be positive")
+
+    branch = catalog.child_path(record)
+    rows, next_cursor = catalog.descendants_page(
+        record["lib"],
+        branch,
+        want=min(want, config.max_folder_objects()),
+        after=request.args.get("cursor") or None,
+    )
+    # Name paths of the folders this page can name, by id: its own folders as
+    # they arrive, and those from earlier pages read once, all together.
+    names = {row["node_id"]: row["name"] for row in rows if row["kind"] == catalog.KIND_FOLDER}
+    ancestry = {row["node_id"]: row["path"][len(branch):].split("/")[:-1] for row in rows}
+    missing = {node for ids in ancestry.values() for node in ids if node not in names}
+    names.update({node: found["name"] for node, found in catalog.records(list(missing)).items()})
+
+    nodes = []
+    for row in rows:
+        folders = ancestry[row["node_id"]]
+        if any(node not in names for node in folders):
+            continue
+        nodes.append({**_view(row), "path": "/".join([*(names[n] for n in folders), row["name"]])})
+    return jsonify({"nodes": nodes, "next_cursor": next_cursor}), 200
+
+
+@bp.post("/presign/batch")
+def presign_batch():
+    """GET URLs for many nodes at once, signed with one client and mostly cached.
+
+    **For a client that would otherwise call `download-url` in a loop** — a
+    grid re-signing the tiles it holds, the pipeline fetching a run's outputs.
+    Each of those calls was a request, a `GetItem`, a `HeadObject` and a
+    signature; here it is one request, one `catalog.records` for all of them,
+    no `HeadObject` at all, and a signature only for what `s3.presign_expiring`
+    has not signed recently.
+
+    **No HEAD, and so a row must have landed to be signed.** A record carries
+    `size` only once `confirm-upload` has read it from the object, or a write put
+    the bytes itself; a row with a `blob_key` and no `size` is a placeholder
+    whose upload may never have arrived, and signing it would hand out the
+    broken tile `browse._unlanded` exists to hide. Such a row, a file row with no
+    blob at all, a folder and an id that names nothing are answered with `url: null` and a `reason` —
+    `"missing"`, `"folder"` or `"not-uploaded"` — and do not fail the batch, for
+    `/api/resolve/batch`'s reason.
+
+    **A node in a library the caller is not in fails the whole batch**, with the
+    403 `download-url` would answer. That is the shared-id case the module
+    docstring describes, and a batch is not a way round the rule it states.
+
+    Ids, not keys: a client never holds a `blob_key` to send. Answers come back
+    one per id, in the order asked, duplicates included. `disposition` is the
+    same `inline` or `attachment` as `download-url` and applies to the whole
+    batch; each answer's `expires_in` is what that URL has left, which for a
+    cached one is less than `config.presign_ttl_seconds`.
+    """
+    body = _body()
+    node_ids = body.get("nodes")
+    if not isinstance(node_ids, list) or not all(isinstance(node_id, str) for node_id in node_ids):
+        raise ValidationError("nodes must be a list of node ids")
+    if len(node_ids) > config.max_presign_nodes():
+        raise ValidationError(
+            f"A batch may sign at most {config.max_presign_nodes()} nodes; "
+            f"this one names {len(node_ids)}."
+        )
+    disposition = body.get("disposition") or "inline"
+    if disposition not in ("inline", "attachment"):
+        raise ValidationError("disposition must be 'inline' or 'attachment'")
+
+    memberships = _memberships()
+    records = catalog.records([node_id for node_id in node_ids if node_id])
+    for record in records.values():
+        _member_of(record["lib"], memberships)
+
+    answers = []
+    for node_id in node_ids:
+        record = records.get(node_id)
+        if record is None:
+            answers.append({"id": node_id, "url": None, "reason": "missing"})
+        elif record["kind"] != catalog.KIND_FILE:
+            answers.append({"id": node_id, "url": None, "reason": "folder"})
+        elif not record.get("blob_key") or "size" not in record:
+            answers.append({"id": node_id, "url": None, "reason": "not-uploaded"})
+        else:
+            url, expires_in = s3.presign_expiring(
+                record["blob_key"], disposition=disposition, filename=record["name"]
+            )
+            answers.append({"id": node_id, "url": url, "expires_in": expires_in})
+    return jsonify(answers), 200
+
+
 @bp.post("/nodes/<node_id>/upload-url")
 def upload_url(node_id: str):
     """Sign a PUT for one node's blob. Call `confirm-upload` once it lands.
@@ -562,9 +809,9 @@ def upload_url(node_id: str):
     another object. The TTL is `config.upload_ttl_seconds`, shorter than a read
     URL's and well under the Lambda credential lifetime.
 
-    **Still no multipart grant.** `max_upload_bytes` is S3's single-PUT ceiling
-    rather than a policy number: past it a single `PutObject` is impossible, and
-    multipart is a separate decision again.
+    **One PUT, so at most `max_upload_bytes`**, S3's single-PUT ceiling rather
+    than a policy number. Past it — and well before it, for anything a failure
+    should not have to resend whole — the multipart routes below are the way in.
 
     The row is not touched here. The node stays a placeholder — a key with no
     object behind it — until `confirm-upload` runs. A client that signs a URL and
@@ -580,7 +827,7 @@ def upload_url(node_id: str):
     if size > config.max_upload_bytes():
         raise ValidationError(
             f"size must be at most {config.max_upload_bytes()} bytes — "
-            "there is no multipart upload"
+            "upload anything larger as a multipart upload"
         )
     if not isinstance(content_type, str) or not content_type:
         raise ValidationError("content_type is required")
@@ -626,6 +873,10 @@ def confirm_upload(node_id: str):
     today; the SPA's uploader deletes the node itself when a PUT fails
     (`frontend/src/apis/upload.ts`), which is why the broken tile is rare rather
     than why it is impossible.
+
+    A confirmed image or video is handed to `services.derived` here rather than
+    left for the first listing to notice, so its preview is usually made before
+    anyone scrolls to it.
     """
     memberships = _memberships()
     record = catalog.node(node_id)
@@ -642,9 +893,216 @@ def confirm_upload(node_id: str):
         size=metadata.get("ContentLength", 0),
         content_type=metadata.get("ContentType"),
     )
+    derived.schedule(record["lib"], [updated])
+    return jsonify(_view(updated)), 200
+
+
+# ──────────────────────────── multipart upload ────────────────────────────
+#
+# `upload-url` signs one PUT, and one PUT is 5 GiB at most and all-or-nothing:
+# a rendered video that fails at 90% is sent again from the first byte. These
+# five routes are the same upload in parts. The client asks for an upload,
+# signs its parts a batch at a time, PUTs them in any order and in parallel,
+# and asks for the object to be completed; a client that died part-way asks for
+# the upload again, is handed the one already open and the parts S3 already
+# holds, and sends only the rest.
+#
+# **The upload is tracked on the node** (`catalog.set_upload`), which is what
+# makes it resumable by anyone who can write the node and not only by the
+# process that opened it. **S3 is the authority on which parts arrived**: every
+# answer lists them from `ListParts`, and `complete` joins what S3 holds rather
+# than ETags a client reports — so nothing here needs the bucket's CORS rule to
+# expose a header, and a client cannot complete an upload with parts it did not
+# send. The bounds are `upload-url`'s, applied per part: the node's own key,
+# one exact length per part, the same short TTL.
+
+# S3's ceiling on parts in one upload, and how many part URLs one request signs.
+MAX_PARTS = 10_000
+MAX_PART_URLS = 100
+
+
+def _writable(node_id: str) -> tuple[dict, str]:
+    """The node and its API blob key, once the caller is known to be a member."""
+    memberships = _memberships()
+    record = catalog.node(node_id)
+    _member_of(record["lib"], memberships)
+    return record, _api_blob_key(record)
+
+
+def _open_upload(record: dict) -> dict:
+    upload = catalog.upload_of(record)
+    if upload is None:
+        raise NotFoundError(f"{record['node_id']} has no upload in flight")
+    return upload
+
+
+def _part_count(upload: dict) -> int:
+    return -(-upload["size"] // upload["part_bytes"])
+
+
+def _part_length(upload: dict, number: int) -> int:
+    """The exact length part `number` must be: `part_bytes`, or what is left."""
+    return min(upload["part_bytes"], upload["size"] - (number - 1) * upload["part_bytes"])
+
+
+def _upload_view(node_id: str, upload: dict, parts: list[dict]) -> dict:
+    """An upload as a client resumes it: its shape, and the parts S3 already holds."""
+    return {
+        "id": node_id,
+        "upload_id": upload["id"],
+        "size": upload["size"],
+        "content_type": upload["content_type"],
+        "part_bytes": upload["part_bytes"],
+        "part_count": _part_count(upload),
+        # The ETag of a single part is the MD5 of its bytes, which is how a
+        # resuming client tells a part it can keep from one of a different file
+        # that happened to be the same size.
+        "parts": [
+            {"number": part["number"], "size": part["size"], "etag": part["etag"].strip('"')}
+            for part in parts
+        ],
+    }
+
+
+@bp.post("/nodes/<node_id>/multipart")
+def start_multipart(node_id: str):
+    """Open a multipart upload into a placeholder's blob, or hand back the open one.
+
+    **Asking again is how an upload resumes.** When the node already has an
+    upload of the same size and type, and S3 still knows it, that upload is the
+    answer — 200, with `parts` listing what arrived — and the client sends what
+    is missing. A different size or type means different bytes, so the open
+    upload is aborted and a new one opened (201); so is an upload S3 has
+    forgotten, aborted by the bucket's lifecycle rule after a week.
+
+    `part_bytes` is `config.multipart_part_bytes`, or larger when the object
+    would otherwise need more than `MAX_PARTS` parts.
+    """
+    body = _body()
+    size = body.get("size")
+    content_type = body.get("content_type")
+    # Positive, where `upload-url` allows 0: an empty object has no parts to
+    # send, and `isinstance(size, bool)` for `upload-url`'s reason.
+    if not isinstance(size, int) or isinstance(size, bool) or size < 1:
+        raise ValidationError("size must be a positive integer")
+    if size > config.max_multipart_bytes():
+        raise ValidationError(f"size must be at most {config.max_multipart_bytes()} bytes")
+    if not isinstance(content_type, str) or not content_type:
+        raise ValidationError("content_type is required")
+
+    record, blob_key = _writable(node_id)
+    upload = catalog.upload_of(record)
+    if upload is not None:
+        if (upload["size"], upload["content_type"]) == (size, content_type):
+            try:
+                parts = s3.list_parts(blob_key, upload["id"])
+            except NotFoundError:
+                parts = None
+            if parts is not None:
+                return jsonify(_upload_view(node_id, upload, parts)), 200
+        s3.abort_multipart(blob_key, upload["id"])
+
+    upload = {
+        "id": s3.create_multipart(blob_key, content_type=content_type),
+        "size": size,
+        "part_bytes": max(config.multipart_part_bytes(), -(-size // MAX_PARTS)),
+        "content_type": content_type,
+    }
+    catalog.set_upload(node_id, blob_key, upload)
+    logger.info("Opened a %d-part upload into %s", _part_count(upload), node_id)
+    return jsonify(_upload_view(node_id, upload, [])), 201
+
+
+@bp.get("/nodes/<node_id>/multipart")
+def get_multipart(node_id: str):
+    """The node's upload in flight and the parts S3 holds of it. 404 when there is none."""
+    record, blob_key = _writable(node_id)
+    upload = _open_upload(record)
+    return jsonify(_upload_view(node_id, upload, s3.list_parts(blob_key, upload["id"]))), 200
+
+
+@bp.post("/nodes/<node_id>/multipart/urls")
+def sign_parts(node_id: str):
+    """Presigned PUTs for the part numbers asked for, up to `MAX_PART_URLS` at once.
+
+    Each URL is signed for its part's exact length — `part_bytes`, or the
+    remainder for the last — and the length is echoed as the one header the
+    PUT must carry, as `upload-url` echoes its two.
+    """
+    numbers = _body().get("parts")
+    if not isinstance(numbers, list) or not numbers:
+        raise ValidationError("parts must be a non-empty list of part numbers")
+    if len(numbers) > MAX_PART_URLS:
+        raise ValidationError(f"at most {MAX_PART_URLS} parts can be signed at once")
+
+    record, blob_key = _writable(node_id)
+    upload = _open_upload(record)
+    count = _part_count(upload)
+    if not all(
+        isinstance(number, int) and not isinstance(number, bool) and 1 <= number <= count
+        for number in numbers
+    ):
+        raise ValidationError(f"part numbers run from 1 to {count}")
+
+    answers = []
+    for number in numbers:
+        length = _part_length(upload, number)
+        answers.append(
+            {
+                "number": number,
+                "url": s3.presign_part(blob_key, upload["id"], number, content_length=length),
+                "headers": {"Content-Length": str(length)},
+            }
+        )
+    return jsonify({"expires_in": config.upload_ttl_seconds(), "parts": answers}), 200
+
+
+@bp.post("/nodes/<node_id>/multipart/complete")
+def complete_multipart(node_id: str):
+    """Join the parts into the object and confirm the node, as `confirm-upload` does.
+
+    **Only when S3 holds every part at its exact length.** A part missing or
+    short is a 400 naming the part numbers still owed, and the upload stays
+    open to be finished. The row is then written from `HeadObject`, exactly as
+    `confirm-upload` writes it, and the upload comes off the node with it.
+    """
+    record, blob_key = _writable(node_id)
+    upload = _open_upload(record)
+    parts = s3.list_parts(blob_key, upload["id"])
+
+    held = {part["number"]: part["size"] for part in parts}
+    owed = [
+        number
+        for number in range(1, _part_count(upload) + 1)
+        if held.get(number) != _part_length(upload, number)
+    ]
+    if owed:
+        shown = ", ".join(str(number) for number in owed[:20])
+        raise ValidationError(f"parts still to send: {shown}{' …' if len(owed) > 20 else ''}")
+
+    s3.complete_multipart(blob_key, upload["id"], parts)
+    metadata = s3.head(blob_key)
+    updated = catalog.set_blob(
+        node_id,
+        blob_key,
+        size=metadata.get("ContentLength", 0),
+        content_type=metadata.get("ContentType"),
+    )
+    derived.schedule(record["lib"], [updated])
+    logger.info("Completed a %d-part upload into %s", len(parts), node_id)
     return jsonify(_view(updated)), 200
 
 
+@bp.delete("/nodes/<node_id>/multipart")
+def abort_multipart(node_id: str):
+    """Abandon the node's upload: its parts go, and the node is a placeholder again."""
+    record, blob_key = _writable(node_id)
+    upload = _open_upload(record)
+    s3.abort_multipart(blob_key, upload["id"])
+    catalog.set_upload(node_id, blob_key, None)
+    return "", 204
+
+
 def _api_blob_key(record: dict) -> str:
     """The key both upload routes work on, or a refusal.
 
@@ -657,12 +1115,20 @@ def _api_blob_key(record: dict) -> str:
     is the entire thing being avoided. A node whose `blob_key` is anything else
     predates the catalog (#309), and overwriting bytes that were written before
     this table existed is not what these routes are for.
+
+    **Nor is a blob another node shares.** A copy points at its source's key,
+    and bytes written through the source's signature would change the copy too
+    — so a node with copies outstanding is refused with a 409 until they are
+    gone. The copies themselves never get this far: their key is their
+    source's, not `blobs/<their id>`.
     """
     if record["kind"] != catalog.KIND_FILE:
         raise ValidationError("only a file can carry a blob")
     blob_key = catalog.blob_key_for(record["node_id"])
     if record.get("blob_key") != blob_key:
         raise ValidationError("this node's blob was not written through the API")
+    if catalog.blob_refs([blob_key]).get(blob_key, 0) > 1:
+        raise ConflictError("this file's bytes are shared with a copy — upload a new file instead")
     return blob_key
 
 
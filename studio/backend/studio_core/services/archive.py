@@ -0,0 +1,215 @@
+"""A folder as one tar stream: every file beneath it, and a manifest at the end.
+
+Exporting a folder used to be the pipeline downloading it file by file —
+`store.download` per node, each a presign and a GET, with the walk done client
+side. `GET /api/nodes/<id>/archive` answers it in one response instead.
+
+## The two halves
+
+**`plan` decides, and raises; `stream` only writes.** Once the first byte of a
+200 has gone out there is no status left to change, so everything that could
+refuse the request — a file where a folder was asked for, an archive larger
+than the deployment can carry — is decided by `plan`, from the catalog alone,
+before the route answers. There is no cap on how many files: the branch is
+read by `catalog.descendants` a page at a time, as the stream reaches it. What `stream` can still meet
+is an object that vanished between the two, and that is skipped and named in
+the manifest rather than ending the archive.
+
+**One part in memory, never an object.** The member header is written from
+the length `GetObject` reports, and the body is copied through in
+`CHUNK_BYTES` pieces as it arrives, so the largest thing this process holds is
+one chunk however large the video behind it. That is why this writes tar blocks
+itself rather than using `tarfile.addfile`: the module copies a member's whole
+body in one call, into whatever file object it was given, and a response
+stream is not a file object it can be given.
+
+**Tar rather than zip** because a tar member is a header and then the bytes,
+with nothing owed afterwards: a zip needs each entry's CRC, and either a
+data descriptor after the bytes or a second pass before them, and its central
+directory is one more thing to hold until the end. The PAX format carries
+UTF-8 names and sizes past 8 GiB, both of which this library has.
+
+## The manifest
+
+`manifest.json`, the last member: the archived folder's id, then `files` —
+`{id, path, size}` for every member written, in archive order — and `skipped`,
+`{id, path, reason}` for each file that has no bytes to send, or `{id, reason}`
+for one moved in under a folder the walk had already passed, which has no
+path in the archive to name. A placeholder
+whose upload never finished is skipped rather than archived empty, for the
+reason `browse.is_abandoned_upload` gives. It is last because only the end of
+the stream knows what made it in.
+
+## What bounds it in a Lambda
+
+Behind API Gateway this does not stream at all: Mangum collects the whole body
+before it answers, and a Lambda response is capped at 6 MB. So
+`config.max_archive_bytes` is a few megabytes there, and an archive past it is
+a 400 that says so. Served by anything
+that streams a WSGI body (the dev server, a container), the cap is off and the
+archive is as large as the folder.
+"""
+
+import json
+import logging
+import tarfile
+import time
+from collections.abc import Iterator
+from datetime import datetime
+
+from studio_core import config
+from studio_core.clients.aws import s3
+from studio_core.errors import NotFoundError, ValidationError
+from studio_core.services import browse, catalog
+
+logger = logging.getLogger(__name__)
+
+# The size of each piece a body is copied through in, and so the most of any
+# one object this process holds at a time. A megabyte keeps the number of
+# yields for a 2 GB video in the thousands rather than the millions.
+CHUNK_BYTES = 1024 * 1024
+
+MANIFEST_NAME = "manifest.json"
+
+_BLOCK = tarfile.BLOCKSIZE
+
+
+def _mtime(record: dict) -> int:
+    """The row's own timestamp as epoch seconds, what a tar header carries."""
+    stamp = record.get("updated_at") or record.get("created_at")
+    return int(datetime.fromisoformat(stamp).timestamp()) if stamp else 0
+
+
+def _header(name: str, *, size: int = 0, mtime: int = 0, folder: bool = False) -> bytes:
+    info = tarfile.TarInfo(name)
+    info.size = size
+    info.mtime = mtime
+    info.type = tarfile.DIRTYPE if folder else tarfile.REGTYPE
+    info.mode = 0o755 if folder else 0o644
+    return info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % _BLOCK)
+
+
+def plan(record: dict) -> dict:
+    """What an archive of this folder will be, or the reason there will be none.
+
+    **Decided without holding the branch.** The rows are read by
+    `catalog.descendants`, which has no cap, so a folder of any number of files
+    can be archived; the only refusal left past "not a folder" is
+    `config.max_archive_bytes`, and only where it is set is the branch read at
+    all here — one pass of `KEY_FIELDS`, summing sizes as they arrive. `stream`
+    reads it again for the records it writes, so a file added between the two
+    is archived and a file deleted between them is skipped, like a vanished
+    object.
+    """
+    if record["kind"] != catalog.KIND_FOLDER:
+        raise ValidationError("only a folder can be archived")
+
+    cap = config.max_archive_bytes()
+    if cap:
+        size = 0
+        for row in catalog.descendants(
+            record["lib"], catalog.child_path(record), keys_only=True
+        ):
+            size += row.get("size", 0) if row["kind"] != catalog.KIND_FOLDER else 0
+            if size > cap:
+                raise ValidationError(
+                    f"this folder holds more than {cap} bytes, more than an archive "
+                    "through this API can carry — archive its folders one at a time"
+                )
+    return {"record": record, "node_id": record["node_id"], "name": record["name"]}
+
+
+def members(planned: dict) -> Iterator[tuple[dict, str | None]]:
+    """Every row beneath the planned folder and the name path it is archived under.
+
+    The archived folder comes first, under its own name, so the archive unpacks
+    into one directory; then everything beneath it in `catalog.descendants`'
+    order, which puts each folder before what it holds. Only folders' names are
+    remembered to build the paths of what is inside them, so what this holds
+    grows with the number of folders, not files. A row whose folder was never
+    met has no path to be archived under, and comes with `None`.
+    """
+    record = planned["record"]
+    names = {record["node_id"]: record["name"]}
+    yield record, record["name"]
+    for row in catalog.descendants(record["lib"], catalog.child_path(record)):
+        parent = names.get(row["parent_id"])
+        if parent is None:
+            # Its folder was not met on the way down: moved in after the walk
+            # passed the place it sorts. Left out, rather than archived under
+            # a path nobody could name — but still yielded, so `stream` can
+            # name it in the manifest. Its name is not remembered, so what it
+            # holds is left out with it.
+            yield row, None
+            continue
+        path = f"{parent}/{row['name']}"
+        if row["kind"] == catalog.KIND_FOLDER:
+            names[row["node_id"]] = path
+        yield row, path
+
+
+def stream(planned: dict) -> Iterator[bytes]:
+    """The tar stream `plan` described, one header or one chunk at a time."""
+    written = 0
+    manifest = {"id": planned["node_id"], "files": [], "skipped": []}
+    for record, path in members(planned):
+        if path is None:
+            if record["kind"] != catalog.KIND_FOLDER:
+                reason = "its folder moved in after the walk passed it"
+                manifest["skipped"].append({"id": record["node_id"], "reason": reason})
+            continue
+        if record["kind"] == catalog.KIND_FOLDER:
+            block = _header(f"{path}/", mtime=_mtime(record), folder=True)
+            written += len(block)
+            yield block
+            continue
+        for block in _member(record, path, manifest):
+            written += len(block)
+            yield block
+
+    body = json.dumps(manifest, indent=2, ensure_ascii=False).encode()
+    ending = [
+        _header(f"{planned['name']}/{MANIFEST_NAME}", size=len(body), mtime=int(time.time())),
+        body,
+        _padding(len(body)),
+        b"\0" * (2 * _BLOCK),
+    ]
+    written += sum(len(block) for block in ending)
+    # Padded out to a whole record, as `tarfile` and GNU tar both write one.
+    ending.append(b"\0" * (-written % tarfile.RECORDSIZE))
+    yield b"".join(ending)
+
+
+def _member(record: dict, path: str, manifest: dict) -> Iterator[bytes]:
+    """One file: its header, its body a chunk at a time, and its padding.
+
+    Nothing is yielded until `GetObject` has answered, so an object that is gone
+    costs the archive nothing but a line in `skipped`.
+    """
+    entry = {"id": record["node_id"], "path": path}
+    if not record.get("blob_key") or browse.is_abandoned_upload(record):
+        manifest["skipped"].append({**entry, "reason": "no bytes were ever uploaded"})
+        return
+    try:
+        size, chunks = s3.stream(record["blob_key"], CHUNK_BYTES)
+    except NotFoundError:
+        logger.warning("Archiving %s: %s has no object", record["node_id"], path)
+        manifest["skipped"].append({**entry, "reason": "the object is gone"})
+        return
+
+    yield _header(path, size=size, mtime=_mtime(record))
+    sent = 0
+    for chunk in chunks:
+        sent += len(chunk)
+        yield chunk
+    if sent != size:
+        # The header has gone out promising `size` bytes; the only honest thing
+        # left is to end the response here rather than let the next header land
+        # inside this member's body.
+        raise RuntimeError(f"{path}: {sent} of {size} bytes arrived")
+    yield _padding(size)
+    manifest["files"].append({**entry, "size": size})
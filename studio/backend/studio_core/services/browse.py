@@ -22,17 +22,27 @@ and no name path that can address it. `keys.clean_key` and the traversal rules
 under it stay alive for that one parameter; #312 expected to take them and
 cannot.
 
+**A listing carries a validator** (`tagged_folder`, `tagged_reel`), sent as a
+weak `ETag` by the routes so a client holding the listing can ask whether it
+still stands. A folder's is its `rev` — a counter the catalog moves on with
+every change to a child — and is asked before a single child is read; a reel's
+is a digest of the rows it enumerated, since no one counter covers a branch.
+`list_folder` and `reel_items` are the same reads without one.
+
 Run metadata (`request.json`, `result.json`, `prompt.json`) is deliberately
 *not* parsed — those files are served as text and the frontend shows them
 read-only, which keeps this service honest when the pipeline changes their shape.
 """
 
+import hashlib
 import logging
+import time
+from collections.abc import Callable
 
 from studio_core import config
 from studio_core.clients.aws import s3
 from studio_core.errors import ForbiddenError, NotFoundError, ValidationError
-from studio_core.services import catalog, keys
+from studio_core.services import catalog, derived, keys
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +57,14 @@ MAX_REEL_PAGE_SIZE = 1000
 SORTS = frozenset({"newest", "oldest", "name", "name_desc"})
 DEFAULT_SORT = "newest"
 
+# How the reel pages. `offset` is the default and the one the SPA uses: it can
+# sort by name and report a total. `keyset` is for a caller that scrolls deep
+# into a large library and needs page twenty to cost what page one does — see
+# `_reel_keyset` for what it gives up to get there.
+PAGINATIONS = frozenset({"offset", "keyset"})
+DEFAULT_PAGINATION = "offset"
+KEYSET_SORTS = frozenset({"newest", "oldest"})
+
 # The epoch, for a row carrying no timestamp at all. Sorting newest-first puts
 # it last, which is where something we know nothing about belongs. Only a row
 # written by hand can reach this — `catalog` stamps every write.
@@ -199,6 +217,34 @@ def _name_path(record: dict) -> str:
 # ───────────────────────── rows as listing entries ─────────────────────────
 
 
+# ─────────────────────────────── validators ───────────────────────────────
+
+
+def _never(_tag: str) -> bool:
+    return False
+
+
+def _validator(*parts) -> str:
+    """An opaque tag for a listing, from everything its body depends on.
+
+    A digest rather than the parts themselves: a name path is user text, and an
+    `ETag` is a quoted string that must not contain a quote.
+    """
+    return hashlib.md5("\x1f".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _signing_window() -> int:
+    """Which `presign_ttl_seconds` slice of time this is.
+
+    Part of every validator, because a listing's body is mostly presigned URLs
+    and a URL dies on a clock the rows know nothing about. Without it a folder
+    nobody touched would validate forever, and a client revalidating a listing
+    for a day would be drawing tiles from URLs that expired hours ago. With it,
+    one body is revalidated for a TTL at most before a fresh one is signed.
+    """
+    return int(time.time() // config.presign_ttl_seconds())
+
+
 def _timestamp(record: dict) -> str:
     """The one date a row reports, and the one every order here sorts on.
 
@@ -210,6 +256,16 @@ def _timestamp(record: dict) -> str:
     return record.get("updated_at") or record.get("created_at") or _UNDATED
 
 
+def _row_version(record: dict) -> str:
+    """What a reel validator takes from one row: everything its entry renders from.
+
+    The date moves with every write to the row, and `preview` is the one write
+    that does not move it — `catalog.set_preview` is not a change a user made,
+    so it leaves `updated_at` alone — and it changes the entry's `preview_url`.
+    """
+    return f"{record['node_id']}@{_timestamp(record)}#{record.get('preview', '')}"
+
+
 def is_abandoned_upload(record: dict) -> bool:
     """A row that names bytes which never arrived — an upload that stopped mid-way.
 
@@ -262,6 +318,12 @@ def _file_entry(record: dict, prefix: str) -> dict:
     `language` are still classified from the extension, because `content_type`
     is what an uploader claimed and the extension is what the browser will
     actually try to decode.
+
+    **`preview_url` is what a tile draws**, on every image and video: the
+    `services.derived` copy once there is one, and the original until then —
+    so a client can switch to it unconditionally and lose nothing while a
+    library is still being filled in. `url` stays the original, for opening,
+    playing and downloading.
     """
     name = record["name"]
     entry = {
@@ -277,6 +339,8 @@ def _file_entry(record: dict, prefix: str) -> dict:
     blob_key = record.get("blob_key")
     if blob_key:
         entry["url"] = s3.presign(blob_key)
+        if entry["kind"] in REEL_KINDS:
+            entry["preview_url"] = derived.url(record) or entry["url"]
     # No `url` at all when there is no blob: a placeholder whose bytes never
     # landed (#294 mints the row before the upload) has nothing to sign for, and
     # a signed URL onto a missing object is a broken tile rather than an absent
@@ -326,34 +390,6 @@ def _sort_records(records: list[dict], sort: str) -> None:
         records.sort(key=_timestamp, reverse=sort == "newest")
 
 
-def _records_for(entries: list[dict]) -> list[dict]:
-    """Full records for a folder's children, in the order they were listed.
-
-    `catalog.children` returns the by-parent projection — `node_id`, `lib`,
-    `kind`, `path`, `created_at` and the name — which has no `size`, no
-    `content_type` and no `blob_key`, so a listing cannot be rendered from it
-    alone. Those come from `catalog.records`: one query plus `ceil(n / 100)`
-    batched reads. Widening the projection instead would make this one query and
-    put a mutable copy of every file's metadata on a second item, which every
-    rename and every text edit would then have to keep in step (#280).
-    """
-    full = catalog.records([entry["node_id"] for entry in entries])
-    records = []
-    for entry in entries:
-        record = full.get(entry["node_id"])
-        if record is None:
-            # A folder listing a child whose record is not there. Reported from
-            # the projection rather than dropped, for the reason
-            # `routes/nodes.list_nodes` gives: a node hidden here is a node that
-            # still exists and can still be opened by id. Logged because every
-            # write in `services.catalog` is a transaction over both halves, so
-            # one half alone means a row was written by hand.
-            logger.warning("Listed child has no record: %s", entry["node_id"])
-            record = entry
-        records.append(record)
-    return records
-
-
 # ───────────────────────────── the endpoints ─────────────────────────────
 
 
@@ -364,20 +400,39 @@ def list_folder(
     *,
     node_id: str | None = None,
 ) -> dict:
-    """Immediate contents of one folder, ready to render.
+    """Immediate contents of one folder, ready to render. `tagged_folder` without the tag."""
+    return tagged_folder(lib, raw_prefix, raw_sort, node_id=node_id)[1]
+
+
+def tagged_folder(
+    lib: str,
+    raw_prefix: str | None = None,
+    raw_sort: str | None = None,
+    *,
+    node_id: str | None = None,
+    unchanged: Callable[[str], bool] = _never,
+) -> tuple[str, dict | None]:
+    """Immediate contents of one folder, ready to render, and its validator.
 
-    **One query and one batched read** (#309), where this used to be a delimited
-    `ListObjectsV2`. Folders and files come back in the same pass distinguished
-    by `kind` — they are the same item type now — and the query returns
-    name-ascending, which is two of the four sorts for free.
+    **One query** (#309), where this used to be a delimited `ListObjectsV2` and
+    then a query and a batched read: `catalog.listing` reads the by-parent items,
+    which carry everything an entry renders. Folders and files come back in the
+    same pass distinguished by `kind` — they are the same item type now — and
+    the query returns name-ascending, which is two of the four sorts for free.
 
     A zero-byte folder marker cannot exist in a catalog, so nothing filters for
     one. That filter, and the "the prefix itself comes back as an object" filter
     beside it, were both artefacts of asking S3 what a folder was.
+
+    **`unchanged` is asked the validator before the children are read**, and a
+    yes returns `(tag, None)` with that query never made — the caller already
+    holds this listing. The tag is the folder's `rev` beside everything else the
+    body is drawn from that a child write does not move: the sort, the name path
+    (a rename of an ancestor changes every `key` here and touches no child of
+    this folder), and the signing window.
     """
     sort = clean_sort(raw_sort)
     folder = _node_at(lib, raw_prefix, node_id)
-    records = _records_for(catalog.children(folder["node_id"]))
 
     # **The prefix is read back off the crumbs, never echoed from the request.**
     # Under `?node=` there was no path to echo, and under `?prefix=` the crumbs
@@ -386,6 +441,13 @@ def list_folder(
     breadcrumbs = _breadcrumbs(folder)
     prefix = breadcrumbs[-1]["prefix"]
 
+    tag = _validator(
+        "tree", folder["node_id"], catalog.listing_rev(folder), sort, prefix, _signing_window()
+    )
+    if unchanged(tag):
+        return tag, None
+    records = catalog.listing(folder["node_id"])
+
     folders = [record for record in records if record["kind"] == catalog.KIND_FOLDER]
     files = [
         record
@@ -396,7 +458,8 @@ def list_folder(
     _sort_records(files, sort)
 
     entries = [_file_entry(record, prefix) for record in files]
-    return {
+    derived.schedule(lib, files)
+    return tag, {
         "prefix": prefix,
         "sort": sort,
         "breadcrumbs": breadcrumbs,
@@ -418,8 +481,26 @@ def reel_items(
     raw_sort: str | None = None,
     *,
     node_id: str | None = None,
+    pagination: str | None = None,
 ) -> dict:
-    """Every image and video beneath a folder, recursively, one page at a time.
+    """One reel page. `tagged_reel` without the tag."""
+    return tagged_reel(
+        lib, raw_prefix, cursor, page_size, raw_sort, node_id=node_id, pagination=pagination
+    )[1]
+
+
+def tagged_reel(
+    lib: str,
+    raw_prefix: str | None = None,
+    cursor: str | None = None,
+    page_size: int | None = None,
+    raw_sort: str | None = None,
+    *,
+    node_id: str | None = None,
+    pagination: str | None = None,
+    unchanged: Callable[[str], bool] = _never,
+) -> tuple[str, dict | None]:
+    """Every image and video beneath a folder, recursively, one page at a time, and its validator.
 
     **Two enumerations, one for each shape of request** (#310). A reel from the
     library root is a `by-recent` query — hashed on `lib`, ranged on
@@ -438,37 +519,67 @@ def reel_items(
 
     Presigning still happens *after* the slice, so a request signs one page's
     worth of URLs rather than the branch's. Keep it that way.
+
+    `pagination=keyset` is the other answer to the cost, for a caller that can
+    live without name sorts and a total: see `_reel_keyset`.
+
+    **The validator comes after the enumeration, not before it**, unlike
+    `tagged_folder`'s. A folder's `rev` counts its children and nothing deeper,
+    and a counter that covered a branch would have to move on every ancestor
+    with every write — the library root's record in every transaction the
+    library makes, each colliding with all the others. So the tag is a digest of
+    what was read, `_row_version` per row, and a match skips the sort, the
+    slice and the signing rather than the query. A row's date moves with every
+    write to it, a rename of a folder in the branch included, which is what
+    makes it enough.
     """
     sort = clean_sort(raw_sort)
     limit = _reel_page_size(page_size)
-    offset = _reel_offset(cursor)
+    keyset = _clean_pagination(pagination) == "keyset"
+    if keyset and sort not in KEYSET_SORTS:
+        raise ValidationError(
+            "keyset pagination orders by date; "
+            f"sort must be one of {', '.join(sorted(KEYSET_SORTS))}"
+        )
+    offset = 0 if keyset else _reel_offset(cursor)
 
     folder = _node_at(lib, raw_prefix, node_id)
     breadcrumbs = _breadcrumbs(folder)
     prefix = breadcrumbs[-1]["prefix"]
 
-    cap = config.max_folder_objects()
     base_path = catalog.child_path(folder)
+    if keyset:
+        return _reel_keyset(lib, folder, prefix, base_path, sort, limit, cursor, unchanged)
+
+    cap = config.max_folder_objects()
     if folder.get("parent_id"):
         rows, truncated = catalog.branch(lib, base_path, cap)
     else:
         rows, truncated = catalog.recent(lib, cap)
 
-    media = [
-        record
-        for record in rows
-        if record["kind"] == catalog.KIND_FILE
-        and not is_abandoned_upload(record)
-        and keys.kind(record["name"]) in REEL_KINDS
-    ]
+    tag = _validator(
+        "reel",
+        folder["node_id"],
+        sort,
+        offset,
+        limit,
+        prefix,
+        _signing_window(),
+        *(_row_version(record) for record in rows),
+    )
+    if unchanged(tag):
+        return tag, None
+
+    media = [record for record in rows if _is_reel_media(record)]
     _sort_records(media, sort)
 
     window = media[offset : offset + limit]
     prefixes = _folder_prefixes(window, prefix, base_path, rows)
     items = [_file_entry(record, prefixes[record["node_id"]]) for record in window]
+    derived.schedule(lib, window)
 
     next_offset = offset + len(window)
-    return {
+    return tag, {
         "prefix": prefix,
         "sort": sort,
         "items": items,
@@ -481,6 +592,83 @@ def reel_items(
     }
 
 
+def _is_reel_media(record: dict) -> bool:
+    """Whether a row belongs in a reel: a finished upload of an image or a video."""
+    return (
+        record["kind"] == catalog.KIND_FILE
+        and not is_abandoned_upload(record)
+        and keys.kind(record["name"]) in REEL_KINDS
+    )
+
+
+def _reel_keyset(
+    lib: str,
+    folder: dict,
+    prefix: str,
+    base_path: str,
+    sort: str,
+    limit: int,
+    cursor: str | None,
+    unchanged: Callable[[str], bool],
+) -> tuple[str, dict | None]:
+    """One reel page read from a position rather than cut from the whole branch.
+
+    `catalog.recent_page` reads `by-recent` forward from the cursor and stops at
+    `limit` media rows, so the cost of a page is the page's, not the depth's,
+    and nothing caps how far a caller can scroll — the offset reel stops at
+    `config.max_folder_objects` and says `truncated`, this one has no such
+    ceiling. Presigning is still only the page.
+
+    **What it gives up, and why each follows from the index:**
+
+    * **Date orders only.** `by-recent` is ranged on `created_at`, so `newest`
+      and `oldest` are the orders it can resume in; a name sort needs every row
+      before the first page can be cut, which is the offset reel's job.
+    * **Ordered by `created_at`, displayed as `last_modified`.** The index
+      knows when a row was made, not when it last changed, so a renamed file
+      keeps its place here where the offset reel would move it up. That is the
+      one place a listing orders by a date it does not show, and it is
+      confined to a mode a caller has to ask for.
+    * **No total**, because knowing one is reading everything. `total` is
+      `None` and `truncated` is `False`; the end is `next_cursor` being `None`.
+    * **A page can be short without being the last**, when a small branch sits
+      in a large library and the read stopped at its row budget. Keep following
+      `next_cursor`.
+
+    Its validator is the page's rows and where the next page starts, which is
+    all of the body that is not a URL or the request echoed back.
+    """
+    window, next_cursor = catalog.recent_page(
+        lib,
+        newest=sort == "newest",
+        want=limit,
+        keep=_is_reel_media,
+        branch=base_path if folder.get("parent_id") else None,
+        after=cursor or None,
+    )
+    tag = _validator(
+        "keyset",
+        folder["node_id"],
+        sort,
+        prefix,
+        next_cursor,
+        _signing_window(),
+        *(_row_version(record) for record in window),
+    )
+    if unchanged(tag):
+        return tag, None
+    prefixes = _folder_prefixes(window, prefix, base_path, [])
+    derived.schedule(lib, window)
+    return tag, {
+        "prefix": prefix,
+        "sort": sort,
+        "items": [_file_entry(record, prefixes[record["node_id"]]) for record in window],
+        "total": None,
+        "truncated": False,
+        "next_cursor": next_cursor,
+    }
+
+
 def _folder_prefixes(
     window: list[dict], base_prefix: str, base_path: str, rows: list[dict]
 ) -> dict[str, str]:
@@ -517,6 +705,14 @@ def _folder_prefixes(
     return prefixes
 
 
+def _clean_pagination(raw: str | None) -> str:
+    if raw in (None, ""):
+        return DEFAULT_PAGINATION
+    if raw not in PAGINATIONS:
+        raise ValidationError(f"pagination must be one of {', '.join(sorted(PAGINATIONS))}")
+    return raw
+
+
 def _reel_offset(cursor: str | None) -> int:
     if cursor in (None, ""):
         return 0
@@ -578,6 +774,27 @@ def _blob_at(lib: str, raw_path: str | None, node_id: str | None) -> dict:
     return record
 
 
+def _recorded_blob(record: dict | None) -> tuple[int, str] | None:
+    """`size` and `content_type` off a row that has both, or `None` to go and ask S3.
+
+    Membership rather than truthiness for `size`, for `_unlanded`'s reason: an
+    empty file is `0`, and that is an answer.
+    """
+    if record is None or "size" not in record or not record.get("content_type"):
+        return None
+    return record["size"], record["content_type"]
+
+
+def _headed_blob(blob_key: str) -> tuple[int, str | None]:
+    """`size` and `content_type` from a `HeadObject`.
+
+    HEAD before signing so a mistyped key is a clean 404 rather than a URL that
+    only fails once the browser follows it.
+    """
+    metadata = s3.head(blob_key)
+    return metadata.get("ContentLength", 0), metadata.get("ContentType")
+
+
 def asset_url(
     lib: str, raw_key: str | None, disposition: str | None, *, node_id: str | None = None
 ) -> dict:
@@ -593,13 +810,23 @@ def asset_url(
     still signs what it was given — see the section comment above for the shared
     material that needs it.
 
-    `size` and `content_type` come from S3 in both branches rather than off the
-    row, because this endpoint's job is to prove the bytes are there before it
-    signs for them.
+    **`size` and `content_type` come off the row when the row has them**, and
+    then nothing is sent to S3 at all. They used to come from a `HeadObject`
+    before every signature, on the argument that this endpoint should prove the
+    bytes are there — but a row carries `size` only once `confirm-upload` has
+    read it from that same `HeadObject`, or a write has put those bytes itself,
+    so the proof was already on record and the HEAD was a round trip per tile
+    re-signed. A row without them — a placeholder, or one written before the
+    catalog kept them — still gets the HEAD, and so does every `?key=`, which
+    has no row to ask.
+
+    Signed `fresh`: a client is here because a URL stopped working, and the
+    signed-URL cache in `s3.presign_expiring` would otherwise hand that one back.
     """
     if disposition not in (None, "", "inline", "attachment"):
         raise ValidationError("disposition must be 'inline' or 'attachment'")
 
+    record = None
     if node_id:
         # `raw_key` is handed on rather than ignored: sending both is the 400
         # `_node_at` makes, and swallowing one here would answer for a request
@@ -611,9 +838,10 @@ def asset_url(
         key = blob_key = keys.clean_key(raw_key)
         name = keys.basename(key)
 
-    # HEAD before signing so a mistyped key is a clean 404 rather than a URL that
-    # only fails once the browser follows it.
-    metadata = s3.head(blob_key)
+    size, content_type = _recorded_blob(record) or _headed_blob(blob_key)
+    url, expires_in = s3.presign_expiring(
+        blob_key, disposition=disposition or "inline", filename=name, fresh=True
+    )
 
     return {
         "key": key,
@@ -622,10 +850,10 @@ def asset_url(
         # `_file_entry`'s reason: the header is what an uploader claimed and the
         # extension is what the browser will actually try to decode.
         "kind": keys.kind(name),
-        "size": metadata.get("ContentLength", 0),
-        "content_type": metadata.get("ContentType"),
-        "expires_in": config.presign_ttl_seconds(),
-        "url": s3.presign(blob_key, disposition=disposition or "inline", filename=name),
+        "size": size,
+        "content_type": content_type,
+        "expires_in": expires_in,
+        "url": url,
     }
 
 
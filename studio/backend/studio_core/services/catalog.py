@@ -23,13 +23,50 @@ One node type. A folder is a node with no blob; a file is a node with one.
 | Membership | `USER#<sub>` | `LIB#<lib_id>` |
 | Node — by parent | `NODE#<parent_id>` | `NAME#<name>` |
 | Node — by id | `NODE#<node_id>` | `META` |
+| Job | `JOB#<job_id>` | `META` |
+| Job — its node ids | `JOB#<job_id>` | `ITEMS#<page>` |
+| Blob reference | `BLOB#<blob_key>` | `META` |
+| Released blob | `GCQ#<shard>` | `<blob_key>` |
+| Numbering counter | `NODE#<parent_id>` | `SEQ#<name>` |
+
+A job is not part of the tree. It is a bulk write too large for one request —
+see `services.jobs` — kept here because this is the table the API can already
+write, and because only this module spells a `pk`. Its row keeps its library
+and its submission time as `job_lib` and `submitted_at`, never `lib` and
+`created_at`, so it sits in neither `by-path` nor `by-recent` and a reel or a
+subtree never reads it as a node. See `_JOB_STORED`.
+
+Nor is a blob reference. It is a count — `refs`, and nothing else — of the
+nodes whose `blob_key` is that key, changed in the same transaction as the rows
+that change it, so a copy can share its source's bytes and a delete can tell
+which bytes nobody names any more. It carries neither `blob_key` nor `lib`, so
+it sits in no index and `studio catalog gc` never mistakes it for a row that
+references something. See `blob_refs`.
+
+A numbering counter is the next number `create_numbered` hands out for one name
+in one folder. It sits in the folder's partition beside its children, under a
+prefix no listing reads, and goes when the folder does. See `_reserve`.
+
+A released blob is the collector's queue: the transaction that drops a key's
+last count also puts the key on `GCQ#<shard>`, so `studio catalog gc --queue`
+reads what deletes have released since it last ran instead of scanning the
+table and listing the bucket. See `_release`.
 
 **A node is two items, so every write here is a `TransactWriteItems`.** The
 by-parent item is what makes a folder listable and what makes a name unique
 inside it; the by-id item is the record. There is no write that touches one
-without the other, and no code path in this module that puts an item outside a
+without the other, and no code path in this module that writes a node outside a
 transaction — a node that exists under one key and not the other is a node that
-either cannot be listed or cannot be opened.
+either cannot be listed or cannot be opened. (A numbering counter is the one
+item written alone, because it is no half of anything.)
+
+**A folder's record counts the changes to its listing.** `rev` on a
+`NODE#<id>`/`META` item is moved on by every write that changes one of its
+by-parent items — a child created, renamed, moved in or out, deleted, or given
+new bytes — in the same transaction as that change, so the number a listing
+read before its children names exactly the children it is about to read. The
+listing routes send it as a weak `ETag` and answer `If-None-Match` with a 304
+before any child is queried. See `listing_rev`.
 
 ## The three rules this module holds
 
@@ -74,15 +111,35 @@ which is why that function had no caller left and went with #312.
 
 ## What this module does not do
 
-It never touches S3. `delete_node` returns the `blob_key` values it removed
-rows for rather than deleting the objects behind them, because two nodes may
-point at one key — a copy in this model copies a row, not bytes — so whether a
-blob is now unreferenced is not a question a single delete can answer.
+It never touches S3. `delete_node` returns the `blob_key` values nothing names
+any more rather than deleting the objects behind them, and `set_blob` does the
+same for the key it moved a node off. Two nodes may point at one key — a copy
+made through `manage.copy_objects` copies a row, not bytes — and the `BLOB#`
+count is what turns "is this blob now unreferenced" into a question one delete
+*can* answer; what to do with the answer is the caller's, because the caller is
+the one holding an S3 client.
+
+**A key with no count is one this table has never counted**, not one nobody
+names: every row written before the counts existed, and every row the pipeline
+writes straight into the table, is uncounted until `studio catalog refs
+--apply` rebuilds the counts from a scan. Such a key is never shared — a copy of
+it falls back to copying bytes — so deleting a row that holds one releases it,
+exactly as every delete did before there was a count to consult.
 """
 
+import base64
+import hashlib
+import json
 import logging
+import posixpath
+import random
+import re
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 
 from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
@@ -91,7 +148,7 @@ from botocore.exceptions import ClientError
 from studio_core import config
 from studio_core.clients.aws import dynamodb
 from studio_core.errors import ConflictError, NotFoundError, UpstreamError, ValidationError
-from studio_core.services import keys
+from studio_core.services import keys, node_cache
 
 logger = logging.getLogger(__name__)
 
@@ -123,11 +180,63 @@ BY_RECENT_INDEX = "by-recent"
 # The sort key of the record half of a node, and of a library.
 META = "META"
 
+# The sort key prefix of a folder's numbering counters, one per name that has
+# clashed in it. See `_reserve`.
+SEQUENCE_PREFIX = "SEQ#"
+
+# Set on a folder's record before its first counter, so a delete knows which
+# folders to look in. See `_mark_numbered`.
+NUMBERED_FIELD = "numbered"
+
+# What the by-parent item carries beyond the keys and `node_id`, `lib`, `kind`,
+# `path` and `created_at`: everything a folder listing renders, so a listing is
+# the one query on `NODE#<parent>` and nothing after it. Every write that changes
+# one of these on a record changes it on the by-parent item in the same
+# transaction — `set_blob` is the one that had not needed to, and `_rewrite_branch`
+# now stamps `updated_at` on both halves. `updated_at` is also how a reader tells
+# a listed item from one written before these were projected; see `listing`.
+# `preview` is the width of the reduced copy `services.derived` made of the
+# blob, or `0` when none could be made; `set_preview` writes it on both halves
+# and `set_blob` takes it off both.
+LISTED_FIELDS = ("blob_key", "size", "content_type", "updated_at", "preview")
+
+# A multipart upload in flight into a node's blob, on its record half only. See
+# `set_upload`.
+UPLOAD_FIELDS = ("upload_id", "upload_size", "upload_part_bytes", "upload_content_type")
+
+# What `descendants(keys_only=True)` reads back of each node: enough to place
+# it in the tree, name it, and find and weigh its bytes, and nothing a listing
+# renders. A caller walking a million rows to count, sum or collect blob keys
+# holds these and not the rest.
+KEY_FIELDS = ("node_id", "parent_id", "name", "kind", "path", "blob_key", "size")
+
 # DynamoDB's hard ceiling on one `TransactWriteItems`. A subtree rewrite is two
 # items per node — the record and its by-parent item — so it moves fifty nodes
 # per call.
 TRANSACTION_ITEMS = 100
 
+# How many times a transaction cancelled by contention rather than by one of its
+# own conditions is sent, and the ceiling of the first pause between sends,
+# doubling each attempt. The pause is drawn uniformly below that ceiling — full
+# jitter — because the transactions that collided are usually this process's
+# own siblings from `_write_chunks`, and siblings that back off by the same
+# amount collide again.
+TRANSACTION_ATTEMPTS = 5
+TRANSACTION_BACKOFF = 0.05
+
+# The cancellation reasons that say "another writer, or too fast" rather than
+# "this write is wrong". A transaction cancelled only for these, and for `None`
+# on the items that were fine, is safe to send again as it is: a cancelled
+# transaction applied nothing.
+TRANSIENT_CANCELLATIONS = frozenset(
+    {
+        "TransactionConflict",
+        "ThrottlingError",
+        "ProvisionedThroughputExceeded",
+        "RequestLimitExceeded",
+    }
+)
+
 # DynamoDB's ceiling on one `BatchGetItem`, and how many times a *partial*
 # answer is asked again before it becomes an error. The two numbers belong
 # together: the batch is where `UnprocessedKeys` comes from, and a caller that
@@ -141,9 +250,35 @@ BATCH_GET_ATTEMPTS = 4
 # partition throttle, and this runs inside a request a person is waiting on.
 BATCH_GET_BACKOFF = 0.05
 
+# How many partitions the released-blob queue is spread over, named `GCQ#0`
+# to `GCQ#f` by the first hex digit of the key's MD5. Spread because a folder
+# delete releases every blob in it, inside one request, and one partition takes
+# a thousand writes a second; the collector queries all sixteen, which costs it
+# sixteen round trips on an empty queue. `maintenance/catalog_gc.py` spells the
+# same list rather than importing it, as it does everything of this module's.
+GC_QUEUE_SHARDS = "0123456789abcdef"
+
+# How many node ids one `ITEMS#` row of a job holds. A node id is about forty
+# bytes, so a page is about 20 KB: far under DynamoDB's 400 KB item limit, which
+# a job of ten thousand ids on its own row used to pass, and small enough that
+# `TRANSACTION_ITEMS` pages stay under a transaction's 4 MB.
+JOB_PAGE_ITEMS = 500
+
+# How many callers' membership rows one process remembers. A library has a
+# handful of members, so this is a bound on a leak rather than a tuning knob:
+# past it the oldest entry goes, and the cost is one query for whoever it was.
+MEMBERSHIP_CACHE_ENTRIES = 1024
+
 _serialize = TypeSerializer().serialize
 _deserialize = TypeDeserializer().deserialize
 
+# `USER#<sub>` -> (monotonic expiry, membership rows). See `libraries_for`.
+# Locked for the reason `node_cache.LruTier` is: request threads and the
+# subtree worker pool both reorder and evict it, and an `OrderedDict` being
+# reordered by one while another evicts raises or loses its order.
+_membership_cache: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+_membership_lock = threading.Lock()
+
 
 def _now() -> str:
     """ISO-8601 with microseconds, always UTC.
@@ -165,6 +300,11 @@ def _name_sk(name: str) -> str:
     return f"NAME#{name}"
 
 
+def _cached(pk: str, sk: str) -> str:
+    """An item's key in `node_cache` — its primary key, which is what makes it one item."""
+    return f"{pk}/{sk}"
+
+
 def _lib_pk(lib: str) -> str:
     """The library's own partition.
 
@@ -198,7 +338,7 @@ def _attributes(item: dict) -> dict:
 
 
 def _record(item: dict) -> dict:
-    """Unmarshal one item as a node record, with `size` back to an int.
+    """Unmarshal one item as a node record, with its counts back to ints.
 
     `pk` and `sk` are dropped because they are the layout, and the layout does
     not leave this module. The deserialiser hands back `Decimal` for every N,
@@ -208,11 +348,25 @@ def _record(item: dict) -> dict:
     record = _attributes(item)
     record.pop("pk", None)
     record.pop("sk", None)
-    if "size" in record:
-        record["size"] = int(record["size"])
+    for field in ("size", "rev", "preview", "upload_size", "upload_part_bytes"):
+        if field in record:
+            record[field] = int(record[field])
     return record
 
 
+def listing_rev(record: dict) -> int:
+    """How many times a folder's listing has changed, off its own record.
+
+    Read from the record `node` returns — a consistent read — and never from a
+    cached one: a validator that lagged the children it stands for would tell a
+    client its stale listing was current. A folder no write has touched since
+    the counter existed has none, and is `0`; the first change makes it `1`, so
+    a client holding a listing from before the counter is sent the new one
+    exactly once.
+    """
+    return int(record.get("rev", 0))
+
+
 def child_path(record: dict) -> str:
     """The `path` every child of this node carries.
 
@@ -283,14 +437,35 @@ def libraries_for(sub: str) -> list[dict]:
     `LIB#<id>`/`META` item, and fetching it here would be a read per library for
     a caller that may only want to check access. Whoever needs the names asks
     for them.
+
+    **Remembered for `config.membership_ttl_seconds`, per process.** Every
+    request but a health check asks this, and a warm container serving one
+    person's browsing session would otherwise read the same partition dozens of
+    times a minute. The entry is dropped early by `_write` whenever a transaction
+    here touches a `USER#` or `LIB#` item — none does today, but the day one
+    does, the process that made the write must not be the last to believe it.
+    The writes that matter now come from `scripts/add-member.sh`, outside this
+    process, and the TTL is the only thing that bounds how long a warm container
+    takes to see them.
+
+    Copies go out and copies are stored, so a caller mutating what it was handed
+    cannot edit what the next request is told.
     """
+    key = _user_pk(sub)
+    ttl = config.membership_ttl_seconds()
+    with _membership_lock:
+        cached = _membership_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            _membership_cache.move_to_end(key)
+            return [dict(row) for row in cached[1]]
+
     items = _query(
         TableName=config.catalog_table(),
         KeyConditionExpression="pk = :pk",
-        ExpressionAttributeValues={":pk": {"S": _user_pk(sub)}},
+        ExpressionAttributeValues={":pk": {"S": key}},
     )
     rows = [_attributes(item) for item in items]
-    return [
+    memberships = [
         {
             "lib": row["sk"].split("#", 1)[1],
             "role": row.get("role"),
@@ -299,6 +474,43 @@ def libraries_for(sub: str) -> list[dict]:
         for row in rows
     ]
 
+    if ttl > 0:
+        entry = (time.monotonic() + ttl, [dict(row) for row in memberships])
+        with _membership_lock:
+            _membership_cache[key] = entry
+            _membership_cache.move_to_end(key)
+            while len(_membership_cache) > MEMBERSHIP_CACHE_ENTRIES:
+                _membership_cache.popitem(last=False)
+    return memberships
+
+
+def reset_membership_cache() -> None:
+    """Forget every remembered membership. Tests use this; writes go through `_write`."""
+    with _membership_lock:
+        _membership_cache.clear()
+
+
+def _forget_memberships(transact_items: list[dict]) -> None:
+    """Drop the cached memberships a transaction may have changed.
+
+    A `USER#<sub>` item is that caller's membership, so only their entry goes.
+    A `LIB#<lib>` item is a library, and which subs are in it is exactly what
+    the cache cannot answer without the `by-sk` read `members_of` used to make,
+    so every entry goes — a library write is rare enough that the next request
+    per caller paying one query is not worth an index read to avoid.
+    """
+    for entry in transact_items:
+        operation = next(iter(entry.values()))
+        key = operation.get("Key") or operation.get("Item") or {}
+        pk = key.get("pk", {}).get("S", "")
+        if pk.startswith("LIB#"):
+            with _membership_lock:
+                _membership_cache.clear()
+            return
+        if pk.startswith("USER#"):
+            with _membership_lock:
+                _membership_cache.pop(pk, None)
+
 
 def library(lib: str) -> dict:
     """One library's own record: its name, and the node it opens on.
@@ -334,11 +546,20 @@ def node(node_id: str) -> dict:
     Raises rather than returning `None`: every caller in this module treats a
     missing node as the end of the request, and the routes above map
     `NotFoundError` to 404 already.
+
+    **Never answered from `node_cache`, only written to it.** This is the read
+    every write in this module builds its transaction from — `rename_node`
+    deletes the by-parent item under the name it finds here — and the read
+    every route authorises a node by, through its `lib`. Both want the row as
+    it is, not as another container last left it. What it reads is put in the
+    cache for `records` to find, which is the read a listing makes next.
     """
+    read_at = node_cache.version()
     try:
         response = dynamodb.client().get_item(
             TableName=config.catalog_table(),
             Key={"pk": {"S": _node_pk(node_id)}, "sk": {"S": META}},
+            ConsistentRead=True,
         )
     except ClientError as exc:
         logger.warning("GetItem failed for %s: %s", node_id, exc)
@@ -347,7 +568,9 @@ def node(node_id: str) -> dict:
     item = response.get("Item")
     if not item:
         raise NotFoundError(node_id)
-    return _record(item)
+    record = _record(item)
+    node_cache.put(_cached(_node_pk(node_id), META), record, read_at)
+    return record
 
 
 def _batch_get(keys: list[dict]) -> list[dict]:
@@ -365,10 +588,15 @@ def _batch_get(keys: list[dict]) -> list[dict]:
     caller should hear about rather than a delay to absorb. Giving up raises,
     because the alternative — returning what did arrive — is the silent
     short listing this function exists to prevent.
+
+    Strongly consistent, because what comes back may be put in `node_cache`
+    and a cached row should be no older than the last write before it was
+    read. It is twice the read capacity of an eventually consistent batch,
+    paid only on a miss.
     """
     table = config.catalog_table()
     items: list[dict] = []
-    pending = {table: {"Keys": keys}}
+    pending = {table: {"Keys": keys, "ConsistentRead": True}}
 
     for attempt in range(BATCH_GET_ATTEMPTS):
         if attempt:
@@ -391,15 +619,13 @@ def _batch_get(keys: list[dict]) -> list[dict]:
 def records(node_ids: list[str]) -> dict[str, dict]:
     """Full records for many nodes at once, keyed by id.
 
-    **This exists because `children` cannot answer with `size` or
-    `content_type`.** The by-parent item carries the index projection #280
-    defines and nothing more, so a listing that wants a file's size is one query
-    for the folder plus `ceil(n / 100)` batched reads for the records — and that
-    is the shape to keep. Widening the projection would remove the batch and put
-    a second copy of every mutable attribute on a second item, which every
-    rename and every text edit would then have to keep in step. A stale byte
-    count in a listing is worse than an extra round trip, and unlike the round
-    trip it is invisible.
+    **For the reads that hold ids and not a folder.** A listing no longer comes
+    here: the by-parent item carries `LISTED_FIELDS`, so `listing` is one query,
+    and only by-parent items written before the projection widened are filled
+    in from this. What still calls it holds a scattered set of ids — the
+    ancestors a reel or a descendants page needs names for, the nodes a batch
+    resolve or a batch presign was asked about — and wants each one's record,
+    `ceil(n / 100)` batched reads for all of them rather than a `GetItem` apiece.
 
     Keyed by id rather than returned as a list because a batch answers in
     whatever order it likes: the caller holds the order it wants — `children`
@@ -408,9 +634,21 @@ def records(node_ids: list[str]) -> dict[str, dict]:
     Duplicate ids are collapsed before the call. `BatchGetItem` rejects a
     request that names one key twice, and a caller merging two listings has no
     reason to know that.
+
+    Read through `node_cache`: only the ids it cannot answer are batched, and
+    what the batch returns is remembered. A listing is the read a browse
+    repeats, and the records under a folder are what it repeats it for.
     """
-    wanted = list(dict.fromkeys(node_ids))
     found: dict[str, dict] = {}
+    wanted = []
+    for node_id in dict.fromkeys(node_ids):
+        cached = node_cache.get(_cached(_node_pk(node_id), META))
+        if cached is None:
+            wanted.append(node_id)
+        else:
+            found[node_id] = cached
+
+    read_at = node_cache.version()
     for start in range(0, len(wanted), BATCH_GET_KEYS):
         keys = [
             {"pk": {"S": _node_pk(node_id)}, "sk": {"S": META}}
@@ -419,6 +657,7 @@ def records(node_ids: list[str]) -> dict[str, dict]:
         for item in _batch_get(keys):
             record = _record(item)
             found[record["node_id"]] = record
+            node_cache.put(_cached(_node_pk(record["node_id"]), META), record, read_at)
     return found
 
 
@@ -426,13 +665,11 @@ def children(parent_id: str) -> list[dict]:
     """One folder's contents, name-ascending.
 
     This reads the by-parent items, so what comes back is the **index
-    projection** #280 defines — `node_id`, `lib`, `kind`, `path`, `created_at`,
-    plus the `name` carried in the sort key — and not the full record. A caller
-    that needs `blob_key` or `size` for one entry fetches it with `node`.
-
-    That is a deliberate reading of the schema rather than an oversight: the
-    projection is what makes a listing one query, and widening it would mean
-    every rename and move keeps a second copy of the file's metadata in step.
+    projection** — `node_id`, `lib`, `kind`, `path`, `created_at` and
+    `LISTED_FIELDS`, plus the `name` carried in the sort key and the
+    `parent_id` carried in the partition key — and not the full record. A folder
+    view wants `listing`, which is this with the rows written before the
+    projection widened filled in.
 
     The order is free. DynamoDB returns a partition sorted by sort key, and the
     sort key is `NAME#<name>`, so a folder listing arrives name-ascending
@@ -449,10 +686,50 @@ def children(parent_id: str) -> list[dict]:
     for item in items:
         record = _record(item)
         record["name"] = _deserialize(item["sk"]).split("#", 1)[1]
+        record["parent_id"] = parent_id
         entries.append(record)
     return entries
 
 
+def listing(parent_id: str) -> list[dict]:
+    """One folder's contents as records a listing can render, name-ascending.
+
+    **One paginated query**, where it was a query and `ceil(n / 100)` batched
+    reads: the by-parent item carries `LISTED_FIELDS`, so `children` already
+    holds what `browse._file_entry` and `routes/nodes._view` read. What the
+    projection does not carry — `updated_at` excepted, the attributes nobody
+    renders — stays on the record for `node` to answer.
+
+    **A by-parent item without `updated_at` predates the projection** and is
+    read through `records` instead, so a table nobody has backfilled lists
+    correctly and only costs what it used to. `studio catalog listing --apply`
+    is the backfill, and the check that says whether one is needed.
+
+    A child whose record is not there either is reported from the projection
+    rather than dropped: a node hidden here still exists and can still be opened
+    by id. Logged, because every write in this module is a transaction over both
+    halves, so one half alone means a row was written by hand.
+    """
+    entries = children(parent_id)
+    unlisted = [entry["node_id"] for entry in entries if "updated_at" not in entry]
+    if not unlisted:
+        return entries
+
+    full = records(unlisted)
+    found = []
+    for entry in entries:
+        if "updated_at" not in entry:
+            record = full.get(entry["node_id"])
+            if record is None:
+                logger.warning(
+                    "Folder %s lists a child with no record: %s", parent_id, entry["node_id"]
+                )
+            else:
+                entry = record
+        found.append(entry)
+    return found
+
+
 def child_by_name(parent_id: str, name: str) -> dict:
     """The one child of a folder with this name, as the index projection.
 
@@ -466,11 +743,22 @@ def child_by_name(parent_id: str, name: str) -> dict:
     The projection, not the record. A walk only needs the next `node_id`, and
     the caller that has arrived fetches the record with `node`. Raises
     `NotFoundError` naming the segment, like every other read here.
+
+    Read through `node_cache`, and only a name that is there is remembered. An
+    absence cached here would hide a folder another container had just created
+    from the very next `store.folder` that resolves it, for the whole TTL.
     """
+    key = _cached(_node_pk(parent_id), _name_sk(name))
+    cached = node_cache.get(key)
+    if cached is not None:
+        return {**cached, "name": name}
+
+    read_at = node_cache.version()
     try:
         response = dynamodb.client().get_item(
             TableName=config.catalog_table(),
             Key={"pk": {"S": _node_pk(parent_id)}, "sk": {"S": _name_sk(name)}},
+            ConsistentRead=True,
         )
     except ClientError as exc:
         logger.warning("GetItem failed for '%s' under %s: %s", name, parent_id, exc)
@@ -479,7 +767,47 @@ def child_by_name(parent_id: str, name: str) -> dict:
     item = response.get("Item")
     if not item:
         raise NotFoundError(name)
-    return {**_record(item), "name": name}
+    entry = _record(item)
+    node_cache.put(key, entry, read_at)
+    return {**entry, "name": name}
+
+
+def children_named(pairs: list[tuple[str, str]]) -> dict[tuple[str, str], dict]:
+    """Many `child_by_name` answers at once, keyed by `(parent_id, name)`.
+
+    The batched twin of `child_by_name`, for the same reason `records` is the
+    batched twin of `node`: the by-parent item's full primary key is exactly
+    the question, so a set of questions is a set of keys, and a set of keys is
+    `ceil(n / 100)` `BatchGetItem` calls rather than `n` `GetItem`s. This is
+    what `POST /api/resolve/batch` asks once per level of the paths it walks.
+
+    A pair that names nothing is absent from the result rather than an error —
+    the caller asked about many and one missing is an answer, not a failure —
+    and duplicates are collapsed before the call, because `BatchGetItem`
+    rejects a request that names one key twice.
+    """
+    found: dict[tuple[str, str], dict] = {}
+    wanted = []
+    for parent_id, name in dict.fromkeys(pairs):
+        cached = node_cache.get(_cached(_node_pk(parent_id), _name_sk(name)))
+        if cached is None:
+            wanted.append((parent_id, name))
+        else:
+            found[(parent_id, name)] = {**cached, "name": name}
+
+    read_at = node_cache.version()
+    for start in range(0, len(wanted), BATCH_GET_KEYS):
+        keys = [
+            {"pk": {"S": _node_pk(parent_id)}, "sk": {"S": _name_sk(name)}}
+            for parent_id, name in wanted[start : start + BATCH_GET_KEYS]
+        ]
+        for item in _batch_get(keys):
+            pk, sk = _deserialize(item["pk"]), _deserialize(item["sk"])
+            entry = _record(item)
+            node_cache.put(_cached(pk, sk), entry, read_at)
+            name = sk.split("#", 1)[1]
+            found[(pk.split("#", 1)[1], name)] = {**entry, "name": name}
+    return found
 
 
 def branch(lib: str, path: str, limit: int) -> tuple[list[dict], bool]:
@@ -527,6 +855,187 @@ def recent(lib: str, limit: int) -> tuple[list[dict], bool]:
     )
 
 
+def recent_page(
+    lib: str,
+    *,
+    newest: bool,
+    want: int,
+    keep,
+    branch: str | None = None,
+    after: str | None = None,
+) -> tuple[list[dict], str | None]:
+    """Up to `want` records from `by-recent`, resuming where the last page stopped.
+
+    **The keyset half of the reel** (`browse.reel_items` with
+    `pagination=keyset`). `recent` reads a library's newest rows up to a cap and
+    leaves the page to be cut in memory, so page twenty costs what pages one to
+    twenty cost together; this reads from a position forward and stops when the
+    page is full, so every page costs about the same however deep it is.
+
+    `by-recent` and not `by-path`, for a branch too: `by-path` is ranged on the
+    ancestor list, so the order it could resume in is the tree's rather than
+    the date's, and a reel is read by date. A branch is a `begins_with` filter
+    on `path` instead. What that costs is said plainly: a filter is applied
+    *after* the read, so a page of a small branch in a large library may read
+    many rows to find a few — which is why each call also stops after
+    `config.max_folder_objects` rows *read* and hands back a position, even
+    with a short page. Read, not kept: the budget is charged DynamoDB's
+    `ScannedCount`, which counts the rows the filter threw away, because those
+    are the rows that cost capacity and time. A page with fewer than `want`
+    records and a token is not the end; `None` is.
+
+    `keep` is the caller's filter over records, applied here so the page is
+    counted in rows the caller wants; the `META`-and-file half of it is pushed
+    into the query, because half of every index is by-parent projections and
+    reading them only to drop them is the waste this exists to remove.
+
+    **The position is a seek, not an `ExclusiveStartKey`.** The token carries
+    the `created_at` of the last row examined and the ids already examined at
+    that instant, and the next page asks for `created_at <= :at` (or `>=`,
+    oldest first) and skips those ids. A key condition is something every
+    DynamoDB — and the moto the suite runs on, which resumes an index query
+    from a start key in *table* order and applies `Limit` before ordering —
+    answers the same way, and the id list is what makes two nodes created in
+    one microsecond safe: an index does not promise an order between equal
+    sort keys, so "after this one" would not be a position at all. Within one
+    call the reads go on from DynamoDB's own start key, each with a `Limit`
+    sized to what the page still needs — twice it, since half the index is
+    projections the filter drops, plus the ids the seek will skip — so a page
+    reads about a page of rows and not a full 1 MB. A call that stops on its
+    budget rather than a full page hands back that start key in the token as
+    well, because the rows it read last may all have been dropped by the filter
+    — the seek names only rows it kept, and a library whose rows share one
+    instant would otherwise be read from the same place forever. (moto applies
+    `Limit` before ordering an index; the suite's table fixture corrects that,
+    and `tests/conftest.py` says how.)
+
+    The token is opaque to every caller and checked on the way back in. It is
+    bound to the library, direction and branch it was issued for; a token from
+    any other reel is a `ValidationError`, and a forged one positions a query
+    inside this library's partition and nowhere else.
+    """
+    names = {"#kind": "kind"}
+    values = {":lib": {"S": lib}, ":meta": {"S": META}, ":file": {"S": KIND_FILE}}
+    condition = "sk = :meta AND #kind = :file"
+    if branch is not None:
+        names["#path"] = "path"
+        values[":branch"] = {"S": branch}
+        condition += " AND begins_with(#path, :branch)"
+
+    at, seen, start = (
+        _from_token(after, lib=lib, newest=newest, branch=branch) if after else (None, [], None)
+    )
+    budget = config.max_folder_objects()
+    records: list[dict] = []
+    while True:
+        kwargs = {
+            "TableName": config.catalog_table(),
+            "IndexName": BY_RECENT_INDEX,
+            "KeyConditionExpression": "lib = :lib",
+            "FilterExpression": condition,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": dict(values),
+            "ScanIndexForward": not newest,
+        }
+        if at is not None:
+            kwargs["KeyConditionExpression"] += (
+                " AND created_at <= :at" if newest else " AND created_at >= :at"
+            )
+            kwargs["ExpressionAttributeValues"][":at"] = {"S": at}
+        if start:
+            kwargs["ExclusiveStartKey"] = start
+        kwargs["Limit"] = max(1, min(budget, 2 * (want - len(records)) + len(seen)))
+        try:
+            response = dynamodb.client().query(**kwargs)
+        except ClientError as exc:
+            logger.warning("Query failed (%s): %s", BY_RECENT_INDEX, exc)
+            raise UpstreamError("Could not read the catalog") from exc
+
+        for item in response.get("Items", []):
+            record = _record(item)
+            if record["created_at"] == at and record["node_id"] in seen:
+                continue
+            if record["created_at"] != at:
+                at, seen = record["created_at"], []
+            seen.append(record["node_id"])
+            if keep(record):
+                records.append(record)
+                if len(records) == want:
+                    return records, _to_token(lib, at, seen, newest=newest, branch=branch)
+
+        start = response.get("LastEvaluatedKey")
+        if not start:
+            return records, None
+        budget -= response.get("ScannedCount", 0)
+        if budget <= 0:
+            read_to = start["created_at"]["S"]
+            return records, _to_token(
+                lib, read_to, seen if read_to == at else [], newest=newest, branch=branch,
+                start=start,
+            )
+
+
+def _to_token(
+    lib: str,
+    at: str,
+    seen: list[str],
+    *,
+    newest: bool,
+    branch: str | None,
+    start: dict | None = None,
+) -> str:
+    """A `by-recent` position as an opaque, URL-safe string.
+
+    `start` is the start key of the read the page stopped in the middle of, kept
+    as its `pk` and `sk` — the library and `created_at` are already in the token.
+    """
+    payload = {"l": lib, "at": at, "seen": seen, "n": newest, "b": branch}
+    if start is not None:
+        payload["k"] = [start["pk"]["S"], start["sk"]["S"]]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def _from_token(
+    token: str, *, lib: str, newest: bool, branch: str | None
+) -> tuple[str, list[str], dict | None]:
+    """The position a `_to_token` string names, if it was issued for this reel.
+
+    A start key is rebuilt inside this library's partition whatever the token
+    says, so a forged one can position a read nowhere else.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        at, seen, key = payload["at"], payload["seen"], payload.get("k")
+        valid = (
+            payload["l"] == lib
+            and payload["n"] is newest
+            and payload["b"] == branch
+            and isinstance(at, str)
+            and isinstance(seen, list)
+            and (0 < len(seen) or key is not None)
+            and len(seen) <= config.max_folder_objects()
+            and all(isinstance(node_id, str) for node_id in seen)
+            and (
+                key is None
+                or (isinstance(key, list) and len(key) == 2 and all(isinstance(k, str) for k in key))
+            )
+        )
+    except (ValueError, TypeError, KeyError):
+        valid = False
+    if not valid:
+        raise ValidationError("cursor is not valid")
+    start = None
+    if key is not None:
+        start = {
+            "pk": {"S": key[0]},
+            "sk": {"S": key[1]},
+            "lib": {"S": lib},
+            "created_at": {"S": at},
+        }
+    return at, seen, start
+
+
 def subtree(lib: str, path: str) -> list[dict]:
     """`branch`, with the cap as a refusal rather than a limit.
 
@@ -547,6 +1056,158 @@ def subtree(lib: str, path: str) -> list[dict]:
     return records
 
 
+def descendants(
+    lib: str, path: str, *, depth: int | None = None, keys_only: bool = False
+) -> Iterator[dict]:
+    """Every node beneath a path, one at a time, with no cap at all.
+
+    **The reader for a tree too large to hold.** `subtree` collects a branch
+    into a list and refuses past `config.max_folder_objects`, which is right for
+    a move or a delete that must be done whole inside one request, and wrong for
+    anything that only needs to *visit* each node: an archive, a count, a sum, a
+    sweep. This is the same `begins_with` on `by-path`, read a page at a time
+    and yielded as it arrives, so what a caller holds is one page however large
+    the branch. Abandoning the iterator abandons the query, as `_pages` says.
+
+    **In path order, which is parents first.** `by-path` is ranged on the
+    ancestor list, and a folder's children carry its path with its own id
+    appended, so a folder always comes before anything beneath it. Siblings —
+    rows with one `path` — come in whatever order the index keeps them, which is
+    not their names'; a caller that wants names in order sorts a folder's
+    worth, not the branch.
+
+    `depth` stops at that many levels below `path` — `1` is the nodes whose
+    `path` is `path` itself. The cut is made here, on the ancestor list, and
+    not in the query: DynamoDB cannot count slashes, so a shallow walk of a deep
+    tree still reads the deep rows and drops them. For one level `children` is
+    the cheaper read.
+
+    `keys_only` reads back only `KEY_FIELDS`. The by-parent halves are filtered
+    out in the query either way. Neither saves capacity — a GSI read is billed on
+    the items it touches, not the attributes it returns — but both shrink every
+    page on the wire and every row in memory.
+    """
+    kwargs = {
+        "TableName": config.catalog_table(),
+        "IndexName": BY_PATH_INDEX,
+        "KeyConditionExpression": "lib = :lib AND begins_with(#path, :path)",
+        "FilterExpression": "sk = :meta",
+        "ExpressionAttributeNames": {"#path": "path"},
+        "ExpressionAttributeValues": {
+            ":lib": {"S": lib},
+            ":path": {"S": path},
+            ":meta": {"S": META},
+        },
+    }
+    if keys_only:
+        names = {f"#k{index}": field for index, field in enumerate(KEY_FIELDS)}
+        kwargs["ExpressionAttributeNames"].update(names)
+        kwargs["ProjectionExpression"] = ", ".join(names)
+    for page in _pages(**kwargs):
+        for item in page.get("Items", []):
+            record = _record(item)
+            if depth is not None and record["path"][len(path):].count("/") >= depth:
+                continue
+            yield record
+
+
+def descendants_page(
+    lib: str, path: str, *, want: int, after: str | None = None
+) -> tuple[list[dict], str | None]:
+    """`descendants` a page at a time, for a caller that cannot hold the iterator.
+
+    **What `GET /api/nodes/<id>/descendants` reads.** `descendants` is a
+    generator, which is right inside one request and useless across several:
+    the client walking a project comes back for the next page on a new request,
+    with nothing but a token to say where it stopped. This is the same
+    `begins_with` on `by-path`, in the same parents-first order, stopping once
+    it holds `want` records and handing back that position.
+
+    **A page ends between folders, never inside one.** Rows with one `path` are
+    one folder's children, and the index keeps no order among them — so
+    "after this row" is not a position inside a folder, and the token is the
+    last `path` finished instead. The next page asks for the paths after it,
+    and that is a key condition: a seek, for the reason `recent_page` gives,
+    with nothing to skip on the way back in. What it costs is that a page is
+    whole folders: `want` is where a page may end, and a folder of ten thousand
+    files is one page of ten thousand — no more than `GET /api/nodes` already
+    returns for that folder.
+
+    The token is opaque, checked on the way back in, and bound to the library
+    and branch it was issued for; any other is a `ValidationError`. `None` is
+    the end.
+    """
+    values = {":lib": {"S": lib}, ":meta": {"S": META}}
+    if after is None:
+        condition = "lib = :lib AND begins_with(#path, :path)"
+        values[":path"] = {"S": path}
+    else:
+        # Ids are `node-<uuid>`, so no path sorts between `at` and `at/` but `at`;
+        # and every path under the branch sorts before the branch with its
+        # trailing `/` raised to `0`, the character after it.
+        condition = "lib = :lib AND #path BETWEEN :from AND :to"
+        values[":from"] = {"S": _walk_position(after, lib=lib, branch=path) + "/"}
+        values[":to"] = {"S": path[:-1] + "0"}
+
+    records: list[dict] = []
+    folder = None
+    start = None
+    while True:
+        kwargs = {
+            "TableName": config.catalog_table(),
+            "IndexName": BY_PATH_INDEX,
+            "KeyConditionExpression": condition,
+            "FilterExpression": "sk = :meta",
+            "ExpressionAttributeNames": {"#path": "path"},
+            "ExpressionAttributeValues": values,
+        }
+        if start:
+            kwargs["ExclusiveStartKey"] = start
+        try:
+            response = dynamodb.client().query(**kwargs)
+        except ClientError as exc:
+            logger.warning("Query failed (%s): %s", BY_PATH_INDEX, exc)
+            raise UpstreamError("Could not read the catalog") from exc
+
+        for item in response.get("Items", []):
+            record = _record(item)
+            if record["path"] != folder:
+                if len(records) >= want:
+                    return records, _walk_token(lib, path, folder)
+                folder = record["path"]
+            records.append(record)
+
+        # Only past 1 MB of one branch, where a start key is all there is.
+        start = response.get("LastEvaluatedKey")
+        if not start:
+            return records, None
+
+
+def _walk_token(lib: str, branch: str, at: str) -> str:
+    """A `by-path` position as an opaque, URL-safe string."""
+    payload = {"l": lib, "b": branch, "at": at}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def _walk_position(token: str, *, lib: str, branch: str) -> str:
+    """The path a `_walk_token` string names, if it was issued for this branch."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        at = payload["at"]
+        valid = (
+            payload["l"] == lib
+            and payload["b"] == branch
+            and isinstance(at, str)
+            and at.startswith(branch)
+        )
+    except (ValueError, TypeError, KeyError):
+        valid = False
+    if not valid:
+        raise ValidationError("cursor is not valid")
+    return at
+
+
 # ──────────────────────────── writes ────────────────────────────
 
 
@@ -565,9 +1226,19 @@ def _write(steps: list[tuple[dict, Exception | None]]) -> None:
 
     Anything the reasons cannot explain is upstream: a throttle, a transaction
     conflict with another writer, a table that is not there.
+
+    Cached memberships the transaction touches are forgotten *before* it is
+    sent, so a write that fails part-way can only cost a re-read, never leave a
+    stale grant behind. Cached nodes are forgotten before it and again after
+    it, for the reason `node_cache` gives — and this being the one writer is
+    what lets every operation below, `_rewrite_branch`'s batches included, keep
+    that cache true without knowing it exists.
     """
+    transact_items = [item for item, _ in steps]
+    _forget_memberships(transact_items)
+    _forget_nodes(transact_items)
     try:
-        dynamodb.client().transact_write_items(TransactItems=[item for item, _ in steps])
+        dynamodb.client().transact_write_items(TransactItems=transact_items)
     except ClientError as exc:
         if exc.response.get("Error", {}).get("Code") != "TransactionCanceledException":
             logger.warning("TransactWriteItems failed: %s", exc)
@@ -579,11 +1250,94 @@ def _write(steps: list[tuple[dict, Exception | None]]) -> None:
                 raise failure from exc
 
         logger.warning("TransactWriteItems cancelled: %s", reasons)
+        codes = {reason.get("Code") for reason in reasons} - {"None", None}
+        if codes and codes <= TRANSIENT_CANCELLATIONS:
+            raise _Contended("Could not write to the catalog") from exc
         raise UpstreamError("Could not write to the catalog") from exc
+    finally:
+        _forget_nodes(transact_items)
+
+
+class _Contended(UpstreamError):
+    """A transaction cancelled by contention alone — the one failure worth retrying.
+
+    Still an `UpstreamError`, so a caller that does not retry reports it as the
+    502 it always was.
+    """
+
+
+def _write_retrying(steps: list[tuple[dict, Exception | None]]) -> None:
+    """`_write`, sent again with jittered backoff while only contention refuses it."""
+    for attempt in range(1, TRANSACTION_ATTEMPTS + 1):
+        try:
+            _write(steps)
+            return
+        except _Contended:
+            if attempt == TRANSACTION_ATTEMPTS:
+                raise
+            time.sleep(random.uniform(0, TRANSACTION_BACKOFF * 2 ** (attempt - 1)))
+
+
+def _write_chunks(steps: list[tuple[dict, Exception | None]]) -> None:
+    """Write steps that do not depend on each other, `TRANSACTION_ITEMS` at a time, concurrently.
+
+    **The caller vouches for independence.** Every chunk is sent at once — see
+    `_write_transactions` — so nothing may need another chunk to have landed
+    first: a descendant `path` rewrite qualifies, a delete of a parent and its
+    child does not. A chunk never splits a node's two items, because both are
+    an even count and a node's steps are adjacent.
+    """
+    _write_transactions(
+        [steps[start : start + TRANSACTION_ITEMS] for start in range(0, len(steps), TRANSACTION_ITEMS)]
+    )
+
+
+def _write_transactions(transactions: list[list[tuple[dict, Exception | None]]]) -> None:
+    """Send transactions that do not depend on each other, up to `config.transaction_workers` at once.
+
+    Split from `_write_chunks` for `delete_node`, whose transactions are not
+    even slices of one list: each carries the `BLOB#` decrements for the nodes
+    in it, so where one ends is a matter of counting distinct keys as well as
+    nodes.
+
+    **The first failure stops what has not started.** Transactions still queued
+    are cancelled, the ones in flight finish, and the failure is raised — the
+    same "interrupted part-way" state a sequential loop left, with the same
+    repair: run the operation again.
+    """
+    if len(transactions) <= 1:
+        for steps in transactions:
+            _write_retrying(steps)
+        return
+
+    workers = min(config.transaction_workers(), len(transactions))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_write_retrying, steps) for steps in transactions]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+    for future in futures:
+        if not future.cancelled() and future.exception() is not None:
+            raise future.exception()
+
+
+def _forget_nodes(transact_items: list[dict]) -> None:
+    """Drop every item a transaction writes from `node_cache`, and move its version on."""
+    keys = []
+    for entry in transact_items:
+        operation = next(iter(entry.values()))
+        key = operation.get("Key") or operation.get("Item") or {}
+        if "pk" in key and "sk" in key:
+            keys.append(_cached(_deserialize(key["pk"]), _deserialize(key["sk"])))
+    node_cache.invalidate(keys)
 
 
 def _put_name(record: dict, *, parent_id: str, name: str) -> dict:
-    """The by-parent half of a node, put only if that name is free."""
+    """The by-parent half of a node, put only if that name is free.
+
+    It carries `LISTED_FIELDS` off the record it is given, so every caller hands
+    over the record as it will be after the write — `updated_at` included.
+    """
     return {
         "Put": {
             "TableName": config.catalog_table(),
@@ -596,6 +1350,7 @@ def _put_name(record: dict, *, parent_id: str, name: str) -> dict:
                     "kind": record["kind"],
                     "path": record["path"],
                     "created_at": record["created_at"],
+                    **{field: record.get(field) for field in LISTED_FIELDS},
                 }
             ),
             "ConditionExpression": "attribute_not_exists(pk)",
@@ -628,8 +1383,8 @@ def _delete_meta(node_id: str) -> dict:
     }
 
 
-def _update(key: dict, assignments: dict) -> dict:
-    """Set named attributes on an item that already exists.
+def _update(key: dict, assignments: dict, removals: tuple[str, ...] = ()) -> dict:
+    """Set named attributes on an item that already exists, and remove `removals`.
 
     Every attribute goes through `ExpressionAttributeNames`, because `name`,
     `path` and `size` are all DynamoDB reserved words and half of this module's
@@ -644,31 +1399,67 @@ def _update(key: dict, assignments: dict) -> dict:
     """
     names = {f"#{index}": attribute for index, attribute in enumerate(assignments)}
     values = {f":{index}": _serialize(value) for index, value in enumerate(assignments.values())}
-    return {
-        "Update": {
-            "TableName": config.catalog_table(),
-            "Key": key,
-            "UpdateExpression": "SET " + ", ".join(f"{k} = :{k[1:]}" for k in names),
-            "ExpressionAttributeNames": names,
-            "ExpressionAttributeValues": values,
-            "ConditionExpression": "attribute_exists(pk)",
-        }
+    clauses = ["SET " + ", ".join(f"{k} = :{k[1:]}" for k in names)] if names else []
+    if removals:
+        removed = {f"#r{index}": attribute for index, attribute in enumerate(removals)}
+        names |= removed
+        clauses.append("REMOVE " + ", ".join(removed))
+    update = {
+        "TableName": config.catalog_table(),
+        "Key": key,
+        "UpdateExpression": " ".join(clauses),
+        "ExpressionAttributeNames": names,
+        "ConditionExpression": "attribute_exists(pk)",
     }
+    if values:
+        update["ExpressionAttributeValues"] = values
+    return {"Update": update}
 
 
-def _update_meta(node_id: str, assignments: dict) -> dict:
-    return _update({"pk": {"S": _node_pk(node_id)}, "sk": {"S": META}}, assignments)
+def _update_meta(node_id: str, assignments: dict, removals: tuple[str, ...] = ()) -> dict:
+    return _update({"pk": {"S": _node_pk(node_id)}, "sk": {"S": META}}, assignments, removals)
 
 
-def _update_name(*, parent_id: str, name: str, assignments: dict) -> dict:
+def _update_name(
+    *, parent_id: str, name: str, assignments: dict, removals: tuple[str, ...] = ()
+) -> dict:
     """Change an attribute on the by-parent half of a node.
 
-    Only `path` is ever assigned through here, by a move. It is an update rather
+    `path` by a move and `LISTED_FIELDS` by `set_blob`. It is an update rather
     than a put because the item is already there and its name is not changing —
     `_put_name`'s `attribute_not_exists` guard would refuse it, correctly, since
     that guard is the collision check.
     """
-    return _update({"pk": {"S": _node_pk(parent_id)}, "sk": {"S": _name_sk(name)}}, assignments)
+    return _update(
+        {"pk": {"S": _node_pk(parent_id)}, "sk": {"S": _name_sk(name)}}, assignments, removals
+    )
+
+
+def _bump_rev(parent_id: str) -> tuple[dict, Exception]:
+    """The step that moves a folder's `rev` on, for a transaction changing one of its children.
+
+    `ADD`, for `_count_blob`'s reason: two writes into one folder must each
+    count, and a folder written before the counter starts from zero. The
+    condition is `_update`'s — `ADD` on a missing item creates it, and a
+    three-attribute `META` item for a folder that was deleted meanwhile would be
+    a record with no name and no `lib`.
+
+    **Every write into one folder now shares this item**, so two of them in
+    flight at once collide as a transaction conflict where before they touched
+    disjoint keys. That is why each writer here sends through `_write_retrying`.
+    """
+    return (
+        {
+            "Update": {
+                "TableName": config.catalog_table(),
+                "Key": {"pk": {"S": _node_pk(parent_id)}, "sk": {"S": META}},
+                "UpdateExpression": "ADD rev :one",
+                "ExpressionAttributeValues": {":one": {"N": "1"}},
+                "ConditionExpression": "attribute_exists(pk)",
+            }
+        },
+        NotFoundError(parent_id),
+    )
 
 
 def _folder_node(node_id: str) -> dict:
@@ -699,6 +1490,158 @@ def blob_key_for(node_id: str) -> str:
     return f"blobs/{node_id}"
 
 
+def private_blob_key(record: dict) -> str:
+    """A key for new bytes on `record` that no other row can be naming.
+
+    What `manage.update_text` writes to when the node's own blob is shared: the
+    id-derived key when the node is not already on it — a copy that shared its
+    source's bytes never wrote anything there — and otherwise a fresh key under
+    it, since the id-derived one is exactly what the other sharers point at.
+    """
+    own = blob_key_for(record["node_id"])
+    if record.get("blob_key") != own:
+        return own
+    return f"{own}/{uuid.uuid4().hex}"
+
+
+class UncountedBlob(ConflictError):
+    """A copy asked to share a blob this table holds no live count for.
+
+    Raised by `create_node(share=True)`, and not a refusal the caller passes on:
+    it means "copy the bytes instead", which is what `manage` does with it.
+    """
+
+
+def _blob_ref_key(blob_key: str) -> dict:
+    return {"pk": {"S": f"BLOB#{blob_key}"}, "sk": {"S": META}}
+
+
+def _count_blob(blob_key: str, delta: int, *, shared: bool = False) -> dict:
+    """Move a blob's reference count by `delta`, creating the count if it is missing.
+
+    `ADD` rather than a read and a `SET`, so two transactions counting the same
+    key never lose one another's change, and an item that does not exist yet
+    starts from zero. That is also why a decrement of a key nobody counted
+    leaves `-1` rather than failing: see `_release`.
+
+    `shared` is a copy joining a key someone else already holds, and carries
+    the one condition a count has: the key must be counted and alive. A missing
+    item fails `refs > 0` as well as a zero one does, so a copy can neither
+    share bytes this table has never counted nor revive a blob a delete has
+    just released.
+    """
+    update = {
+        "TableName": config.catalog_table(),
+        "Key": _blob_ref_key(blob_key),
+        "UpdateExpression": "ADD refs :delta",
+        "ExpressionAttributeValues": {":delta": {"N": str(delta)}},
+    }
+    if shared:
+        update["ConditionExpression"] = "refs > :none"
+        update["ExpressionAttributeValues"][":none"] = {"N": "0"}
+    return {"Update": update}
+
+
+def blob_refs(blob_keys: list[str]) -> dict[str, int]:
+    """How many nodes name each of these blobs, keyed by blob key.
+
+    A key with no count is absent from the answer rather than `0`: it is a key
+    this table has never counted — see the module docstring — and a caller
+    deciding whether it may share one must not read that as "nobody".
+
+    Strongly consistent, for `_batch_get`'s reason and one of its own: a copy
+    that read a count from before a delete would decide to share bytes that
+    delete is about to hand back for removal. The `refs > 0` condition on the
+    share is what actually closes that race; reading consistently keeps it
+    from being the usual path.
+    """
+    found: dict[str, int] = {}
+    wanted = list(dict.fromkeys(blob_keys))
+    for start in range(0, len(wanted), BATCH_GET_KEYS):
+        keys = [_blob_ref_key(blob_key) for blob_key in wanted[start : start + BATCH_GET_KEYS]]
+        for item in _batch_get(keys):
+            found[_deserialize(item["pk"]).split("#", 1)[1]] = int(_deserialize(item["refs"]))
+    return found
+
+
+def _gc_queue_key(blob_key: str) -> dict:
+    shard = hashlib.md5(blob_key.encode()).hexdigest()[0]
+    return {"pk": {"S": f"GCQ#{shard}"}, "sk": {"S": blob_key}}
+
+
+def _release(blob_keys: list[str]) -> list[str]:
+    """Drop the counts of these blobs that nothing names any more, and say which they were.
+
+    A conditional delete per key, `refs <= 0`, fifty keys to a transaction. A
+    cancelled transaction names the keys whose condition failed — still
+    referenced, or already released by another delete that reached zero at the
+    same moment — and is sent again without them, so what comes back is
+    exactly the keys *this* call took from one to nothing. That is what makes
+    the S3 delete that follows happen once per blob however many deletes race.
+
+    `<= 0` rather than `= 0` for the uncounted key: its first decrement leaves
+    `-1`, and releasing it is what a delete did before counts existed.
+
+    **Each release also queues the key for the collector**, in the same
+    transaction — a `GCQ#` item with the time it was released, which is why a
+    transaction holds fifty keys rather than a hundred. The caller deletes the
+    bytes straight afterwards and nearly always succeeds; the queue is for the
+    time it does not, and for the process that dies in between, which were the
+    two ways an orphan used to need a whole-bucket listing to be found. The
+    item carries no `blob_key` attribute, so `studio catalog gc` never counts
+    the queue as a reference to what it queues.
+    """
+    released: list[str] = []
+    per = TRANSACTION_ITEMS // 2
+    for start in range(0, len(blob_keys), per):
+        pending = blob_keys[start : start + per]
+        attempt = 0
+        while pending:
+            attempt += 1
+            now = _now()
+            transact_items = []
+            for blob_key in pending:
+                transact_items.append(
+                    {
+                        "Delete": {
+                            "TableName": config.catalog_table(),
+                            "Key": _blob_ref_key(blob_key),
+                            "ConditionExpression": "refs <= :none",
+                            "ExpressionAttributeValues": {":none": {"N": "0"}},
+                        }
+                    }
+                )
+                transact_items.append(
+                    {
+                        "Put": {
+                            "TableName": config.catalog_table(),
+                            "Item": {**_gc_queue_key(blob_key), "queued_at": {"S": now}},
+                        }
+                    }
+                )
+            try:
+                dynamodb.client().transact_write_items(TransactItems=transact_items)
+            except ClientError as exc:
+                reasons = exc.response.get("CancellationReasons") or []
+                held = {
+                    blob_key
+                    for blob_key, reason in zip(pending, reasons[::2])
+                    if reason.get("Code") == "ConditionalCheckFailed"
+                }
+                codes = {reason.get("Code") for reason in reasons} - {"None", None}
+                if held:
+                    pending = [blob_key for blob_key in pending if blob_key not in held]
+                    continue
+                if codes and codes <= TRANSIENT_CANCELLATIONS and attempt < TRANSACTION_ATTEMPTS:
+                    time.sleep(random.uniform(0, TRANSACTION_BACKOFF * 2 ** (attempt - 1)))
+                    continue
+                logger.warning("Releasing %d blobs failed: %s", len(pending), exc)
+                raise UpstreamError("Could not write to the catalog") from exc
+            released.extend(pending)
+            pending = []
+    return released
+
+
 def create_node(
     parent_id: str,
     raw_name: str | None,
@@ -707,6 +1650,7 @@ def create_node(
     blob_key: str | None = None,
     size: int | None = None,
     content_type: str | None = None,
+    share: bool = False,
 ) -> dict:
     """Add a folder or a file under an existing parent.
 
@@ -738,6 +1682,13 @@ def create_node(
 
     An explicit `blob_key` is still stored exactly as given, because prod holds
     keys written long before this table did.
+
+    **Every file is counted against its blob in the same transaction** — a
+    third item, `BLOB#<blob_key>`, gets `refs + 1`. `share` says the key is
+    another node's and this one is a copy of it: the count must then already
+    be alive, and `UncountedBlob` is raised, with nothing written, when it is
+    not. That is what lets `manage.copy_objects` copy a 2 GB video by writing
+    three items.
     """
     if kind not in KINDS:
         raise ValidationError(f"kind must be one of {', '.join(sorted(KINDS))}")
@@ -765,7 +1716,10 @@ def create_node(
         "updated_at": now,
     }
 
-    _write(
+    counted = []
+    if blob_key:
+        counted.append((_count_blob(blob_key, 1, shared=share), UncountedBlob(blob_key)))
+    _write_retrying(
         [
             (
                 _put_name(record, parent_id=parent_id, name=name),
@@ -787,6 +1741,8 @@ def create_node(
                 },
                 ConflictError(f"'{name}' already exists here"),
             ),
+            *counted,
+            _bump_rev(parent_id),
         ]
     )
 
@@ -794,6 +1750,102 @@ def create_node(
     return {key: value for key, value in record.items() if value is not None}
 
 
+def _sequence_key(parent_id: str, name: str) -> dict:
+    return {"pk": {"S": _node_pk(parent_id)}, "sk": {"S": f"{SEQUENCE_PREFIX}{name}"}}
+
+
+def _reserve(parent_id: str, name: str, *, counted: bool = False) -> int | None:
+    """The next number for `name` in this folder, taken atomically; `1` the first time.
+
+    One `UpdateItem` with `ADD`, and the only write in this module that is not a
+    transaction: a transaction answers with nothing, and the number is the
+    answer. Nothing reads the counter but this, so it is kept out of
+    `node_cache` by never being read any other way, and a number taken by a
+    create that then fails is a gap in the numbering rather than a row out of
+    step with another.
+
+    `counted` takes a number only from a counter that is already there, and is
+    `None` where there is none — the same round trip, without making one.
+    """
+    request = {
+        "TableName": config.catalog_table(),
+        "Key": _sequence_key(parent_id, name),
+        "UpdateExpression": "ADD next_number :one",
+        "ExpressionAttributeValues": {":one": {"N": "1"}},
+        "ReturnValues": "UPDATED_NEW",
+    }
+    if counted:
+        request["ConditionExpression"] = "attribute_exists(pk)"
+    try:
+        response = dynamodb.client().update_item(**request)
+    except ClientError as exc:
+        if counted and exc.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            return None
+        logger.warning("UpdateItem failed for the '%s' sequence in %s: %s", name, parent_id, exc)
+        raise UpstreamError("Could not write to the catalog") from exc
+    return int(response["Attributes"]["next_number"]["N"])
+
+
+def _mark_numbered(parent_id: str) -> None:
+    """Flag a folder as keeping counters, before its first one exists.
+
+    A flag rather than a list of the counters' names: it is written once per
+    clashing name whatever the folder holds, and the record stays the size it
+    was. `delete_node` queries the `SEQ#` items of the folders that carry it and
+    of no others, and written first, an interruption before the counter leaves
+    a flag with nothing under it rather than a counter no delete looks for.
+    """
+    _write([(_update_meta(parent_id, {NUMBERED_FIELD: True}), NotFoundError(parent_id))])
+
+
+def _catch_up(parent_id: str, name: str, taken: int) -> None:
+    """Move a counter past every variant of `name` already in the folder.
+
+    A counter starts at nothing in a folder that may already hold `clip.mp4`
+    to `clip (40).mp4` — written before counters existed, or by `create_node`,
+    a rename or a copy, none of which count. So the first number a counter
+    hands out can be taken, and rather than take the next one forty times this
+    reads the variants once — one query on `NAME#<stem> (` — and sets the
+    counter to the highest. The condition keeps a counter another creator
+    moved further meanwhile where it is.
+    """
+    stem, ext = posixpath.splitext(name)
+    variant = re.compile(rf"{re.escape(stem)} \((\d+)\){re.escape(ext)}")
+    items = _query(
+        TableName=config.catalog_table(),
+        KeyConditionExpression="pk = :pk AND begins_with(sk, :variants)",
+        ExpressionAttributeValues={
+            ":pk": {"S": _node_pk(parent_id)},
+            ":variants": {"S": _name_sk(f"{stem} (")},
+        },
+        ProjectionExpression="sk",
+    )
+    highest = taken
+    for item in items:
+        found = variant.fullmatch(_deserialize(item["sk"]).split("#", 1)[1])
+        if found:
+            highest = max(highest, int(found.group(1)))
+    try:
+        _write(
+            [
+                (
+                    {
+                        "Update": {
+                            "TableName": config.catalog_table(),
+                            "Key": _sequence_key(parent_id, name),
+                            "UpdateExpression": "SET next_number = :highest",
+                            "ExpressionAttributeValues": {":highest": {"N": str(highest)}},
+                            "ConditionExpression": "next_number < :highest",
+                        }
+                    },
+                    ConflictError(name),
+                )
+            ]
+        )
+    except ConflictError:
+        pass
+
+
 def create_numbered(parent_id: str, raw_name: str | None, kind: str) -> dict:
     """`create_node`, but a taken name is numbered instead of refused.
 
@@ -801,15 +1853,31 @@ def create_numbered(parent_id: str, raw_name: str | None, kind: str) -> dict:
     `keys.numbered_name` owns and `manage.copy_objects` has produced since #317.
     Nothing is overwritten in any branch, and nothing is refused for a clash.
 
-    **Retry-on-conflict, not list-then-choose, and the difference is the whole
-    reason this is a function rather than two lines at a call site.** Reading the
-    destination's names first and picking a free one describes a folder as it was
-    a moment ago: the pipeline records runs into the same table, and a browser
-    uploading five files is five round trips during which that snapshot ages. The
-    conditional put on the `NAME#` item is the only authority on whether a name is
-    free, so this asks *it*, and a loser of a race simply takes the next number.
-    It also costs nothing in the ordinary case — one write, no query — where a
-    listing would cost a query per file.
+    **A counter hands out the number, and the conditional put still decides.**
+    This used to try `clip.mp4`, then `clip (2).mp4`, and so on until a put
+    succeeded, so the hundredth take into a folder cost a hundred cancelled
+    transactions, and thirty-two writers numbering one name at once spent most
+    of their attempts colliding with each other. Now a folder keeps a
+    `SEQ#<name>` item beside its children for each name that has clashed
+    there, and `_reserve` takes the next number from it with one atomic `ADD`:
+    concurrent creators are handed different numbers, never the same one, and
+    each take is one update and one transaction however many the folder
+    already holds.
+
+    **A name that has never clashed makes no counter.** The first reservation
+    only counts where a counter exists; where none does, the plain name is put
+    as `create_node` would put it, and only its refusal makes one. A folder of
+    distinct uploads therefore holds no `SEQ#` items at all, and each of them
+    is a refused update and one transaction.
+
+    The `NAME#` put's condition is still the only authority on whether a name
+    is free, so a number is never trusted blindly. A counter made by a clash
+    starts at nothing in a folder that holds the name, and perhaps `(2)` to
+    `(40)` beside it — written before the counter, or by anything that does not
+    count — so `_catch_up` moves it past the variants already there before a
+    number is used; so does the first number an older counter hands out that
+    turns out taken. A create that fails for any other reason has spent its
+    number; the folder shows a gap, never a duplicate.
 
     **Numbering consults names and nothing else.** Not sizes, not checksums: an
     upload of the same bytes twice is two files, the same bargain
@@ -817,20 +1885,35 @@ def create_numbered(parent_id: str, raw_name: str | None, kind: str) -> dict:
     not a question this service answers.
 
     The bound is `keys.MAX_NAME_VARIANTS`, shared with copy so one folder cannot
-    accept `(100)` from one entry point and refuse it from the other.
+    accept `(100)` from one entry point and refuse it from the other. A counter
+    past it refuses, gaps and all.
     """
     name = keys.clean_name(raw_name)
-    for attempt in range(1, keys.MAX_NAME_VARIANTS + 1):
-        candidate = name if attempt == 1 else keys.numbered_name(name, attempt)
+    number = _reserve(parent_id, name, counted=True)
+    if number is None:
         try:
-            return create_node(parent_id, candidate, kind)
+            return create_node(parent_id, name, kind)
         except ConflictError:
-            continue
-
-    raise ConflictError(
-        f"'{name}' already names {keys.MAX_NAME_VARIANTS} files here — "
-        "rename some of them first"
-    )
+            _mark_numbered(parent_id)
+            number = _reserve(parent_id, name)
+
+    caught_up = False
+    while True:
+        if number > keys.MAX_NAME_VARIANTS:
+            raise ConflictError(
+                f"'{name}' already names {keys.MAX_NAME_VARIANTS} files here — "
+                "rename some of them first"
+            )
+        # `1` stands for the plain name, which this create has seen taken.
+        if number > 1:
+            try:
+                return create_node(parent_id, keys.numbered_name(name, number), kind)
+            except ConflictError:
+                pass
+        if not caught_up:
+            _catch_up(parent_id, name, number)
+            caught_up = True
+        number = _reserve(parent_id, name)
 
 
 def rename_node(node_id: str, raw_name: str | None) -> dict:
@@ -854,7 +1937,7 @@ def rename_node(node_id: str, raw_name: str | None) -> dict:
     now = _now()
     updated = {**record, "name": name, "updated_at": now}
 
-    _write(
+    _write_retrying(
         [
             (_delete_name(parent_id=parent_id, name=record["name"]), None),
             (
@@ -862,6 +1945,7 @@ def rename_node(node_id: str, raw_name: str | None) -> dict:
                 ConflictError(f"'{name}' already exists here"),
             ),
             (_update_meta(node_id, {"name": name, "updated_at": now}), NotFoundError(node_id)),
+            _bump_rev(parent_id),
         ]
     )
 
@@ -913,7 +1997,7 @@ def move_node(node_id: str, parent_id: str) -> dict:
     now = _now()
     moved = {**record, "parent_id": parent_id, "path": child_path(destination), "updated_at": now}
 
-    _write(
+    _write_retrying(
         [
             (_delete_name(parent_id=record["parent_id"], name=record["name"]), None),
             (
@@ -926,6 +2010,8 @@ def move_node(node_id: str, parent_id: str) -> dict:
                 ),
                 NotFoundError(node_id),
             ),
+            _bump_rev(record["parent_id"]),
+            _bump_rev(parent_id),
         ]
     )
 
@@ -1004,7 +2090,7 @@ def transfer_node(node_id: str, lib: str) -> dict:
         "updated_at": now,
     }
 
-    _write(
+    _write_retrying(
         [
             (_delete_name(parent_id=record["parent_id"], name=record["name"]), None),
             (
@@ -1023,6 +2109,8 @@ def transfer_node(node_id: str, lib: str) -> dict:
                 ),
                 NotFoundError(node_id),
             ),
+            _bump_rev(record["parent_id"]),
+            _bump_rev(destination["node_id"]),
         ]
     )
 
@@ -1046,8 +2134,9 @@ def _rewrite_branch(
     Both halves of every node, because the by-parent item carries `path` and
     `lib` too and `by-path` is hashed on the one and ranged on the other: a
     descendant rewritten on the record half alone would be indexed under a
-    library it is no longer in. Two writes per descendant is what fixes the batch
-    at fifty nodes.
+    library it is no longer in. The same `updated_at` goes on both, because the
+    by-parent item is what a listing dates the row by. Two writes per descendant
+    is what fixes the batch at fifty nodes.
 
     Only the prefix of `path` changes. The part below the moved node describes
     ancestors that moved with it and is copied across untouched.
@@ -1055,14 +2144,23 @@ def _rewrite_branch(
     `lib` is optional because a move never changes it — the destination is in the
     same library or `move_node` refused — and assigning it there would be a
     second writer of the attribute every GSI partitions on, for no change.
+
+    Every folder whose children were rewritten has its `rev` moved on once the
+    rewrite has landed — the moved node and each folder beneath it — because
+    each of those children now reports a new `updated_at`. After, not within:
+    a folder's own record is one of the items a chunk rewrites, and DynamoDB
+    refuses two operations on one item in a transaction. A listing read between
+    the two validates as it did before the move, for that moment only.
     """
     steps: list[tuple[dict, Exception | None]] = []
     for record in descendants:
         path = new + record["path"][len(old):]
-        assignments = {"path": path} if lib is None else {"path": path, "lib": lib}
+        assignments = {"path": path, "updated_at": _now()}
+        if lib is not None:
+            assignments["lib"] = lib
         steps.append(
             (
-                _update_meta(record["node_id"], {**assignments, "updated_at": _now()}),
+                _update_meta(record["node_id"], assignments),
                 NotFoundError(record["node_id"]),
             )
         )
@@ -1077,46 +2175,135 @@ def _rewrite_branch(
             )
         )
 
-    for start in range(0, len(steps), TRANSACTION_ITEMS):
-        _write(steps[start : start + TRANSACTION_ITEMS])
+    _write_chunks(steps)
+    parents = dict.fromkeys(record["parent_id"] for record in descendants)
+    _write_chunks([_bump_rev(parent_id) for parent_id in parents])
 
 
 def delete_node(node_id: str) -> dict:
-    """Remove a node and everything beneath it, and report the blobs it held.
+    """Remove a node and everything beneath it, and report the blobs nothing names now.
 
     **Deepest first, the node itself last.** Batching means a subtree bigger
     than fifty nodes is several transactions, so an interruption is possible;
     deleting upwards means what survives is still a tree hanging off a parent
     that lists it, rather than a set of rows nothing can reach. Re-running the
-    delete finishes the job.
-
-    Nothing in S3 is touched. The `blob_key` values come back so the caller can
-    decide what to do about the bytes — two nodes may point at one key, since a
-    copy in this model copies a row, so "is this blob now unreferenced" is not a
-    question one delete can answer.
+    delete finishes the job. The order is kept between depths and not within
+    one, which is what lets each depth's transactions go concurrently through
+    `_write_transactions`: a level is the unit of "everything below is gone".
+
+    **Each transaction takes its nodes' references with it.** The `BLOB#`
+    decrements for the nodes in a transaction ride in that transaction, one per
+    distinct key — DynamoDB refuses two operations on one item in a single
+    call, so three copies of a file deleted together are one `refs - 3` — and a
+    row can therefore never be gone while its count still includes it. See
+    `_deletions` for how a level is cut.
+
+    Only the parent's `rev` moves, in the transaction that removes the node
+    itself. The folders beneath are going too, and a listing of one is a 404
+    once it has; a delete interrupted part-way leaves them validating as they
+    did before it, until the re-run that finishes the job.
+
+    Nothing in S3 is touched. `blob_keys` is what `_release` found at zero once
+    every level had landed: the keys this delete took the last reference to,
+    which the caller may remove, and each of them is on the GC queue already,
+    so a caller that fails to remove them leaves work for `studio catalog gc
+    --queue` rather than an orphan only a full audit finds. A key a surviving
+    copy still names is not in it. An interruption between the last level and
+    the release leaves counts of zero behind and bytes nobody names, and
+    nothing queued; `studio catalog refs --apply` drops the first and the full
+    `studio catalog gc` the second.
     """
     record = node(node_id)
     if not record.get("parent_id"):
         raise ValidationError("the library root cannot be deleted")
 
     descendants = subtree(record["lib"], child_path(record))
-    descendants.sort(key=lambda entry: len(entry["path"]), reverse=True)
     doomed = descendants + [record]
 
+    # Counters first: a delete interrupted after them leaves folders that
+    # number from scratch and catch up, where one interrupted before them would
+    # leave counters in partitions nothing reaches any more.
+    _write_chunks(_counter_deletions([victim for victim in doomed if victim.get(NUMBERED_FIELD)]))
+
+    # One depth at a time, deepest first, and every transaction of one depth at
+    # once. Nodes at one depth never contain each other, so their transactions
+    # may land in any order; the next depth up waits for all of them.
+    levels: dict[int, list[dict]] = {}
+    for victim in descendants:
+        levels.setdefault(victim["path"].count("/"), []).append(victim)
+
+    for depth in sorted(levels, reverse=True):
+        _write_transactions(_deletions(levels[depth]))
+    (last,) = _deletions([record])
+    _write_retrying([*last, _bump_rev(record["parent_id"])])
+
+    released = _release(
+        list(dict.fromkeys(victim["blob_key"] for victim in doomed if victim.get("blob_key")))
+    )
+
+    logger.info("Deleted %s (%d nodes, %d blobs released)", node_id, len(doomed), len(released))
+    return {"node_id": node_id, "deleted": len(doomed), "blob_keys": released}
+
+
+def _deletions(victims: list[dict]) -> list[list[tuple[dict, Exception | None]]]:
+    """One level of a delete as transactions: two items per node, plus one per distinct blob.
+
+    Victims are taken in `blob_key` order, so the copies of one file sit
+    together and share as few transactions as possible. Every transaction that
+    decrements a key writes the same `BLOB#` item, and those land concurrently;
+    keeping them few is what keeps `_write_retrying` from spending its attempts
+    on a delete's own siblings.
+    """
+    transactions = []
     steps: list[tuple[dict, Exception | None]] = []
-    for victim in doomed:
+    counts: dict[str, int] = {}
+    for victim in sorted(victims, key=lambda victim: victim.get("blob_key") or ""):
+        blob_key = victim.get("blob_key")
+        cost = 2 + (1 if blob_key and blob_key not in counts else 0)
+        if steps and len(steps) + len(counts) + cost > TRANSACTION_ITEMS:
+            transactions.append(steps + [(_count_blob(key, -n), None) for key, n in counts.items()])
+            steps, counts = [], {}
         steps.append((_delete_name(parent_id=victim["parent_id"], name=victim["name"]), None))
         steps.append((_delete_meta(victim["node_id"]), None))
+        if blob_key:
+            counts[blob_key] = counts.get(blob_key, 0) + 1
+    if steps:
+        transactions.append(steps + [(_count_blob(key, -n), None) for key, n in counts.items()])
+    return transactions
+
+
+def _counter_deletions(folders: list[dict]) -> list[tuple[dict, Exception | None]]:
+    """A delete for every numbering counter these folders keep, for `_write_chunks`.
+
+    Only folders `_mark_numbered` flagged are asked — most have no counter,
+    since one is only made when a name clashes — with one query each on
+    `begins_with(sk, "SEQ#")`, which reads the counters and none of the children
+    beside them, up to `config.transaction_workers` at once. A folder with
+    hundreds is hundreds of independent deletes, so they go in chunks of their
+    own and never into a level's transactions, where they once pushed one past
+    `TRANSACTION_ITEMS`.
+    """
+    if not folders:
+        return []
 
-    for start in range(0, len(steps), TRANSACTION_ITEMS):
-        _write(steps[start : start + TRANSACTION_ITEMS])
+    def counters(folder: dict) -> list[dict]:
+        return _query(
+            TableName=config.catalog_table(),
+            KeyConditionExpression="pk = :pk AND begins_with(sk, :counter)",
+            ExpressionAttributeValues={
+                ":pk": {"S": _node_pk(folder["node_id"])},
+                ":counter": {"S": SEQUENCE_PREFIX},
+            },
+            ProjectionExpression="pk, sk",
+        )
 
-    logger.info("Deleted %s (%d nodes)", node_id, len(doomed))
-    return {
-        "node_id": node_id,
-        "deleted": len(doomed),
-        "blob_keys": [victim["blob_key"] for victim in doomed if victim.get("blob_key")],
-    }
+    with ThreadPoolExecutor(max_workers=min(config.transaction_workers(), len(folders))) as pool:
+        found = list(pool.map(counters, folders))
+    return [
+        ({"Delete": {"TableName": config.catalog_table(), "Key": item}}, None)
+        for items in found
+        for item in items
+    ]
 
 
 def set_blob(
@@ -1128,17 +2315,30 @@ def set_blob(
 ) -> dict:
     """Point a file node at its bytes.
 
-    The by-parent item is untouched, because #280 does not project `blob_key`,
-    `size` or `content_type` onto it — so this is one item, and still a
-    transaction. That costs twice the write capacity of a bare `UpdateItem` and
-    buys one thing worth having: every write in this module fails the same way,
-    through `_write`, with a per-item reason. A single `UpdateItem` here would
-    be the one path with its own error handling to keep true.
+    Both halves, because the by-parent item carries `LISTED_FIELDS` and a
+    listing reads nothing else: a new size written to the record alone would be
+    a folder view showing the old one until the next rename. #280 kept
+    `blob_key`, `size` and `content_type` off that item so this could be one
+    write; putting them there is what made `listing` one query, and this second
+    update in the same transaction is its price.
 
     `blob_key` is stored exactly as given. It is not validated against a prefix,
     not checked for existence in the bucket, and not derived from `node_id` —
     prod holds keys written long before this table did and they stay where they
     are.
+
+    **A new key moves the node's reference** — `+1` on it, `-1` on the old one,
+    in the same transaction — and the old key comes back under `released` when
+    that was its last reference, for the caller to delete the way it deletes
+    `delete_node`'s. Setting the key a node already has changes no count.
+
+    Any multipart upload `set_upload` recorded is taken off with it: the bytes
+    it was writing have landed, or been replaced by a single PUT.
+
+    **And takes `preview` off both halves, whatever the key.** A confirm on the
+    key a node already has is new bytes under the old name, so a reduced copy
+    made of the old ones no longer stands for it; `services.derived` makes
+    another and `set_preview` records it.
     """
     if not blob_key:
         raise ValidationError("blob_key is required")
@@ -1154,7 +2354,295 @@ def set_blob(
     if content_type is not None:
         assignments["content_type"] = content_type
 
-    _write([(_update_meta(node_id, assignments), NotFoundError(node_id))])
+    previous = record.get("blob_key")
+    counted = []
+    if blob_key != previous:
+        counted.append((_count_blob(blob_key, 1), None))
+        if previous:
+            counted.append((_count_blob(previous, -1), None))
 
+    _write_retrying(
+        [
+            (
+                _update_meta(node_id, assignments, ("preview", *UPLOAD_FIELDS)),
+                NotFoundError(node_id),
+            ),
+            (
+                _update_name(
+                    parent_id=record["parent_id"],
+                    name=record["name"],
+                    assignments=assignments,
+                    removals=("preview",),
+                ),
+                NotFoundError(node_id),
+            ),
+            *counted,
+            _bump_rev(record["parent_id"]),
+        ]
+    )
+
+    released = _release([previous]) if previous and blob_key != previous else []
     logger.info("Set blob on %s", node_id)
-    return {**record, **assignments}
+    for field in ("preview", *UPLOAD_FIELDS):
+        record.pop(field, None)
+    return {**record, **assignments, "released": released}
+
+
+def set_preview(node_id: str, blob_key: str, width: int) -> None:
+    """Record that `services.derived` made a `width`-wide copy of this node's blob.
+
+    `0` records that it could not — bytes that would not decode — so the node is
+    not handed back to it on every listing until a new blob arrives. Written on
+    both halves for `set_blob`'s reason, and moves the parent's `rev`, since a
+    listing that carried the original as the preview now carries the copy.
+
+    **Only while the node still names `blob_key`.** A derivative is made well
+    after the listing that asked for it, and a confirm in between means it was
+    made of bytes the node no longer has; that is a `ConflictError`, and the
+    caller drops it — the confirm took `preview` off, and the next listing asks
+    again.
+    """
+    record = node(node_id)
+    changed = ConflictError(f"{node_id} has a new blob")
+    steps = []
+    for step in (
+        _update_meta(node_id, {"preview": width}),
+        _update_name(
+            parent_id=record["parent_id"], name=record["name"], assignments={"preview": width}
+        ),
+    ):
+        update = step["Update"]
+        update["ConditionExpression"] = "attribute_exists(pk) AND #blob = :blob"
+        update["ExpressionAttributeNames"]["#blob"] = "blob_key"
+        update["ExpressionAttributeValues"][":blob"] = {"S": blob_key}
+        steps.append((step, changed))
+    _write_retrying([*steps, _bump_rev(record["parent_id"])])
+
+
+def set_upload(node_id: str, blob_key: str, upload: dict | None) -> dict:
+    """Record the multipart upload in flight into this node's blob, or clear it.
+
+    `upload` is `{"id", "size", "part_bytes", "content_type"}` as
+    `routes/nodes` opened it, stored as `UPLOAD_FIELDS` on the record half only:
+    a listing renders none of it, and the one reader is the route that resumes
+    or completes the upload, which reads `node`. `None` removes them. No `rev`
+    moves, for the same reason — nothing a listing draws has changed.
+
+    **Only while the node still names `blob_key`**, for `set_preview`'s reason:
+    an upload opened into bytes the node has since stopped naming is not this
+    node's any more. `set_blob` clears it too, in its own transaction, so a
+    completed upload never leaves its id behind.
+    """
+    values = dict(zip(UPLOAD_FIELDS, _upload_values(upload))) if upload else {}
+    step = _update_meta(node_id, values, () if upload else UPLOAD_FIELDS)
+    update = step["Update"]
+    update["ConditionExpression"] = "attribute_exists(pk) AND #blob = :blob"
+    update["ExpressionAttributeNames"]["#blob"] = "blob_key"
+    update.setdefault("ExpressionAttributeValues", {})[":blob"] = {"S": blob_key}
+    _write_retrying([(step, ConflictError(f"{node_id} has a new blob"))])
+    return node(node_id)
+
+
+def _upload_values(upload: dict) -> tuple:
+    return (upload["id"], upload["size"], upload["part_bytes"], upload["content_type"])
+
+
+def upload_of(record: dict) -> dict | None:
+    """The multipart upload `set_upload` recorded on this record, in its own shape."""
+    if "upload_id" not in record:
+        return None
+    return {
+        "id": record["upload_id"],
+        "size": record["upload_size"],
+        "part_bytes": record["upload_part_bytes"],
+        "content_type": record["upload_content_type"],
+    }
+
+
+# ──────────────────────────────── jobs ────────────────────────────────
+
+
+def _job_key(job_id: str) -> dict:
+    return {"pk": {"S": f"JOB#{job_id}"}, "sk": {"S": META}}
+
+
+# What a job's record calls a field, and what its row does. The row's names are
+# ones no index is keyed on; see the module docstring.
+_JOB_STORED = {"lib": "job_lib", "created_at": "submitted_at"}
+
+
+def _job(item: dict) -> dict:
+    """Unmarshal a job, with its counters back to ints for `_record`'s reason."""
+    record = _record(item)
+    for field, stored in _JOB_STORED.items():
+        record[field] = record.pop(stored)
+    for field in ("total", "done"):
+        record[field] = int(record[field])
+    record["result"] = {key: int(value) for key, value in record.get("result", {}).items()}
+    return record
+
+
+def _job_page_key(job_id: str, page: int) -> dict:
+    return {"pk": {"S": f"JOB#{job_id}"}, "sk": {"S": f"ITEMS#{page:06d}"}}
+
+
+def create_job(
+    lib: str,
+    kind: str,
+    params: dict,
+    *,
+    total: int,
+    items: list[str] | None = None,
+    created_by: str,
+) -> dict:
+    """Write a queued job of `total` items, and `items` if it has a list of them.
+
+    The ids are resolved by the caller before the job exists, so everything a
+    request can be refused for — a bad name, a taken destination — is still a
+    400 or a 409 on the request itself rather than a job that fails later.
+
+    **The ids are not on the job's own row.** A selection of ten thousand files
+    is ten thousand ids, past DynamoDB's 400 KB item limit, and a job that big
+    is exactly the job this path exists for. They go in `ITEMS#` rows of
+    `JOB_PAGE_ITEMS` each, written before the row that makes the job visible,
+    and `job_items` reads back the few a chunk needs. A job with no list — a
+    folder delete, which works through whatever the folder still holds — has
+    its source in `params` and no pages at all.
+    """
+    now = _now()
+    record = {
+        "job_id": f"job-{uuid.uuid4()}",
+        "lib": lib,
+        "kind": kind,
+        "status": "queued",
+        "params": params,
+        "total": total,
+        "done": 0,
+        "result": {},
+        "created_by": created_by,
+        "created_at": now,
+        "updated_at": now,
+    }
+    pages = [
+        items[start : start + JOB_PAGE_ITEMS]
+        for start in range(0, len(items or []), JOB_PAGE_ITEMS)
+    ]
+    _write_chunks(
+        [
+            (
+                {
+                    "Put": {
+                        "TableName": config.catalog_table(),
+                        "Item": {
+                            **_job_page_key(record["job_id"], number),
+                            **_item({"items": page}),
+                        },
+                    }
+                },
+                None,
+            )
+            for number, page in enumerate(pages)
+        ]
+    )
+    _write(
+        [
+            (
+                {
+                    "Put": {
+                        "TableName": config.catalog_table(),
+                        "Item": {
+                            **_job_key(record["job_id"]),
+                            **_item(
+                                {_JOB_STORED.get(field, field): value for field, value in record.items()}
+                            ),
+                        },
+                        "ConditionExpression": "attribute_not_exists(pk)",
+                    }
+                },
+                ConflictError(record["job_id"]),
+            )
+        ]
+    )
+    return record
+
+
+def job_items(job_id: str, start: int, count: int) -> list[str]:
+    """The node ids at `[start, start + count)` of a job's list, from its `ITEMS#` rows.
+
+    A chunk is far smaller than a page, so this is one `GetItem`, or two where
+    the chunk straddles a page boundary. Read consistently, for `job`'s reason.
+    """
+    found: list[str] = []
+    first, last = start // JOB_PAGE_ITEMS, (start + count - 1) // JOB_PAGE_ITEMS
+    for number in range(first, last + 1):
+        try:
+            response = dynamodb.client().get_item(
+                TableName=config.catalog_table(),
+                Key=_job_page_key(job_id, number),
+                ConsistentRead=True,
+            )
+        except ClientError as exc:
+            logger.warning("GetItem failed for %s page %d: %s", job_id, number, exc)
+            raise UpstreamError("Could not read the catalog") from exc
+        if "Item" in response:
+            found.extend(_deserialize(response["Item"]["items"]))
+    offset = start - first * JOB_PAGE_ITEMS
+    return found[offset : offset + count]
+
+
+def child_ids(parent_id: str, limit: int) -> list[str]:
+    """The ids of up to `limit` of a folder's children, in no promised order.
+
+    One page of the by-parent items, and no more: a folder-delete job reads this
+    once a chunk, and the children a chunk deletes are gone by the next, so the
+    first page of what is left is always the next page of work. `children`
+    would read all ten thousand to delete twenty-five.
+    """
+    try:
+        response = dynamodb.client().query(
+            TableName=config.catalog_table(),
+            KeyConditionExpression="pk = :pk AND begins_with(sk, :name)",
+            ExpressionAttributeValues={
+                ":pk": {"S": _node_pk(parent_id)},
+                ":name": {"S": "NAME#"},
+            },
+            ProjectionExpression="node_id",
+            Limit=limit,
+        )
+    except ClientError as exc:
+        logger.warning("Query failed for the children of %s: %s", parent_id, exc)
+        raise UpstreamError("Could not read the catalog") from exc
+    return [_deserialize(item["node_id"]) for item in response.get("Items", [])]
+
+
+def job(job_id: str) -> dict:
+    """One job, read consistently — a poll must not see progress go backwards."""
+    try:
+        response = dynamodb.client().get_item(
+            TableName=config.catalog_table(), Key=_job_key(job_id), ConsistentRead=True
+        )
+    except ClientError as exc:
+        logger.warning("GetItem failed for %s: %s", job_id, exc)
+        raise UpstreamError("Could not read the catalog") from exc
+
+    item = response.get("Item")
+    if not item:
+        raise NotFoundError(job_id)
+    return _job(item)
+
+
+def advance_job(job_id: str, *, at: int, assignments: dict) -> None:
+    """Checkpoint a job, provided nobody else has since it was read at `done == at`.
+
+    The condition is what makes a job single-writer without a lock. A queue
+    delivers at least once, so two workers can hold the same job; both read
+    `done`, both do a chunk, and only the first checkpoint lands — the second is
+    a `ConflictError` its worker takes as "someone else has this". Every chunk
+    is safe to do twice (see `services.jobs`), so the duplicate work is waste
+    and not damage.
+    """
+    update = _update(_job_key(job_id), {**assignments, "updated_at": _now()})["Update"]
+    update["ConditionExpression"] = "attribute_exists(pk) AND #done_at = :done_at"
+    update["ExpressionAttributeNames"]["#done_at"] = "done"
+    update["ExpressionAttributeValues"][":done_at"] = _serialize(at)
+    _write([({"Update": update}, ConflictError(job_id))])
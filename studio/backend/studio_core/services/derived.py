@@ -0,0 +1,274 @@
+"""Previews: a reduced copy of every image and a poster frame of every video.
+
+A reel tile is a few hundred pixels across, and until this it was drawn from
+the original — a twelve-megapixel still or a whole video, fetched in full so
+that a browser could shrink it. A page of two hundred tiles was gigabytes.
+Now each image gets a `THUMB_WIDTH` JPEG and each video a `POSTER_WIDTH` JPEG
+of one frame, kept at `s3.derived_key(blob_key, width)`, and `browse` hands
+out those as `preview_url`.
+
+## When one is made
+
+**Lazily, by whichever listing first meets a row without one.** `browse`
+passes the rows it is about to render to `schedule`, which hands the ones still
+wanting a preview to a `derive` job (`services.jobs`), and answers with the
+original as the preview meanwhile; the listing does not wait. A confirmed
+upload is handed over the same way by `routes/nodes.confirm_upload`, so a new
+file usually has its preview before anyone lists it. Asking for a preview is
+therefore the same thing as needing one, and a library written before this
+existed fills in as it is browsed rather than in one pass over everything.
+
+Where no job can run — a Lambda with no queue, or `config.derive_previews`
+off — nothing is asked and every preview is the original, exactly as before.
+
+**`preview` on the row says what exists.** `catalog.set_preview` records the
+width made, on both halves of the node, so a listing knows from the one query
+it already makes; `0` means the bytes would not decode and the original
+stands, and stops the row being asked about again. `set_blob` takes it off, so
+new bytes get a new preview.
+
+## What each costs
+
+An image is read whole, up to `config.max_preview_source_bytes`, and decoded
+with Pillow; `draft` lets a JPEG decode at a fraction of its size, which is
+most of the saving on the commonest input. A video is never read whole:
+ffmpeg is pointed at a presigned URL and seeks one second in, so it reads the
+container's index and the bytes around one frame by range. Both arrive in the
+image as wheels — Pillow, and ffmpeg from `imageio-ffmpeg`, as the pipeline
+has it — and are imported only by the job that renders.
+
+**Keyed by the blob, not the node.** A copy shares its source's blob, so its
+preview is already there; `produce` finds it by the source size stored beside
+it and records it without rendering again.
+"""
+
+import io
+import logging
+import subprocess
+import threading
+
+from studio_core import config
+from studio_core.clients.aws import s3
+from studio_core.errors import ConflictError, NotFoundError, UpstreamError
+from studio_core.services import catalog, jobs, keys
+
+logger = logging.getLogger(__name__)
+
+# The width of an image's preview, and of a video's poster frame. A tile is
+# drawn at up to about 240 CSS pixels, so 480 covers a 2x display; a poster is
+# what a video shows full-width before it plays, so it is wider.
+THUMB_WIDTH = 480
+POSTER_WIDTH = 960
+
+JPEG_QUALITY = 82
+
+# How far into a video the poster frame is taken. The first frame of a
+# generated clip is very often black or a fade; one second in rarely is. A clip
+# shorter than that gets its first frame instead.
+POSTER_SEEK_SECONDS = 1
+
+FFMPEG_TIMEOUT_SECONDS = 60
+
+# Who a `derive` job says created it. No person asked for it.
+CREATED_BY = "studio:previews"
+
+# (node_id, blob_key, size) already handed to a job by this process. Without it
+# every listing of a folder between a job being queued and its first preview
+# landing would queue the same rows again. Bounded crudely — cleared when full —
+# because forgetting costs one redundant job, which `produce` makes cheap.
+_ASKED_LIMIT = 10_000
+_asked: set[tuple[str, str, int]] = set()
+_asked_lock = threading.Lock()
+
+
+def reset() -> None:
+    """Forget what has been asked for. Tests use this."""
+    with _asked_lock:
+        _asked.clear()
+
+
+def width_for(record: dict) -> int | None:
+    """The width of the preview this row gets, or `None` when it gets none."""
+    kind = keys.kind(record["name"])
+    if kind == "image":
+        return THUMB_WIDTH
+    if kind == "video":
+        return POSTER_WIDTH
+    return None
+
+
+def wanted(record: dict) -> bool:
+    """Whether this row is a finished upload of media with no preview recorded."""
+    return (
+        record["kind"] == catalog.KIND_FILE
+        and bool(record.get("blob_key"))
+        and "size" in record
+        and "preview" not in record
+        and width_for(record) is not None
+    )
+
+
+def url(record: dict) -> str | None:
+    """A signed URL for the row's preview, or `None` when it has none to sign."""
+    width = record.get("preview")
+    if not width or not record.get("blob_key"):
+        return None
+    return s3.presign(s3.derived_key(record["blob_key"], width))
+
+
+def available() -> bool:
+    """Whether asking for a preview now would get one made."""
+    return config.derive_previews() and jobs.available()
+
+
+def schedule(lib: str, records: list[dict]) -> None:
+    """Hand the rows that want a preview to one `derive` job, if any do.
+
+    Never raises for a failure to queue: the caller is a listing, and a listing
+    without previews is what every listing was until now. The rows are
+    forgotten again, so the next listing asks once more.
+    """
+    if not available():
+        return
+    fresh = []
+    with _asked_lock:
+        for record in records:
+            if not wanted(record):
+                continue
+            asked = (record["node_id"], record["blob_key"], record["size"])
+            if asked in _asked:
+                continue
+            if len(_asked) >= _ASKED_LIMIT:
+                _asked.clear()
+            _asked.add(asked)
+            fresh.append(record)
+    if not fresh:
+        return
+    try:
+        jobs.submit(
+            lib, "derive", [record["node_id"] for record in fresh], {}, created_by=CREATED_BY
+        )
+    except UpstreamError as error:
+        logger.warning("Could not queue %d previews: %s", len(fresh), error)
+        with _asked_lock:
+            _asked.difference_update(
+                (record["node_id"], record["blob_key"], record["size"]) for record in fresh
+            )
+
+
+def render_image(body: bytes, width: int) -> bytes:
+    """A JPEG no wider or taller than `width`, upright, on white where it was clear."""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(body)) as opened:
+        # A JPEG decodes at 1/2, 1/4 or 1/8 scale when asked first; anything
+        # else ignores this.
+        opened.draft("RGB", (width, width))
+        image = ImageOps.exif_transpose(opened)
+        image.thumbnail((width, width))
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            flattened = Image.new("RGB", image.size, "white")
+            flattened.paste(image, mask=image.getchannel("A"))
+            image = flattened
+        out = io.BytesIO()
+        image.convert("RGB").save(out, "JPEG", quality=JPEG_QUALITY, optimize=True)
+        return out.getvalue()
+
+
+def render_video(source: str, width: int) -> bytes | None:
+    """One frame of the video at `source`, a URL or a path, as a JPEG; `None` if none decodes."""
+    import imageio_ffmpeg
+
+    scale = (
+        f"scale=w='min({width},iw)':h='min({width},ih)':force_original_aspect_ratio=decrease"
+    )
+    for seek in (["-ss", str(POSTER_SEEK_SECONDS)], []):
+        try:
+            done = subprocess.run(
+                [
+                    imageio_ffmpeg.get_ffmpeg_exe(),
+                    "-v", "error",
+                    *seek,
+                    "-i", source,
+                    "-frames:v", "1",
+                    "-vf", scale,
+                    "-f", "image2pipe",
+                    "-c:v", "mjpeg",
+                    "-q:v", "4",
+                    "-",
+                ],
+                capture_output=True,
+                timeout=FFMPEG_TIMEOUT_SECONDS,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        if done.returncode == 0 and done.stdout:
+            return done.stdout
+    return None
+
+
+def _video_source(blob_key: str) -> str:
+    """What ffmpeg reads a video from: a URL it can range over."""
+    return s3.presign(blob_key, fresh=True)
+
+
+def _render(record: dict, width: int) -> bytes | None:
+    """The preview's bytes, or `None` when this blob cannot have one."""
+    blob_key = record["blob_key"]
+    if width == POSTER_WIDTH:
+        return render_video(_video_source(blob_key), width)
+    if record["size"] > config.max_preview_source_bytes():
+        return None
+    try:
+        body = s3.get_body(blob_key, record["size"])
+    except NotFoundError:
+        return None
+    try:
+        return render_image(body, width)
+    except Exception as error:  # noqa: BLE001 - Pillow raises a dozen types for bad bytes
+        logger.info("No preview for %s: %s", record["node_id"], error)
+        return None
+
+
+def produce(record: dict) -> int | None:
+    """Make this row's preview if it is not already stored, and record it.
+
+    Returns the width recorded — `0` for none possible — or `None` when the row
+    moved on meanwhile: deleted, or given a new blob whose own preview will be
+    asked for by the next listing.
+    """
+    blob_key, size = record["blob_key"], record["size"]
+    width = width_for(record)
+    if s3.derived_source_size(blob_key, width) != size:
+        body = _render(record, width)
+        if body is None:
+            width = 0
+        else:
+            s3.put_derived(blob_key, width, body, source_size=size)
+    try:
+        catalog.set_preview(record["node_id"], blob_key, width)
+    except (ConflictError, NotFoundError):
+        return None
+    return width
+
+
+def _derive_step(job: dict, chunk: list[str]) -> dict:
+    """A `derive` job's chunk. Safe twice: a row with a preview is not wanted."""
+    made = none = 0
+    for node_id in chunk:
+        try:
+            record = catalog.node(node_id)
+        except NotFoundError:
+            continue
+        if not wanted(record):
+            continue
+        width = produce(record)
+        if width:
+            made += 1
+        elif width == 0:
+            none += 1
+    return {"derived": made, "undecodable": none}
+
+
+JOB_STEPS = {"derive": _derive_step}
@@ -32,6 +32,11 @@ follows from the token kind: humbugg validates an access token and so checks
 reference implementation in this repo; this is that pattern in Python.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 import jwt
 from jwt import PyJWKClient
 from jwt.exceptions import (
@@ -48,8 +53,21 @@ from studio_core.errors import AuthError, ConfigError, UpstreamError
 # symmetric algorithm keyed on the public key.
 ALGORITHMS = ["RS256"]
 
+# How many verified tokens are remembered at once. A token is about 1 KB and a
+# warm container serves a handful of people, each holding one ID token an hour;
+# the cap exists so that a client minting tokens in a loop cannot grow this
+# without bound, not because any real traffic approaches it.
+CLAIMS_CACHE_ENTRIES = 1024
+
 _jwks_client = None
 
+# Digest of (issuer, client id, token) -> the claims that token verified to.
+# Ordered so the least recently used entry is the one evicted past the cap, and
+# locked because the local dev server answers requests on threads: one thread
+# reordering it while another evicts is not atomic. See `node_cache.LruTier`.
+_claims_cache: OrderedDict[str, dict] = OrderedDict()
+_claims_lock = threading.Lock()
+
 
 def jwks_client() -> PyJWKClient:
     """Lazily built, module-cached client over the pool's JWKS endpoint.
@@ -72,18 +90,53 @@ def reset_jwks_client() -> None:
     _jwks_client = None
 
 
+def reset_claims_cache() -> None:
+    """Forget every verified token. Tests use this; entries otherwise leave at `exp`."""
+    with _claims_lock:
+        _claims_cache.clear()
+
+
 def caller_sub(authorization_header: str | None) -> str:
     """The Cognito `sub` of the caller, or `AuthError` if there is no valid one.
 
     `sub` and not the email address: it is the pool's immutable identifier for a
     user, while an email can be changed. Anything that records ownership records
     this.
+
+    **A token that verified once is not verified again until it expires.** The
+    JWKS fetch was already cached; what was not is the RSA signature check,
+    which is the whole cost of this function and was paid on every request for
+    a token that cannot have changed since the last one. So the claims are
+    remembered against a SHA-256 of the token, and held until that token's own
+    `exp` — the moment `jwt.decode` would start refusing it anyway. Only
+    successes are remembered: a refusal is cheap to repeat, and caching one
+    would let a transient JWKS failure outlive itself.
+
+    The digest covers the issuer and client id as well as the token, so a
+    process whose configuration changed (a test does this; prod does not)
+    cannot answer from an entry verified against the old pool. A token that is
+    tampered with in any byte is a different digest and takes the full path.
+
+    What this gives up is exactly one thing: **a signing key withdrawn from the
+    JWKS does not un-verify tokens already seen.** Neither did anything before —
+    `PyJWKClient` holds the key set for its lifespan — and Cognito rotates by
+    publishing the new key alongside the old one, so the window is bounded by
+    the ID token's lifetime, an hour by default.
     """
     token = _bearer_token(authorization_header)
     client_id = config.cognito_client_id()
     if not client_id:
         raise ConfigError("STUDIO_COGNITO_CLIENT_ID is not set.")
 
+    digest = hashlib.sha256(f"{_issuer()}\n{client_id}\n{token}".encode()).hexdigest()
+    with _claims_lock:
+        cached = _claims_cache.get(digest)
+        if cached is not None:
+            if cached["exp"] > time.time():
+                _claims_cache.move_to_end(digest)
+                return cached["sub"]
+            del _claims_cache[digest]
+
     try:
         signing_key = jwks_client().get_signing_key_from_jwt(token)
     except PyJWKClientConnectionError as error:
@@ -118,6 +171,10 @@ def caller_sub(authorization_header: str | None) -> str:
     if claims["token_use"] != "id":
         raise AuthError("The token is not valid.")
 
+    with _claims_lock:
+        _claims_cache[digest] = claims
+        while len(_claims_cache) > CLAIMS_CACHE_ENTRIES:
+            _claims_cache.popitem(last=False)
     return claims["sub"]
 
 
@@ -0,0 +1,288 @@
+"""Bulk writes too large for one request, run as jobs a caller polls.
+
+A bulk move, copy or delete is a transaction per node, and a folder delete is
+one per fifty. A few hundred of either used to run inside the request, and the
+request has a clock the work does not: API Gateway gives up at 29 seconds, and
+what had been done by then stayed done with nobody told where it stopped. Past
+`config.job_threshold` nodes the routes in `routes/manage` now resolve the
+request exactly as before — every refusal is still the request's own 400 or
+409 — and then, instead of doing the work, write a job and answer 202 with it.
+
+## What a job is
+
+A `JOB#<job_id>` row in the catalog table (`catalog.create_job`) holding
+`done`, how many items are finished, and where the items come from. For a bulk
+selection that is a list of node ids, kept in pages beside the row rather than
+on it — ten thousand ids are past DynamoDB's item limit — and read back a chunk
+at a time with `catalog.job_items`. For a folder delete it is the folder, in
+`params["folder"]`: each chunk is the first page of whatever the folder still
+holds, since the last chunk's children are gone, and the folder itself is the
+last item. `run` takes the items `JOB_CHUNK` at a time, hands each chunk to the
+step `services.manage` registered for the job's `kind`, and checkpoints `done`
+after every chunk under a condition on the value it read. `GET /api/jobs/<id>`
+reads the row back.
+
+An `UpstreamError` — DynamoDB or S3 refusing for now — says nothing about the
+job, so it fails nothing: `run` raises it with the job left at its last
+checkpoint, the queue delivers the message again, and the next run resumes at
+`done`. A step that raises anything else — a bug, not a refusal — fails the job
+with a generic error and a logged traceback, rather than leaving it `running`
+for a poll that would never see it move again.
+
+**Every step is safe to run twice on the same chunk, and that is what makes a
+checkpoint enough.** A worker that dies between finishing a chunk and
+checkpointing it leaves that chunk to be done again by whoever runs the job
+next. A move of a node already moved writes nothing, and a delete of a node
+already gone is skipped. A copy is the exception: done twice, it makes a second
+numbered copy. The chunk is small so that the exception stays small.
+
+## Who runs it
+
+A runner: anything with `submit(job_id)`. Three, chosen by `runner()`:
+
+* **`QueueRunner`** posts the id to `config.job_queue_url`, and the worker
+  Lambda in `handlers/aws/jobs` calls `run` for each message. A run that nears
+  the worker's own timeout checkpoints and posts itself again rather than being
+  killed mid-chunk.
+* **`LocalRunner`** runs jobs on one background thread in this process — the
+  dev server, and the suite, which calls `drain` to wait for it. Not in a
+  Lambda: the container freezes as soon as the response is sent, and the thread
+  with it. It stands in for the queue's redelivery too, running a job an
+  `UpstreamError` stopped again, `LOCAL_ATTEMPTS` times in all.
+* **None at all** in a Lambda with no queue configured. `available()` is then
+  false and the routes stay inline, which is exactly what they did before jobs
+  existed — so deploying this ahead of the queue changes nothing.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from studio_core import config
+from studio_core.clients.aws import sqs
+from studio_core.errors import ConflictError, NotFoundError, UpstreamError, ValidationError
+from studio_core.services import catalog
+
+logger = logging.getLogger(__name__)
+
+# How many items one checkpoint covers. Small enough that a chunk redone after a
+# crash is a few seconds of work, large enough that the checkpoint — one
+# conditional write — is not the cost of the job.
+JOB_CHUNK = 25
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# What a job's step is allowed to fail with and still be reported, rather than
+# logged as a bug: the same refusals the synchronous route would have answered
+# with, arriving late. Not `UpstreamError`, which is no answer about the job and
+# is run again instead; see the module docstring.
+REPORTED = (ConflictError, NotFoundError, ValidationError)
+
+# How many times `LocalRunner` runs a job an `UpstreamError` keeps stopping, and
+# how long it waits before each rerun — the queue's redelivery, in this process.
+LOCAL_ATTEMPTS = 3
+LOCAL_RETRY_SECONDS = 1.0
+
+
+class LocalRunner:
+    """Runs jobs one at a time on a background thread in this process."""
+
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="studio-job")
+        self._futures = []
+        self._lock = threading.Lock()
+
+    def submit(self, job_id: str, attempt: int = 1) -> None:
+        with self._lock:
+            self._futures.append(self._pool.submit(self._run, job_id, attempt))
+
+    def _run(self, job_id: str, attempt: int) -> None:
+        try:
+            run(job_id)
+        except UpstreamError:
+            if attempt >= LOCAL_ATTEMPTS:
+                logger.error("Job %s stopped on upstream errors %d times; leaving it", job_id, attempt)
+                return
+            time.sleep(LOCAL_RETRY_SECONDS * attempt)
+            self.submit(job_id, attempt + 1)
+
+    def drain(self) -> None:
+        """Wait for every job submitted so far, including those they resubmitted."""
+        while True:
+            with self._lock:
+                pending = [future for future in self._futures if not future.done()]
+            if not pending:
+                return
+            wait(pending)
+
+
+class QueueRunner:
+    """Posts a job to the queue the worker Lambda reads."""
+
+    def submit(self, job_id: str) -> None:
+        sqs.send(config.job_queue_url(), {"job_id": job_id})
+
+
+_runner = None
+
+
+def install(runner) -> None:
+    """Replace the runner. Tests use this."""
+    global _runner
+    _runner = runner
+
+
+def runner():
+    """The runner for this process, chosen once; `None` when jobs cannot run here."""
+    global _runner
+    if _runner is None:
+        if config.job_queue_url():
+            _runner = QueueRunner()
+        elif not config.in_lambda():
+            _runner = LocalRunner()
+    return _runner
+
+
+def available() -> bool:
+    """Whether a job submitted now would be run by anything."""
+    return runner() is not None
+
+
+def wanted(size: int | None) -> bool:
+    """Whether work of this many nodes should be a job. `None` is "too many to count"."""
+    return available() and (size is None or size > config.job_threshold())
+
+
+def submit(
+    lib: str,
+    kind: str,
+    items: list[str] | None,
+    params: dict,
+    *,
+    created_by: str,
+    total: int | None = None,
+) -> dict:
+    """Write a job and hand it to the runner. Returns its view, for a 202.
+
+    `items` is the node ids to work through; `None` for a folder delete, whose
+    `params["folder"]` is its source and `total` the count it starts from.
+    """
+    total = len(items) if items is not None else total
+    record = catalog.create_job(
+        lib, kind, params, total=total, items=items, created_by=created_by
+    )
+    runner().submit(record["job_id"])
+    logger.info("Queued %s job %s over %d items", kind, record["job_id"], total)
+    return view(record)
+
+
+def view(record: dict) -> dict:
+    """What a poll answers with. The item list stays in the table."""
+    return {
+        "job_id": record["job_id"],
+        "kind": record["kind"],
+        "status": record["status"],
+        "total": record["total"],
+        "done": record["done"],
+        "result": record["result"],
+        "error": record.get("error"),
+        "created_at": record["created_at"],
+        "updated_at": record["updated_at"],
+    }
+
+
+def _steps() -> dict:
+    # Imported here rather than at the top: `services.manage` and
+    # `services.derived` submit jobs, so they import this module, and the steps
+    # they register are their own functions.
+    from studio_core.services import derived, manage
+
+    return manage.JOB_STEPS | derived.JOB_STEPS
+
+
+def run(job_id: str, *, deadline: float | None = None) -> None:
+    """Work a job through to the end, or until `deadline` on `time.monotonic()`.
+
+    At least one chunk is done whatever the deadline says, so a job always moves
+    forward. Past it, the job is resubmitted and this call returns; the next
+    run picks up at `done`.
+    """
+    record = catalog.job(job_id)
+    step = _steps()[record["kind"]]
+    first = True
+    while record["status"] in (QUEUED, RUNNING) and record["done"] < record["total"]:
+        if not first and deadline is not None and time.monotonic() >= deadline:
+            runner().submit(job_id)
+            return
+        first = False
+
+        at = record["done"]
+        try:
+            chunk, last = _chunk(record)
+            partial = step(record, chunk)
+        except UpstreamError:
+            # Left at the last checkpoint, status and all, for the delivery
+            # after this one: what failed was the catalog or the bucket, not
+            # anything the job asked for.
+            logger.warning("Job %s stopped at %d on an upstream error; leaving it to run again", job_id, at)
+            raise
+        except REPORTED as error:
+            # Worded as the route would have worded it, `app_factory`'s 404
+            # prefix included, since this is the same refusal arriving late.
+            message = f"No such object: {error}" if isinstance(error, NotFoundError) else str(error)
+            _checkpoint(job_id, at, {"status": FAILED, "error": message})
+            logger.warning("Job %s failed at %d: %s", job_id, at, error)
+            return
+        except Exception:
+            # Not a refusal, so nothing a caller can act on is in it; the
+            # traceback is for the log. Failed rather than left `running`,
+            # which a poll would watch forever.
+            logger.exception("Job %s stopped at %d", job_id, at)
+            _checkpoint(job_id, at, {"status": FAILED, "error": "The job stopped on an internal error."})
+            return
+
+        result = dict(record["result"])
+        for name, count in partial.items():
+            result[name] = result.get(name, 0) + count
+        done = at + len(chunk)
+        finished = last or done >= record["total"]
+        changes = {
+            "done": done,
+            "result": result,
+            "status": DONE if finished else RUNNING,
+        }
+        if "folder" in record["params"]:
+            # Counted when the job was written; a child added since is work too.
+            changes["total"] = done if finished else max(record["total"], done + 1)
+        if not _checkpoint(job_id, at, changes):
+            return
+        record = {**record, **changes}
+
+    logger.info("Job %s is %s", job_id, record["status"])
+
+
+def _chunk(record: dict) -> tuple[list[str], bool]:
+    """The next chunk of a job's items, and whether it is the last.
+
+    A folder delete's chunk is the first page of the children still there, and
+    once there are none, the folder itself; a list's is the next `JOB_CHUNK` ids.
+    """
+    folder = record["params"].get("folder")
+    if folder is None:
+        return catalog.job_items(record["job_id"], record["done"], JOB_CHUNK), False
+    children = catalog.child_ids(folder, JOB_CHUNK)
+    return (children, False) if children else ([folder], True)
+
+
+def _checkpoint(job_id: str, at: int, changes: dict) -> bool:
+    """Record progress; `False` when another worker got there first and owns the job now."""
+    try:
+        catalog.advance_job(job_id, at=at, assignments=changes)
+    except ConflictError:
+        logger.info("Job %s was advanced past %d elsewhere; leaving it", job_id, at)
+        return False
+    return True
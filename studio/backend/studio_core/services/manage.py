@@ -38,11 +38,23 @@ What did *not* change is the rule that was never about storage:
 intact: it is 1000 because `DeleteObjects` takes 1000 keys per call, and a bulk
 delete is no longer one call. See `_bulk`.
 
+## Past `config.job_threshold`, a job
+
+The four bulk writes — `move_objects`, `copy_objects`, `delete_objects` and
+`delete_folder` — resolve and check everything they always did, and then, when
+the work is more nodes than a request should carry, hand the resolved node ids
+to `services.jobs` and answer with the job instead of the result. The steps a
+job runs are at the bottom of this file, in `JOB_STEPS`, beside the inline
+loops they mirror; each one has to survive being run twice on the same chunk,
+which is `services.jobs`' one rule for them.
+
 ## What still touches S3, and in which order
 
-Only bytes. `copy_objects` issues one `CopyObject` per blob, the two deletes
-remove blobs **after** their rows, and `update_text` overwrites one object.
-Nothing here lists the bucket any more.
+Only bytes. `copy_objects` shares its sources' blobs and issues a `CopyObject`
+only for a blob the catalog has no count for, the two deletes remove blobs
+**after** their rows — and only the ones nothing names any more — and
+`update_text` overwrites one object, or writes a fresh one when its own is
+shared. Nothing here lists the bucket any more.
 
 The delete order is the recoverable one and is worth stating where it is
 implemented: an orphan blob is invisible to every reader and collectable later,
@@ -70,12 +82,13 @@ the walk would not have reached it.
 instead.
 """
 
+import itertools
 import logging
 
 from studio_core import config
 from studio_core.clients.aws import s3
 from studio_core.errors import ConflictError, NotFoundError, ValidationError
-from studio_core.services import catalog, keys
+from studio_core.services import catalog, jobs, keys
 
 logger = logging.getLogger(__name__)
 
@@ -210,7 +223,9 @@ def rename_folder(lib: str, raw_prefix: str | None, raw_name: str | None) -> dic
 # ──────────────────────────────── move ────────────────────────────────
 
 
-def move_objects(lib: str, raw_keys: list | None, raw_destination: str | None) -> dict:
+def move_objects(
+    lib: str, raw_keys: list | None, raw_destination: str | None, *, caller: str | None = None
+) -> dict:
     """Move one or many files into another folder, keeping their names.
 
     The counterpart of `rename_object`: that one changes the last segment and
@@ -260,6 +275,16 @@ def move_objects(lib: str, raw_keys: list | None, raw_destination: str | None) -
         if _taken(destination["node_id"], record["name"]):
             raise ConflictError(f"'{record['name']}' already exists there")
 
+    if jobs.wanted(len(moving)):
+        job = jobs.submit(
+            lib,
+            "move_objects",
+            [record["node_id"] for record in moving],
+            {"destination": destination["node_id"]},
+            created_by=caller,
+        )
+        return {"destination": prefix, "skipped": skipped, "job": job}
+
     for record in moving:
         catalog.move_node(record["node_id"], destination["node_id"])
 
@@ -322,12 +347,14 @@ def move_folder(lib: str, raw_prefix: str | None, raw_destination: str | None) -
 # ──────────────────────────────── copy ────────────────────────────────
 
 
-def copy_objects(lib: str, raw_keys: list | None, raw_destination: str | None) -> dict:
+def copy_objects(
+    lib: str, raw_keys: list | None, raw_destination: str | None, *, caller: str | None = None
+) -> dict:
     """Copy one or many files into another folder, leaving the sources alone.
 
-    **The only write in this service that copies bytes**, and that is the point
-    of it rather than an oversight. Every other copy this module used to make was
-    half of a rename or a move, and all of those are transactions now.
+    **The only write in this service that may copy bytes**, and it does so only
+    when it has to. Every other copy this module used to make was half of a
+    rename or a move, and all of those are transactions now.
 
     It takes the same `{keys, destination}` as `move_objects` and differs in two
     places:
@@ -346,18 +373,23 @@ def copy_objects(lib: str, raw_keys: list | None, raw_destination: str | None) -
     bookkeeping the favourites feature was removed for. Ask for a copy, get a
     copy. Nothing is overwritten in any branch.
 
-    **Each copy gets its own blob, and that is load-bearing rather than
-    incidental.** A row is cheap and a second row on one `blob_key` would be
-    cheaper still, but `catalog.delete_node` reports the keys it removed rows for
-    without asking whether anything else still points at them — there is no index
-    on `blob_key` — so the two deletes below would destroy a surviving copy's
-    bytes. Copy-on-write is #334 and has to revisit that; until it does, the
-    invariant "no two rows share a key" is held here, by the `CopyObject`.
-
-    The row is minted before its bytes, so a failure between the two leaves a
-    placeholder — a row with a key and no object — which a listing renders
-    without a URL rather than as a broken tile. That is #294's state and the same
-    trade `routes/nodes.record_run` makes.
+    **A copy shares its source's blob** — a row on the same `blob_key`, and a
+    `refs + 1` on its `BLOB#` count in the same transaction — so copying a 2 GB
+    video is three items written and no bytes moved. The count is what makes
+    that safe: `catalog.delete_node` hands back only the keys it took the last
+    reference to, so the two deletes below leave a surviving copy's bytes alone,
+    and `update_text` writes a shared file's new body somewhere of its own. The
+    copy's size and content type are the source row's, which for a confirmed
+    upload is what S3 said when it landed; no `HeadObject` is made.
+
+    **A source the catalog has no count for is copied the old way**: its row
+    predates the counts, or was seeded straight into the table, and sharing an
+    uncounted key would let the first delete of either row take the other's
+    bytes. Its copy gets its own blob, with the row minted before the bytes, so
+    a failure between the two leaves a placeholder — a row with a key and no
+    object — which a listing renders without a URL rather than as a broken tile.
+    That is #294's state and the same trade `routes/nodes.record_run` makes.
+    `studio catalog refs --apply` counts those keys, after which they share too.
     """
     _bulk(raw_keys, "copy")
 
@@ -365,10 +397,28 @@ def copy_objects(lib: str, raw_keys: list | None, raw_destination: str | None) -
     prefix = _as_prefix(walked)
     sources = [_file_at(lib, raw)[0] for raw in raw_keys]
 
+    if jobs.wanted(len(sources)):
+        # A placeholder is still refused up front, from the row. The `HeadObject`
+        # per source is left to the job — a thousand of them is the slow half of
+        # the request — so an object gone from under its row fails the job at
+        # that file rather than refusing the request.
+        for record in sources:
+            if not record.get("blob_key"):
+                raise NotFoundError(record["name"])
+        job = jobs.submit(
+            lib,
+            "copy_objects",
+            [record["node_id"] for record in sources],
+            {"destination": destination["node_id"]},
+            created_by=caller,
+        )
+        return {"destination": prefix, "job": job}
+
     # Every source's bytes located before any row is written, for the reason the
     # key resolution above happens first: one unreadable source must not leave
     # half a request applied.
-    blobs = [(record, _source_blob(record)) for record in sources]
+    counted = catalog.blob_refs([record["blob_key"] for record in sources if record.get("blob_key")])
+    blobs = [(record, _source_blob(record, counted)) for record in sources]
 
     # The destination's names, listed once and then kept current in memory, so a
     # bulk copy of forty costs one query rather than forty — and so two sources
@@ -377,19 +427,8 @@ def copy_objects(lib: str, raw_keys: list | None, raw_destination: str | None) -
     taken = {entry["name"] for entry in catalog.children(destination["node_id"])}
     copied: list[str] = []
 
-    for record, (blob_key, metadata) in blobs:
-        name = _free_copy_name(record["name"], taken)
-        taken.add(name)
-
-        created = catalog.create_node(destination["node_id"], name, catalog.KIND_FILE)
-        s3.copy(blob_key, created["blob_key"])
-        catalog.set_blob(
-            created["node_id"],
-            created["blob_key"],
-            size=metadata.get("ContentLength", 0),
-            content_type=metadata.get("ContentType"),
-        )
-        copied.append(name)
+    for record, blob in blobs:
+        copied.append(_copy_one(record, blob, destination["node_id"], taken))
 
     logger.info("Copied %d objects into %s", len(copied), destination["node_id"])
     return {
@@ -399,21 +438,72 @@ def copy_objects(lib: str, raw_keys: list | None, raw_destination: str | None) -
     }
 
 
-def _source_blob(record: dict) -> tuple[str, dict]:
-    """Where a file's bytes are, and what S3 says about them.
+def _copy_one(
+    record: dict, blob: tuple[str, dict, bool], destination_id: str, taken: set[str]
+) -> str:
+    """Copy one file under a free name, sharing its blob where it can. Returns the name.
+
+    A share can still be refused between `blob_refs` and the write — the last
+    other row on the key deleted in between, taking the count to zero — and
+    `UncountedBlob` then means "copy the bytes", which is what a source that was
+    never counted gets anyway. The `CopyObject` that follows reports a 404 if
+    the bytes went with that delete.
+    """
+    blob_key, metadata, shared = blob
+    name = _free_copy_name(record["name"], taken)
+    taken.add(name)
+
+    if shared:
+        try:
+            catalog.create_node(
+                destination_id,
+                name,
+                catalog.KIND_FILE,
+                blob_key=blob_key,
+                size=metadata.get("ContentLength", 0),
+                content_type=metadata.get("ContentType"),
+                share=True,
+            )
+            return name
+        except catalog.UncountedBlob:
+            logger.info("Blob of %s was released mid-copy; copying its bytes", record["node_id"])
+
+    created = catalog.create_node(destination_id, name, catalog.KIND_FILE)
+    s3.copy(blob_key, created["blob_key"])
+    catalog.set_blob(
+        created["node_id"],
+        created["blob_key"],
+        size=metadata.get("ContentLength", 0),
+        content_type=metadata.get("ContentType"),
+    )
+    return name
+
+
+def _source_blob(record: dict, counted: dict[str, int]) -> tuple[str, dict, bool]:
+    """Where a file's bytes are, what they are, and whether a copy may share them.
 
     A file row with no `blob_key`, or one whose object is not there, is a
     placeholder whose upload never landed (#294). There is nothing to copy, and a
     404 naming the file is the honest answer — `s3.head` raises exactly that.
 
-    The size and content type come from S3 rather than from the source row so the
-    copy describes the bytes it actually received, not what the source claimed
-    about them.
+    **Shared when the key is counted and the row carries a `size`.** The count
+    is `counted`, read once for the whole request by `catalog.blob_refs`; the
+    size is what a confirmed upload, a finished copy and a text save all write,
+    and a placeholder never has. Both together mean the row already says what
+    the bytes are, so it is believed rather than headed. Anything else is asked
+    of S3, as every copy used to be, so the copy describes the bytes it actually
+    received rather than what the source claimed about them.
     """
     blob_key = record.get("blob_key")
     if not blob_key:
         raise NotFoundError(record["name"])
-    return blob_key, s3.head(blob_key)
+    if counted.get(blob_key, 0) > 0 and "size" in record:
+        return (
+            blob_key,
+            {"ContentLength": record["size"], "ContentType": record.get("content_type")},
+            True,
+        )
+    return blob_key, s3.head(blob_key), False
 
 
 def _free_copy_name(name: str, taken: set[str]) -> str:
@@ -460,6 +550,12 @@ def update_text(lib: str, raw_key: str | None, raw_content: str | None) -> dict:
     the delete is the way round it is. `size` on the row is a claim about an
     object; writing it before the object exists would be a claim about bytes that
     were never stored, and a listing reports that number without re-reading S3.
+
+    **A blob a copy shares is never overwritten** — that would edit the copy as
+    well. The new body goes to `catalog.private_blob_key` instead and `set_blob`
+    moves this row's reference onto it, which is the copy-on-write half of
+    `copy_objects` sharing blobs. A blob this row holds alone, or one the
+    catalog has no count for, is overwritten in place as it always was.
     """
     record, walked = _file_at(lib, raw_key)
     name = record["name"]
@@ -478,9 +574,15 @@ def update_text(lib: str, raw_key: str | None, raw_content: str | None) -> dict:
     if not blob_key:
         raise NotFoundError(name)
 
+    if catalog.blob_refs([blob_key]).get(blob_key, 0) > 1:
+        blob_key = catalog.private_blob_key(record)
+
     content_type = keys.content_type(name)
     s3.put_text(blob_key, body, content_type)
-    catalog.set_blob(record["node_id"], blob_key, size=len(body), content_type=content_type)
+    updated = catalog.set_blob(record["node_id"], blob_key, size=len(body), content_type=content_type)
+    # Empty unless a copy deleted since the count was read left this row the
+    # old key's last holder.
+    s3.delete(updated["released"])
 
     logger.info("Saved %d bytes to %s", len(body), record["node_id"])
     return {
@@ -494,7 +596,7 @@ def update_text(lib: str, raw_key: str | None, raw_content: str | None) -> dict:
 # ─────────────────────────────── delete ───────────────────────────────
 
 
-def delete_objects(lib: str, raw_keys: list | None) -> dict:
+def delete_objects(lib: str, raw_keys: list | None, *, caller: str | None = None) -> dict:
     """Delete one or many files.
 
     Bulk and single are the same call because the grid's selection is the reason
@@ -527,6 +629,16 @@ def delete_objects(lib: str, raw_keys: list | None) -> dict:
         seen.add(record["node_id"])
         resolved.append((record, walked))
 
+    if jobs.wanted(len(resolved)):
+        job = jobs.submit(
+            lib,
+            "delete_objects",
+            [record["node_id"] for record, _walked in resolved],
+            {},
+            created_by=caller,
+        )
+        return {"job": job}
+
     blob_keys: list[str] = []
     for record, _walked in resolved:
         blob_keys.extend(catalog.delete_node(record["node_id"])["blob_keys"])
@@ -539,7 +651,7 @@ def delete_objects(lib: str, raw_keys: list | None) -> dict:
     }
 
 
-def delete_folder(lib: str, raw_prefix: str | None) -> dict:
+def delete_folder(lib: str, raw_prefix: str | None, *, caller: str | None = None) -> dict:
     """Delete a folder and everything beneath it.
 
     `deleted` counts **nodes** rather than objects — the folders are rows now and
@@ -547,12 +659,105 @@ def delete_folder(lib: str, raw_prefix: str | None) -> dict:
     reports the five rows that describe them.
 
     Rows before blobs, for the reason `delete_objects` gives. The subtree bound
-    is `catalog.subtree`'s and it refuses rather than truncates.
+    is `catalog.subtree`'s and it refuses rather than truncates — inline. **A job
+    is how a folder past that bound is deleted at all:** it works through the
+    folder's children and then the folder, one `delete_node` each, so the bound
+    applies to each child's subtree rather than to the whole. The job holds the
+    folder's id and reads its children a chunk at a time, not a list of them,
+    which at ten thousand would not fit in one item. A child that is itself past
+    the bound still fails the job, at that child.
     """
     record, walked = _folder_at(lib, raw_prefix)
 
+    # `delete_node`'s own refusal, made before a job can get as far as deleting
+    # everything beneath the root and only then being told. Counted, not
+    # collected, and only as far as the threshold: past it the answer is a job
+    # whatever the rest of the count would have been.
+    if jobs.available() and record.get("parent_id"):
+        size = sum(
+            1
+            for _row in itertools.islice(
+                catalog.descendants(lib, catalog.child_path(record), keys_only=True),
+                config.job_threshold() + 1,
+            )
+        )
+        if jobs.wanted(size):
+            job = jobs.submit(
+                lib,
+                "delete_folder",
+                None,
+                {"folder": record["node_id"]},
+                created_by=caller,
+                total=len(catalog.children(record["node_id"])) + 1,
+            )
+            return {"prefix": _as_prefix(walked), "job": job}
+
     result = catalog.delete_node(record["node_id"])
     s3.delete(result["blob_keys"])
 
     logger.info("Deleted folder %s (%d nodes)", record["node_id"], result["deleted"])
     return {"prefix": _as_prefix(walked), "deleted": result["deleted"]}
+
+
+# ─────────────────────────────── job steps ───────────────────────────────
+#
+# What `services.jobs.run` calls for each chunk of a job's node ids, by kind.
+# Each returns counts to add to the job's `result`, and each must leave things
+# right if it is run a second time on a chunk it already did: the checkpoint
+# comes after the chunk, so a worker that dies in between leaves it to be
+# redone.
+
+
+def _move_step(job: dict, chunk: list[str]) -> dict:
+    """`move_node` each; a second move to the same parent writes nothing.
+
+    The destination is read first so that its disappearing fails the job, where
+    a source disappearing only skips that source.
+    """
+    destination_id = catalog.node(job["params"]["destination"])["node_id"]
+    moved = 0
+    for node_id in chunk:
+        try:
+            moved += catalog.move_node(node_id, destination_id)["moved"]
+        except NotFoundError:
+            continue
+    return {"moved": moved}
+
+
+def _copy_step(job: dict, chunk: list[str]) -> dict:
+    """`_copy_one` each, numbering against the destination as it is now.
+
+    The one step that is not quite idempotent: a chunk redone makes second,
+    numbered copies of whatever it had copied before the crash. Nothing is
+    overwritten, and `JOB_CHUNK` bounds how many — and since a counted blob is
+    shared rather than copied, a redone copy costs a row, not the bytes again.
+    """
+    destination_id = job["params"]["destination"]
+    taken = {entry["name"] for entry in catalog.children(destination_id)}
+    sources = [catalog.node(node_id) for node_id in chunk]
+    counted = catalog.blob_refs([record["blob_key"] for record in sources if record.get("blob_key")])
+    for record in sources:
+        _copy_one(record, _source_blob(record, counted), destination_id, taken)
+    return {"copied": len(chunk)}
+
+
+def _delete_step(job: dict, chunk: list[str]) -> dict:
+    """`delete_node` each, rows before blobs; a node already gone is skipped."""
+    deleted, blob_keys = 0, []
+    for node_id in chunk:
+        try:
+            result = catalog.delete_node(node_id)
+        except NotFoundError:
+            continue
+        deleted += result["deleted"]
+        blob_keys.extend(result["blob_keys"])
+    s3.delete(blob_keys)
+    return {"deleted": deleted}
+
+
+JOB_STEPS = {
+    "move_objects": _move_step,
+    "copy_objects": _copy_step,
+    "delete_objects": _delete_step,
+    "delete_folder": _delete_step,
+}
@@ -0,0 +1,161 @@
+"""Catalog items already read, kept in the process for the next request to reuse.
+
+`services.catalog` reads through this for the items a browse repeats most — a
+node's record (`NODE#<id>`/`META`) and a folder's entry for one name
+(`NODE#<parent>`/`NAME#<name>`) — so a warm container answering one person's
+browsing session stops paying a round trip and a `TypeDeserializer` pass for
+the same rows every few hundred milliseconds. The keys are the item's `pk` and
+`sk` joined with `/`, built by `catalog` and opaque here: the table's layout
+stays the one thing only that module knows.
+
+## Three things keep it honest
+
+**Every write forgets what it touched, twice.** `catalog._write` is the only
+way an item is written, and it calls `invalidate` with the keys of every item
+in the transaction before sending it and again after, whether it succeeded or
+not. Before, so nothing cached can outlive the write; after, so a read that
+raced the transaction in another thread cannot have put the old row back.
+
+**Each entry carries the version it was read at.** `version()` is a counter
+bumped by every `invalidate`. A reader takes it *before* going to DynamoDB and
+hands it back to `put`, and a `put` whose version is no longer current is
+dropped — the read began before some write finished, so what it found may be
+the row as it was. That refuses more than it strictly has to (any write, not
+just one to this key), which is the right way round for a cache: a refusal
+costs one read, a wrong acceptance costs a stale answer until the TTL.
+
+**The TTL is what bounds everything else.** Another container's write cannot
+reach this process, so `config.node_cache_ttl_seconds` is how long a rename or
+an upload made elsewhere can take to show here. Short for that reason, and `0`
+turns the cache off.
+
+## Tiers
+
+What holds the entries is a tier: `get`, `put`, `delete` and `clear`, keyed by
+string. `LruTier` is the only one, and `install` swaps it, which is what a test
+that wants a tiny cap does. A shared tier behind a local socket was considered
+and not built — the API runs one Lambda process per container and `dev-up.sh`
+runs one dev server, so there is no second process on the same host to share
+with.
+
+`stats()` reports hits, misses and refused puts since the last `reset`. A hit
+rate is the one number that says whether the TTL is earning anything.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from studio_core import config
+
+# How many items are remembered at once. A record is a few hundred bytes, so
+# this is a couple of megabytes at the cap — small beside the Lambda's memory,
+# and well past the few folders one person browses inside a TTL.
+NODE_CACHE_ENTRIES = 4096
+
+
+class LruTier:
+    """The in-process tier: an ordered dict, least recently used evicted first.
+
+    Locked because the local dev server answers requests on threads, and an
+    `OrderedDict` being reordered by one while another evicts is not atomic.
+    The Lambda serves one request at a time and never waits on it.
+    """
+
+    def __init__(self, entries: int = NODE_CACHE_ENTRIES):
+        self.entries = entries
+        self._items: OrderedDict[str, tuple[int, float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[int, float, dict] | None:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                self._items.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: tuple[int, float, dict]) -> None:
+        with self._lock:
+            self._items[key] = entry
+            self._items.move_to_end(key)
+            while len(self._items) > self.entries:
+                self._items.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_tier = LruTier()
+_version = 0
+# Held across `put`'s version check and its store, and across `invalidate`'s
+# bump and deletes. A subtree write sends its transactions from a pool, so two
+# invalidations — or an invalidation and a read thread's put — can interleave,
+# and a put that checked the version just before a bump must not store just
+# after the delete it was meant to lose to.
+_guard = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "refused": 0}
+
+
+def install(tier) -> None:
+    """Replace the tier, and start it and the counters from empty. Tests use this."""
+    global _tier
+    _tier = tier
+    reset()
+
+
+def version() -> int:
+    """The version to hand back to `put` — read it before going to DynamoDB."""
+    return _version
+
+
+def get(key: str) -> dict | None:
+    """A copy of the cached item, or `None` when absent, expired or disabled."""
+    if config.node_cache_ttl_seconds() <= 0:
+        return None
+    entry = _tier.get(key)
+    if entry is None or entry[1] <= time.monotonic():
+        _stats["misses"] += 1
+        return None
+    _stats["hits"] += 1
+    return dict(entry[2])
+
+
+def put(key: str, value: dict, read_at: int) -> None:
+    """Remember a copy of an item read at `read_at`, unless a write has happened since."""
+    ttl = config.node_cache_ttl_seconds()
+    if ttl <= 0:
+        return
+    with _guard:
+        if read_at != _version:
+            _stats["refused"] += 1
+            return
+        _tier.put(key, (read_at, time.monotonic() + ttl, dict(value)))
+
+
+def invalidate(keys: list[str]) -> None:
+    """Forget these items and move the version on, so in-flight reads cannot restore them."""
+    global _version
+    with _guard:
+        _version += 1
+        for key in keys:
+            _tier.delete(key)
+
+
+def stats() -> dict:
+    """Hits, misses and refused puts since the last `reset`, and how full the tier is."""
+    return {**_stats, "entries": len(_tier)}
+
+
+def reset() -> None:
+    """Empty the tier and zero the counters. Tests use this; writes use `invalidate`."""
+    _tier.clear()
+    for name in _stats:
+        _stats[name] = 0
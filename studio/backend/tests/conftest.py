@@ -13,12 +13,17 @@ os.environ.setdefault("STUDIO_CATALOG_TABLE", "studio-prod-catalog")
 # stale `STUDIO_MEDIA_ROOT_PREFIX` left in a shell would otherwise silently
 # rewrite what every test in the suite is asserting about.
 os.environ["STUDIO_MEDIA_ROOT_PREFIX"] = ""
+# Off, because on it would hand every listing's images to a background job,
+# and the fixture's "images" are a few bytes that decode to nothing.
+# `test_derived` turns it back on where it is what is being tested.
+os.environ["STUDIO_DERIVE_PREVIEWS"] = "0"
 
 from moto import mock_dynamodb, mock_s3  # noqa: E402
 
 from studio_core import app_factory, config  # noqa: E402
 from studio_core.clients.aws import dynamodb, s3  # noqa: E402
 from studio_core.errors import AuthError  # noqa: E402
+from studio_core.services import catalog, node_cache  # noqa: E402
 
 # A miniature of the real bucket, which no longer wraps anything in `media/`:
 # `characters/` holds who a subject is, `projects/` holds what was generated of
@@ -120,9 +125,16 @@ CATALOG_ITEMS = [
 
 @pytest.fixture
 def catalog_table():
-    """A live (moto-backed) copy of the catalog table, isolated per test."""
+    """A live (moto-backed) copy of the catalog table, isolated per test.
+
+    The membership cache and `node_cache` are emptied with it, both ways:
+    `catalog` remembers rows per process, and a row remembered from the last
+    test's table is one this test never wrote.
+    """
     with mock_dynamodb():
         dynamodb.reset_client()
+        catalog.reset_membership_cache()
+        node_cache.reset()
         client = boto3.client("dynamodb", region_name="us-east-1")
         client.create_table(
             TableName=config.catalog_table(),
@@ -175,6 +187,8 @@ def catalog_table():
             client.put_item(TableName=config.catalog_table(), Item=item)
         yield client
         dynamodb.reset_client()
+        catalog.reset_membership_cache()
+        node_cache.reset()
 
 
 # ─────────────────────── the same tree, as catalog rows ───────────────────────
@@ -242,6 +256,7 @@ def _tree_items(objects: dict) -> list[dict]:
                 "kind": {"S": kind},
                 "path": {"S": f"{path}/"},
                 "created_at": {"S": stamp},
+                **{field: record[field] for field in catalog.LISTED_FIELDS if field in record},
             }
         )
         return node_id
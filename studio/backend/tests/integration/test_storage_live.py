@@ -1,9 +1,10 @@
 """S3 and DynamoDB behaviours moto does not reproduce (#289).
 
-Three things the unit suite asserts against a fake and therefore cannot settle:
+Four things the unit suite asserts against a fake and therefore cannot settle:
 a presigned URL that a real HTTP client can actually fetch, a
-`TransactWriteItems` condition failure with real cancellation semantics, and the
-claim that moving a node touches no object at all.
+`TransactWriteItems` condition failure with real cancellation semantics, the
+claim that moving a node touches no object at all, and a keyset reel paged
+through `by-recent` with the `Limit` semantics moto 4.2 gets wrong.
 """
 
 import urllib.request
@@ -12,7 +13,7 @@ import pytest
 
 from studio_core.clients.aws import s3
 from studio_core.errors import ConflictError
-from studio_core.services import catalog
+from studio_core.services import browse, catalog
 
 
 def test_a_presigned_url_fetches_real_bytes(bucket, library):
@@ -96,3 +97,36 @@ def test_a_rename_leaves_descendant_paths_untouched(library):
     catalog.rename_node(folder["node_id"], "subjects")
 
     assert catalog.node(child["node_id"])["path"] == before
+
+
+def test_a_keyset_reel_of_a_branch_reads_a_real_index_in_order(library, monkeypatch):
+    """What `dynamodb_limits` in `tests/test_browse.py` stands in for, against the real thing.
+
+    A `Limit` on `by-recent` counts rows read in index order, and the filter
+    runs after it. Newer files outside the branch then sit between the reel and
+    the three inside it, and a row budget smaller than them makes every read
+    stop early: the reel still has to arrive newest first, whole, and once each.
+    """
+    root = library["root"]
+    inside = catalog.create_node(root, "inside", catalog.KIND_FOLDER)
+    outside = catalog.create_node(root, "outside", catalog.KIND_FOLDER)
+    library["created"].extend([inside["node_id"], outside["node_id"]])
+    for n in range(3):
+        catalog.create_node(
+            inside["node_id"], f"{n}.png", catalog.KIND_FILE, blob_key=f"blobs/it-{n}", size=1
+        )
+    for n in range(12):
+        catalog.create_node(
+            outside["node_id"], f"{n}.png", catalog.KIND_FILE, blob_key=f"blobs/it-o{n}", size=1
+        )
+    monkeypatch.setattr("studio_core.config.max_folder_objects", lambda: 4)
+
+    keys, cursor = [], None
+    while True:
+        page = browse.reel_items(library["lib"], "inside/", cursor, 1, pagination="keyset")
+        keys.extend(item["key"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert keys == ["inside/2.png", "inside/1.png", "inside/0.png"]
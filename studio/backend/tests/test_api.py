@@ -201,6 +201,74 @@ def test_tree_rejects_an_unknown_sort(catalog_tree):
     assert _client().get("/api/tree?sort=sideways").status_code == 400
 
 
+# ---------------------------------------------------------------------------
+# Conditional GET
+#
+# A listing goes out with a weak `ETag`, and a request that sends it back is
+# answered 304 until something in the folder changes — or the URLs the body
+# would have carried were re-signed, which is a change to the body too.
+# ---------------------------------------------------------------------------
+
+
+def _revalidated(path, response):
+    return _client().get(path, headers={"If-None-Match": response.headers["ETag"]})
+
+
+def test_tree_sends_a_weak_tag_and_answers_it_with_a_304(catalog_tree):
+    first = _client().get("/api/tree?prefix=characters/subject-a/")
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    again = _revalidated("/api/tree?prefix=characters/subject-a/", first)
+
+    assert again.status_code == 304
+    assert again.data == b""
+    assert again.headers["ETag"] == first.headers["ETag"]
+
+
+def test_tree_is_sent_again_once_its_folder_changes(catalog_tree):
+    first = _client().get("/api/tree?prefix=characters/subject-a/")
+    _client().post("/api/folder", json={"prefix": "characters/subject-a/", "name": "keepers"})
+
+    again = _revalidated("/api/tree?prefix=characters/subject-a/", first)
+
+    assert again.status_code == 200
+    assert "keepers" in [folder["name"] for folder in again.get_json()["folders"]]
+    assert again.headers["ETag"] != first.headers["ETag"]
+
+
+def test_tree_is_sent_again_once_an_ancestor_is_renamed(catalog_tree):
+    """The folder's own rev did not move, but the `prefix` its body carries did."""
+    node_id = _client().get("/api/tree?prefix=characters/").get_json()["folders"][0]["id"]
+    first = _client().get(f"/api/tree?node={node_id}")
+    _client().patch("/api/folder", json={"prefix": "characters/", "name": "cast"})
+
+    again = _revalidated(f"/api/tree?node={node_id}", first)
+
+    assert again.status_code == 200
+    assert again.get_json()["prefix"].startswith("cast/")
+
+
+def test_tree_is_sent_again_once_its_urls_are_resigned(catalog_tree, monkeypatch):
+    from studio_core.services import browse
+
+    first = _client().get("/api/tree?prefix=characters/subject-a/")
+    monkeypatch.setattr(browse, "_signing_window", lambda: -1)
+
+    assert _revalidated("/api/tree?prefix=characters/subject-a/", first).status_code == 200
+
+
+def test_reel_answers_its_own_tag_with_a_304(catalog_tree):
+    first = _client().get("/api/reel?prefix=characters/subject-a/")
+    assert first.headers["ETag"].startswith('W/"')
+
+    assert _revalidated("/api/reel?prefix=characters/subject-a/", first).status_code == 304
+    # The second page is a different body and so a different tag.
+    paged = _client().get("/api/reel?prefix=characters/subject-a/&cursor=1")
+    assert paged.headers["ETag"] != first.headers["ETag"]
+
+
 # ---------------------------------------------------------------------------
 # Writes
 #
@@ -18,8 +18,10 @@ from flask import g, jsonify
 
 from studio_core import app_factory, config
 from studio_core.app_factory import create_app
+from studio_core.clients.aws import dynamodb
+from studio_core.routes import nodes
 from studio_core.services import catalog
-from tests.conftest import CATALOG_LIBRARY, CATALOG_MEMBER, CATALOG_OWNER
+from tests.conftest import CATALOG_LIBRARY, CATALOG_MEMBER, CATALOG_OWNER, CATALOG_ROOT
 
 OTHER_LIBRARY = "lib-0002"
 STRANGER = "sub-stranger"
@@ -324,3 +326,52 @@ def test_the_library_header_is_ignored_on_libraries(real_catalog, signed_in):
 
     assert resp.status_code == 200
     assert resp.get_json() == {"sub": STRANGER, "library": None}
+
+
+# ─────────────────── how many times the rows are read ───────────────────
+#
+# The hook reads the caller's memberships and every node route authorises
+# against them, so the two used to be two queries on `USER#<sub>` per request.
+# Counted at the client rather than by stubbing `libraries_for`, because a stub
+# would count calls to a function that is now allowed to answer from memory.
+
+
+@pytest.fixture
+def membership_queries(real_catalog, monkeypatch):
+    """How many `USER#` queries reach the moto table, as a one-item list."""
+    monkeypatch.setattr(nodes, "catalog", catalog)
+    count = [0]
+
+    def _count(params, **_kwargs):
+        values = params.get("ExpressionAttributeValues", {})
+        if values.get(":pk", {}).get("S", "").startswith("USER#"):
+            count[0] += 1
+
+    dynamodb.client().meta.events.register("provide-client-params.dynamodb.Query", _count)
+    return count
+
+
+def test_a_node_route_reads_the_memberships_once(membership_queries, signed_in, monkeypatch):
+    """The hook's read and the route's check are the same rows now.
+
+    With the cache off, so that a second read would reach the table and be
+    counted rather than being answered from memory and hiding.
+    """
+    monkeypatch.setenv("STUDIO_MEMBERSHIP_TTL_SECONDS", "0")
+    signed_in.sub = CATALOG_OWNER
+
+    resp = _client().get(f"/api/nodes/{CATALOG_ROOT}")
+
+    assert resp.status_code == 200
+    assert membership_queries[0] == 1
+
+
+def test_a_warm_request_reads_no_memberships(membership_queries, signed_in):
+    signed_in.sub = CATALOG_OWNER
+    client = _client()
+    client.get(f"/api/nodes/{CATALOG_ROOT}")
+
+    resp = client.get(f"/api/nodes?parent={CATALOG_ROOT}")
+
+    assert resp.status_code == 200
+    assert membership_queries[0] == 1
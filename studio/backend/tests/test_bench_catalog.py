@@ -0,0 +1,61 @@
+"""The catalog's counted costs, held to `benchmarks/catalog_baseline.json`.
+
+A change that makes `children`, `branch`, `subtree`, `descendants`, `recent`,
+`create_numbered`, `move_node` or `delete_node` take more round trips or more
+capacity than the baseline records — past `STUDIO_BENCH_TOLERANCE`, 10% unless
+set — fails here, naming the operation, the shape and the number. A change
+meant to cost more rewrites the baseline in the same commit:
+
+    cd studio/backend && python -m benchmarks.bench_catalog --nodes 1000,10000 --write-baseline
+
+Only counts are compared. Seconds are moto's, and a suite that failed on a slow
+machine would be a suite people learn to rerun. `STUDIO_BENCH_NODES` picks the
+sizes, `1000` unless set; each must be in the baseline.
+"""
+
+import os
+
+import pytest
+
+from benchmarks import bench_catalog
+
+SIZES = [int(size) for size in os.environ.get("STUDIO_BENCH_NODES", "1000").split(",")]
+
+
+@pytest.mark.parametrize("shape", bench_catalog.SHAPES)
+def test_no_catalog_operation_costs_more_than_its_baseline(shape):
+    baseline = bench_catalog.load_baseline()
+    for nodes in SIZES:
+        assert shape in baseline.get(str(nodes), {}), f"no baseline for {nodes} {shape}"
+
+    report = bench_catalog.measure(SIZES, (shape,))
+
+    assert bench_catalog.compare(baseline, report, tolerance=bench_catalog.tolerance()) == []
+
+
+def test_a_number_past_the_tolerance_is_a_regression():
+    baseline = {"1000": {"flat": {"children": {
+        "round_trips": 10, "read_units": 4.0, "write_units": 0.0, "seconds": 1.0,
+    }}}}
+    within = {"1000": {"flat": {"children": {
+        "round_trips": 11, "read_units": 3.0, "write_units": 0.0, "seconds": 9.0,
+    }}}}
+    past = {"1000": {"flat": {"children": {
+        "round_trips": 12, "read_units": 4.0, "write_units": 0.0, "seconds": 1.0,
+    }}}}
+
+    assert bench_catalog.compare(baseline, within, tolerance=0.1) == []
+    assert bench_catalog.compare(baseline, past, tolerance=0.1) == [
+        "1000 flat children: round_trips 12 > 10 (+10%)"
+    ]
+    assert bench_catalog.compare(baseline, within, tolerance=0.1, timed=True) == [
+        "1000 flat children: seconds 9.0 > 1.0 (+10%)"
+    ]
+
+
+def test_what_the_baseline_does_not_hold_is_not_compared():
+    report = {"50": {"flat": {"children": {
+        "round_trips": 99, "read_units": 99.0, "write_units": 99.0, "seconds": 99.0,
+    }}}}
+
+    assert bench_catalog.compare({}, report, tolerance=0.0) == []
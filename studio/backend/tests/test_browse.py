@@ -1,6 +1,7 @@
 import pytest
 
 from studio_core import config
+from studio_core.clients.aws import s3
 from studio_core.errors import ForbiddenError, NotFoundError, ValidationError
 from studio_core.services import browse, catalog, manage
 from tests.conftest import CATALOG_LIBRARY
@@ -95,6 +96,32 @@ def test_listing_presigns_every_file(catalog_tree):
     assert all("X-Amz-Signature" in f["url"] for f in result["files"])
 
 
+def test_a_listing_asked_again_hands_out_the_urls_it_signed(catalog_tree, monkeypatch):
+    """The second listing of a folder signs nothing; the URLs are still good."""
+    first = browse.list_folder(CATALOG_LIBRARY, "characters/subject-a/seed/")
+    monkeypatch.setattr(
+        s3.client(), "generate_presigned_url", lambda *args, **kwargs: pytest.fail("signed")
+    )
+
+    again = browse.list_folder(CATALOG_LIBRARY, "characters/subject-a/seed/")
+
+    assert [f["url"] for f in again["files"]] == [f["url"] for f in first["files"]]
+
+
+def test_a_folder_the_caller_already_holds_is_never_listed(catalog_tree, monkeypatch):
+    """The tag is decided off the folder's own record, before its children are read."""
+    tag, body = browse.tagged_folder(CATALOG_LIBRARY, "characters/subject-a/")
+    assert body is not None
+
+    def listed(_parent_id):
+        raise AssertionError("a revalidated folder queried its children")
+
+    monkeypatch.setattr(catalog, "listing", listed)
+    assert browse.tagged_folder(
+        CATALOG_LIBRARY, "characters/subject-a/", unchanged=lambda held: held == tag
+    ) == (tag, None)
+
+
 def test_a_file_row_with_no_blob_lists_without_a_url(catalog_tree, catalog_table):
     """A row pointing at nothing lists, and signs nothing.
 
@@ -351,6 +378,21 @@ def test_asset_url_by_node_reaches_a_blob_a_name_path_cannot(catalog_tree):
         browse.asset_url(CATALOG_LIBRARY, "characters/subject-a/seed/minted.webp", None)
 
 
+def test_asset_url_by_node_takes_size_and_type_off_a_described_row(catalog_tree, monkeypatch):
+    """No HEAD when the row already says what the object is."""
+    media_bucket, _ = catalog_tree
+    record = _minted(
+        media_bucket, "characters/subject-a/seed/", "minted.webp", b"webp",
+        content_type="image/webp",
+    )
+    monkeypatch.setattr(s3, "head", lambda key: pytest.fail(f"HEAD {key}"))
+
+    signed = browse.asset_url(CATALOG_LIBRARY, None, None, node_id=record["node_id"])
+
+    assert (signed["size"], signed["content_type"]) == (len(b"webp"), "image/webp")
+    assert signed["expires_in"] == config.presign_ttl_seconds()
+
+
 def test_asset_url_by_key_signs_material_that_has_no_node(catalog_tree, media_bucket):
     """The one raw S3 key left, and the reason it is left.
 
@@ -663,6 +705,218 @@ def test_a_truncated_reel_still_names_its_folders(catalog_tree, monkeypatch):
         assert "node-" not in item["key"], item["key"]
 
 
+@pytest.fixture
+def dynamodb_limits(catalog_tree, monkeypatch):
+    """Make a `by-recent` query's `Limit` count rows in index order, as DynamoDB does.
+
+    For the keyset reel tests below and no others. **moto 4.2 applies `Limit`
+    before it orders an index**: it takes the first `Limit` matching rows in
+    *table* order, then sorts those, so a newest-first page of two is the two
+    oldest rows reversed, and its start key resumes in table order too.
+    `catalog.recent_page` sends a `Limit` sized to the page, and against that
+    these tests would be testing moto's ordering rather than the reel's.
+
+    So for that one index, and only when a `Limit` is sent, the read is
+    answered the way DynamoDB answers it: the rows the key condition matches,
+    in index order; resumed after the start key; cut at `Limit` rows *read*,
+    which is what `ScannedCount` reports; and only then filtered. Both halves
+    come from moto without a `Limit`, where it orders correctly. The test of
+    the real thing is `tests/integration/`, against a live table.
+    """
+    client = catalog.dynamodb.client()
+    real = client.query
+
+    def _identity(item):
+        return item["pk"]["S"], item["sk"]["S"]
+
+    def query(**kwargs):
+        if kwargs.get("IndexName") != "by-recent" or "Limit" not in kwargs:
+            return real(**kwargs)
+        limit = kwargs.pop("Limit")
+        start = kwargs.pop("ExclusiveStartKey", None)
+        kept = {_identity(item): item for item in real(**kwargs)["Items"]}
+        condition = kwargs["KeyConditionExpression"]
+        read = real(
+            TableName=kwargs["TableName"],
+            IndexName=kwargs["IndexName"],
+            KeyConditionExpression=condition,
+            ExpressionAttributeValues={
+                name: value
+                for name, value in kwargs["ExpressionAttributeValues"].items()
+                if name in condition
+            },
+            ScanIndexForward=kwargs.get("ScanIndexForward", True),
+        )["Items"]
+        position = 0
+        if start is not None:
+            position = 1 + [_identity(item) for item in read].index(_identity(start))
+        window = read[position : position + limit]
+        items = [kept[_identity(row)] for row in window if _identity(row) in kept]
+        response = {"Items": items, "Count": len(items), "ScannedCount": len(window)}
+        if position + limit < len(read):
+            response["LastEvaluatedKey"] = {
+                name: window[-1][name] for name in ("pk", "sk", "lib", "created_at")
+            }
+        return response
+
+    monkeypatch.setattr(client, "query", query)
+
+
+def _keyset_pages(raw_prefix=None, page_size=2, sort=None):
+    """Every page of a keyset reel, followed to the end."""
+    pages, cursor = [], None
+    while True:
+        page = browse.reel_items(
+            CATALOG_LIBRARY, raw_prefix, cursor, page_size, sort, pagination="keyset"
+        )
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_a_keyset_reel_pages_through_everything_the_offset_reel_lists(dynamodb_limits):
+    pages = _keyset_pages(page_size=2)
+    keys = [item["key"] for page in pages for item in page["items"]]
+
+    assert all(len(page["items"]) <= 2 for page in pages)
+    assert len(keys) == len(set(keys)), "no row is on two pages"
+    assert set(keys) == {item["key"] for item in browse.reel_items(CATALOG_LIBRARY)["items"]}
+    # Full name paths, composed from the batched read: a keyset page never read
+    # the branch's folders, so this is the only way it can have them.
+    assert all("node-" not in key for key in keys)
+    assert all(page["total"] is None and page["truncated"] is False for page in pages)
+
+
+def test_a_keyset_reel_runs_newest_first_by_creation_and_oldest_reverses_it(dynamodb_limits):
+    newest = [item["key"] for page in _keyset_pages() for item in page["items"]]
+    oldest = [item["key"] for page in _keyset_pages(sort="oldest") for item in page["items"]]
+
+    assert oldest == list(reversed(newest))
+    # The fixture writes rows in FIXTURE_OBJECTS order and nothing has been
+    # edited since, so creation order and the offset reel's order agree.
+    assert newest == [item["key"] for item in browse.reel_items(CATALOG_LIBRARY)["items"]]
+
+
+def test_a_keyset_reel_of_a_branch_stays_inside_it(dynamodb_limits):
+    keys = [
+        item["key"]
+        for page in _keyset_pages("characters/subject-a/", page_size=1)
+        for item in page["items"]
+    ]
+
+    assert keys == [
+        "characters/subject-a/reference/subject-a_1.webp",
+        "characters/subject-a/seed/subject-a_2.webp",
+        "characters/subject-a/seed/subject-a_1.webp",
+    ]
+
+
+def test_a_keyset_reel_of_a_small_branch_reads_its_budget_and_no_more(
+    dynamodb_limits, monkeypatch
+):
+    """Rows the filter throws away are charged to the budget, not read for free.
+
+    Sixty newer files outside the branch sit between a newest-first reel of it
+    and the three it holds. Counting only what the filter kept, the first call
+    would read all sixty (and more, one 1 MB page at a time) before stopping;
+    charged what DynamoDB scanned, no call reads past its budget.
+    """
+    root = catalog.library(CATALOG_LIBRARY)["root_node"]
+    bulk = catalog.create_node(root, "bulk", catalog.KIND_FOLDER)["node_id"]
+    for n in range(60):
+        catalog.create_node(bulk, f"{n}.png", catalog.KIND_FILE, blob_key=f"blobs/{n}", size=3)
+    monkeypatch.setattr("studio_core.config.max_folder_objects", lambda: 10)
+    client = catalog.dynamodb.client()
+    query = client.query
+    scanned = []
+
+    def _counting(**kwargs):
+        response = query(**kwargs)
+        if kwargs.get("IndexName") == catalog.BY_RECENT_INDEX:
+            scanned[-1] += response["ScannedCount"]
+        return response
+
+    monkeypatch.setattr(client, "query", _counting)
+    pages, cursor = [], None
+    while True:
+        scanned.append(0)
+        page = browse.reel_items(
+            CATALOG_LIBRARY, "characters/subject-a/", cursor, 1, pagination="keyset"
+        )
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert max(scanned) <= 10
+    assert [item["key"] for page in pages for item in page["items"]] == [
+        "characters/subject-a/reference/subject-a_1.webp",
+        "characters/subject-a/seed/subject-a_2.webp",
+        "characters/subject-a/seed/subject-a_1.webp",
+    ]
+
+
+def test_a_keyset_reel_is_not_capped_by_the_folder_limit(dynamodb_limits, monkeypatch):
+    """Where the offset reel truncates, this one stops each read early and carries on.
+
+    A page may then come back short with a cursor — the row budget ran out
+    before the page filled — which is not the end of the reel.
+    """
+    everything = len(browse.reel_items(CATALOG_LIBRARY)["items"])
+    monkeypatch.setattr("studio_core.config.max_folder_objects", lambda: 2)
+    pages = _keyset_pages(page_size=50)
+
+    keys = [item["key"] for page in pages for item in page["items"]]
+    assert len(pages) > 1
+    assert len(keys) == len(set(keys)) == everything
+
+
+def test_a_keyset_reel_keeps_nodes_created_in_the_same_instant(dynamodb_limits, monkeypatch):
+    """Equal `created_at` has no order in the index, so the cursor names who was seen."""
+    root = catalog.library(CATALOG_LIBRARY)["root_node"]
+    monkeypatch.setattr(catalog, "_now", lambda: "2030-01-01T00:00:00.000000+00:00")
+    for name in ("a.png", "b.png", "c.png"):
+        catalog.create_node(root, name, catalog.KIND_FILE, blob_key=f"blobs/{name}", size=3)
+
+    keys = [item["key"] for page in _keyset_pages(page_size=1) for item in page["items"]]
+
+    assert sorted(keys[:3]) == ["a.png", "b.png", "c.png"]
+    assert len(keys) == len(set(keys))
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["2", "not-base64!", "eyJrIjoge319"],
+    ids=["an offset", "garbage", "an empty position"],
+)
+def test_a_keyset_reel_rejects_a_cursor_it_did_not_issue(catalog_tree, cursor):
+    with pytest.raises(ValidationError):
+        browse.reel_items(CATALOG_LIBRARY, None, cursor, 2, pagination="keyset")
+
+
+def test_a_keyset_cursor_is_bound_to_the_reel_it_came_from(dynamodb_limits):
+    cursor = browse.reel_items(CATALOG_LIBRARY, None, None, 1, pagination="keyset")[
+        "next_cursor"
+    ]
+
+    with pytest.raises(ValidationError):
+        browse.reel_items(CATALOG_LIBRARY, None, cursor, 1, "oldest", pagination="keyset")
+    with pytest.raises(ValidationError):
+        browse.reel_items(CATALOG_LIBRARY, "characters/", cursor, 1, pagination="keyset")
+
+
+def test_a_keyset_reel_refuses_a_name_sort(catalog_tree):
+    """No index is ordered by name, so there is no position to resume from."""
+    with pytest.raises(ValidationError):
+        browse.reel_items(CATALOG_LIBRARY, None, None, 2, "name", pagination="keyset")
+
+
+def test_an_unknown_pagination_is_refused(catalog_tree):
+    with pytest.raises(ValidationError):
+        browse.reel_items(CATALOG_LIBRARY, pagination="page")
+
+
 # ---------------------------------------------------------------------------
 # What a listing carries, and what it must never carry
 # ---------------------------------------------------------------------------
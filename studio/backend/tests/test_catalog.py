@@ -12,6 +12,8 @@ Every assertion about a stored item is made through `client.get_item` or
 reader and the writer share a mistake.
 """
 
+import threading
+
 import pytest
 
 from studio_core import config
@@ -55,6 +57,111 @@ def test_libraries_for_a_stranger_is_empty(catalog_table):
     assert catalog.libraries_for("sub-nobody") == []
 
 
+def _grant(client, sub, lib):
+    """A membership row written behind the catalog's back, as `add-member.sh` does."""
+    client.put_item(
+        TableName=config.catalog_table(),
+        Item={
+            "pk": {"S": f"USER#{sub}"},
+            "sk": {"S": f"LIB#{lib}"},
+            "role": {"S": "member"},
+            "created_at": {"S": "2026-08-19T12:00:00.000000+00:00"},
+        },
+    )
+
+
+def test_libraries_for_is_remembered_within_the_ttl(catalog_table):
+    """A grant made outside the process is not seen until the entry expires.
+
+    That is the cost the TTL is chosen against, asserted so that nobody reads
+    the cache as coherent with `scripts/add-member.sh` — it is not, and cannot
+    be, since the script never talks to this process.
+    """
+    catalog.libraries_for(CATALOG_OWNER)
+    _grant(catalog_table, CATALOG_OWNER, "lib-0002")
+
+    assert [row["lib"] for row in catalog.libraries_for(CATALOG_OWNER)] == [CATALOG_LIBRARY]
+
+
+def test_libraries_for_reads_again_once_the_entry_expires(catalog_table, monkeypatch):
+    catalog.libraries_for(CATALOG_OWNER)
+    _grant(catalog_table, CATALOG_OWNER, "lib-0002")
+    real = catalog.time.monotonic
+    monkeypatch.setattr(
+        catalog.time, "monotonic", lambda: real() + config.membership_ttl_seconds() + 1
+    )
+
+    assert {row["lib"] for row in catalog.libraries_for(CATALOG_OWNER)} == {
+        CATALOG_LIBRARY,
+        "lib-0002",
+    }
+
+
+def test_a_ttl_of_zero_turns_the_cache_off(catalog_table, monkeypatch):
+    monkeypatch.setenv("STUDIO_MEMBERSHIP_TTL_SECONDS", "0")
+    catalog.libraries_for(CATALOG_OWNER)
+    _grant(catalog_table, CATALOG_OWNER, "lib-0002")
+
+    assert len(catalog.libraries_for(CATALOG_OWNER)) == 2
+
+
+def test_a_catalog_write_to_a_membership_forgets_it(catalog_table):
+    """Nothing in the catalog writes a membership today; the first thing that does
+    goes through `_write`, and must not leave its own process believing the old rows."""
+    catalog.libraries_for(CATALOG_OWNER)
+    catalog._write(
+        [
+            (
+                {
+                    "Put": {
+                        "TableName": config.catalog_table(),
+                        "Item": {
+                            "pk": {"S": f"USER#{CATALOG_OWNER}"},
+                            "sk": {"S": "LIB#lib-0002"},
+                            "role": {"S": "member"},
+                        },
+                    }
+                },
+                None,
+            )
+        ]
+    )
+
+    assert len(catalog.libraries_for(CATALOG_OWNER)) == 2
+
+
+def test_the_membership_cache_holds_its_cap_under_threads(monkeypatch):
+    """Request threads and the subtree pool share it; evicting while another
+    thread reorders must neither raise nor leave it past its cap."""
+    monkeypatch.setattr(catalog, "MEMBERSHIP_CACHE_ENTRIES", 8)
+    monkeypatch.setattr(catalog, "_query", lambda **_: [])
+    catalog.reset_membership_cache()
+    failures = []
+
+    def churn(offset):
+        try:
+            for n in range(400):
+                catalog.libraries_for(f"sub-{(offset + n) % 24}")
+        except Exception as error:  # noqa: BLE001 — any of them is the failure
+            failures.append(error)
+
+    threads = [threading.Thread(target=churn, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
+    assert len(catalog._membership_cache) <= 8
+    catalog.reset_membership_cache()
+
+
+def test_what_libraries_for_hands_out_cannot_edit_the_cache(catalog_table):
+    catalog.libraries_for(CATALOG_OWNER)[0]["role"] = "owner-of-everything"
+
+    assert catalog.libraries_for(CATALOG_OWNER)[0]["role"] == "owner"
+
+
 def test_library_returns_the_name_and_the_root(catalog_table):
     # The two attributes a membership row does not carry, which is the whole
     # reason this read exists beside `libraries_for`.
@@ -180,6 +287,163 @@ def test_create_node_refuses_a_file_as_a_parent(catalog_table):
         _folder("output", parent=clip["node_id"])
 
 
+# ──────────────────────────── numbering ────────────────────────────
+
+
+class _Serialised:
+    """The real client, one call at a time, for moto's sake and no one else's.
+
+    Calls from many threads still interleave between one another — which is
+    the race being tested — but never inside one, where moto's table copies
+    are not safe. Every `fail_every`th transaction raises as a throttled
+    DynamoDB would, so some creates abort after taking their number.
+    """
+
+    def __init__(self, real, fail_every=0):
+        self._real, self._fail_every = real, fail_every
+        self._lock = threading.Lock()
+        self.transactions = 0
+
+    def transact_write_items(self, **kwargs):
+        from botocore.exceptions import ClientError
+
+        with self._lock:
+            self.transactions += 1
+            if self._fail_every and self.transactions % self._fail_every == 0:
+                raise ClientError(
+                    {"Error": {"Code": "InternalServerError", "Message": "injected"}},
+                    "TransactWriteItems",
+                )
+            return self._real.transact_write_items(**kwargs)
+
+    def __getattr__(self, name):
+        method = getattr(self._real, name)
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return method(*args, **kwargs)
+
+        return locked
+
+
+def _number(name, base="take.mp4"):
+    return 1 if name == base else int(name[len("take ("):-len(").mp4")])
+
+
+def test_create_numbered_hands_32_parallel_creators_distinct_numbers(catalog_table, monkeypatch):
+    """No duplicates, and no more gaps than there were creates that failed."""
+    takes = _folder("takes")
+    wrapped = _Serialised(catalog.dynamodb.client(), fail_every=7)
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+    start = threading.Barrier(32)
+    created, aborted, lock = [], [], threading.Lock()
+
+    def create():
+        start.wait()
+        try:
+            record = catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+        except UpstreamError as error:
+            with lock:
+                aborted.append(error)
+        else:
+            with lock:
+                created.append(record["name"])
+
+    threads = [threading.Thread(target=create) for _ in range(32)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) + len(aborted) == 32
+    assert aborted, "the stand-in failed nothing, so the gap bound was not exercised"
+    numbers = sorted(_number(name) for name in created)
+    assert len(set(numbers)) == len(numbers)
+    assert numbers[-1] - len(numbers) <= len(aborted)
+    assert sorted(entry["name"] for entry in catalog.children(takes["node_id"])) == sorted(created)
+
+
+def test_create_numbered_costs_the_same_in_a_full_folder(catalog_table, monkeypatch):
+    """The fortieth take is one reservation and one transaction, like the second."""
+    takes = _folder("takes")
+    for _ in range(40):
+        catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+    wrapped = _Serialised(catalog.dynamodb.client())
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+
+    record = catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+
+    assert record["name"] == "take (41).mp4"
+    assert wrapped.transactions == 1
+
+
+def test_create_numbered_of_a_free_name_is_one_transaction_and_no_counter(catalog_table, monkeypatch):
+    takes = _folder("takes")
+    wrapped = _Serialised(catalog.dynamodb.client())
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+
+    record = catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+
+    assert record["name"] == "take.mp4"
+    assert wrapped.transactions == 1
+    counter = f"{catalog.SEQUENCE_PREFIX}take.mp4"
+    assert _item(catalog_table, f"NODE#{takes['node_id']}", counter) is None
+
+
+def test_create_numbered_catches_up_past_names_it_never_counted(catalog_table):
+    takes = _folder("takes")
+    for name in ("take.mp4", "take (2).mp4", "take (9).mp4", "take (x).mp4"):
+        catalog.create_node(takes["node_id"], name, catalog.KIND_FILE)
+
+    first = catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+    second = catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+
+    assert (first["name"], second["name"]) == ("take (10).mp4", "take (11).mp4")
+
+
+def test_create_numbered_refuses_past_the_variant_bound(catalog_table, monkeypatch):
+    monkeypatch.setattr(catalog.keys, "MAX_NAME_VARIANTS", 2)
+    takes = _folder("takes")
+    catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+    catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+
+    with pytest.raises(ConflictError):
+        catalog.create_numbered(takes["node_id"], "take.mp4", catalog.KIND_FILE)
+
+
+def test_a_deleted_folder_takes_its_counters_with_it(catalog_table):
+    takes = _folder("takes")
+    for name in ("take.mp4", "take.mp4", "still.png", "still.png"):
+        catalog.create_numbered(takes["node_id"], name, catalog.KIND_FILE)
+    counter = f"{catalog.SEQUENCE_PREFIX}take.mp4"
+    assert _item(catalog_table, f"NODE#{takes['node_id']}", counter) is not None
+
+    catalog.delete_node(takes["node_id"])
+
+    for name in ("take.mp4", "still.png"):
+        counter = f"{catalog.SEQUENCE_PREFIX}{name}"
+        assert _item(catalog_table, f"NODE#{takes['node_id']}", counter) is None
+
+
+def test_a_folder_with_more_counters_than_a_transaction_holds_deletes(catalog_table, monkeypatch):
+    """A counter per clashing name, 120 of them, and the folder still goes."""
+    takes = _folder("takes")
+    for index in range(120):
+        catalog.create_numbered(takes["node_id"], f"take {index}.mp4", catalog.KIND_FILE)
+        catalog.create_numbered(takes["node_id"], f"take {index}.mp4", catalog.KIND_FILE)
+    wrapped = _Serialised(catalog.dynamodb.client())
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+
+    assert catalog.delete_node(takes["node_id"])["deleted"] == 241
+
+    left = catalog_table.query(
+        TableName=config.catalog_table(),
+        KeyConditionExpression="pk = :pk",
+        ExpressionAttributeValues={":pk": {"S": f"NODE#{takes['node_id']}"}},
+    )
+    assert left["Items"] == []
+
+
 # ──────────────────────────── children ────────────────────────────
 
 
@@ -199,15 +463,22 @@ def test_children_of_an_empty_folder_is_empty(catalog_table):
     assert catalog.children(folder["node_id"]) == []
 
 
-def test_children_carry_the_index_projection_only(catalog_table):
-    _file("clip.mp4", blob_key="blobs/node-x")
+def test_children_carry_what_a_listing_renders(catalog_table):
+    clip = catalog.create_node(
+        CATALOG_ROOT,
+        "clip.mp4",
+        catalog.KIND_FILE,
+        blob_key="blobs/node-x",
+        size=7,
+        content_type="video/mp4",
+    )
+    catalog.set_preview(clip["node_id"], "blobs/node-x", 960)
     entry = catalog.children(CATALOG_ROOT)[0]
 
-    assert entry["kind"] == "file"
-    # `blob_key` is not projected onto the by-parent item, by schema. A caller
-    # that needs it fetches the record.
-    assert "blob_key" not in entry
-    assert catalog.node(entry["node_id"])["blob_key"] == "blobs/node-x"
+    record = catalog.node(clip["node_id"])
+    for field in ("kind", "created_at", *catalog.LISTED_FIELDS):
+        assert entry[field] == record[field]
+    assert entry["parent_id"] == CATALOG_ROOT
 
 
 def test_child_by_name_finds_one_child(catalog_table):
@@ -230,6 +501,140 @@ def test_child_by_name_does_not_reach_into_another_folder(catalog_table):
         catalog.child_by_name(CATALOG_ROOT, "runs")
 
 
+def test_children_named_answers_many_names_under_many_parents(catalog_table):
+    characters = _folder("characters")
+    projects = _folder("projects")
+    runs = _folder("runs", parent=projects["node_id"])
+
+    found = catalog.children_named(
+        [
+            (CATALOG_ROOT, "characters"),
+            (projects["node_id"], "runs"),
+            (CATALOG_ROOT, "runs"),
+            (CATALOG_ROOT, "characters"),
+        ]
+    )
+
+    # Keyed by the question, so the same name under another parent is a miss
+    # rather than an answer — the by-parent twin of the test above.
+    assert set(found) == {(CATALOG_ROOT, "characters"), (projects["node_id"], "runs")}
+    assert found[(CATALOG_ROOT, "characters")]["node_id"] == characters["node_id"]
+    assert found[(projects["node_id"], "runs")] == {
+        **catalog.child_by_name(projects["node_id"], "runs"),
+        "node_id": runs["node_id"],
+    }
+
+
+def test_children_named_of_nothing_reads_nothing(catalog_table):
+    assert catalog.children_named([]) == {}
+
+
+# ──────────────────────────── listing ────────────────────────────
+#
+# The by-parent item is a second copy of `LISTED_FIELDS`, so the tests that
+# matter are the ones that catch the two copies drifting: after every write that
+# changes a listed field, a scan of the table must find each `NAME#` item saying
+# what its record says.
+
+
+def _listing_drift(client):
+    """Every `NAME#` item whose listed fields differ from its record's, from a scan."""
+    items = client.scan(TableName=config.catalog_table())["Items"]
+    metas = {item["pk"]["S"]: item for item in items if item["sk"]["S"] == "META"}
+    drift = []
+    for item in items:
+        if not item["sk"]["S"].startswith("NAME#"):
+            continue
+        meta = metas[f"NODE#{item['node_id']['S']}"]
+        for field in ("kind", "created_at", *catalog.LISTED_FIELDS):
+            if item.get(field) != meta.get(field):
+                drift.append((item["sk"]["S"], field))
+    return drift
+
+
+LISTED_WRITES = {
+    "create": lambda tree: catalog.create_node(
+        tree["folder"]["node_id"], "b.png", catalog.KIND_FILE, size=1, content_type="image/png"
+    ),
+    "rename": lambda tree: catalog.rename_node(tree["file"]["node_id"], "renamed.png"),
+    "move": lambda tree: catalog.move_node(tree["folder"]["node_id"], tree["other"]["node_id"]),
+    "set_blob": lambda tree: catalog.set_blob(
+        tree["file"]["node_id"], "blobs/replaced", size=11, content_type="image/webp"
+    ),
+    "transfer": lambda tree: catalog.transfer_node(tree["folder"]["node_id"], OTHER_LIBRARY),
+}
+
+
+@pytest.mark.parametrize("write", sorted(LISTED_WRITES))
+def test_no_write_leaves_the_listing_behind_the_record(catalog_table, write):
+    _other_library(catalog_table)
+    folder = _folder("characters")
+    tree = {
+        "folder": folder,
+        "other": _folder("archive"),
+        "file": _file("a.png", parent=folder["node_id"], blob_key="blobs/a"),
+    }
+
+    LISTED_WRITES[write](tree)
+
+    assert _listing_drift(catalog_table) == []
+
+
+def test_listing_is_one_query(catalog_table):
+    for index in range(3):
+        _file(f"{index}.png", blob_key=f"blobs/{index}")
+    calls = []
+    catalog.dynamodb.client().meta.events.register(
+        "before-call.dynamodb", lambda model, **_: calls.append(model.name)
+    )
+
+    entries = catalog.listing(CATALOG_ROOT)
+
+    assert [entry["name"] for entry in entries] == ["0.png", "1.png", "2.png"]
+    assert calls == ["Query"]
+
+
+def test_listing_reads_the_record_for_an_item_written_before_the_projection(catalog_table):
+    """A by-parent item without `updated_at` is an old one, and is filled in from `META`."""
+    clip = catalog.create_node(
+        CATALOG_ROOT, "clip.mp4", catalog.KIND_FILE, blob_key="blobs/c", size=3
+    )
+    catalog_table.put_item(
+        TableName=config.catalog_table(),
+        Item={
+            "pk": {"S": f"NODE#{CATALOG_ROOT}"},
+            "sk": {"S": "NAME#clip.mp4"},
+            "node_id": {"S": clip["node_id"]},
+            "lib": {"S": CATALOG_LIBRARY},
+            "kind": {"S": "file"},
+            "path": {"S": clip["path"]},
+            "created_at": {"S": clip["created_at"]},
+        },
+    )
+
+    (entry,) = catalog.listing(CATALOG_ROOT)
+
+    assert entry["size"] == 3
+    assert entry["blob_key"] == "blobs/c"
+
+
+def test_listing_keeps_a_child_whose_record_is_missing(catalog_table):
+    catalog_table.put_item(
+        TableName=config.catalog_table(),
+        Item={
+            "pk": {"S": f"NODE#{CATALOG_ROOT}"},
+            "sk": {"S": "NAME#ghost.png"},
+            "node_id": {"S": "node-ghost"},
+            "lib": {"S": CATALOG_LIBRARY},
+            "kind": {"S": "file"},
+            "path": {"S": f"/{CATALOG_ROOT}/"},
+            "created_at": {"S": "2026-08-19T12:00:00.000000+00:00"},
+        },
+    )
+
+    assert [entry["node_id"] for entry in catalog.listing(CATALOG_ROOT)] == ["node-ghost"]
+
+
 # ──────────────────────────── records ────────────────────────────
 
 
@@ -449,6 +854,113 @@ def test_subtree_refuses_past_the_folder_cap(catalog_table, monkeypatch):
         catalog.subtree(CATALOG_LIBRARY, catalog.child_path(parent))
 
 
+def test_descendants_reads_past_the_folder_cap_parents_first(catalog_table, monkeypatch):
+    """No cap, and every folder before what it holds, however deep."""
+    monkeypatch.setenv("STUDIO_MAX_FOLDER_OBJECTS", "2")
+    parent = _folder("projects")
+    project = _folder("<project>", parent=parent["node_id"])
+    output = _folder("output", parent=project["node_id"])
+    clips = [_file(f"clip-{index}.mp4", parent=output["node_id"]) for index in range(3)]
+
+    found = [
+        entry["node_id"]
+        for entry in catalog.descendants(CATALOG_LIBRARY, catalog.child_path(parent))
+    ]
+
+    assert found[:2] == [project["node_id"], output["node_id"]]
+    assert sorted(found[2:]) == sorted(clip["node_id"] for clip in clips)
+
+
+def test_descendants_stops_at_the_depth_asked_for(catalog_table):
+    parent = _folder("projects")
+    project = _folder("<project>", parent=parent["node_id"])
+    output = _folder("output", parent=project["node_id"])
+    _file("clip.mp4", parent=output["node_id"])
+    below = catalog.child_path(parent)
+
+    def ids(depth):
+        return [
+            entry["node_id"]
+            for entry in catalog.descendants(CATALOG_LIBRARY, below, depth=depth)
+        ]
+
+    assert ids(1) == [project["node_id"]]
+    assert ids(2) == [project["node_id"], output["node_id"]]
+    assert len(ids(None)) == 3
+
+
+def test_descendants_keys_only_reads_back_only_the_keys(catalog_table):
+    parent = _folder("projects")
+    created = catalog.create_node(
+        parent["node_id"], "clip.mp4", catalog.KIND_FILE, size=7, content_type="video/mp4"
+    )
+
+    [found] = catalog.descendants(
+        CATALOG_LIBRARY, catalog.child_path(parent), keys_only=True
+    )
+
+    assert set(found) == set(catalog.KEY_FIELDS)
+    assert found["node_id"] == created["node_id"]
+    assert found["size"] == 7
+
+
+def test_descendants_abandoned_reads_no_further_pages(catalog_table, monkeypatch):
+    """What a caller holds is a page: stopping early stops the query."""
+    parent = _folder("projects")
+    for index in range(5):
+        _folder(f"run-{index}", parent=parent["node_id"])
+    pages = []
+    original = catalog._pages
+
+    def counted(**kwargs):
+        for page in original(Limit=2, **kwargs):
+            pages.append(page)
+            yield page
+
+    monkeypatch.setattr(catalog, "_pages", counted)
+    walk = catalog.descendants(CATALOG_LIBRARY, catalog.child_path(parent))
+
+    assert next(walk)["kind"] == catalog.KIND_FOLDER
+    # The last page read still had a next one, and it was never asked for.
+    assert "LastEvaluatedKey" in pages[-1]
+    assert len(pages) < 5
+
+
+def test_descendants_pages_add_up_to_descendants(catalog_table):
+    parent = _folder("projects")
+    for run in range(4):
+        folder = _folder(f"run-{run}", parent=parent["node_id"])
+        for index in range(run):
+            _file(f"{index}.png", parent=folder["node_id"])
+    below = catalog.child_path(parent)
+
+    walked, after = [], None
+    while True:
+        page, after = catalog.descendants_page(CATALOG_LIBRARY, below, want=2, after=after)
+        # Whole folders only: no `path` on this page was on an earlier one.
+        assert not {entry["path"] for entry in page} & {entry["path"] for entry in walked}
+        walked += page
+        if after is None:
+            break
+
+    expected = list(catalog.descendants(CATALOG_LIBRARY, below))
+    assert sorted(entry["node_id"] for entry in walked) == sorted(
+        entry["node_id"] for entry in expected
+    )
+    assert len(walked) == len(expected) == 4 + 6
+
+
+def test_a_descendants_cursor_is_bound_to_its_library(catalog_table):
+    parent = _folder("projects")
+    for run in range(2):
+        _file("a.png", parent=_folder(f"run-{run}", parent=parent["node_id"])["node_id"])
+    below = catalog.child_path(parent)
+    _, after = catalog.descendants_page(CATALOG_LIBRARY, below, want=1)
+
+    with pytest.raises(ValidationError, match="cursor"):
+        catalog.descendants_page("lib-elsewhere", below, want=1, after=after)
+
+
 # ──────────────────────────── rename ────────────────────────────
 
 
@@ -793,8 +1305,8 @@ def test_delete_node_reports_the_blobs_it_orphaned(catalog_table):
 
     result = catalog.delete_node(folder["node_id"])
 
-    # Reported, not deleted — this module never touches S3, and whether a blob
-    # is now unreferenced is not a question one delete can answer.
+    # Reported, not deleted — this module never touches S3. Each key was held
+    # by one row, so this delete took its last reference.
     assert sorted(result["blob_keys"]) == ["blobs/node-a", "blobs/node-b"]
 
 
@@ -812,6 +1324,150 @@ def test_delete_node_refuses_the_library_root(catalog_table):
         catalog.delete_node(CATALOG_ROOT)
 
 
+def _deep(levels, width):
+    """`levels` nested folders, each also holding `width` files — a tree to chunk."""
+    parent, made = CATALOG_ROOT, []
+    for depth in range(levels):
+        folder = _folder(f"level-{depth}", parent=parent)
+        made.append(folder)
+        for index in range(width):
+            made.append(_file(f"still-{index}.png", parent=folder["node_id"]))
+        parent = folder["node_id"]
+    return made
+
+
+class _Transactions:
+    """The real client, with every `TransactWriteItems` seen first by `before`.
+
+    One at a time: moto's `transact_write_items` deep-copies its tables to roll
+    back with, and a second thread writing during the copy breaks it. DynamoDB
+    has no such limit, and what these tests check — the order transactions are
+    sent in, and what is sent again — does not need them overlapping.
+    """
+
+    def __init__(self, real, before=lambda items: None):
+        self._real, self._before = real, before
+        self._lock = threading.Lock()
+
+    def transact_write_items(self, **kwargs):
+        with self._lock:
+            self._before(kwargs["TransactItems"])
+            return self._real.transact_write_items(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+def _cancelled(*codes):
+    from botocore.exceptions import ClientError
+
+    return ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "cancelled"},
+            "CancellationReasons": [{"Code": code} for code in codes],
+        },
+        "TransactWriteItems",
+    )
+
+
+def test_delete_node_finishes_each_depth_before_the_one_above(catalog_table, monkeypatch):
+    """Chunks of one depth may land in any order; a shallower one never before them."""
+    made = _deep(levels=4, width=3)
+    depth_of = {node["node_id"]: node["path"].count("/") for node in made}
+    sent = []
+
+    def record(items):
+        # Node records only: the `BLOB#` counts ride along, and are released after.
+        records = [item["Delete"]["Key"] for item in items if "Delete" in item]
+        depths = {depth_of[key["pk"]["S"][len("NODE#"):]] for key in records
+                  if key["pk"]["S"].startswith("NODE#") and key["sk"]["S"] == "META"}
+        if depths:
+            sent.append(depths)
+
+    real = catalog.dynamodb.client()
+    wrapped = _Transactions(real, record)
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+    monkeypatch.setattr(catalog, "TRANSACTION_ITEMS", 4)
+    monkeypatch.setenv("STUDIO_TRANSACTION_WORKERS", "4")
+
+    result = catalog.delete_node(made[0]["node_id"])
+
+    assert result["deleted"] == len(made)
+    assert all(len(depths) == 1 for depths in sent), sent
+    order = [depths.pop() for depths in sent]
+    assert order == sorted(order, reverse=True)
+    assert catalog.children(CATALOG_ROOT) == []
+
+
+def test_move_node_rewrites_a_subtree_of_many_transactions(catalog_table, monkeypatch):
+    made = _deep(levels=3, width=5)
+    archive = _folder("archive")
+    real = catalog.dynamodb.client()
+    wrapped = _Transactions(real)
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+    monkeypatch.setattr(catalog, "TRANSACTION_ITEMS", 4)
+    monkeypatch.setenv("STUDIO_TRANSACTION_WORKERS", "4")
+
+    result = catalog.move_node(made[0]["node_id"], archive["node_id"])
+
+    assert result["descendants"] == len(made) - 1
+    moved = catalog.subtree(CATALOG_LIBRARY, catalog.child_path(archive))
+    assert {entry["node_id"] for entry in moved} == {node["node_id"] for node in made}
+
+
+def test_a_contended_transaction_is_sent_again(catalog_table, monkeypatch):
+    """Cancelled only because another writer was there: nothing applied, safe to resend."""
+    refused = {"count": 0}
+
+    def conflict_once(items):
+        if refused["count"] == 0:
+            refused["count"] += 1
+            raise _cancelled("None", "TransactionConflict")
+
+    folder = _folder("projects")
+    real = catalog.dynamodb.client()
+    wrapped = _Transactions(real, conflict_once)
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+    monkeypatch.setattr(catalog, "TRANSACTION_BACKOFF", 0)
+
+    catalog.delete_node(folder["node_id"])
+
+    assert refused["count"] == 1
+    with pytest.raises(NotFoundError):
+        catalog.node(folder["node_id"])
+
+
+def test_a_transaction_that_stays_contended_is_a_502(catalog_table, monkeypatch):
+    folder = _folder("projects")
+    sent = []
+
+    def always(items):
+        sent.append(items)
+        raise _cancelled("ThrottlingError", "None")
+
+    real = catalog.dynamodb.client()
+    wrapped = _Transactions(real, always)
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+    monkeypatch.setattr(catalog, "TRANSACTION_BACKOFF", 0)
+
+    with pytest.raises(UpstreamError):
+        catalog.delete_node(folder["node_id"])
+    assert len(sent) == catalog.TRANSACTION_ATTEMPTS
+
+
+def test_a_failed_condition_is_not_retried(catalog_table, monkeypatch):
+    """A taken name stays taken; sending the same transaction again cannot change that."""
+    _folder("projects")
+    sent = []
+    real = catalog.dynamodb.client()
+    wrapped = _Transactions(real, sent.append)
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+
+    with pytest.raises(ConflictError):
+        _folder("projects")
+    assert len(sent) == 1
+
+
 # ──────────────────────────── set_blob ────────────────────────────
 
 
@@ -827,13 +1483,14 @@ def test_set_blob_points_a_file_at_its_bytes(catalog_table):
     assert record["updated_at"] > created["updated_at"]
 
 
-def test_set_blob_leaves_the_by_parent_item_alone(catalog_table):
+def test_set_blob_writes_the_by_parent_item_too(catalog_table):
     created = _file("clip.mp4")
-    catalog.set_blob(created["node_id"], "blobs/node-a")
+    catalog.set_blob(created["node_id"], "blobs/node-a", size=5)
 
-    # Nothing it writes is projected onto that half, so there is nothing to sync.
+    # A listing reads only that half, so it has to say what the record says.
     by_parent = _item(catalog_table, f"NODE#{CATALOG_ROOT}", "NAME#clip.mp4")
-    assert "blob_key" not in by_parent
+    assert by_parent["blob_key"] == {"S": "blobs/node-a"}
+    assert by_parent["size"] == {"N": "5"}
 
 
 def test_set_blob_refuses_a_folder(catalog_table):
@@ -853,3 +1510,309 @@ def test_set_blob_refuses_an_empty_key(catalog_table):
 def test_set_blob_refuses_a_missing_node(catalog_table):
     with pytest.raises(NotFoundError):
         catalog.set_blob("node-gone", "blobs/node-a")
+
+
+# ──────────────────────────── set_upload ────────────────────────────
+
+UPLOAD = {"id": "upload-1", "size": 300, "part_bytes": 128, "content_type": "video/mp4"}
+
+
+def test_an_upload_is_recorded_on_the_record_half_only(catalog_table):
+    created = _file("clip.mp4", blob_key="blobs/node-a")
+
+    catalog.set_upload(created["node_id"], "blobs/node-a", UPLOAD)
+
+    assert catalog.upload_of(catalog.node(created["node_id"])) == UPLOAD
+    by_parent = _item(catalog_table, f"NODE#{CATALOG_ROOT}", "NAME#clip.mp4")
+    assert "upload_id" not in by_parent
+
+
+def test_an_upload_is_refused_once_the_node_names_other_bytes(catalog_table):
+    created = _file("clip.mp4", blob_key="blobs/node-b")
+
+    with pytest.raises(ConflictError):
+        catalog.set_upload(created["node_id"], "blobs/node-a", UPLOAD)
+
+
+def test_clearing_an_upload_removes_every_field(catalog_table):
+    created = _file("clip.mp4", blob_key="blobs/node-a")
+    catalog.set_upload(created["node_id"], "blobs/node-a", UPLOAD)
+
+    catalog.set_upload(created["node_id"], "blobs/node-a", None)
+
+    record = catalog.node(created["node_id"])
+    assert catalog.upload_of(record) is None
+    assert not set(catalog.UPLOAD_FIELDS) & set(record)
+
+
+def test_set_blob_clears_the_upload_it_completes(catalog_table):
+    created = _file("clip.mp4", blob_key="blobs/node-a")
+    catalog.set_upload(created["node_id"], "blobs/node-a", UPLOAD)
+
+    returned = catalog.set_blob(created["node_id"], "blobs/node-a", size=300)
+
+    assert catalog.upload_of(returned) is None
+    assert catalog.upload_of(catalog.node(created["node_id"])) is None
+
+
+# ──────────────────────────── blob references ────────────────────────────
+
+
+def _refs(client, blob_key):
+    """The raw count, or None when there is no `BLOB#` item at all."""
+    item = _item(client, f"BLOB#{blob_key}", "META")
+    return None if item is None else int(item["refs"]["N"])
+
+
+def test_create_node_counts_its_blob(catalog_table):
+    created = _file("clip.mp4", blob_key="blobs/node-a")
+    placeholder = catalog.create_node(CATALOG_ROOT, "still.webp", catalog.KIND_FILE)
+
+    assert _refs(catalog_table, "blobs/node-a") == 1
+    assert _refs(catalog_table, placeholder["blob_key"]) == 1
+    # Nothing a GSI or `studio catalog gc` would mistake for a node.
+    item = _item(catalog_table, "BLOB#blobs/node-a", "META")
+    assert set(item) == {"pk", "sk", "refs"}
+    assert catalog.blob_refs(["blobs/node-a", "blobs/nobody"]) == {"blobs/node-a": 1}
+    assert created["blob_key"] == "blobs/node-a"
+
+
+def test_a_shared_create_joins_a_counted_blob(catalog_table):
+    _file("clip.mp4", blob_key="blobs/node-a")
+
+    copy = catalog.create_node(
+        CATALOG_ROOT, "clip (2).mp4", catalog.KIND_FILE, blob_key="blobs/node-a", share=True
+    )
+
+    assert copy["blob_key"] == "blobs/node-a"
+    assert _refs(catalog_table, "blobs/node-a") == 2
+
+
+def test_a_shared_create_refuses_an_uncounted_blob_and_writes_nothing(catalog_table):
+    with pytest.raises(catalog.UncountedBlob):
+        catalog.create_node(
+            CATALOG_ROOT, "clip.mp4", catalog.KIND_FILE, blob_key="legacy/clip.mp4", share=True
+        )
+
+    assert catalog.children(CATALOG_ROOT) == []
+    assert _refs(catalog_table, "legacy/clip.mp4") is None
+
+
+def test_deleting_a_copy_keeps_the_blob_and_the_last_holder_releases_it(catalog_table):
+    original = _file("clip.mp4", blob_key="blobs/node-a")
+    copy = catalog.create_node(
+        CATALOG_ROOT, "clip (2).mp4", catalog.KIND_FILE, blob_key="blobs/node-a", share=True
+    )
+
+    assert catalog.delete_node(copy["node_id"])["blob_keys"] == []
+    assert _refs(catalog_table, "blobs/node-a") == 1
+
+    assert catalog.delete_node(original["node_id"])["blob_keys"] == ["blobs/node-a"]
+    assert _refs(catalog_table, "blobs/node-a") is None
+
+
+def test_a_delete_counts_each_blob_once_per_transaction(catalog_table, monkeypatch):
+    """Copies of one file deleted together: one decrement per key, never two on one item."""
+    folder = _folder("copies")
+    _file("clip.mp4", parent=folder["node_id"], blob_key="blobs/node-a")
+    for index in range(2, 8):
+        catalog.create_node(
+            folder["node_id"], f"clip ({index}).mp4", catalog.KIND_FILE,
+            blob_key="blobs/node-a", share=True,
+        )
+    _file("still.webp", parent=folder["node_id"], blob_key="blobs/node-b")
+    sent = []
+    wrapped = _Transactions(catalog.dynamodb.client(), sent.append)
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+    monkeypatch.setattr(catalog, "TRANSACTION_ITEMS", 7)
+
+    result = catalog.delete_node(folder["node_id"])
+
+    assert sorted(result["blob_keys"]) == ["blobs/node-a", "blobs/node-b"]
+    for items in sent:
+        assert len(items) <= 7
+        counted = [item["Update"]["Key"]["pk"]["S"] for item in items if "Update" in item]
+        assert len(counted) == len(set(counted)), items
+    assert _refs(catalog_table, "blobs/node-a") is None
+    assert _refs(catalog_table, "blobs/node-b") is None
+
+
+def test_an_uncounted_blob_is_released_by_its_delete(catalog_table):
+    """A row written before the counts: its delete releases the key, as every delete used to."""
+    created = _file("clip.mp4", blob_key="legacy/clip.mp4")
+    catalog_table.delete_item(
+        TableName=config.catalog_table(),
+        Key={"pk": {"S": "BLOB#legacy/clip.mp4"}, "sk": {"S": "META"}},
+    )
+
+    assert catalog.delete_node(created["node_id"])["blob_keys"] == ["legacy/clip.mp4"]
+    assert _refs(catalog_table, "legacy/clip.mp4") is None
+
+
+def test_set_blob_moves_the_reference_and_releases_the_old_key(catalog_table):
+    created = _file("notes.md", blob_key="blobs/node-a")
+
+    updated = catalog.set_blob(created["node_id"], "blobs/node-b", size=5)
+
+    assert updated["released"] == ["blobs/node-a"]
+    assert _refs(catalog_table, "blobs/node-a") is None
+    assert _refs(catalog_table, "blobs/node-b") == 1
+
+
+def test_set_blob_on_the_same_key_changes_no_count(catalog_table):
+    created = _file("notes.md", blob_key="blobs/node-a")
+
+    assert catalog.set_blob(created["node_id"], "blobs/node-a", size=5)["released"] == []
+    assert _refs(catalog_table, "blobs/node-a") == 1
+
+
+def test_a_private_key_is_never_the_one_a_copy_shares(catalog_table):
+    original = catalog.create_node(CATALOG_ROOT, "notes.md", catalog.KIND_FILE)
+    copy = catalog.create_node(
+        CATALOG_ROOT, "notes (2).md", catalog.KIND_FILE,
+        blob_key=original["blob_key"], share=True,
+    )
+
+    assert catalog.private_blob_key(copy) == catalog.blob_key_for(copy["node_id"])
+    private = catalog.private_blob_key(original)
+    assert private.startswith(f"{original['blob_key']}/")
+    assert private != catalog.private_blob_key(original)
+
+
+def _queued(client):
+    """Every key on the GC queue, across its shards."""
+    keys = []
+    for shard in catalog.GC_QUEUE_SHARDS:
+        answer = client.query(
+            TableName=config.catalog_table(),
+            KeyConditionExpression="pk = :pk",
+            ExpressionAttributeValues={":pk": {"S": f"GCQ#{shard}"}},
+        )
+        keys += [item["sk"]["S"] for item in answer["Items"]]
+    return sorted(keys)
+
+
+def test_only_a_release_queues_the_key_for_the_collector(catalog_table):
+    original = _file("clip.mp4", blob_key="blobs/node-a")
+    copy = catalog.create_node(
+        CATALOG_ROOT, "clip (2).mp4", catalog.KIND_FILE, blob_key="blobs/node-a", share=True
+    )
+
+    catalog.delete_node(copy["node_id"])
+    assert _queued(catalog_table) == []
+
+    catalog.delete_node(original["node_id"])
+    assert _queued(catalog_table) == ["blobs/node-a"]
+    # No `blob_key` for `studio catalog gc` to count as a reference, no `lib` for a GSI.
+    (item,) = [
+        item
+        for shard in catalog.GC_QUEUE_SHARDS
+        if (item := _item(catalog_table, f"GCQ#{shard}", "blobs/node-a"))
+    ]
+    assert set(item) == {"pk", "sk", "queued_at"}
+
+
+def test_a_release_larger_than_one_transaction_queues_every_key(catalog_table, monkeypatch):
+    folder = _folder("stills")
+    keys = [f"blobs/node-{index}" for index in range(8)]
+    for index, blob_key in enumerate(keys):
+        _file(f"still-{index}.webp", parent=folder["node_id"], blob_key=blob_key)
+    sent = []
+    wrapped = _Transactions(catalog.dynamodb.client(), sent.append)
+    monkeypatch.setattr(catalog.dynamodb, "client", lambda: wrapped)
+    monkeypatch.setattr(catalog, "TRANSACTION_ITEMS", 7)
+
+    assert sorted(catalog.delete_node(folder["node_id"])["blob_keys"]) == keys
+
+    assert all(len(items) <= 7 for items in sent)
+    assert _queued(catalog_table) == keys
+
+
+def test_set_blob_queues_the_key_it_releases(catalog_table):
+    created = _file("notes.md", blob_key="blobs/node-a")
+
+    catalog.set_blob(created["node_id"], "blobs/node-b", size=5)
+
+    assert _queued(catalog_table) == ["blobs/node-a"]
+
+
+# ──────────────────────────── listing revisions ────────────────────────────
+
+
+def _rev(client, node_id):
+    """A folder's `rev` off its raw `META` item, `0` when it has none."""
+    item = _item(client, f"NODE#{node_id}", "META")
+    return int(item["rev"]["N"]) if "rev" in item else 0
+
+
+def test_a_folder_no_write_has_touched_is_rev_zero(catalog_table):
+    folder = _folder("stills")
+
+    assert catalog.listing_rev(catalog.node(folder["node_id"])) == 0
+    assert _rev(catalog_table, folder["node_id"]) == 0
+
+
+def test_each_write_to_a_child_moves_its_parents_rev(catalog_table):
+    folder = _folder("stills")
+    root = _rev(catalog_table, CATALOG_ROOT)
+
+    created = _file("a.webp", parent=folder["node_id"], blob_key="blobs/node-a")
+    catalog.rename_node(created["node_id"], "b.webp")
+    catalog.set_blob(created["node_id"], "blobs/node-b", size=5)
+
+    assert _rev(catalog_table, folder["node_id"]) == 3
+    assert catalog.listing_rev(catalog.node(folder["node_id"])) == 3
+    # A grandchild's change is not the root's: its listing did not move.
+    assert _rev(catalog_table, CATALOG_ROOT) == root
+
+
+def test_a_move_moves_both_parents_and_every_folder_in_the_branch(catalog_table):
+    """Both listings changed, and every row below the moved node got a new `path`."""
+    projects, archive, project, output, _clip = _tree(catalog_table)
+    before = {
+        node["node_id"]: _rev(catalog_table, node["node_id"])
+        for node in (projects, archive, project, output)
+    }
+
+    catalog.move_node(project["node_id"], archive["node_id"])
+
+    after = {node_id: _rev(catalog_table, node_id) for node_id in before}
+    assert {node_id: after[node_id] - before[node_id] for node_id in before} == {
+        projects["node_id"]: 1,
+        archive["node_id"]: 1,
+        project["node_id"]: 1,
+        output["node_id"]: 1,
+    }
+
+
+def test_a_transfer_moves_the_old_parent_and_the_destination_root(catalog_table):
+    _other_library(catalog_table)
+    projects, _archive, project, _output, _clip = _tree(catalog_table)
+    before = _rev(catalog_table, projects["node_id"])
+
+    catalog.transfer_node(project["node_id"], OTHER_LIBRARY)
+
+    assert _rev(catalog_table, projects["node_id"]) == before + 1
+    assert _rev(catalog_table, OTHER_ROOT) == 1
+
+
+def test_a_delete_moves_only_the_parent_of_what_it_removed(catalog_table):
+    projects, _archive, project, _output, _clip = _tree(catalog_table)
+    before = _rev(catalog_table, projects["node_id"])
+    root = _rev(catalog_table, CATALOG_ROOT)
+
+    catalog.delete_node(project["node_id"])
+
+    assert _rev(catalog_table, projects["node_id"]) == before + 1
+    assert _rev(catalog_table, CATALOG_ROOT) == root
+
+
+def test_a_refused_create_leaves_the_rev_where_it_was(catalog_table):
+    """The bump is in the transaction, so a name collision cancels it too."""
+    folder = _folder("stills")
+    _file("a.webp", parent=folder["node_id"])
+
+    with pytest.raises(ConflictError):
+        _file("a.webp", parent=folder["node_id"])
+
+    assert _rev(catalog_table, folder["node_id"]) == 1
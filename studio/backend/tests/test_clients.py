@@ -6,8 +6,14 @@ no longer exists — and the way that fails is a test quietly asserting against
 another test's bucket rather than raising. The hook had no test of its own; it
 gets one here for each client, so a caching change cannot break every fixture in
 the suite silently.
+
+The signed-URL cache `s3.presign_expiring` keeps is tested here too, for the
+same reason: `reset_client` is what empties it between fixtures. Signing makes
+no network call, so none of these needs a mock.
 """
 
+from types import SimpleNamespace
+
 import pytest
 
 from studio_core.clients.aws import dynamodb, s3
@@ -44,3 +50,100 @@ def test_dynamodb_reset_client_drops_the_cached_client():
     cached = dynamodb.client()
     dynamodb.reset_client()
     assert dynamodb.client() is not cached
+
+
+# ──────────────────────────── signed-URL cache ────────────────────────────
+
+
+class Signer:
+    """A client whose every signature is a new URL, and counts them.
+
+    botocore stamps a URL to the second, so two real signatures a moment apart
+    are the same string; this makes "signed again" observable.
+    """
+
+    def __init__(self):
+        self.signed = 0
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.signed += 1
+        disposition = Params.get("ResponseContentDisposition", "")
+        return f"https://signed/{Params['Key']}?n={self.signed}&d={disposition}"
+
+
+@pytest.fixture
+def signer(monkeypatch):
+    fake = Signer()
+    monkeypatch.setattr(s3, "client", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """`s3`'s view of `time.monotonic`, moved by hand."""
+    now = SimpleNamespace(value=1_000.0)
+    monkeypatch.setattr(s3, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_a_signed_url_is_handed_out_again(signer, clock):
+    first, expires_in = s3.presign_expiring("characters/a.png")
+    clock.value += 60
+
+    again, left = s3.presign_expiring("characters/a.png")
+
+    assert again == first
+    assert left == expires_in - 60
+    assert signer.signed == 1
+
+
+def test_a_url_near_expiry_is_signed_again(signer, clock, monkeypatch):
+    monkeypatch.setenv("STUDIO_PRESIGN_TTL_SECONDS", "900")
+    first = s3.presign("characters/a.png")
+    clock.value += 900 - s3.SIGNED_URL_MARGIN_SECONDS
+
+    again, left = s3.presign_expiring("characters/a.png")
+
+    assert again != first
+    assert left == 900
+
+
+def test_inline_and_attachment_are_different_urls(signer, clock):
+    inline = s3.presign("characters/a.png")
+    attachment = s3.presign("characters/a.png", disposition="attachment")
+    renamed = s3.presign("characters/a.png", disposition="attachment", filename="b.png")
+
+    assert len({inline, attachment, renamed}) == 3
+    assert s3.presign("characters/a.png", disposition="attachment") == attachment
+    assert signer.signed == 3
+
+
+def test_fresh_signs_regardless_and_replaces_the_cached_url(signer, clock):
+    cached = s3.presign("characters/a.png")
+
+    fresh = s3.presign("characters/a.png", fresh=True)
+
+    assert fresh != cached
+    assert s3.presign("characters/a.png") == fresh
+
+
+def test_reset_client_forgets_what_it_signed(signer, clock):
+    s3.presign("characters/a.png")
+    s3.reset_client()
+    s3.presign("characters/a.png")
+
+    assert signer.signed == 2
+
+
+def test_the_cache_is_bounded_and_can_be_turned_off(signer, clock, monkeypatch):
+    monkeypatch.setenv("STUDIO_PRESIGN_CACHE_ENTRIES", "2")
+    for name in ("a", "b", "c", "a"):
+        s3.presign(f"characters/{name}.png")
+    # `a` was the least recently used when `c` arrived, so it went.
+    assert signer.signed == 4
+
+    monkeypatch.setenv("STUDIO_PRESIGN_CACHE_ENTRIES", "0")
+    s3.reset_client()
+    s3.presign("characters/d.png")
+    s3.presign("characters/d.png")
+    assert signer.signed == 6
@@ -0,0 +1,267 @@
+"""Previews, against the moto-backed tree, with real images and a real video.
+
+The images are drawn with Pillow and the video is made by the same ffmpeg that
+renders posters, so what is decoded here is what a library holds, not a
+stand-in for it. ffmpeg reads the video from a local path rather than a
+presigned URL — moto serves no HTTP for it to range over — which is the one
+seam `_video_source` exists to be.
+"""
+
+import io
+import subprocess
+
+import imageio_ffmpeg
+import pytest
+from PIL import Image
+
+from studio_core import config
+from studio_core.clients.aws import s3
+from studio_core.errors import ConflictError
+from studio_core.services import browse, catalog, derived, jobs
+from tests.conftest import CATALOG_LIBRARY, CATALOG_ROOT
+
+LIB = CATALOG_LIBRARY
+
+
+class Held:
+    """A runner that runs nothing, so a test can see what was asked of it."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, job_id):
+        self.submitted.append(job_id)
+
+
+@pytest.fixture(autouse=True)
+def forgetful():
+    derived.reset()
+    yield
+    derived.reset()
+    jobs.install(None)
+
+
+@pytest.fixture
+def folder(catalog_table):
+    return catalog.create_node(CATALOG_ROOT, "previews", catalog.KIND_FOLDER)
+
+
+def _png(width, height, mode="RGB"):
+    out = io.BytesIO()
+    Image.new(mode, (width, height), "red" if mode == "RGB" else (255, 0, 0, 128)).save(
+        out, "PNG"
+    )
+    return out.getvalue()
+
+
+def _mp4(tmp_path, seconds, size="1280x720"):
+    path = tmp_path / f"clip-{seconds}.mp4"
+    subprocess.run(
+        [
+            imageio_ffmpeg.get_ffmpeg_exe(),
+            "-v", "error",
+            "-f", "lavfi",
+            "-i", f"testsrc=duration={seconds}:size={size}:rate=24",
+            "-pix_fmt", "yuv420p",
+            str(path),
+        ],
+        check=True,
+    )
+    return path
+
+
+def _stored(media_bucket, folder, name, body):
+    """A confirmed file: a row with its `size`, and the bytes behind its key."""
+    created = catalog.create_node(folder["node_id"], name, catalog.KIND_FILE, size=len(body))
+    media_bucket.put_object(Bucket=config.media_bucket(), Key=created["blob_key"], Body=body)
+    return catalog.node(created["node_id"])
+
+
+def _derived(media_bucket, record, width):
+    body = media_bucket.get_object(
+        Bucket=config.media_bucket(), Key=s3.derived_key(record["blob_key"], width)
+    )["Body"].read()
+    return Image.open(io.BytesIO(body))
+
+
+# ─────────────────────────────── rendering ───────────────────────────────
+
+
+def test_an_image_gets_a_jpeg_no_wider_than_the_thumb_width(folder, media_bucket):
+    record = _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+
+    assert derived.produce(record) == derived.THUMB_WIDTH
+
+    preview = _derived(media_bucket, record, derived.THUMB_WIDTH)
+    assert preview.format == "JPEG"
+    assert preview.size == (derived.THUMB_WIDTH, derived.THUMB_WIDTH // 2)
+    assert catalog.node(record["node_id"])["preview"] == derived.THUMB_WIDTH
+
+
+def test_an_image_already_smaller_is_not_enlarged(folder, media_bucket):
+    record = _stored(media_bucket, folder, "small.png", _png(200, 100, mode="RGBA"))
+
+    derived.produce(record)
+
+    preview = _derived(media_bucket, record, derived.THUMB_WIDTH)
+    assert preview.size == (200, 100)
+    assert preview.mode == "RGB"
+
+
+def test_a_video_gets_one_frame_as_its_poster(folder, media_bucket, tmp_path, monkeypatch):
+    clip = _mp4(tmp_path, 2)
+    record = _stored(media_bucket, folder, "clip.mp4", clip.read_bytes())
+    monkeypatch.setattr(derived, "_video_source", lambda _blob_key: str(clip))
+
+    assert derived.produce(record) == derived.POSTER_WIDTH
+
+    poster = _derived(media_bucket, record, derived.POSTER_WIDTH)
+    assert poster.format == "JPEG"
+    assert poster.size == (derived.POSTER_WIDTH, 540)
+
+
+def test_a_clip_shorter_than_the_seek_gets_its_first_frame(
+    folder, media_bucket, tmp_path, monkeypatch
+):
+    clip = _mp4(tmp_path, 0.5, size="320x240")
+    record = _stored(media_bucket, folder, "blink.mp4", clip.read_bytes())
+    monkeypatch.setattr(derived, "_video_source", lambda _blob_key: str(clip))
+
+    assert derived.produce(record) == derived.POSTER_WIDTH
+    assert _derived(media_bucket, record, derived.POSTER_WIDTH).size == (320, 240)
+
+
+def test_bytes_that_do_not_decode_record_no_preview(folder, media_bucket):
+    record = _stored(media_bucket, folder, "broken.jpg", b"jpg-bytes")
+
+    assert derived.produce(record) == 0
+    assert catalog.node(record["node_id"])["preview"] == 0
+    assert derived.url(catalog.node(record["node_id"])) is None
+    assert not derived.wanted(catalog.node(record["node_id"]))
+
+
+def test_an_image_past_the_source_cap_keeps_its_original(folder, media_bucket, monkeypatch):
+    monkeypatch.setenv("STUDIO_MAX_PREVIEW_SOURCE_BYTES", "100")
+    record = _stored(media_bucket, folder, "large.png", _png(2000, 1000))
+
+    assert derived.produce(record) == 0
+
+
+def test_a_stored_preview_of_the_same_bytes_is_reused(folder, media_bucket, monkeypatch):
+    """A copy shares its source's blob, so its preview is already made."""
+    record = _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+    derived.produce(record)
+    catalog.set_blob(record["node_id"], record["blob_key"], size=record["size"])
+
+    def refuse(*_args):
+        raise AssertionError("rendered again")
+
+    monkeypatch.setattr(derived, "render_image", refuse)
+    assert derived.produce(catalog.node(record["node_id"])) == derived.THUMB_WIDTH
+
+
+# ───────────────────────────── the catalog side ─────────────────────────────
+
+
+def test_a_preview_of_bytes_the_node_no_longer_names_is_a_conflict(folder, media_bucket):
+    record = _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+
+    with pytest.raises(ConflictError):
+        catalog.set_preview(record["node_id"], "blobs/someone-else", derived.THUMB_WIDTH)
+    assert "preview" not in catalog.node(record["node_id"])
+
+
+def test_confirming_new_bytes_takes_the_preview_off(folder, media_bucket):
+    record = _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+    derived.produce(record)
+
+    updated = catalog.set_blob(record["node_id"], record["blob_key"], size=10)
+
+    assert "preview" not in updated
+    assert "preview" not in catalog.node(record["node_id"])
+    assert all("preview" not in row for row in catalog.listing(folder["node_id"]))
+
+
+# ─────────────────────────────── listings ───────────────────────────────
+
+
+def test_a_listing_draws_the_original_until_a_preview_exists(folder, media_bucket):
+    record = _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+    _stored(media_bucket, folder, "notes.txt", b"words")
+
+    before = browse.list_folder(LIB, node_id=folder["node_id"])["files"]
+    assert [entry.get("preview_url") for entry in before if entry["kind"] == "text"] == [None]
+    [image] = [entry for entry in before if entry["kind"] == "image"]
+    assert image["preview_url"] == image["url"]
+
+    derived.produce(record)
+
+    [image] = [
+        entry
+        for entry in browse.list_folder(LIB, node_id=folder["node_id"])["files"]
+        if entry["kind"] == "image"
+    ]
+    assert "derived/" in image["preview_url"]
+    assert "derived/" not in image["url"]
+
+
+def test_a_preview_landing_moves_the_reel_tag_on(folder, media_bucket):
+    record = _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+    before, _ = browse.tagged_reel(LIB, node_id=folder["node_id"])
+
+    derived.produce(record)
+
+    after, _ = browse.tagged_reel(LIB, node_id=folder["node_id"])
+    assert after != before
+
+
+def test_a_listing_asks_once_for_what_it_meets_without_a_preview(
+    folder, media_bucket, monkeypatch
+):
+    monkeypatch.setenv("STUDIO_DERIVE_PREVIEWS", "1")
+    held = Held()
+    jobs.install(held)
+    wide = _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+    _stored(media_bucket, folder, "notes.txt", b"words")
+
+    browse.list_folder(LIB, node_id=folder["node_id"])
+    browse.reel_items(LIB, node_id=folder["node_id"])
+
+    [job_id] = held.submitted
+    job = catalog.job(job_id)
+    assert job["kind"] == "derive"
+    assert catalog.job_items(job_id, 0, job["total"]) == [wide["node_id"]]
+    assert job["created_by"] == derived.CREATED_BY
+
+
+def test_a_derive_job_records_every_preview_it_was_handed(folder, media_bucket, monkeypatch):
+    monkeypatch.setenv("STUDIO_DERIVE_PREVIEWS", "1")
+    held = Held()
+    jobs.install(held)
+    wide = _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+    broken = _stored(media_bucket, folder, "broken.jpg", b"jpg-bytes")
+
+    browse.list_folder(LIB, node_id=folder["node_id"])
+    [job_id] = held.submitted
+    jobs.run(job_id)
+
+    assert catalog.node(wide["node_id"])["preview"] == derived.THUMB_WIDTH
+    assert catalog.node(broken["node_id"])["preview"] == 0
+    assert catalog.job(job_id)["result"] == {"derived": 1, "undecodable": 1}
+    # A chunk run again, as a redelivered message would run it, finds nothing
+    # left to want.
+    job = catalog.job(job_id)
+    items = catalog.job_items(job_id, 0, job["total"])
+    assert derived.JOB_STEPS["derive"](job, items) == {"derived": 0, "undecodable": 0}
+
+
+def test_nothing_is_asked_where_no_job_can_run(folder, media_bucket, monkeypatch):
+    monkeypatch.setenv("STUDIO_DERIVE_PREVIEWS", "1")
+    monkeypatch.setattr(jobs, "available", lambda: False)
+    submitted = []
+    monkeypatch.setattr(jobs, "submit", lambda *args, **kwargs: submitted.append(args))
+    _stored(media_bucket, folder, "wide.png", _png(2000, 1000))
+
+    browse.list_folder(LIB, node_id=folder["node_id"])
+
+    assert submitted == []
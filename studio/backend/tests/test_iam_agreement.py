@@ -87,6 +87,12 @@ S3_ACTIONS = {
     "delete_object": {"s3:DeleteObject"},
     "delete_objects": {"s3:DeleteObject"},
     "list_objects_v2": {"s3:ListBucket"},
+    # A multipart upload is a `PutObject` in every step but two.
+    "create_multipart_upload": {"s3:PutObject"},
+    "upload_part": {"s3:PutObject"},
+    "complete_multipart_upload": {"s3:PutObject"},
+    "list_parts": {"s3:ListMultipartUploadParts"},
+    "abort_multipart_upload": {"s3:AbortMultipartUpload"},
 }
 
 # Methods on a boto3 client that are not themselves API calls. Both of them name
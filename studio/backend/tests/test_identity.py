@@ -8,6 +8,8 @@ keeps the malformed case failing where it really would.
 """
 
 import datetime as dt
+import threading
+import time
 
 import jwt
 import pytest
@@ -44,8 +46,10 @@ def pool(monkeypatch):
 
     monkeypatch.setattr(identity, "jwks_client", _StubClient)
     identity.reset_jwks_client()
+    identity.reset_claims_cache()
     yield
     identity.reset_jwks_client()
+    identity.reset_claims_cache()
 
 
 def _token(**overrides):
@@ -152,3 +156,153 @@ def test_the_error_handler_answers_401():
     resp = app.test_client().get("/api/_auth_probe")
     assert resp.status_code == 401
     assert resp.get_json() == {"error": "The token is not valid."}
+
+
+# --- the verified-claims cache ------------------------------------------------
+
+
+@pytest.fixture
+def verifications(monkeypatch):
+    """How many times a signature was actually checked, counted at `jwt.decode`."""
+    calls = []
+    real = identity.jwt.decode
+
+    def _counting(*args, **kwargs):
+        calls.append(1)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(identity.jwt, "decode", _counting)
+    return calls
+
+
+def test_a_token_is_verified_once_and_then_remembered(verifications):
+    header = _header()
+    for _ in range(5):
+        assert identity.caller_sub(header) == SUB
+    assert len(verifications) == 1
+
+
+def test_a_remembered_token_is_refused_once_it_expires():
+    """Held until `exp` and not a moment past it: the cache never outlives the token."""
+    header = _header(exp=int(time.time()) + 1)
+    assert identity.caller_sub(header) == SUB
+    time.sleep(max(0.0, int(time.time()) + 1.05 - time.time()))
+    with pytest.raises(AuthError):
+        identity.caller_sub(header)
+
+
+def test_an_expired_entry_is_verified_again_rather_than_served(monkeypatch, verifications):
+    header = _header()
+    identity.caller_sub(header)
+    later = time.time() + 2 * 3600
+    monkeypatch.setattr(identity.time, "time", lambda: later)
+    # `jwt.decode` keeps its own clock, so the token is still good to it — what
+    # is under test is that the cache stopped answering, not PyJWT's expiry.
+    identity.caller_sub(header)
+    assert len(verifications) == 2
+
+
+@pytest.mark.parametrize("part", [1, 2], ids=["payload", "signature"])
+def test_a_tampered_copy_of_a_remembered_token_is_refused(part):
+    token = _token()
+    assert identity.caller_sub(f"Bearer {token}") == SUB
+
+    pieces = token.split(".")
+    flipped = "A" if pieces[part][5] != "A" else "B"
+    pieces[part] = pieces[part][:5] + flipped + pieces[part][6:]
+    with pytest.raises(AuthError):
+        identity.caller_sub(f"Bearer {'.'.join(pieces)}")
+
+
+def test_key_rotation(monkeypatch, verifications):
+    """A new key verifies new tokens; a token seen under the old one stays good until `exp`.
+
+    The second half is the documented trade: a key withdrawn from the set does
+    not un-verify what was already verified with it. A token *never* seen under
+    the withdrawn key is refused, which is what keeps that trade bounded.
+    """
+    before = _header()
+    unseen = _header(email="other@example.com")
+    assert identity.caller_sub(before) == SUB
+
+    rotated = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    class _RotatedKey:
+        key = rotated.public_key()
+
+    class _RotatedClient:
+        def get_signing_key_from_jwt(self, token):
+            jwt.get_unverified_header(token)
+            return _RotatedKey()
+
+    monkeypatch.setattr(identity, "jwks_client", _RotatedClient)
+    after = jwt.encode(
+        {
+            "sub": SUB,
+            "iss": ISSUER,
+            "aud": CLIENT_ID,
+            "token_use": "id",
+            "exp": dt.datetime.now(tz=dt.timezone.utc) + dt.timedelta(hours=1),
+        },
+        rotated,
+        algorithm="RS256",
+    )
+
+    assert identity.caller_sub(f"Bearer {after}") == SUB
+    assert identity.caller_sub(before) == SUB
+    with pytest.raises(AuthError):
+        identity.caller_sub(unseen)
+    assert len(verifications) == 3
+
+
+def test_a_refusal_is_not_remembered(verifications):
+    header = _header(token_use="access")
+    for _ in range(2):
+        with pytest.raises(AuthError):
+            identity.caller_sub(header)
+    assert len(verifications) == 2
+
+
+def test_a_token_verified_against_one_pool_is_not_answered_for_another(monkeypatch):
+    header = _header()
+    identity.caller_sub(header)
+    monkeypatch.setenv("STUDIO_COGNITO_USER_POOL_ID", "us-east-1_OTHER")
+    with pytest.raises(AuthError):
+        identity.caller_sub(header)
+
+
+def test_the_cache_is_bounded(monkeypatch, verifications):
+    monkeypatch.setattr(identity, "CLAIMS_CACHE_ENTRIES", 2)
+    first, second, third = (_header(email=f"{n}@example.com") for n in range(3))
+    for header in (first, second, third):
+        identity.caller_sub(header)
+    assert len(identity._claims_cache) == 2
+
+    identity.caller_sub(third)
+    assert len(verifications) == 3
+    identity.caller_sub(first)
+    assert len(verifications) == 4
+
+
+def test_the_cache_holds_its_cap_under_threads(monkeypatch):
+    """The dev server verifies on threads; evicting while another thread reorders
+    must neither raise nor leave the cache past its cap."""
+    monkeypatch.setattr(identity, "CLAIMS_CACHE_ENTRIES", 4)
+    headers = [_header(email=f"{n}@example.com") for n in range(12)]
+    failures = []
+
+    def churn(offset):
+        try:
+            for n in range(60):
+                assert identity.caller_sub(headers[(offset + n) % len(headers)]) == SUB
+        except Exception as error:  # noqa: BLE001 — any of them is the failure
+            failures.append(error)
+
+    threads = [threading.Thread(target=churn, args=(n,)) for n in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
+    assert len(identity._claims_cache) <= 4
@@ -0,0 +1,383 @@
+"""Bulk writes handed to a job, against the moto-backed tree.
+
+`STUDIO_JOB_THRESHOLD` is `0` throughout, so every bulk write in this file is a
+job however small the fixture tree is, and `LocalRunner.drain` is what waits
+for it. What is asserted is the same tree `test_manage` asserts after the
+inline write — a job that finished must leave exactly what the request would
+have — plus the two things only a job has: a checkpoint a second run resumes
+from, and a condition that lets one worker of two win.
+"""
+
+import json
+import time
+
+import boto3
+import pytest
+from moto import mock_sqs
+
+from studio_core import config
+from studio_core.app_factory import create_app
+from studio_core.clients.aws import sqs
+from studio_core.errors import ConflictError, NotFoundError, UpstreamError, ValidationError
+from studio_core.handlers.aws.jobs import job_handler
+from studio_core.services import browse, catalog, jobs, manage
+from tests.conftest import CATALOG_LIBRARY
+
+LIB = CATALOG_LIBRARY
+
+RUN = "projects/subject-a/runs/2026-08-04_21-30-54_wave-porch-1x1/"
+OUTPUT = f"{RUN}output/wave-porch.jpeg"
+VIDEO = "projects/subject-b/runs/2026-08-14_21-47-05_standing-flex/output/standing-flex.mp4"
+
+
+class Held:
+    """A runner that runs nothing, so a test can run the job itself."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, job_id):
+        self.submitted.append(job_id)
+
+
+@pytest.fixture(autouse=True)
+def runner(monkeypatch):
+    monkeypatch.setenv("STUDIO_JOB_THRESHOLD", "0")
+    local = jobs.LocalRunner()
+    jobs.install(local)
+    yield local
+    local.drain()
+    jobs.install(None)
+
+
+def _node(path):
+    node_id = catalog.library(LIB)["root_node"]
+    for name in [segment for segment in path.split("/") if segment]:
+        node_id = catalog.child_by_name(node_id, name)["node_id"]
+    return catalog.node(node_id)
+
+
+def _missing(path):
+    try:
+        _node(path)
+    except NotFoundError:
+        return True
+    return False
+
+
+def _finished(runner, answer):
+    runner.drain()
+    return catalog.job(answer["job"]["job_id"])
+
+
+# ───────────────────────────── each bulk write ─────────────────────────────
+
+
+def test_a_bulk_move_is_answered_with_a_job_and_then_done_by_it(catalog_tree, runner):
+    answer = manage.move_objects(LIB, [OUTPUT, VIDEO], "characters/subject-a/")
+
+    assert answer["job"]["status"] == "queued"
+    assert answer["job"]["total"] == 2
+    job = _finished(runner, answer)
+    assert (job["status"], job["done"], job["result"]) == ("done", 2, {"moved": 2})
+    assert _missing(OUTPUT) and _missing(VIDEO)
+    assert _node("characters/subject-a/wave-porch.jpeg")["kind"] == "file"
+
+
+def test_a_job_row_is_never_read_as_a_node_of_its_library(catalog_tree, runner):
+    """A job row keyed like a node would sit in `by-recent`, and the root reel would 500."""
+    answer = manage.move_objects(LIB, [OUTPUT, VIDEO], "characters/subject-a/")
+    _finished(runner, answer)
+
+    reel = browse.reel_items(LIB, "")
+    assert "standing-flex.mp4" in [item["name"] for item in reel["items"]]
+    assert all("node_id" in row for row in catalog.recent(LIB, 1000)[0])
+    assert catalog.job(answer["job"]["job_id"])["lib"] == LIB
+
+
+def test_a_bulk_move_is_still_refused_before_any_job_exists(catalog_tree):
+    with pytest.raises(ConflictError):
+        manage.move_objects(
+            LIB, ["characters/subject-a/reference/subject-a_1.webp"], "characters/subject-a/seed/"
+        )
+
+
+def test_a_bulk_copy_job_numbers_and_copies_bytes(catalog_tree, runner, media_bucket):
+    answer = manage.copy_objects(LIB, [OUTPUT, OUTPUT], f"{RUN}output/")
+
+    job = _finished(runner, answer)
+    assert job["result"] == {"copied": 2}
+    copy = _node(f"{RUN}output/wave-porch (2).jpeg")
+    body = media_bucket.get_object(Bucket=config.media_bucket(), Key=copy["blob_key"])
+    assert body["Body"].read() == b"jpeg-bytes"
+
+
+def test_a_bulk_delete_job_removes_rows_then_blobs(catalog_tree, runner, media_bucket):
+    blob = _node(OUTPUT)["blob_key"]
+    answer = manage.delete_objects(LIB, [OUTPUT, VIDEO])
+
+    assert _finished(runner, answer)["result"] == {"deleted": 2}
+    assert _missing(OUTPUT) and _missing(VIDEO)
+    listed = media_bucket.list_objects_v2(Bucket=config.media_bucket(), Prefix=blob)
+    assert listed.get("KeyCount", 0) == 0
+
+
+def test_a_folder_past_the_subtree_bound_is_deleted_by_a_job(catalog_tree, runner, monkeypatch):
+    """Inline this is refused; a job takes it a child at a time."""
+    monkeypatch.setattr("studio_core.config.max_folder_objects", lambda: 2)
+
+    answer = manage.delete_folder(LIB, RUN)
+
+    assert answer["prefix"] == RUN
+    job = _finished(runner, answer)
+    assert job["status"] == "done", job.get("error")
+    assert job["result"] == {"deleted": 5}
+    assert _missing(RUN)
+
+
+def _job_row(client, job_id):
+    """The job's own item, raw — what has to fit in 400 KB."""
+    return client.get_item(
+        TableName=config.catalog_table(), Key={"pk": {"S": f"JOB#{job_id}"}, "sk": {"S": "META"}}
+    )["Item"]
+
+
+def test_a_long_selection_is_paged_beside_the_job_and_read_a_chunk_at_a_time(
+    catalog_tree, monkeypatch
+):
+    """Chunks of two over pages of three, so a chunk straddles a page boundary."""
+    _bucket, client = catalog_tree
+    jobs.install(Held())
+    monkeypatch.setattr(catalog, "JOB_PAGE_ITEMS", 3)
+    monkeypatch.setattr(jobs, "JOB_CHUNK", 2)
+    keys = [
+        OUTPUT,
+        VIDEO,
+        "characters/subject-a/reference/subject-a_1.webp",
+        "characters/subject-a/seed/subject-a_1.webp",
+        "characters/subject-a/seed/subject-a_2.webp",
+    ]
+    job_id = manage.delete_objects(LIB, keys)["job"]["job_id"]
+
+    assert "items" not in _job_row(client, job_id)
+    pages = client.query(
+        TableName=config.catalog_table(),
+        KeyConditionExpression="pk = :pk AND begins_with(sk, :items)",
+        ExpressionAttributeValues={":pk": {"S": f"JOB#{job_id}"}, ":items": {"S": "ITEMS#"}},
+    )["Items"]
+    assert [len(page["items"]["L"]) for page in pages] == [3, 2]
+
+    jobs.run(job_id)
+
+    job = catalog.job(job_id)
+    assert (job["status"], job["done"], job["result"]) == ("done", 5, {"deleted": 5})
+    assert all(_missing(key) for key in keys)
+
+
+def test_a_folder_delete_job_holds_the_folder_and_not_its_children(
+    catalog_tree, monkeypatch
+):
+    _bucket, client = catalog_tree
+    jobs.install(Held())
+    monkeypatch.setattr(jobs, "JOB_CHUNK", 1)
+    folder = _node(RUN)["node_id"]
+    job_id = manage.delete_folder(LIB, RUN)["job"]["job_id"]
+
+    row = catalog._attributes(_job_row(client, job_id))
+    assert "items" not in row
+    assert row["params"] == {"folder": folder}
+
+    jobs.run(job_id)
+
+    job = catalog.job(job_id)
+    assert (job["status"], job["result"]) == ("done", {"deleted": 5})
+    assert job["done"] == job["total"]
+    assert _missing(RUN)
+
+
+def test_a_step_that_breaks_fails_the_job_rather_than_leaving_it_running(
+    catalog_tree, monkeypatch
+):
+    jobs.install(Held())
+    job_id = manage.delete_objects(LIB, [OUTPUT])["job"]["job_id"]
+
+    def _broken(job, chunk):
+        raise KeyError("a bug")
+
+    monkeypatch.setitem(manage.JOB_STEPS, "delete_objects", _broken)
+    jobs.run(job_id)
+
+    job = catalog.job(job_id)
+    assert (job["status"], job["done"]) == ("failed", 0)
+    assert job["error"] == "The job stopped on an internal error."
+    assert not _missing(OUTPUT)
+
+
+def _flaky(monkeypatch, kind, failures):
+    """The step registered for `kind`, refused upstream `failures` times first."""
+    real = manage.JOB_STEPS[kind]
+    left = {"failures": failures}
+
+    def step(job, chunk):
+        if left["failures"]:
+            left["failures"] -= 1
+            raise UpstreamError("Could not write to the catalog")
+        return real(job, chunk)
+
+    monkeypatch.setitem(manage.JOB_STEPS, kind, step)
+
+
+def test_an_upstream_error_leaves_the_job_for_the_next_delivery(catalog_tree, monkeypatch):
+    jobs.install(Held())
+    job_id = manage.delete_objects(LIB, [OUTPUT])["job"]["job_id"]
+    _flaky(monkeypatch, "delete_objects", 1)
+
+    with pytest.raises(UpstreamError):
+        jobs.run(job_id)
+    job = catalog.job(job_id)
+    assert (job["status"], job["done"]) == ("queued", 0)
+
+    jobs.run(job_id)
+    assert catalog.job(job_id)["status"] == "done"
+    assert _missing(OUTPUT)
+
+
+def test_the_local_runner_runs_a_job_again_after_an_upstream_error(
+    catalog_tree, runner, monkeypatch
+):
+    monkeypatch.setattr(jobs, "LOCAL_RETRY_SECONDS", 0)
+    _flaky(monkeypatch, "delete_objects", 2)
+
+    answer = manage.delete_objects(LIB, [OUTPUT])
+
+    assert _finished(runner, answer)["status"] == "done"
+    assert _missing(OUTPUT)
+
+
+def test_the_library_root_is_refused_before_a_job_is_written(catalog_tree, runner):
+    with pytest.raises(ValidationError, match="root"):
+        manage.delete_folder(LIB, "")
+    assert not _missing("projects/")
+
+
+# ──────────────────────────── checkpoints ────────────────────────────
+
+
+def test_a_run_past_its_deadline_checkpoints_and_resubmits(catalog_tree, monkeypatch):
+    held = Held()
+    jobs.install(held)
+    monkeypatch.setattr(jobs, "JOB_CHUNK", 1)
+    answer = manage.delete_objects(LIB, [OUTPUT, VIDEO])
+    job_id = answer["job"]["job_id"]
+
+    jobs.run(job_id, deadline=time.monotonic() - 1)
+
+    # One chunk however late, then handed back rather than carried on.
+    job = catalog.job(job_id)
+    assert (job["status"], job["done"]) == ("running", 1)
+    assert held.submitted == [job_id, job_id]
+    assert _missing(OUTPUT) and not _missing(VIDEO)
+
+    jobs.run(job_id)
+    job = catalog.job(job_id)
+    assert (job["status"], job["done"], job["result"]) == ("done", 2, {"deleted": 2})
+
+
+def test_a_chunk_done_twice_is_harmless(catalog_tree):
+    """A worker that died before its checkpoint: the next run redoes the chunk."""
+    jobs.install(Held())
+    answer = manage.move_objects(LIB, [OUTPUT], "characters/subject-a/")
+    job_id = answer["job"]["job_id"]
+    manage.JOB_STEPS["move_objects"](catalog.job(job_id), [_node(OUTPUT)["node_id"]])
+
+    jobs.run(job_id)
+
+    job = catalog.job(job_id)
+    assert (job["status"], job["result"]) == ("done", {"moved": 0})
+    assert _node("characters/subject-a/wave-porch.jpeg")["kind"] == "file"
+
+
+def test_only_one_of_two_workers_can_checkpoint_a_chunk(catalog_tree):
+    jobs.install(Held())
+    job_id = manage.delete_objects(LIB, [OUTPUT])["job"]["job_id"]
+
+    catalog.advance_job(job_id, at=0, assignments={"done": 1, "status": "done"})
+    with pytest.raises(ConflictError):
+        catalog.advance_job(job_id, at=0, assignments={"done": 1, "status": "done"})
+
+
+def test_a_refusal_arriving_late_fails_the_job_and_says_why(catalog_tree):
+    jobs.install(Held())
+    answer = manage.move_objects(LIB, [OUTPUT], "characters/subject-b/")
+    jobs.run(manage.delete_folder(LIB, "characters/subject-b/")["job"]["job_id"])
+
+    jobs.run(answer["job"]["job_id"])
+
+    job = catalog.job(answer["job"]["job_id"])
+    assert job["status"] == "failed"
+    assert job["error"].startswith("No such object")
+    assert not _missing(OUTPUT)
+
+
+# ─────────────────────────────── the API ───────────────────────────────
+
+
+def test_the_route_answers_202_and_the_job_can_be_polled(catalog_tree, runner):
+    client = create_app().test_client()
+    resp = client.delete("/api/objects", json={"keys": [OUTPUT]})
+
+    assert resp.status_code == 202
+    location = resp.headers["Location"]
+    assert location == f"/api/jobs/{resp.get_json()['job']['job_id']}"
+
+    runner.drain()
+    polled = client.get(location)
+    assert polled.status_code == 200
+    assert polled.get_json()["status"] == "done"
+    assert "items" not in polled.get_json()
+
+
+def test_a_job_in_another_library_is_a_404(catalog_tree):
+    other = catalog.create_job(
+        "lib-other", "delete_objects", {}, total=1, items=["node-x"], created_by="sub-x"
+    )
+
+    resp = create_app().test_client().get(f"/api/jobs/{other['job_id']}")
+    assert resp.status_code == 404
+    assert create_app().test_client().get("/api/jobs/job-nope").status_code == 404
+
+
+# ─────────────────────────────── the queue ───────────────────────────────
+
+
+def test_the_queue_runner_and_the_worker_handler_carry_a_job_through(catalog_tree, monkeypatch):
+    class Context:
+        def get_remaining_time_in_millis(self):
+            return 900_000
+
+    with mock_sqs():
+        sqs.reset_client()
+        queue = boto3.client("sqs", region_name="us-east-1").create_queue(QueueName="jobs")
+        monkeypatch.setenv("STUDIO_JOB_QUEUE_URL", queue["QueueUrl"])
+        jobs.install(None)
+        assert isinstance(jobs.runner(), jobs.QueueRunner)
+
+        job_id = manage.delete_objects(LIB, [OUTPUT])["job"]["job_id"]
+        messages = boto3.client("sqs", region_name="us-east-1").receive_message(
+            QueueUrl=queue["QueueUrl"]
+        )["Messages"]
+        assert [json.loads(message["Body"]) for message in messages] == [{"job_id": job_id}]
+
+        job_handler.handler({"Records": [{"body": messages[0]["Body"]}]}, Context())
+        sqs.reset_client()
+
+    assert catalog.job(job_id)["status"] == "done"
+    assert _missing(OUTPUT)
+
+
+def test_a_lambda_with_no_queue_runs_bulk_writes_inline(catalog_tree, monkeypatch):
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "studio-api")
+    monkeypatch.delenv("STUDIO_JOB_QUEUE_URL", raising=False)
+    jobs.install(None)
+
+    assert manage.delete_objects(LIB, [OUTPUT]) == {"deleted": 1, "keys": [OUTPUT]}
@@ -19,7 +19,7 @@ import pytest
 from studio_core import config
 from studio_core.clients.aws import s3
 from studio_core.errors import ConflictError, NotFoundError, UpstreamError, ValidationError
-from studio_core.services import catalog, manage
+from studio_core.services import catalog, jobs, manage
 from tests.conftest import CATALOG_LIBRARY, CATALOG_ROOT
 
 LIB = CATALOG_LIBRARY
@@ -851,7 +851,11 @@ def test_delete_missing_folder_is_404(catalog_tree):
 
 
 def test_delete_folder_refuses_an_oversized_subtree(catalog_tree, monkeypatch):
+    """Inline, that is — where nothing could run a job, as in a Lambda with no queue."""
     monkeypatch.setattr("studio_core.config.max_folder_objects", lambda: 1)
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "studio-api")
+    monkeypatch.delenv("STUDIO_JOB_QUEUE_URL", raising=False)
+    monkeypatch.setattr(jobs, "_runner", None)
     with pytest.raises(ValidationError):
         manage.delete_folder(LIB, RUN)
     assert _names(f"{RUN}output/") == ["wave-porch.jpeg"]
@@ -895,15 +899,13 @@ def test_copy_leaves_the_source_where_it_was(input_pool):
     assert _names(f"{RUN}output/") == ["wave-porch.jpeg"], "the source is still there"
 
 
-def test_a_copy_gets_its_own_blob(input_pool):
-    """**Load-bearing, not incidental** — `catalog.delete_node` depends on it.
+def test_a_copy_of_an_uncounted_blob_gets_its_own(input_pool):
+    """The fixture's rows predate the `BLOB#` counts, so their bytes are copied.
 
-    A second row on one `blob_key` would be cheaper, and copy-on-write is #334.
-    Until it lands, `delete_node` reports the keys it removed rows for without
-    asking whether anything else still points at them — there is no index on
-    `blob_key` — so a shared key means deleting one copy destroys the other's
-    bytes. Deleting the copy below and re-reading the source is that failure,
-    inverted into a test.
+    Sharing a key nothing has counted would let the first delete of either row
+    release it — `catalog.delete_node` releases an uncounted key, as every
+    delete did before counts existed. Deleting the copy below and re-reading
+    the source is that failure, inverted into a test.
     """
     media_bucket, _ = input_pool
     manage.copy_objects(LIB, [OUTPUT], INPUT_POOL)
@@ -916,6 +918,81 @@ def test_a_copy_gets_its_own_blob(input_pool):
     assert source in _objects(media_bucket), "deleting the copy kept the original's bytes"
 
 
+def _counted_copy(path=OUTPUT):
+    """A copy of a fixture file — counted, since this service wrote it — and its path."""
+    manage.copy_objects(LIB, [path], INPUT_POOL)
+    return f"{INPUT_POOL}{path.rsplit('/', 1)[1]}"
+
+
+def test_a_copy_of_a_counted_blob_shares_it_and_moves_no_bytes(input_pool, monkeypatch):
+    first = _counted_copy()
+    spy = _S3Spy()
+    monkeypatch.setattr(s3, "client", lambda: spy)
+
+    manage.copy_objects(LIB, [first], INPUT_POOL)
+
+    assert spy.calls == [], "no HeadObject, no CopyObject"
+    second = _node(f"{INPUT_POOL}wave-porch (2).jpeg")
+    assert second["blob_key"] == _node(first)["blob_key"]
+    assert second["size"] == len(b"jpeg-bytes")
+    assert catalog.blob_refs([second["blob_key"]]) == {second["blob_key"]: 2}
+
+
+def test_deleting_a_shared_copy_keeps_the_bytes_until_the_last_goes(input_pool):
+    media_bucket, _ = input_pool
+    first = _counted_copy()
+    manage.copy_objects(LIB, [first], INPUT_POOL)
+    blob_key = _node(first)["blob_key"]
+
+    manage.delete_objects(LIB, [first])
+    assert blob_key in _objects(media_bucket), "the other copy still names it"
+
+    manage.delete_folder(LIB, INPUT_POOL)
+    assert blob_key not in _objects(media_bucket)
+
+
+def test_a_shared_copy_falls_back_to_bytes_when_its_blob_is_released(input_pool, monkeypatch):
+    """A delete landing between the count read and the share: `UncountedBlob`, then a byte copy."""
+    first = _counted_copy()
+    monkeypatch.setattr(
+        catalog, "blob_refs", lambda blob_keys: {blob_key: 1 for blob_key in blob_keys}
+    )
+    real = catalog.create_node
+
+    def released(*args, **kwargs):
+        if kwargs.get("share"):
+            raise catalog.UncountedBlob(kwargs["blob_key"])
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(catalog, "create_node", released)
+
+    manage.copy_objects(LIB, [first], INPUT_POOL)
+
+    second = _node(f"{INPUT_POOL}wave-porch (2).jpeg")
+    assert second["blob_key"] == catalog.blob_key_for(second["node_id"])
+    assert second["size"] == len(b"jpeg-bytes")
+
+
+def test_editing_a_shared_text_file_leaves_the_copy_alone(input_pool, media_bucket):
+    first = _counted_copy(PROFILE)
+    manage.copy_objects(LIB, [first], INPUT_POOL)
+    second = f"{INPUT_POOL}profile (2).yaml"
+    shared = _node(first)["blob_key"]
+    before = media_bucket.get_object(Bucket=config.media_bucket(), Key=shared)["Body"].read()
+
+    manage.update_text(LIB, second, "name: Subject B\n")
+
+    edited = _node(second)["blob_key"]
+    assert edited != shared
+    assert media_bucket.get_object(Bucket=config.media_bucket(), Key=edited)["Body"].read() == (
+        b"name: Subject B\n"
+    )
+    assert media_bucket.get_object(Bucket=config.media_bucket(), Key=shared)["Body"].read() == (
+        before
+    )
+    assert catalog.blob_refs([shared, edited]) == {shared: 1, edited: 1}
+
+
 def test_a_copy_carries_the_bytes(input_pool):
     media_bucket, _ = input_pool
     manage.copy_objects(LIB, [OUTPUT], INPUT_POOL)
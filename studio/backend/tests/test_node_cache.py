@@ -0,0 +1,307 @@
+"""`services.node_cache`, and `catalog` reading through it without going stale.
+
+Two halves. The first is the cache on its own: a version that refuses a read
+which raced a write, a TTL, a cap, and counters. The second is the one that
+matters, and it is a **stale-read harness** rather than a test per function:
+warm the cache with every item in the table, make one write through `catalog`,
+and compare what the cached reads now say with what a scan of the table says.
+A write path that forgot to invalidate shows up as a difference, whichever path
+it is — so a new write operation earns its coverage by being added to
+`WRITES`, not by someone remembering which items it touches.
+
+The scan is `client.scan` and not `catalog`, for the reason `test_catalog.py`
+gives: the reader under test and the truth it is compared against must not
+share a mistake.
+"""
+
+import pytest
+
+from studio_core import config
+from studio_core.services import catalog, node_cache
+from tests.conftest import CATALOG_ROOT
+
+OTHER_LIBRARY = "lib-0002"
+OTHER_ROOT = "node-root-0002"
+
+_SEED_TIME = "2026-08-19T12:00:00.000000+00:00"
+
+
+# ──────────────────────────── the cache itself ────────────────────────────
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    node_cache.reset()
+    yield
+    node_cache.install(node_cache.LruTier())
+
+
+def test_a_put_is_a_hit_and_a_copy():
+    node_cache.put("NODE#a/META", {"name": "a"}, node_cache.version())
+
+    first = node_cache.get("NODE#a/META")
+    first["name"] = "edited"
+
+    assert node_cache.get("NODE#a/META") == {"name": "a"}
+    assert node_cache.stats()["hits"] == 2
+
+
+def test_a_read_that_raced_a_write_is_not_remembered():
+    """The version taken before the read is stale by the time the put arrives."""
+    read_at = node_cache.version()
+    node_cache.invalidate(["NODE#elsewhere/META"])
+
+    node_cache.put("NODE#a/META", {"name": "as it was"}, read_at)
+
+    assert node_cache.get("NODE#a/META") is None
+    assert node_cache.stats()["refused"] == 1
+
+
+def test_an_entry_expires_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(node_cache.time, "monotonic", lambda: now[0])
+    monkeypatch.setenv("STUDIO_NODE_CACHE_TTL_SECONDS", "5")
+    node_cache.put("NODE#a/META", {"name": "a"}, node_cache.version())
+
+    now[0] += 4.9
+    assert node_cache.get("NODE#a/META") == {"name": "a"}
+    now[0] += 0.2
+    assert node_cache.get("NODE#a/META") is None
+
+
+def test_a_ttl_of_zero_turns_it_off(monkeypatch):
+    monkeypatch.setenv("STUDIO_NODE_CACHE_TTL_SECONDS", "0")
+    node_cache.put("NODE#a/META", {"name": "a"}, node_cache.version())
+
+    assert node_cache.get("NODE#a/META") is None
+    assert node_cache.stats()["entries"] == 0
+
+
+def test_the_tier_evicts_the_least_recently_used():
+    node_cache.install(node_cache.LruTier(entries=2))
+    for key in ("a", "b"):
+        node_cache.put(key, {"key": key}, node_cache.version())
+    node_cache.get("a")
+    node_cache.put("c", {"key": "c"}, node_cache.version())
+
+    assert node_cache.get("b") is None
+    assert node_cache.get("a") == {"key": "a"}
+
+
+# ──────────────────────────── catalog, reading through it ────────────────────────────
+
+
+def _calls(name):
+    """A running count of one DynamoDB operation, read from the service's own client."""
+    counted = {"count": 0}
+
+    def _count(model, **_):
+        if model.name == name:
+            counted["count"] += 1
+
+    catalog.dynamodb.client().meta.events.register("before-call.dynamodb", _count)
+    return counted
+
+
+def test_records_reads_each_id_once(catalog_table):
+    first = catalog.create_node(CATALOG_ROOT, "a.png", catalog.KIND_FILE, blob_key="blobs/a")
+    second = catalog.create_node(CATALOG_ROOT, "b.png", catalog.KIND_FILE, blob_key="blobs/b")
+    batches = _calls("BatchGetItem")
+
+    catalog.records([first["node_id"]])
+    catalog.records([first["node_id"], second["node_id"]])
+    catalog.records([first["node_id"], second["node_id"]])
+
+    # One batch for `a`, one for `b` alone — the cached id is not asked again.
+    assert batches["count"] == 2
+    assert node_cache.stats()["hits"] == 3
+
+
+def test_child_by_name_is_answered_from_the_cache(catalog_table):
+    folder = catalog.create_node(CATALOG_ROOT, "characters", catalog.KIND_FOLDER)
+    gets = _calls("GetItem")
+
+    for _ in range(3):
+        assert catalog.child_by_name(CATALOG_ROOT, "characters")["node_id"] == folder["node_id"]
+
+    assert gets["count"] == 1
+
+
+def test_a_name_that_is_not_there_is_not_remembered(catalog_table):
+    """Another container may create it next, and the next resolve must see that."""
+    with pytest.raises(catalog.NotFoundError):
+        catalog.child_by_name(CATALOG_ROOT, "characters")
+    folder = catalog.create_node(CATALOG_ROOT, "characters", catalog.KIND_FOLDER)
+
+    assert catalog.child_by_name(CATALOG_ROOT, "characters")["node_id"] == folder["node_id"]
+
+
+def test_node_is_never_answered_from_the_cache(catalog_table):
+    """It is the read writes and authorisation are built on; it only fills the cache."""
+    folder = catalog.create_node(CATALOG_ROOT, "characters", catalog.KIND_FOLDER)
+    catalog.records([folder["node_id"]])
+    gets = _calls("GetItem")
+
+    catalog.node(folder["node_id"])
+    catalog.node(folder["node_id"])
+
+    assert gets["count"] == 2
+
+
+def test_a_listing_read_that_races_a_rename_does_not_cache_the_old_name(
+    catalog_table, monkeypatch
+):
+    """The version check, end to end: the batch returns, a write lands, the put is refused."""
+    clip = catalog.create_node(CATALOG_ROOT, "clip.mp4", catalog.KIND_FILE, blob_key="blobs/c")
+    real = catalog._batch_get
+    raced = []
+
+    def _racing(keys):
+        items = real(keys)
+        if not raced:
+            raced.append(True)
+            catalog.rename_node(clip["node_id"], "renamed.mp4")
+        return items
+
+    monkeypatch.setattr(catalog, "_batch_get", _racing)
+
+    assert catalog.records([clip["node_id"]])[clip["node_id"]]["name"] == "clip.mp4"
+    assert catalog.records([clip["node_id"]])[clip["node_id"]]["name"] == "renamed.mp4"
+
+
+# ──────────────────────────── the stale-read harness ────────────────────────────
+
+
+class StaleReads:
+    """Warm every item into the cache, then compare the cached reads with a scan.
+
+    `records` answers for the `META` half and `children_named` for the `NAME#`
+    half, which are the two shapes `node_cache` holds. Ids and names seen while
+    warming are asked about again afterwards as well as the ones the table now
+    has, so an item a write removed must be absent from the cached answer too.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.ids: set[str] = set()
+        self.pairs: set[tuple[str, str]] = set()
+
+    def _table(self):
+        items = self.client.scan(TableName=config.catalog_table())["Items"]
+        records, entries = {}, {}
+        for item in items:
+            pk, sk = item["pk"]["S"], item["sk"]["S"]
+            if not pk.startswith("NODE#"):
+                continue
+            if sk == "META":
+                records[pk.split("#", 1)[1]] = catalog._record(item)
+            elif sk.startswith("NAME#"):
+                name = sk.split("#", 1)[1]
+                entries[(pk.split("#", 1)[1], name)] = {**catalog._record(item), "name": name}
+        return records, entries
+
+    def warm(self):
+        records, entries = self._table()
+        self.ids |= set(records)
+        self.pairs |= set(entries)
+        catalog.records(sorted(self.ids))
+        catalog.children_named(sorted(self.pairs))
+        assert node_cache.stats()["entries"] == len(records) + len(entries)
+
+    def assert_fresh(self):
+        records, entries = self._table()
+        ids, pairs = self.ids | set(records), self.pairs | set(entries)
+
+        assert catalog.records(sorted(ids)) == records
+        assert catalog.children_named(sorted(pairs)) == entries
+
+
+def _other_library(client):
+    for item in (
+        {
+            "pk": {"S": f"LIB#{OTHER_LIBRARY}"},
+            "sk": {"S": "META"},
+            "name": {"S": "Archive"},
+            "root_node": {"S": OTHER_ROOT},
+            "created_at": {"S": _SEED_TIME},
+        },
+        {
+            "pk": {"S": f"NODE#{OTHER_ROOT}"},
+            "sk": {"S": "META"},
+            "node_id": {"S": OTHER_ROOT},
+            "lib": {"S": OTHER_LIBRARY},
+            "name": {"S": "Archive"},
+            "kind": {"S": "folder"},
+            "path": {"S": "/"},
+            "created_at": {"S": _SEED_TIME},
+            "updated_at": {"S": _SEED_TIME},
+        },
+    ):
+        client.put_item(TableName=config.catalog_table(), Item=item)
+
+
+def _tree():
+    """projects/<project>/output/clip.mp4, and an empty archive beside it."""
+    projects = catalog.create_node(CATALOG_ROOT, "projects", catalog.KIND_FOLDER)
+    archive = catalog.create_node(CATALOG_ROOT, "archive", catalog.KIND_FOLDER)
+    project = catalog.create_node(projects["node_id"], "<project>", catalog.KIND_FOLDER)
+    output = catalog.create_node(project["node_id"], "output", catalog.KIND_FOLDER)
+    clip = catalog.create_node(
+        output["node_id"], "clip.mp4", catalog.KIND_FILE, blob_key="blobs/clip", size=3
+    )
+    return {"archive": archive, "project": project, "output": output, "clip": clip}
+
+
+WRITES = {
+    "create": lambda tree: catalog.create_node(
+        tree["output"]["node_id"], "still.jpeg", catalog.KIND_FILE, blob_key="blobs/still"
+    ),
+    "create_numbered": lambda tree: catalog.create_numbered(
+        tree["output"]["node_id"], "clip.mp4", catalog.KIND_FILE
+    ),
+    "rename": lambda tree: catalog.rename_node(tree["clip"]["node_id"], "renamed.mp4"),
+    # A move with descendants, so `_rewrite_branch` rewrites rows the move
+    # itself never names.
+    "move": lambda tree: catalog.move_node(
+        tree["project"]["node_id"], tree["archive"]["node_id"]
+    ),
+    "transfer": lambda tree: catalog.transfer_node(tree["project"]["node_id"], OTHER_LIBRARY),
+    "delete": lambda tree: catalog.delete_node(tree["project"]["node_id"]),
+    "set_blob": lambda tree: catalog.set_blob(
+        tree["clip"]["node_id"], "blobs/replaced", size=11, content_type="video/mp4"
+    ),
+}
+
+
+@pytest.mark.parametrize("write", sorted(WRITES))
+def test_no_write_leaves_a_stale_read_behind(catalog_table, write):
+    _other_library(catalog_table)
+    tree = _tree()
+    harness = StaleReads(catalog_table)
+    harness.warm()
+
+    WRITES[write](tree)
+
+    harness.assert_fresh()
+
+
+def test_the_harness_catches_a_write_made_behind_the_catalogs_back(catalog_table):
+    """The harness has to be able to fail, or the tests above prove nothing.
+
+    A row edited with the raw client is exactly a write from another container:
+    nothing here was told. The cached read is stale until the TTL, by design,
+    and the harness must say so.
+    """
+    clip = _tree()["clip"]
+    harness = StaleReads(catalog_table)
+    harness.warm()
+    catalog_table.update_item(
+        TableName=config.catalog_table(),
+        Key={"pk": {"S": f"NODE#{clip['node_id']}"}, "sk": {"S": "META"}},
+        UpdateExpression="SET #size = :size",
+        ExpressionAttributeNames={"#size": "size"},
+        ExpressionAttributeValues={":size": {"N": "99"}},
+    )
+
+    with pytest.raises(AssertionError):
+        harness.assert_fresh()
@@ -22,12 +22,15 @@ token. It is `before_request` that calls it now rather than the routes — see t
 test hands the header back to the real parsing.
 """
 
+import hashlib
+import json
 from urllib.parse import parse_qs, urlparse
 
 import pytest
 
 from studio_core import config
 from studio_core.app_factory import create_app
+from studio_core.clients.aws import s3
 from studio_core.errors import NotFoundError
 from studio_core.services import catalog, identity
 from tests.conftest import CATALOG_LIBRARY, CATALOG_OWNER, CATALOG_ROOT
@@ -316,6 +319,39 @@ def test_listing_another_callers_library_is_403(catalog_table, signed_in):
     assert resp.status_code == 403
 
 
+def test_a_listing_sent_back_unchanged_is_304_without_a_query(
+    catalog_table, signed_in, catalog_calls
+):
+    """The tag is the parent's `rev`, so a revalidation costs the parent's read alone."""
+    folder = _folder("corpus")
+    _file("a.webp", parent=folder["node_id"])
+    first = _get(f"/api/nodes?parent={folder['node_id']}")
+    assert first.headers["ETag"].startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    catalog_calls.clear()
+
+    etag = first.headers["ETag"]
+    again = _get(f"/api/nodes?parent={folder['node_id']}", **{"If-None-Match": etag})
+
+    assert again.status_code == 304
+    assert again.data == b""
+    assert again.headers["ETag"] == etag
+    assert "Query" not in catalog_calls
+
+
+def test_a_change_to_a_child_moves_the_listing_tag_on(catalog_table, signed_in):
+    folder = _folder("corpus")
+    child = _file("a.webp", parent=folder["node_id"])
+    tag = _get(f"/api/nodes?parent={folder['node_id']}").headers["ETag"]
+
+    catalog.rename_node(child["node_id"], "b.webp")
+    resp = _get(f"/api/nodes?parent={folder['node_id']}", **{"If-None-Match": tag})
+
+    assert resp.status_code == 200
+    assert [entry["name"] for entry in resp.get_json()] == ["b.webp"]
+    assert resp.headers["ETag"] != tag
+
+
 # ──────────────────────── GET /api/nodes/<id> ────────────────────────
 
 
@@ -510,6 +546,131 @@ def test_resolving_as_a_member_of_no_library_is_403(catalog_table, signed_in):
     assert resp.status_code == 403
 
 
+# ───────────────────────── POST /api/resolve/batch ─────────────────────────
+
+
+@pytest.fixture
+def catalog_calls():
+    """Every DynamoDB operation the next requests make, by name, in order."""
+    from studio_core.clients.aws import dynamodb
+
+    calls = []
+    dynamodb.client().meta.events.register(
+        "before-call.dynamodb", lambda model, **_: calls.append(model.name)
+    )
+    return calls
+
+
+def test_a_batch_resolves_every_path_in_the_order_asked(catalog_table, signed_in):
+    projects = _folder("projects")
+    project = _folder("<project>", parent=projects["node_id"])
+    clip = _file("clip.mp4", parent=project["node_id"], size=7)
+    still = _file("still.jpeg", parent=project["node_id"])
+
+    resp = _post(
+        "/api/resolve/batch",
+        {"paths": ["projects/<project>/still.jpeg", "", "/projects/<project>/clip.mp4/"]},
+    )
+
+    assert resp.status_code == 200
+    answers = resp.get_json()
+    assert [answer["path"] for answer in answers] == [
+        "projects/<project>/still.jpeg",
+        "",
+        "/projects/<project>/clip.mp4/",
+    ]
+    assert [answer["node"]["id"] for answer in answers] == [
+        still["node_id"],
+        CATALOG_ROOT,
+        clip["node_id"],
+    ]
+    assert answers[2]["node"]["size"] == 7
+    assert BLOB_KEY not in resp.get_data(as_text=True)
+
+
+def test_sibling_paths_cost_a_batch_per_level_not_a_read_per_segment(
+    catalog_table, signed_in, catalog_calls
+):
+    """Twelve files three deep: three `BatchGetItem`s and one for the records."""
+    projects = _folder("projects")
+    project = _folder("<project>", parent=projects["node_id"])
+    paths = []
+    for index in range(12):
+        _file(f"frame_{index:02}.png", parent=project["node_id"])
+        paths.append(f"projects/<project>/frame_{index:02}.png")
+    catalog_calls.clear()
+
+    resp = _post("/api/resolve/batch", {"paths": paths})
+
+    assert all(answer["node"] for answer in resp.get_json())
+    assert catalog_calls.count("GetItem") == 1  # the library's META, for its root
+    assert catalog_calls.count("BatchGetItem") == 4
+
+
+def test_a_missing_path_is_answered_without_failing_the_batch(catalog_table, signed_in):
+    projects = _folder("projects")
+    _folder("<project>", parent=projects["node_id"])
+
+    resp = _post(
+        "/api/resolve/batch",
+        {"paths": ["projects/<project>/nope/clip.mp4", "projects", "nope"]},
+    )
+
+    assert resp.status_code == 200
+    missing, found, absent = resp.get_json()
+    assert missing == {
+        "path": "projects/<project>/nope/clip.mp4",
+        "node": None,
+        "missing": "projects/<project>/nope",
+    }
+    assert found["node"]["id"] == projects["node_id"]
+    assert absent["missing"] == "nope"
+
+
+def test_a_batch_walks_the_named_library(catalog_table, signed_in):
+    """Names collide across libraries, so the walk has to start at the right root."""
+    _second_library(catalog_table)
+    catalog_table.put_item(
+        TableName=config.catalog_table(),
+        Item={
+            "pk": {"S": f"USER#{CATALOG_OWNER}"},
+            "sk": {"S": f"LIB#{OTHER_LIBRARY}"},
+            "role": {"S": "member"},
+            "created_at": {"S": _SEED_TIME},
+        },
+    )
+
+    resp = _post(
+        "/api/resolve/batch", {"paths": ["secret.jpeg"]}, **{"X-Studio-Library": OTHER_LIBRARY}
+    )
+
+    assert resp.get_json()[0]["node"]["id"] == OTHER_NODE
+
+
+def test_a_batch_in_a_library_the_caller_is_not_in_is_403(catalog_table, signed_in):
+    _second_library(catalog_table)
+
+    resp = _post(
+        "/api/resolve/batch", {"paths": ["secret.jpeg"]}, **{"X-Studio-Library": OTHER_LIBRARY}
+    )
+
+    assert resp.status_code == 403
+
+
+@pytest.mark.parametrize("body", [{}, {"paths": "clip.mp4"}, {"paths": ["clip.mp4", 3]}])
+def test_a_batch_needs_a_list_of_paths(catalog_table, signed_in, body):
+    assert _post("/api/resolve/batch", body).status_code == 400
+
+
+def test_a_batch_larger_than_the_cap_is_refused(catalog_table, signed_in, monkeypatch):
+    monkeypatch.setenv("STUDIO_MAX_RESOLVE_PATHS", "2")
+
+    resp = _post("/api/resolve/batch", {"paths": ["a", "b", "c"]})
+
+    assert resp.status_code == 400
+    assert "at most 2" in resp.get_json()["error"]
+
+
 # ──────────────────────── POST /api/nodes ────────────────────────
 
 
@@ -947,7 +1108,8 @@ def test_deleting_in_another_library_is_403(catalog_table, media_bucket, signed_
 # ─────────────── GET /api/nodes/<id>/download-url ───────────────
 
 # These need the bucket as well as the table: the route heads the object before
-# signing, so a node whose blob is absent is a 404 and not a URL.
+# signing whenever the row cannot say what it holds, so a node whose blob is
+# absent is a 404 and not a URL.
 REAL_KEY = "characters/subject-a/seed/subject-a_1.webp"
 
 
@@ -974,10 +1136,11 @@ def test_a_download_url_is_signed_for_the_nodes_blob(catalog_table, media_bucket
 def test_a_download_url_reports_the_objects_size_not_the_rows(
     catalog_table, media_bucket, signed_in
 ):
-    """S3 is asked, because the bytes are what is being fetched.
+    """S3 is asked when the row has no `content_type`, because then it is not done.
 
-    The row here claims a size that is deliberately wrong. A response that
-    repeated it would hand the client a number the download then contradicts.
+    The row here claims a size that is deliberately wrong and no type — one the
+    catalog never finished describing. A response that repeated it would hand the
+    client a number the download then contradicts.
     """
     created = catalog.create_node(
         CATALOG_ROOT, "seed.webp", catalog.KIND_FILE, blob_key=REAL_KEY, size=999_999
@@ -1037,6 +1200,388 @@ def test_a_download_url_in_another_library_is_403(catalog_table, media_bucket, s
     assert resp.status_code == 403
 
 
+def test_a_described_row_is_signed_without_a_head(
+    catalog_table, media_bucket, signed_in, monkeypatch
+):
+    """`size` and `content_type` on the row are the answer; S3 is not asked again."""
+    created = catalog.create_node(
+        CATALOG_ROOT, "seed.webp", catalog.KIND_FILE,
+        blob_key=REAL_KEY, size=7, content_type="image/webp",
+    )
+    monkeypatch.setattr(s3, "head", lambda key: pytest.fail(f"HEAD {key}"))
+
+    body = _get(f"/api/nodes/{created['node_id']}/download-url").get_json()
+
+    assert (body["size"], body["content_type"]) == (7, "image/webp")
+    assert REAL_KEY in body["url"]
+
+
+def test_a_download_url_is_never_the_cached_one(
+    catalog_table, media_bucket, signed_in, monkeypatch
+):
+    """A client re-signs here because a URL died; handing that one back is no answer."""
+    created = _file_on_disk()
+    cached = s3.presign(REAL_KEY)
+    monkeypatch.setattr(
+        s3.client(), "generate_presigned_url", lambda *args, **kwargs: "https://fresh"
+    )
+
+    body = _get(f"/api/nodes/{created['node_id']}/download-url").get_json()
+
+    assert body["url"] == "https://fresh" != cached
+    # And the next listing hands out the new one rather than the one that died.
+    assert s3.presign(REAL_KEY) == "https://fresh"
+
+
+# ─────────────── GET /api/nodes/<id>/archive ───────────────
+
+
+def _stored(media_bucket, name, body, parent):
+    """A confirmed file: a row with its `size`, and the bytes behind its key."""
+    created = catalog.create_node(parent, name, catalog.KIND_FILE, size=len(body))
+    media_bucket.put_object(Bucket=config.media_bucket(), Key=created["blob_key"], Body=body)
+    return created
+
+
+def _unpacked(resp):
+    """Every member of a tar response, name -> bytes (`None` for a directory)."""
+    import io
+    import tarfile
+
+    members = {}
+    with tarfile.open(fileobj=io.BytesIO(resp.data), mode="r|") as archive:
+        for member in archive:
+            members[member.name] = (
+                None if member.isdir() else archive.extractfile(member).read()
+            )
+    return members
+
+
+def test_an_archive_holds_the_folder_its_files_and_a_manifest(
+    catalog_table, media_bucket, signed_in
+):
+    project = _folder("<project>")
+    output = _folder("output", parent=project["node_id"])
+    clip = _stored(media_bucket, "clip.mp4", b"\x00" * 1500, output["node_id"])
+    notes = _stored(media_bucket, "notes.md", "ünïcode\n".encode(), project["node_id"])
+
+    resp = _get(f"/api/nodes/{project['node_id']}/archive")
+
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-tar"
+    assert 'filename="<project>.tar"' in resp.headers["Content-Disposition"]
+    members = _unpacked(resp)
+    assert members["<project>/output/clip.mp4"] == b"\x00" * 1500
+    assert members["<project>/notes.md"] == "ünïcode\n".encode()
+    assert members["<project>"] is None and members["<project>/output"] is None
+    manifest = json.loads(members["<project>/manifest.json"])
+    assert manifest["id"] == project["node_id"]
+    assert {(entry["id"], entry["path"], entry["size"]) for entry in manifest["files"]} == {
+        (clip["node_id"], "<project>/output/clip.mp4", 1500),
+        (notes["node_id"], "<project>/notes.md", len("ünïcode\n".encode())),
+    }
+    assert manifest["skipped"] == []
+
+
+def test_an_archive_names_what_it_could_not_carry(catalog_table, media_bucket, signed_in):
+    """A placeholder and a row whose object is gone are skipped, not archived empty."""
+    project = _folder("<project>")
+    placeholder = catalog.create_node(project["node_id"], "pending.webp", catalog.KIND_FILE)
+    gone = catalog.create_node(project["node_id"], "gone.webp", catalog.KIND_FILE, size=3)
+
+    members = _unpacked(_get(f"/api/nodes/{project['node_id']}/archive"))
+
+    manifest = json.loads(members["<project>/manifest.json"])
+    assert manifest["files"] == []
+    assert {(entry["id"], entry["reason"]) for entry in manifest["skipped"]} == {
+        (placeholder["node_id"], "no bytes were ever uploaded"),
+        (gone["node_id"], "the object is gone"),
+    }
+    assert set(members) == {"<project>", "<project>/manifest.json"}
+
+
+def test_an_archive_names_a_file_whose_folder_moved_in_behind_the_walk(
+    catalog_table, media_bucket, signed_in, monkeypatch
+):
+    """A row under a folder the walk never met is named, not silently dropped."""
+    project = _folder("<project>")
+    late = _folder("late", parent=project["node_id"])
+    stray = _stored(media_bucket, "stray.webp", b"\x02" * 3, late["node_id"])
+    kept = _stored(media_bucket, "kept.webp", b"\x03" * 3, project["node_id"])
+    descendants = catalog.descendants
+
+    def walked_past_late(*args, **kwargs):
+        # As if `late` moved in after the walk passed where it sorts: its row
+        # is never read, but what it holds still is.
+        for row in descendants(*args, **kwargs):
+            if row["node_id"] != late["node_id"]:
+                yield row
+
+    monkeypatch.setattr(catalog, "descendants", walked_past_late)
+
+    members = _unpacked(_get(f"/api/nodes/{project['node_id']}/archive"))
+
+    manifest = json.loads(members["<project>/manifest.json"])
+    assert [entry["id"] for entry in manifest["files"]] == [kept["node_id"]]
+    assert manifest["skipped"] == [
+        {"id": stray["node_id"], "reason": "its folder moved in after the walk passed it"}
+    ]
+    assert set(members) == {"<project>", "<project>/kept.webp", "<project>/manifest.json"}
+
+
+def test_an_archive_holds_one_chunk_of_an_object_at_a_time(
+    catalog_table, media_bucket, signed_in, monkeypatch
+):
+    from studio_core.services import archive
+
+    monkeypatch.setattr(archive, "CHUNK_BYTES", 1024)
+    project = _folder("<project>")
+    _stored(media_bucket, "clip.mp4", b"\x01" * 10_000, project["node_id"])
+
+    blocks = list(archive.stream(archive.plan(catalog.node(project["node_id"]))))
+
+    # Every block but the closing one — the manifest and the end of the
+    # archive, written together — is a header, a chunk or a padding.
+    assert max(len(block) for block in blocks[:-1]) <= 1024
+    assert b"".join(blocks).count(b"\x01") == 10_000
+
+
+def test_an_archive_is_not_bounded_by_the_folder_cap(
+    catalog_table, media_bucket, signed_in, monkeypatch
+):
+    """A move or a delete must hold the branch; an archive only visits it."""
+    monkeypatch.setenv("STUDIO_MAX_FOLDER_OBJECTS", "1")
+    project = _folder("<project>")
+    output = _folder("output", parent=project["node_id"])
+    for index in range(3):
+        _stored(media_bucket, f"clip-{index}.mp4", b"\x00" * 10, output["node_id"])
+
+    members = _unpacked(_get(f"/api/nodes/{project['node_id']}/archive"))
+
+    assert {f"<project>/output/clip-{index}.mp4" for index in range(3)} <= set(members)
+
+
+def test_an_archive_of_a_file_is_400(catalog_table, media_bucket, signed_in):
+    created = _stored(media_bucket, "clip.mp4", b"abc", CATALOG_ROOT)
+
+    assert _get(f"/api/nodes/{created['node_id']}/archive").status_code == 400
+
+
+def test_an_archive_past_the_byte_cap_is_refused_before_it_starts(
+    catalog_table, media_bucket, signed_in, monkeypatch
+):
+    monkeypatch.setenv("STUDIO_MAX_ARCHIVE_BYTES", "100")
+    project = _folder("<project>")
+    _stored(media_bucket, "clip.mp4", b"\x00" * 101, project["node_id"])
+
+    resp = _get(f"/api/nodes/{project['node_id']}/archive")
+
+    assert resp.status_code == 400
+    assert "one at a time" in resp.get_json()["error"]
+
+
+def test_an_archive_in_another_library_is_403(catalog_table, media_bucket, signed_in):
+    _second_library(catalog_table)
+
+    assert _get(f"/api/nodes/{OTHER_NODE}/archive").status_code == 403
+
+
+# ─────────────── GET /api/nodes/<id>/descendants ───────────────
+
+
+def _walked(node_id, **params):
+    """Every page of a walk, followed to the end: the entries and the page count."""
+    entries, pages, cursor = [], 0, None
+    while True:
+        query = "&".join(f"{k}={v}" for k, v in {**params, "cursor": cursor}.items() if v)
+        resp = _get(f"/api/nodes/{node_id}/descendants?{query}")
+        assert resp.status_code == 200, resp.get_json()
+        pages += 1
+        entries += resp.get_json()["nodes"]
+        cursor = resp.get_json()["next_cursor"]
+        if cursor is None:
+            return entries, pages
+
+
+def test_descendants_name_every_node_beneath_a_folder_by_path(catalog_table, signed_in):
+    project = _folder("<project>")
+    runs = _folder("runs", parent=project["node_id"])
+    run = _folder("run-1", parent=runs["node_id"])
+    clip = _file("clip.mp4", parent=run["node_id"], size=7)
+    _file("outside.png")
+
+    entries, pages = _walked(project["node_id"])
+
+    assert pages == 1
+    assert {entry["path"]: entry["kind"] for entry in entries} == {
+        "runs": "folder",
+        "runs/run-1": "folder",
+        "runs/run-1/clip.mp4": "file",
+    }
+    found = next(entry for entry in entries if entry["path"].endswith("clip.mp4"))
+    assert found["id"] == clip["node_id"] and found["size"] == 7
+    assert found["parent_id"] == run["node_id"] and "created_at" in found
+    assert "blob_key" not in found
+
+
+def test_descendants_put_every_folder_before_what_it_holds(catalog_table, signed_in):
+    project = _folder("<project>")
+    parent = project["node_id"]
+    for depth in range(4):
+        _file(f"file-{depth}.png", parent=parent)
+        parent = _folder(f"level-{depth}", parent=parent)["node_id"]
+
+    entries, _ = _walked(project["node_id"])
+
+    seen = set()
+    for entry in entries:
+        folder = entry["path"].rpartition("/")[0]
+        assert not folder or folder in seen, entry["path"]
+        seen.add(entry["path"])
+
+
+def test_descendants_page_between_folders_and_name_across_pages(catalog_table, signed_in):
+    """Ten folders of three, a page of four: each page ends where a folder does."""
+    project = _folder("<project>")
+    for run in range(10):
+        folder = _folder(f"run-{run}", parent=project["node_id"])
+        for index in range(3):
+            _file(f"{index}.png", parent=folder["node_id"])
+
+    entries, pages = _walked(project["node_id"], page_size=4)
+
+    assert sorted(entry["path"] for entry in entries) == sorted(
+        [f"run-{run}" for run in range(10)]
+        + [f"run-{run}/{index}.png" for run in range(10) for index in range(3)]
+    )
+    # The ten folders are one page; each run's three files, read by a page with
+    # room for four, end the page there — a folder never splits.
+    assert pages == 1 + 10 // 2 + 10 % 2
+
+
+def test_a_folder_larger_than_a_page_is_still_one_page(catalog_table, signed_in):
+    project = _folder("<project>")
+    for index in range(5):
+        _file(f"{index}.png", parent=project["node_id"])
+
+    entries, pages = _walked(project["node_id"], page_size=2)
+
+    assert len(entries) == 5 and pages == 1
+
+
+def test_descendants_of_an_empty_folder_are_an_empty_page(catalog_table, signed_in):
+    assert _walked(_folder("<project>")["node_id"]) == ([], 1)
+
+
+def test_descendants_of_a_file_is_400(catalog_table, signed_in):
+    created = _file("clip.mp4")
+
+    assert _get(f"/api/nodes/{created['node_id']}/descendants").status_code == 400
+
+
+def test_descendants_in_another_library_is_403(catalog_table, signed_in):
+    _second_library(catalog_table)
+
+    assert _get(f"/api/nodes/{OTHER_ROOT}/descendants").status_code == 403
+
+
+@pytest.mark.parametrize("query", ["page_size=0", "page_size=ten", "cursor=not-a-cursor"])
+def test_descendants_refuse_a_bad_page_size_or_cursor(catalog_table, signed_in, query):
+    project = _folder("<project>")
+
+    assert _get(f"/api/nodes/{project['node_id']}/descendants?{query}").status_code == 400
+
+
+def test_a_cursor_from_another_folder_is_refused(catalog_table, signed_in):
+    first, second = _folder("first"), _folder("second")
+    _file("a.png", parent=_folder("inner", parent=first["node_id"])["node_id"])
+    resp = _get(f"/api/nodes/{first['node_id']}/descendants?page_size=1")
+    cursor = resp.get_json()["next_cursor"]
+    assert cursor
+
+    resp = _get(f"/api/nodes/{second['node_id']}/descendants?cursor={cursor}")
+    assert resp.status_code == 400
+
+
+# ──────────────────────── POST /api/presign/batch ────────────────────────
+
+
+def _landed(name, key=REAL_KEY):
+    return catalog.create_node(
+        CATALOG_ROOT, name, catalog.KIND_FILE, blob_key=key, size=7, content_type="image/webp"
+    )
+
+
+def test_a_batch_signs_each_node_in_the_order_asked(
+    catalog_table, media_bucket, signed_in, monkeypatch
+):
+    first, second = _landed("one.webp"), _landed("two.webp", key="characters/two.webp")
+    monkeypatch.setattr(s3, "head", lambda key: pytest.fail(f"HEAD {key}"))
+    asked = [second["node_id"], first["node_id"], second["node_id"]]
+
+    resp = _post("/api/presign/batch", {"nodes": asked})
+
+    assert resp.status_code == 200
+    answers = resp.get_json()
+    assert [answer["id"] for answer in answers] == asked
+    assert "characters/two.webp" in answers[0]["url"]
+    assert REAL_KEY in answers[1]["url"]
+    # Asked twice, signed once.
+    assert answers[2]["url"] == answers[0]["url"]
+    assert all(0 < answer["expires_in"] <= config.presign_ttl_seconds() for answer in answers)
+
+
+def test_a_batch_says_why_it_could_not_sign_a_node(catalog_table, media_bucket, signed_in):
+    landed, folder = _landed("one.webp"), _folder("characters")
+    placeholder = catalog.create_node(CATALOG_ROOT, "pending.webp", catalog.KIND_FILE)
+
+    answers = _post(
+        "/api/presign/batch",
+        {"nodes": [folder["node_id"], "node-nope", placeholder["node_id"], landed["node_id"]]},
+    ).get_json()
+
+    assert [answer.get("reason") for answer in answers] == [
+        "folder", "missing", "not-uploaded", None,
+    ]
+    assert [answer["url"] is None for answer in answers] == [True, True, True, False]
+
+
+def test_a_batch_can_ask_for_attachments(catalog_table, media_bucket, signed_in):
+    landed = _landed("my portrait.webp")
+
+    answers = _post(
+        "/api/presign/batch", {"nodes": [landed["node_id"]], "disposition": "attachment"}
+    ).get_json()
+
+    assert "response-content-disposition" in answers[0]["url"].lower()
+
+
+def test_a_batch_with_a_node_in_another_library_is_403(catalog_table, media_bucket, signed_in):
+    _second_library(catalog_table)
+    mine = _landed("one.webp")
+
+    resp = _post("/api/presign/batch", {"nodes": [mine["node_id"], OTHER_NODE]})
+
+    assert resp.status_code == 403
+
+
+@pytest.mark.parametrize(
+    "body",
+    [{}, {"nodes": "node-x"}, {"nodes": [1]}, {"nodes": [], "disposition": "nope"}],
+)
+def test_a_malformed_batch_is_400(catalog_table, media_bucket, signed_in, body):
+    assert _post("/api/presign/batch", body).status_code == 400
+
+
+def test_a_batch_past_the_cap_is_400(catalog_table, media_bucket, signed_in, monkeypatch):
+    monkeypatch.setenv("STUDIO_MAX_PRESIGN_NODES", "2")
+
+    resp = _post("/api/presign/batch", {"nodes": ["a", "b", "c"]})
+
+    assert resp.status_code == 400
+    assert "at most 2" in resp.get_json()["error"]
+
+
 # ──────────── POST /api/nodes/<id>/upload-url + confirm ────────────
 
 
@@ -1143,6 +1688,30 @@ def test_a_legacy_key_cannot_be_overwritten_through_a_signature(catalog_table, s
     assert resp.status_code == 400
 
 
+def test_a_blob_a_copy_shares_cannot_be_overwritten_through_a_signature(
+    catalog_table, signed_in
+):
+    """The copy would change with it; a 409 until the copy is gone."""
+    created = _placeholder()
+    copy = catalog.create_node(
+        CATALOG_ROOT, "clip (2).mp4", catalog.KIND_FILE,
+        blob_key=created["blob_key"], share=True,
+    )
+
+    resp = _post(
+        f"/api/nodes/{created['node_id']}/upload-url",
+        {"size": 17, "content_type": "video/mp4"},
+    )
+    assert resp.status_code == 409
+
+    catalog.delete_node(copy["node_id"])
+    resp = _post(
+        f"/api/nodes/{created['node_id']}/upload-url",
+        {"size": 17, "content_type": "video/mp4"},
+    )
+    assert resp.status_code == 200
+
+
 def test_a_folder_cannot_be_uploaded_to(catalog_table, signed_in):
     folder = _folder("characters")
 
@@ -1227,6 +1796,240 @@ def test_confirming_in_another_library_is_403(catalog_table, media_bucket, signe
     assert resp.status_code == 403
 
 
+# ──────────────── /api/nodes/<id>/multipart (create, urls, complete) ────────────────
+#
+# S3 wants 5 MiB for every part but the last, and so does moto unless told
+# otherwise; its floor is lowered here so a three-part upload is a few hundred
+# bytes rather than fifteen megabytes of test data.
+
+PART = 256
+
+
+@pytest.fixture
+def small_parts(media_bucket, monkeypatch):
+    import moto.s3.models
+
+    monkeypatch.setattr(moto.s3.models, "S3_UPLOAD_PART_MIN_SIZE", PART)
+    monkeypatch.setenv("STUDIO_MULTIPART_PART_BYTES", str(PART))
+    return media_bucket
+
+
+def _send_part(bucket, node_id, upload_id, number, body):
+    """What a client's PUT to a part URL does — moto does not serve the URL itself."""
+    bucket.upload_part(
+        Bucket=config.media_bucket(),
+        Key=catalog.blob_key_for(node_id),
+        UploadId=upload_id,
+        PartNumber=number,
+        Body=body,
+    )
+
+
+def test_a_multipart_upload_is_cut_into_parts(catalog_table, small_parts, signed_in):
+    created = _placeholder()
+
+    resp = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    )
+
+    assert resp.status_code == 201
+    body = resp.get_json()
+    assert body["part_bytes"] == PART
+    assert body["part_count"] == 3
+    assert body["parts"] == []
+    assert "blob_key" not in resp.get_data(as_text=True)
+
+
+def test_part_urls_are_signed_for_each_parts_exact_length(
+    catalog_table, small_parts, signed_in
+):
+    """Every part but the last is `part_bytes`; the last is what remains."""
+    created = _placeholder()
+    _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    )
+
+    body = _post(f"/api/nodes/{created['node_id']}/multipart/urls", {"parts": [1, 3]}).get_json()
+
+    lengths = {part["number"]: part["headers"]["Content-Length"] for part in body["parts"]}
+    assert lengths == {1: str(PART), 3: "10"}
+    for part in body["parts"]:
+        query = parse_qs(urlparse(part["url"]).query)
+        assert "content-length" in query["X-Amz-SignedHeaders"][0]
+        assert catalog.blob_key_for(created["node_id"]) in part["url"]
+
+
+@pytest.mark.parametrize("parts", [[0], [4], [True], "1", []])
+def test_part_numbers_outside_the_upload_are_refused(
+    catalog_table, small_parts, signed_in, parts
+):
+    created = _placeholder()
+    _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    )
+
+    resp = _post(f"/api/nodes/{created['node_id']}/multipart/urls", {"parts": parts})
+
+    assert resp.status_code == 400
+
+
+def test_asking_again_resumes_with_the_parts_already_sent(
+    catalog_table, small_parts, signed_in
+):
+    """The resume: the same upload comes back, listing what S3 holds of it."""
+    created = _placeholder()
+    first = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    ).get_json()
+    _send_part(small_parts, created["node_id"], first["upload_id"], 2, b"b" * PART)
+
+    resp = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    )
+
+    assert resp.status_code == 200
+    again = resp.get_json()
+    assert again["upload_id"] == first["upload_id"]
+    assert again["parts"] == [
+        {"number": 2, "size": PART, "etag": hashlib.md5(b"b" * PART).hexdigest()}
+    ]
+    assert _get(f"/api/nodes/{created['node_id']}/multipart").get_json() == again
+
+
+def test_a_different_size_starts_a_new_upload(catalog_table, small_parts, signed_in):
+    """Different bytes: the old upload is aborted rather than left to expire."""
+    created = _placeholder()
+    first = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    ).get_json()
+
+    second = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 3 * PART, "content_type": "video/mp4"},
+    ).get_json()
+
+    assert second["upload_id"] != first["upload_id"]
+    uploads = small_parts.list_multipart_uploads(Bucket=config.media_bucket())
+    assert [upload["UploadId"] for upload in uploads["Uploads"]] == [second["upload_id"]]
+
+
+def test_completing_joins_the_parts_and_confirms_the_node(
+    catalog_table, small_parts, signed_in
+):
+    created = _placeholder()
+    upload = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    ).get_json()
+    # Out of order, as parallel PUTs arrive.
+    for number, body in ((3, b"c" * 10), (1, b"a" * PART), (2, b"b" * PART)):
+        _send_part(small_parts, created["node_id"], upload["upload_id"], number, body)
+
+    resp = _post(f"/api/nodes/{created['node_id']}/multipart/complete", {})
+
+    assert resp.status_code == 200
+    assert resp.get_json()["size"] == 2 * PART + 10
+    stored = small_parts.get_object(
+        Bucket=config.media_bucket(), Key=catalog.blob_key_for(created["node_id"])
+    )
+    assert stored["Body"].read() == b"a" * PART + b"b" * PART + b"c" * 10
+    assert stored["ContentType"] == "video/mp4"
+    assert catalog.upload_of(catalog.node(created["node_id"])) is None
+    assert _get(f"/api/nodes/{created['node_id']}/multipart").status_code == 404
+
+
+def test_completing_with_a_part_missing_names_it_and_keeps_the_upload(
+    catalog_table, small_parts, signed_in
+):
+    created = _placeholder()
+    upload = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    ).get_json()
+    _send_part(small_parts, created["node_id"], upload["upload_id"], 1, b"a" * PART)
+    _send_part(small_parts, created["node_id"], upload["upload_id"], 3, b"c" * 10)
+
+    resp = _post(f"/api/nodes/{created['node_id']}/multipart/complete", {})
+
+    assert resp.status_code == 400
+    assert resp.get_json()["error"].endswith(": 2")
+    assert "size" not in catalog.node(created["node_id"])
+    assert _get(f"/api/nodes/{created['node_id']}/multipart").status_code == 200
+
+
+def test_a_short_part_is_owed_again(catalog_table, small_parts, signed_in):
+    """A part S3 holds at the wrong length is not a part of this object."""
+    created = _placeholder()
+    upload = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    ).get_json()
+    _send_part(small_parts, created["node_id"], upload["upload_id"], 1, b"a" * PART)
+    _send_part(small_parts, created["node_id"], upload["upload_id"], 2, b"b" * (PART - 1))
+    _send_part(small_parts, created["node_id"], upload["upload_id"], 3, b"c" * 10)
+
+    resp = _post(f"/api/nodes/{created['node_id']}/multipart/complete", {})
+
+    assert resp.status_code == 400
+    assert resp.get_json()["error"].endswith(": 2")
+
+
+def test_aborting_drops_the_parts_and_the_upload(catalog_table, small_parts, signed_in):
+    created = _placeholder()
+    upload = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": 2 * PART + 10, "content_type": "video/mp4"},
+    ).get_json()
+    _send_part(small_parts, created["node_id"], upload["upload_id"], 1, b"a" * PART)
+
+    assert _delete(f"/api/nodes/{created['node_id']}/multipart").status_code == 204
+
+    assert catalog.upload_of(catalog.node(created["node_id"])) is None
+    assert "Uploads" not in small_parts.list_multipart_uploads(Bucket=config.media_bucket())
+
+
+@pytest.mark.parametrize("size", [0, -1, True, "17"])
+def test_a_multipart_upload_needs_a_positive_size(catalog_table, small_parts, signed_in, size):
+    created = _placeholder()
+
+    resp = _post(
+        f"/api/nodes/{created['node_id']}/multipart", {"size": size, "content_type": "video/mp4"}
+    )
+
+    assert resp.status_code == 400
+
+
+def test_a_huge_upload_gets_larger_parts_not_more_of_them(
+    catalog_table, small_parts, signed_in
+):
+    """S3 allows 10,000 parts, so past that the parts grow."""
+    created = _placeholder()
+
+    body = _post(
+        f"/api/nodes/{created['node_id']}/multipart",
+        {"size": PART * 20_000, "content_type": "video/mp4"},
+    ).get_json()
+
+    assert body["part_count"] == 10_000
+    assert body["part_bytes"] == 2 * PART
+
+
+def test_a_multipart_upload_in_another_library_is_403(catalog_table, small_parts, signed_in):
+    _second_library(catalog_table)
+
+    resp = _post(
+        f"/api/nodes/{OTHER_NODE}/multipart", {"size": PART, "content_type": "video/mp4"}
+    )
+
+    assert resp.status_code == 403
+
+
 # ──────────────────────────── POST /api/runs ────────────────────────────
 
 RUN_NAME = "2026-08-04_21-30-54_wave-porch-1x1"
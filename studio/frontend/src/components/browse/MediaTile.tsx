@@ -18,9 +18,11 @@ interface Props {
 /**
  * One image or video in the grid.
  *
- * Videos get `preload="metadata"` and no poster attribute: the browser paints
- * the first decoded frame, which is a free thumbnail for a bucket that ships no
- * derivatives. Muted + playsInline is what makes that legal on iOS.
+ * An image draws `preview_url`, the API's reduced copy, rather than the
+ * original. A video keeps `preload="metadata"` — it is what reports the
+ * duration — and shows `preview_url` as its poster once that is a frame the API
+ * made; until then the browser paints the first decoded frame, as it always
+ * did. Muted + playsInline is what makes that legal on iOS.
  */
 export function MediaTile({
   file,
@@ -29,7 +31,11 @@ export function MediaTile({
   onOpen,
   onToggleSelect,
 }: Props) {
-  const { src, failed, onError } = useSignedSrc(file.id, file.url);
+  const preview = file.preview_url ?? file.url;
+  const { src, failed, onError } = useSignedSrc(
+    file.id,
+    file.kind === "video" ? file.url : preview,
+  );
   const [duration, setDuration] = useState<number | null>(null);
 
   return (
@@ -60,6 +66,7 @@ export function MediaTile({
             src={src}
             onError={onError}
             onLoadedMetadata={(event) => setDuration(event.currentTarget.duration)}
+            poster={preview !== file.url ? preview : undefined}
             preload="metadata"
             muted
             playsInline
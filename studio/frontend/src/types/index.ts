@@ -88,6 +88,11 @@ export interface FileEntry {
   content_type: string | null;
   /** Presigned inline GET. Short-lived — re-sign through `getAsset` when it dies. */
   url: string;
+  /**
+   * What a tile draws, on images and videos: a small JPEG the API derived, or
+   * `url` itself until one exists. Never what the viewer plays or downloads.
+   */
+  preview_url?: string;
   /** Highlighting hint, present on text files only. */
   language?: string;
 }
@@ -109,7 +109,15 @@ resource "aws_iam_role_policy" "logs" {
 #     composes one, so "delete everything" is not expressible through the API.
 #     `keys.clean_key` still validates exactly one parameter, `GET /api/asset?key=`,
 #     which reads and cannot write. See `clients/aws/s3.py`.
-#   * There is no multipart grant. **There IS now a path that creates an object
+#   * The multipart grant is the two actions `PutObject` does not already
+#     cover: `AbortMultipartUpload` and `ListMultipartUploadParts`. Creating,
+#     completing and every part's PUT are all authorised as `PutObject`, so the
+#     grant widens nothing the single PUT below did not — and the parts arrive
+#     through presigned URLs bound exactly as that PUT is, one part number and
+#     one length each, into the node's own key. A part abandoned mid-upload is
+#     aborted by the bucket's lifecycle rule (`modules/media`), not by anyone
+#     remembering to.
+#   * **There IS now a path that creates an object
 #     out of bytes the caller supplied**, and this paragraph used to say there
 #     was not — #294 was the separate decision this note asked for.
 #     `POST /api/nodes/<id>/upload-url` signs a PUT, so the bytes go to S3
@@ -118,9 +126,10 @@ resource "aws_iam_role_policy" "logs" {
 #     the caller names), one exact content length, one content type, and a TTL
 #     shorter than a read URL's. A signed URL cannot be redirected at another
 #     object without invalidating itself.
-#     The `PutObject` this role grants has exactly two callers left: `put_text`,
-#     which overwrites a text file that already exists, and the destination half
-#     of `copy_objects`. The
+#     The `PutObject` this role grants has exactly three callers left: `put_text`,
+#     which overwrites a text file that already exists, the destination half
+#     of `copy_objects`, and `put_derived`, which writes a reduced copy of a
+#     blob under `derived/<blob_key>/` and nowhere else. The
 #     zero-byte folder marker went with the listings that read it (#316, #317) —
 #     `manage.create_folder` writes one row and no objects — and a rename or a
 #     move is a catalog transaction that touches no bytes at all. Favourites are
@@ -165,7 +174,12 @@ data "aws_iam_policy_document" "media_access" {
   statement {
     sid       = "ManageMediaObjects"
     effect    = "Allow"
-    actions   = ["s3:PutObject", "s3:DeleteObject"]
+    actions = [
+      "s3:PutObject",
+      "s3:DeleteObject",
+      "s3:AbortMultipartUpload",
+      "s3:ListMultipartUploadParts",
+    ]
     resources = ["arn:aws:s3:::${var.media_bucket_name}/${var.media_root_prefix}*"]
   }
 }
@@ -107,3 +107,27 @@ resource "aws_s3_bucket_cors_configuration" "this" {
     max_age_seconds = 3600
   }
 }
+
+# One rule, and it deletes nothing anyone can see: a multipart upload that is
+# never completed or aborted keeps its parts — billed, and invisible to every
+# listing — until something aborts it. `DELETE /api/nodes/<id>/multipart` is
+# the tidy path; this is the one that does not depend on a client surviving to
+# take it. A week is long past any upload anyone is still resuming.
+#
+# No expiration and no noncurrent-version rule, deliberately: versioning above
+# is what makes a delete recoverable, and a rule expiring old versions would
+# quietly put a deadline on that.
+resource "aws_s3_bucket_lifecycle_configuration" "this" {
+  bucket = aws_s3_bucket.this.id
+
+  rule {
+    id     = "abort-incomplete-multipart-uploads"
+    status = "Enabled"
+
+    filter {}
+
+    abort_incomplete_multipart_upload {
+      days_after_initiation = 7
+    }
+  }
+}
@@ -0,0 +1,130 @@
+"""`adapters/api`: a connection per call against the pool, over many small calls.
+
+    cd studio/pipeline && python -m benchmarks.bench_api_transport --calls 1000 --threads 1,8
+
+Starts a local stand-in for the API — `http.server` speaking HTTP/1.1, answering
+every `GET` with a listing-sized JSON body — and makes `--calls` calls to it two
+ways, at each thread count in `--threads`:
+
+* **`urlopen`** — what `api._send` did before the pool: `urllib.request.urlopen`
+  per call, which sends `Connection: close` and opens a new socket every time.
+* **`pooled`** — `api.get`, the transport as it is now.
+
+For each, requests per second and the p50 and p99 of one call's latency, and
+`sockets` — how many distinct client ports the stand-in saw, which is the
+column that carries. The stand-in is the standard library's rather than the
+Flask app, so the pipeline gains no dependency for a benchmark; what is measured
+is the client, and any HTTP/1.1 server that keeps connections open measures it
+the same.
+
+**Loopback without TLS understates the difference.** A new connection here is
+a TCP handshake on one machine; against the real API it is a round trip across
+the internet and a TLS handshake on top, paid on every call by `urlopen` and
+once per thread by the pool. The timings are this machine's: comparable between
+the two columns of one run, and nothing more.
+"""
+
+import argparse
+import http.server
+import json
+import statistics
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from studio_pipeline.adapters import api, auth
+
+# Roughly one folder's listing: a dozen children, names and sizes.
+_LISTING = json.dumps(
+    [{"id": f"node-{n:04d}", "name": f"shot-{n}.png", "kind": "file", "size": 1024 * n}
+     for n in range(12)]
+).encode()
+
+
+class _StandIn(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body leave as two writes; with Nagle on, a kept-alive socket
+    # waits out the client's delayed ACK between them — 40 ms a call that is the
+    # stand-in's, not the transport's.
+    disable_nagle_algorithm = True
+    ports: set[int] = set()
+    lock = threading.Lock()
+
+    def do_GET(self):  # noqa: N802 — the handler's naming, not ours
+        with self.lock:
+            self.ports.add(self.client_address[1])
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_LISTING)))
+        self.end_headers()
+        self.wfile.write(_LISTING)
+
+    def log_message(self, *_):
+        pass
+
+
+def _urlopen_get(base: str, route: str) -> None:
+    """One call the way `_send` made it before the pool."""
+    request = urllib.request.Request(f"{base}{route}", method="GET")  # noqa: S310 — loopback
+    request.add_header("Authorization", "Bearer bench-token")
+    with urllib.request.urlopen(request, timeout=api.TIMEOUT_SECONDS) as response:  # noqa: S310
+        response.read()
+
+
+def _measure(call, calls: int, threads: int) -> dict:
+    _StandIn.ports.clear()
+    latencies: list[float] = []
+
+    def one(index: int) -> None:
+        started = time.perf_counter()
+        call(f"/api/nodes?parent=node-{index % 200:04d}")
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one, range(calls)))
+    seconds = time.perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": round(calls / seconds),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "sockets": len(_StandIn.ports),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000, help="calls per measurement")
+    parser.add_argument("--threads", default="1,8",
+                        help="concurrent callers to measure at, comma-separated")
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    # The pool reads where to call and who is calling from `auth`; neither is
+    # what this measures, so both are fixed rather than signed in.
+    auth.api_url = lambda: base
+    auth.id_token = lambda *, refresh=False: "bench-token"
+    try:
+        runs = []
+        for threads in (int(count) for count in args.threads.split(",")):
+            api.disconnect()
+            api.forget()
+            runs.append({
+                "threads": threads,
+                "urlopen": _measure(lambda route: _urlopen_get(base, route), args.calls, threads),
+                "pooled": _measure(api.get, args.calls, threads),
+            })
+    finally:
+        api.disconnect()
+        server.shutdown()
+        server.server_close()
+    print(json.dumps({"calls": args.calls, "runs": runs}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""`studio catalog gc`: what a pass costs as the library grows, audit against queue.
+
+    cd studio/pipeline && python -m benchmarks.bench_gc --sizes 500,2000,8000 --churn 40
+
+For each library size in `--sizes`, seeds that many file rows — a `NODE#`/`META`
+item naming a `blobs/` key, and a small object behind it — and then `--churn`
+keys released since the last run, the way `services/catalog.py::_release`
+leaves them: no row, no count, a `GCQ#` item, and bytes behind half of them
+(the API deleted the other half straight after the release, as it nearly always
+does). Then the two passes, decision only — nothing is deleted, so each size is
+measured on the same state:
+
+* **`audit`** — `referenced_keys` and `survey`, the scan and the listing the
+  plain command does.
+* **`queue`** — `queued` and `triage`, what `--queue` does.
+
+Both must find the same orphans, and the script says so rather than trusting it.
+`calls` is every request the two clients sent, by operation, which is the
+column that carries to AWS: the audit's grows with the library, a `Scan` page
+per megabyte of table and a `ListObjectsV2` page per thousand objects, and the
+queue's grows with the churn — sixteen queries, then a `GetItem` per released
+key and a `HeadObject` per uncounted one. The timings are moto's and this
+machine's: comparable between the two columns of one run, and nothing more.
+"""
+
+import os
+
+# Credentials, region and the two names must exist before the adapters are
+# imported: they read their environment once, at import.
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ["STUDIO_S3_BUCKET"] = "studio-bench-media"
+os.environ["STUDIO_CATALOG_TABLE"] = "studio-bench-catalog"
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import time  # noqa: E402
+from collections import Counter  # noqa: E402
+
+import boto3  # noqa: E402
+from moto import mock_dynamodb, mock_s3  # noqa: E402
+
+from studio_pipeline.adapters import ddb as ddbc  # noqa: E402
+from studio_pipeline.adapters import s3 as s3c  # noqa: E402
+from studio_pipeline.maintenance import catalog_gc as cg  # noqa: E402
+
+_SEEDED_AT = "2026-10-17T09:00:00.000000+00:00"
+
+
+def _seed(ddb, s3, size: int, churn: int) -> None:
+    """`size` live files and `churn` released keys, half of them still in the bucket."""
+    items = []
+    for index in range(size):
+        blob_key = f"blobs/node-bench-{index:06d}"
+        items.append({"pk": f"NODE#node-bench-{index:06d}", "sk": "META",
+                      "blob_key": blob_key, "kind": "file"})
+        s3.put_object(Bucket=s3c.bucket(), Key=blob_key, Body=b"x")
+    for index in range(churn):
+        blob_key = f"blobs/node-gone-{index:06d}"
+        items.append({"pk": f"GCQ#{cg._shard(blob_key)}", "sk": blob_key,
+                      "queued_at": _SEEDED_AT})
+        if index % 2 == 0:
+            s3.put_object(Bucket=s3c.bucket(), Key=blob_key, Body=b"x")
+    for start in range(0, len(items), 25):
+        ddb.batch_write_item(RequestItems={ddbc.table(): [
+            {"PutRequest": {"Item": ddbc.to_item(item)}} for item in items[start:start + 25]]})
+
+
+def _measure(ddb, s3, decide) -> tuple[list[str], dict]:
+    calls: Counter[str] = Counter()
+
+    def count(model, **_kwargs):
+        calls[model.name] += 1
+
+    for client, service in ((ddb, "dynamodb"), (s3, "s3")):
+        client.meta.events.register(f"before-call.{service}", count)
+    started = time.perf_counter()
+    orphans = decide()
+    seconds = time.perf_counter() - started
+    for client, service in ((ddb, "dynamodb"), (s3, "s3")):
+        client.meta.events.unregister(f"before-call.{service}", count)
+    return orphans, {"calls": dict(sorted(calls.items())), "ms": round(seconds * 1000, 1)}
+
+
+def _run(size: int, churn: int) -> dict:
+    with mock_dynamodb(), mock_s3():
+        ddb = boto3.client("dynamodb", region_name="us-east-1")
+        s3 = boto3.client("s3", region_name="us-east-1")
+        ddb.create_table(
+            TableName=ddbc.table(), BillingMode="PAY_PER_REQUEST",
+            KeySchema=[{"AttributeName": "pk", "KeyType": "HASH"},
+                       {"AttributeName": "sk", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": name, "AttributeType": "S"}
+                                  for name in ("pk", "sk")])
+        s3.create_bucket(Bucket=s3c.bucket())
+        _seed(ddb, s3, size, churn)
+
+        audit_orphans, audit = _measure(
+            ddb, s3, lambda: cg.survey(s3, cg.referenced_keys(ddb))["orphans"])
+        queue_orphans, queue = _measure(
+            ddb, s3, lambda: [entry["blob_key"] for entry in
+                              cg.triage(s3, ddb, cg.queued(ddb))["queued"]])
+        assert audit_orphans == queue_orphans, (audit_orphans, queue_orphans)
+        return {"size": size, "orphans": len(queue_orphans), "audit": audit, "queue": queue}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="500,2000,8000",
+                        help="library sizes to seed, comma-separated")
+    parser.add_argument("--churn", type=int, default=40,
+                        help="keys released since the last run, at every size")
+    args = parser.parse_args()
+
+    report = {"churn": args.churn,
+              "runs": [_run(int(size), args.churn) for size in args.sizes.split(",")]}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
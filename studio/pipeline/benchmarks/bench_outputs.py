@@ -0,0 +1,206 @@
+"""A four-output video, from settled to recorded: one file after another against streamed.
+
+    cd studio/pipeline && python -m benchmarks.bench_outputs --outputs 4 --mib 16
+
+Starts one local stand-in playing both ends of the trip — Replicate's delivery
+host, serving `--outputs` files of `--mib` MiB, and the API with S3 behind it,
+taking presigned PUTs — and times the stage `submit.execute` runs once a
+prediction has settled, up to and including writing `result.json`, two ways:
+
+* **`one-by-one`** — what `execute` did before `submit.archive`: each output
+  downloaded whole into a temporary directory, then read back and uploaded,
+  one output after another.
+* **`streamed`** — `submit.archive`: every output at once, each read off the
+  delivery response straight into its PUT and hashed on the way.
+
+For each, the seconds to recorded and how many MiB were written to local disk
+on the way. The stand-in paces each connection — `--down-mibps` for a delivery,
+`--up-mibps` for a PUT — because on loopback unpaced both would be a memory
+copy, and what the stage spends its time on in the field is the two links: the
+one-by-one path pays both in full for every file, the streamed one pays the
+slower of the two, once. Keep `--mib` under the store's 64 MiB multipart
+threshold; the stand-in signs single PUTs only.
+"""
+
+import argparse
+import http.server
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+from studio_pipeline.adapters import api, auth
+from studio_pipeline.adapters import replicate as RA
+from studio_pipeline.domain import runs as R
+from studio_pipeline.engine import submit as SUB
+
+PROJECT = "bench"
+CHUNK = 256 * 1024
+
+
+class _StandIn(http.server.BaseHTTPRequestHandler):
+    """Delivery host, API and bucket, answering from dicts.
+
+    A node's id is a number, so it can sit in a route; a path the stand-in has
+    not been told about resolves as a folder, which is all `store.folder` asks.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # See `bench_api_transport`: Nagle and delayed ACK would add 40 ms a call.
+    disable_nagle_algorithm = True
+    outputs: dict[str, bytes] = {}
+    nodes: dict[str, str] = {}
+    stored: dict[str, bytes] = {}
+    down = up = 0.0
+    lock = threading.Lock()
+
+    def _answer(self, body: dict, status: int = 200) -> None:
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _paced(self, total: int, rate: float, move) -> None:
+        """`move(offset, length)` a chunk at a time, no faster than `rate` bytes a second."""
+        started = time.monotonic()
+        for offset in range(0, total, CHUNK):
+            move(offset, min(CHUNK, total - offset))
+            ahead = (offset + CHUNK) / rate - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    def do_GET(self):  # noqa: N802 — the handler's naming, not ours
+        route = urllib.parse.urlsplit(self.path)
+        if route.path.startswith("/delivery/"):
+            body = self.outputs[route.path.rsplit("/", 1)[1]]
+            self.send_response(200)
+            self.send_header("Content-Type", "video/mp4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self._paced(len(body), self.down,
+                        lambda at, length: self.wfile.write(body[at:at + length]))
+            return
+        if route.path == "/api/resolve":
+            path = dict(urllib.parse.parse_qsl(route.query))["path"].strip("/")
+            with self.lock:
+                node = self.nodes.get(path)
+            self._answer({"id": node or path.replace("/", "~"), "kind": "file" if node else "folder"})
+            return
+        self._answer({"error": route.path}, 404)
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        sent = json.loads(self.rfile.read(length) or b"{}")
+        route = self.path.split("?")[0]
+        if route == "/api/nodes":
+            with self.lock:
+                node = f"{len(self.nodes) + 1}"
+                self.nodes[f"{sent['parent'].replace('~', '/')}/{sent['name']}"] = node
+            self._answer({"id": node, "kind": sent["kind"]})
+        elif route.endswith("/upload-url"):
+            node = route.split("/")[3]
+            self._answer({"url": f"http://{self.headers['Host']}/bucket/{node}",
+                          "headers": {"Content-Length": str(sent["size"]),
+                                      "Content-Type": sent["content_type"]}})
+        elif route.endswith("/confirm-upload"):
+            node = route.split("/")[3]
+            self._answer({"id": node, "size": len(self.stored.get(node, b""))})
+        elif route == "/api/runs":
+            self._answer({"id": "run"})
+        else:
+            self._answer({"error": route}, 404)
+
+    def do_PUT(self):  # noqa: N802
+        node = self.path.rsplit("/", 1)[1]
+        chunks = []
+        self._paced(int(self.headers["Content-Length"]), self.up,
+                    lambda _, length: chunks.append(self.rfile.read(length)))
+        with self.lock:
+            self.stored[node] = b"".join(chunks)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_):
+        pass
+
+
+def _one_by_one(urls: list[str], run_id: str, staged: list[int]) -> None:
+    """The stage as `execute` ran it before `archive`."""
+    directory = tempfile.mkdtemp(prefix="bench-outputs-")
+    out_keys = []
+    try:
+        for i, url in enumerate(urls, start=1):
+            base = f"clip-{i}.mp4"
+            local = os.path.join(directory, base)
+            request = urllib.request.Request(url, headers={"User-Agent": RA.UA})
+            with urllib.request.urlopen(request) as response, open(local, "wb") as out:  # noqa: S310
+                while chunk := response.read(1 << 20):
+                    out.write(chunk)
+            staged[0] += os.path.getsize(local)
+            out_keys.append(R.upload_output(PROJECT, run_id, local, base))
+            os.remove(local)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    R.record_result(PROJECT, run_id, prediction_id="p-1", status="succeeded",
+                    outputs=out_keys, source_urls=urls)
+
+
+def _streamed(urls: list[str], run_id: str, staged: list[int]) -> None:  # noqa: ARG001
+    digests = SUB.archive(urls, PROJECT, run_id, "clip", "video")
+    R.record_result(PROJECT, run_id, prediction_id="p-1", status="succeeded",
+                    outputs=list(digests), source_urls=urls, sha256=digests)
+
+
+def _measure(stage, urls: list[str], run_id: str) -> dict:
+    _StandIn.stored = {}
+    staged = [0]
+    started = time.perf_counter()
+    stage(urls, run_id, staged)
+    seconds = time.perf_counter() - started
+    stored = sorted(len(body) for body in _StandIn.stored.values())
+    assert stored[-len(urls):] == sorted(len(body) for body in _StandIn.outputs.values())
+    return {"recorded_s": round(seconds, 3), "staged_mib": round(staged[0] / 2**20, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outputs", type=int, default=4, help="files the prediction returned")
+    parser.add_argument("--mib", type=float, default=16, help="size of each, MiB")
+    parser.add_argument("--down-mibps", type=float, default=20,
+                        help="delivery speed of one connection, MiB/s")
+    parser.add_argument("--up-mibps", type=float, default=10,
+                        help="upload speed of one connection, MiB/s")
+    args = parser.parse_args()
+
+    _StandIn.outputs = {f"out-{n}.mp4": os.urandom(int(args.mib * 2**20))
+                        for n in range(1, args.outputs + 1)}
+    _StandIn.down, _StandIn.up = args.down_mibps * 2**20, args.up_mibps * 2**20
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    # Where to call and who is calling are not what this measures.
+    auth.api_url = lambda: base
+    auth.id_token = lambda *, refresh=False: "bench-token"
+    urls = [f"{base}/delivery/{name}" for name in _StandIn.outputs]
+    results = {}
+    try:
+        for name, stage in (("one-by-one", _one_by_one), ("streamed", _streamed)):
+            results[name] = _measure(stage, urls, f"2026-10-17_12-00-00_{name}")
+    finally:
+        api.disconnect()
+        server.shutdown()
+        server.server_close()
+    print(json.dumps({"outputs": args.outputs, "mib_each": args.mib,
+                      "down_mibps": args.down_mibps, "up_mibps": args.up_mibps,
+                      "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
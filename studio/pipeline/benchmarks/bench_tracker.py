@@ -0,0 +1,207 @@
+"""Fifty predictions in flight: a sleeping thread each, against one tracker.
+
+    cd studio/pipeline && python -m benchmarks.bench_tracker --predictions 50 --interval 1
+
+Starts a local stand-in for Replicate whose predictions settle after a latency
+drawn between `--shortest` and `--longest` seconds, creates `--predictions` of
+them at once, and waits for all of them four ways:
+
+* **`sleep-poll`** — what `submit.execute` did before the tracker: a thread per
+  prediction, asking, then sleeping `--interval`, until it settles.
+* **`tracker`** — `tracker.Tracker` on a model it has no history for.
+* **`tracker+history`** — the same, with `runtimes.json` holding the model's
+  average runtime, as it will after the model's first few runs.
+* **`tracker+webhook`** — no history, with the stand-in calling the tracker's
+  webhook listener as each prediction settles.
+
+For each, how many times a prediction was asked about, how many threads were
+started to do the waiting (the stand-in's own left out), and how long after it
+settled it was seen to have — mean, 95th percentile and worst, in seconds. The
+interval defaults to 1 s rather than the 5 s an image uses, with the settles and
+the tracker's `FLOOR` shrunk to match, so a run takes seconds rather than
+minutes; the requests are the same and the latencies scale by five.
+"""
+
+import argparse
+import http.server
+import json
+import pathlib
+import random
+import statistics
+import tempfile
+import threading
+import time
+import urllib.request
+
+from studio_pipeline.adapters import replicate as RA
+from studio_pipeline.adapters import store
+from studio_pipeline.adapters import tracker as TRACK
+
+MODEL = "bench/model"
+
+
+class _StandIn(http.server.BaseHTTPRequestHandler):
+    """Predictions that settle at a set time, and say so to a webhook if given one."""
+
+    protocol_version = "HTTP/1.1"
+    # See `bench_api_transport`: Nagle and delayed ACK would add 40 ms a call.
+    disable_nagle_algorithm = True
+    latencies: list[float] = []
+    due: dict[str, float] = {}
+    asked = 0
+    lock = threading.Lock()
+
+    def _answer(self, body: dict, status: int = 200) -> None:
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_POST(self):  # noqa: N802 — the handler's naming, not ours
+        sent = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.lock:
+            pid = f"p-{len(self.due)}"
+            latency = self.latencies[len(self.due)]
+            self.due[pid] = time.monotonic() + latency
+        if sent.get("webhook"):
+            timer = threading.Timer(latency, _call_back, (sent["webhook"], pid))
+            timer.name = "stand-in-callback"
+            timer.start()
+        self._answer({"id": pid, "status": "starting"}, 201)
+
+    def do_GET(self):  # noqa: N802
+        pid = self.path.rsplit("/", 1)[1]
+        with self.lock:
+            type(self).asked += 1
+        settled = time.monotonic() >= self.due[pid]
+        self._answer({"id": pid, "status": "succeeded" if settled else "processing",
+                      "output": ["out.png"] if settled else None})
+
+    def log_message(self, *_):
+        pass
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    # Fifty threads connect at once in `sleep-poll`; the default backlog of
+    # five resets the rest, and a thread that dies asks nothing more.
+    request_queue_size = 256
+
+
+def _call_back(url: str, pid: str) -> None:
+    body = json.dumps({"id": pid, "status": "succeeded"}).encode()
+    request = urllib.request.Request(url, data=body, method="POST")
+    urllib.request.urlopen(request).close()
+
+
+def _ours(idle: set[threading.Thread]) -> int:
+    """Threads started since `idle`, less the stand-in's handlers and callbacks."""
+    return sum(1 for thread in threading.enumerate()
+               if thread not in idle and "stand-in" not in thread.name
+               and "process_request" not in thread.name)
+
+
+def _sleep_poll(pid: str, interval: float) -> dict:
+    """The loop `submit.execute` ran before the tracker, one per prediction."""
+    url = f"{RA.API_ROOT}/predictions/{pid}"
+    current = RA.api("GET", url, "bench-token")
+    while current.get("status") not in TRACK.SETTLED:
+        time.sleep(interval)
+        current = RA.api("GET", url, "bench-token")
+    return current
+
+
+def _measure(mode: str, count: int, interval: float) -> dict:
+    _StandIn.due, _StandIn.asked = {}, 0
+    seen: dict[str, float] = {}
+    idle = set(threading.enumerate())
+    waiting = 0
+    tracker = None
+    if mode.startswith("tracker"):
+        tracker = TRACK.Tracker("bench-token", listen="127.0.0.1:0",
+                                webhook="pending" if mode == "tracker+webhook" else None)
+        if tracker.webhook:
+            # Nothing to forward from here: the stand-in calls the listener itself.
+            tracker.webhook = f"http://127.0.0.1:{tracker._listener.server_port}/"
+    try:
+        if tracker is None:
+            def one(_: int) -> None:
+                # Created and then waited on by the same thread, as `execute` did.
+                pid = RA.create_prediction(MODEL, {}, "bench-token")["id"]
+                _sleep_poll(pid, interval)
+                seen[pid] = time.monotonic()
+
+            threads = [threading.Thread(target=one, args=(i,)) for i in range(count)]
+            for thread in threads:
+                thread.start()
+            waiting = _ours(idle)
+            for thread in threads:
+                thread.join()
+        else:
+            watches = []
+            for _ in range(count):
+                pid = RA.create_prediction(MODEL, {}, "bench-token", webhook=tracker.webhook)["id"]
+                watch = tracker.track(pid, model=MODEL, interval=interval, timeout=600)
+                watch.future.add_done_callback(
+                    lambda _f, pid=pid: seen.setdefault(pid, time.monotonic()))
+                watches.append(watch)
+            waiting = _ours(idle)
+            for watch in watches:
+                watch.future.result()
+    finally:
+        if tracker is not None:
+            tracker.close()
+    ids = list(seen)
+    late = sorted(seen[pid] - _StandIn.due[pid] for pid in ids)
+    return {
+        "requests": _StandIn.asked,
+        "threads": waiting,
+        "seen_after_s": {
+            "mean": round(statistics.mean(late), 3),
+            "p95": round(late[int(0.95 * (len(late) - 1))], 3),
+            "worst": round(late[-1], 3),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--predictions", type=int, default=50, help="predictions in flight")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="the caller's poll interval, in seconds")
+    parser.add_argument("--shortest", type=float, default=2.0, help="quickest settle, seconds")
+    parser.add_argument("--longest", type=float, default=6.0, help="slowest settle, seconds")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # The floor stands to the interval as it does to an image's five seconds,
+    # so a shorter interval here is the same schedule, faster.
+    TRACK.FLOOR *= args.interval / 5
+    draw = random.Random(args.seed)
+    _StandIn.latencies = [draw.uniform(args.shortest, args.longest)
+                          for _ in range(args.predictions)]
+    server = _Server(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    RA.API_ROOT = f"http://127.0.0.1:{server.server_port}"
+    # History is read from the store's cache directory; keep the bench's own.
+    store.CACHE_DIR = pathlib.Path(tempfile.mkdtemp(prefix="bench-tracker-"))
+    results = {}
+    try:
+        for mode in ("sleep-poll", "tracker", "tracker+history", "tracker+webhook"):
+            history = store.CACHE_DIR / TRACK.RUNTIMES_FILE
+            if mode == "tracker+history":
+                history.write_text(json.dumps({MODEL: statistics.mean(_StandIn.latencies)}))
+            else:
+                history.unlink(missing_ok=True)
+            results[mode] = _measure(mode, args.predictions, args.interval)
+    finally:
+        server.shutdown()
+        server.server_close()
+    print(json.dumps({"predictions": args.predictions, "interval_s": args.interval,
+                      "settle_s": [args.shortest, args.longest], "results": results},
+                     indent=2))
+
+
+if __name__ == "__main__":
+    main()
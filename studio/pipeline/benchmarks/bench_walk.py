@@ -0,0 +1,185 @@
+"""`store.walk_files`: a listing per folder against one `descendants` read a page.
+
+    cd studio/pipeline && python -m benchmarks.bench_walk --runs 400 --files 25 --latency-ms 0,20
+
+Starts a local stand-in for the API holding a synthetic project — `--runs` run
+folders, each with `request.json`, `result.json` and an `output/` folder, and
+`--files` files in all — and walks it two ways at each `--latency-ms`, the
+delay the stand-in adds to every answer:
+
+* **`per-folder`** — what `walk_files` did before the route: `GET /api/nodes`
+  on every folder, one after another, recursing into each.
+* **`descendants`** — `walk_files` as it is now.
+
+For each, the wall-clock seconds of the walk, how many requests it made, and
+how many files it found, which must agree between the two. The stand-in is the
+standard library's, answering from a dict, so what is measured is the client's
+round trips and not the catalog's reads — `bench_catalog` in the backend is
+where those are counted.
+
+**Loopback with no added latency understates the difference**, the way
+`bench_api_transport` says: a request to the real API is a round trip across
+the internet, and it is the per-folder walk that pays it once per folder. The
+`--latency-ms` column is there to put one back.
+"""
+
+import argparse
+import http.server
+import json
+import threading
+import time
+import urllib.parse
+
+from studio_pipeline.adapters import api, auth, store
+
+PAGE = 1000
+
+
+class _Tree:
+    """A project as node rows with parents, and the three routes a walk reads."""
+
+    def __init__(self, runs: int, files: int) -> None:
+        self.nodes: dict[str, dict] = {}
+        self.children: dict[str, list[str]] = {}
+        self.root = self._add(None, "", "folder")
+        project = self._add(self._add(self.root, "projects", "folder"), "bench", "folder")
+        folder = self._add(project, "runs", "folder")
+        for run in range(runs):
+            run_folder = self._add(folder, f"2026-10-17_12-00-{run:04d}_bench", "folder")
+            self._add(run_folder, "request.json", "file")
+            self._add(run_folder, "result.json", "file")
+            output = self._add(run_folder, "output", "folder")
+            for index in range(max(files - 2, 0)):
+                self._add(output, f"bench-{index}.png", "file")
+
+    def _add(self, parent: str | None, name: str, kind: str) -> str:
+        node_id = f"node-{len(self.nodes):06d}"
+        self.nodes[node_id] = {"id": node_id, "parent_id": parent, "name": name, "kind": kind,
+                               "size": 1024 if kind == "file" else None}
+        self.children.setdefault(node_id, [])
+        if parent is not None:
+            self.children[parent].append(node_id)
+        return node_id
+
+    def view(self, node_id: str) -> dict:
+        return {k: v for k, v in self.nodes[node_id].items() if v is not None}
+
+    def resolve(self, path: str) -> dict | None:
+        node_id = self.root
+        for name in filter(None, path.split("/")):
+            node_id = next((c for c in self.children[node_id]
+                            if self.nodes[c]["name"] == name), None)
+            if node_id is None:
+                return None
+        return self.view(node_id)
+
+    def listing(self, parent: str) -> list[dict]:
+        return sorted((self.view(c) for c in self.children[parent]), key=lambda n: n["name"])
+
+    def descendants(self, node_id: str, offset: int) -> dict:
+        rows, level = [], [(node_id, "")]
+        while level:
+            below = []
+            for parent, prefix in level:
+                for child in self.children[parent]:
+                    path = f"{prefix}{self.nodes[child]['name']}"
+                    rows.append({**self.view(child), "path": path})
+                    below.append((child, f"{path}/"))
+            level = below
+        end = offset + PAGE
+        return {"nodes": rows[offset:end], "next_cursor": str(end) if end < len(rows) else None}
+
+
+class _StandIn(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # See `bench_api_transport`: Nagle and delayed ACK would add 40 ms a call.
+    disable_nagle_algorithm = True
+    tree: _Tree
+    latency = 0.0
+    requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self):  # noqa: N802 — the handler's naming, not ours
+        with self.lock:
+            type(self).requests += 1
+        time.sleep(self.latency)
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query, keep_blank_values=True))
+        if url.path == "/api/resolve":
+            answer = self.tree.resolve(query["path"])
+        elif url.path == "/api/nodes":
+            answer = self.tree.listing(query["parent"])
+        elif url.path.endswith("/descendants"):
+            answer = self.tree.descendants(url.path.split("/")[3], int(query.get("cursor") or 0))
+        else:
+            answer = None
+        body = json.dumps(answer if answer is not None else {"error": "not found"}).encode()
+        self.send_response(200 if answer is not None else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+def _per_folder(path: str) -> list[str]:
+    """The walk as `walk_files` made it before `descendants`."""
+    found: list[str] = []
+    for entry in store.children_or_empty(path):
+        child = f"{path}/{entry['name']}"
+        if entry.get("kind") == "folder":
+            found += _per_folder(child)
+        else:
+            found.append(child)
+    return found
+
+
+def _measure(walk) -> dict:
+    api.forget()
+    store.forget()
+    _StandIn.requests = 0
+    started = time.perf_counter()
+    found = walk("projects/bench")
+    return {
+        "seconds": round(time.perf_counter() - started, 3),
+        "requests": _StandIn.requests,
+        "files": len(found),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=400, help="run folders in the project")
+    parser.add_argument("--files", type=int, default=25, help="files in each run folder")
+    parser.add_argument("--latency-ms", default="0,20",
+                        help="delay added to every answer, comma-separated")
+    args = parser.parse_args()
+
+    _StandIn.tree = _Tree(args.runs, args.files)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    # Where to call and who is calling are not what this measures.
+    auth.api_url = lambda: base
+    auth.id_token = lambda *, refresh=False: "bench-token"
+    try:
+        runs = []
+        for latency in (int(ms) for ms in args.latency_ms.split(",")):
+            _StandIn.latency = latency / 1000
+            runs.append({
+                "latency_ms": latency,
+                "per-folder": _measure(_per_folder),
+                "descendants": _measure(store.walk_files),
+            })
+    finally:
+        api.disconnect()
+        server.shutdown()
+        server.server_close()
+    print(json.dumps({"runs": args.runs, "files": args.runs * args.files, "results": runs},
+                     indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,16 +15,35 @@ exactly this and is the reference.
 disagrees with Cognito's would either refresh on every call or never. One retry,
 then the error says what to do.
 
-`urllib` rather than `requests`: the pipeline's dependency set is small on
-purpose, and this needs nothing `urllib` lacks.
+**A listing already held is revalidated, not fetched again.** The API tags its
+folder listings with an `ETag` and answers `If-None-Match` with a bodiless 304
+when nothing in the folder changed. A `GET` whose answer carried a tag is kept
+here, keyed by its URL and library, and the next `GET` of it sends the tag back;
+a 304 is then answered from what is kept. A walk that lists the same folders
+again — `contact_sheet` after a `rewrite`, a `shoot` checking its outputs — costs
+the API one record read per folder instead of every child and a signature for
+each. Routes that send no tag are never kept, so nothing else changes.
+
+**One connection is reused, not one opened per call.** `urlopen` sent
+`Connection: close` and opened a fresh TCP connection — and, against the real
+API, a fresh TLS handshake — for every request, so a `walk_files` over a few
+hundred folders paid a few hundred handshakes for a few hundred small answers.
+`_pool` keeps idle `http.client` connections per host and hands one to each
+caller, so a walk pays one, and callers on several threads each hold their own
+for as long as one exchange takes.
+
+The standard library rather than `requests`: the pipeline's dependency set is
+small on purpose, and this needs nothing `http.client` lacks.
 """
 
 from __future__ import annotations
 
+import http.client
 import json
-import urllib.error
+import threading
 import urllib.parse
 import urllib.request
+from collections.abc import Callable
 
 from studio_pipeline.adapters import auth
 
@@ -35,6 +54,106 @@ LIBRARY_HEADER = "X-Studio-Library"
 
 TIMEOUT_SECONDS = 30
 
+# How many tagged answers `_held` keeps, least recently used out first. A
+# listing is a few kilobytes, and a walk of a whole library revisits far fewer
+# folders than this.
+HELD_RESPONSES = 256
+
+# (url, library) -> (etag, body). Per process, and deliberately not on disk: a
+# tag is only worth sending while the answer it names is still in hand, and the
+# CLI is one signed-in user for its whole life.
+_held: dict[tuple[str, str | None], tuple[str, bytes]] = {}
+_held_lock = threading.Lock()
+
+# See `on_write`.
+_listeners: list[Callable[[str, str], None]] = []
+
+
+# Idle connections kept per host. More callers than this at once is fine — the
+# extra connections are simply closed when they are handed back rather than kept.
+POOL_SIZE = 8
+
+
+class _Pool:
+    """Idle keep-alive connections, per scheme and host, shared across threads.
+
+    A connection belongs to one caller from `take` to `give`, so the `http.client`
+    objects themselves are never shared; only the idle list is, under the lock.
+    Most recently used first, because that is the one least likely to have been
+    timed out by the far end.
+    """
+
+    def __init__(self) -> None:
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, scheme: str, host: str) -> tuple[http.client.HTTPConnection, bool]:
+        """A connection to `host`, and whether it was idle here rather than new."""
+        with self._lock:
+            idle = self._idle.get((scheme, host))
+            if idle:
+                return idle.pop(), True
+        return _connect(scheme, host), False
+
+    def give(self, scheme: str, host: str, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host), [])
+            if len(idle) < POOL_SIZE:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+_pool = _Pool()
+
+
+def _connect(scheme: str, host: str) -> http.client.HTTPConnection:
+    """A new connection, through the environment's proxy when it names one.
+
+    `urlopen` honoured `HTTPS_PROXY` without being asked, and a CLI that stopped
+    doing so would fail only on the networks that need it. An `https` call is
+    tunnelled with `CONNECT`; a plain `http` one is sent to the proxy whole, and
+    `_target` writes its request line in absolute form to match.
+    """
+    kind = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    proxy = _proxy(scheme, host)
+    if proxy is None:
+        return kind(host, timeout=TIMEOUT_SECONDS)
+    if scheme == "https":
+        connection = kind(proxy, timeout=TIMEOUT_SECONDS)
+        connection.set_tunnel(host)
+        return connection
+    return http.client.HTTPConnection(proxy, timeout=TIMEOUT_SECONDS)
+
+
+def _proxy(scheme: str, host: str) -> str | None:
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host.rsplit(":", 1)[0]):
+        return None
+    return urllib.parse.urlsplit(proxy).netloc or proxy
+
+
+def _target(scheme: str, host: str, parts: urllib.parse.SplitResult) -> str:
+    """The request line's target: the path, or the whole URL for a plain-HTTP proxy."""
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    if scheme == "http" and _proxy(scheme, host) is not None:
+        return f"{scheme}://{host}{path}"
+    return path
+
+
+def disconnect() -> None:
+    """Close every idle connection. The next call opens a new one."""
+    _pool.close()
+
 
 class ApiError(RuntimeError):
     """The API refused or failed. `status` is the HTTP code."""
@@ -94,24 +213,87 @@ def _raise(status: int, body: bytes) -> None:
     raise ApiError(message, status)
 
 
-def _send(method: str, url: str, token: str, payload: dict | None) -> tuple[int, bytes]:
+def _recall(key: tuple[str, str | None]) -> tuple[str, bytes] | None:
+    """The tagged answer kept for this GET, marked as just used."""
+    with _held_lock:
+        held = _held.pop(key, None)
+        if held is not None:
+            _held[key] = held
+        return held
+
+
+def _keep(key: tuple[str, str | None], etag: str, body: bytes) -> None:
+    with _held_lock:
+        _held.pop(key, None)
+        _held[key] = (etag, body)
+        while len(_held) > HELD_RESPONSES:
+            del _held[next(iter(_held))]
+
+
+def on_write(listener: Callable[[str, str], None]) -> None:
+    """Call `listener(method, route)` after every request that may have changed something.
+
+    Every method but `GET`, whatever the route, and before the answer is
+    returned or raised. How `store` keeps its path cache true when a caller
+    renames, moves or deletes a node through this module directly — the caller
+    does not have to know a cache exists to keep it honest.
+    """
+    _listeners.append(listener)
+
+
+def forget() -> None:
+    """Drop every kept answer, so the next GET of each is sent unconditionally."""
+    with _held_lock:
+        _held.clear()
+
+
+def _send(
+    method: str, url: str, token: str, payload: dict | None, etag: str | None = None
+) -> tuple[int, bytes, str | None]:
+    """One exchange: the status, the body, and the `ETag` if the answer had one.
+
+    Every status comes back as a status, 4xx and 304 included — `http.client`
+    raises for none of them, so the body the API sent with an error is always
+    read. The body is read in full before the connection goes back to the pool;
+    a connection handed back with an answer half-read would give the next
+    caller the rest of this one.
+
+    **A reused connection that fails is dropped and the call tried again**, until
+    it is on a new one. An idle connection the far end has since closed fails on
+    first use, before any request reached the API, and that is a fact about the
+    pool rather than the call. A new connection that fails is the call failing,
+    and says so.
+    """
     data = json.dumps(payload).encode() if payload is not None else None
-    request = urllib.request.Request(url, data=data, method=method)  # noqa: S310 - https, our own API
-    request.add_header("Authorization", f"Bearer {token}")
+    headers = {"Authorization": f"Bearer {token}"}
     if data is not None:
-        request.add_header("Content-Type", "application/json")
+        headers["Content-Type"] = "application/json"
     library = _library()
     if library:
-        request.add_header(LIBRARY_HEADER, library)
-    try:
-        with urllib.request.urlopen(request, timeout=TIMEOUT_SECONDS) as response:  # noqa: S310
-            return response.status, response.read()
-    except urllib.error.HTTPError as error:
-        # Read the body here: an HTTPError *is* the response, and letting it
-        # close unread throws away the only message the API sent.
-        return error.code, error.read()
-    except urllib.error.URLError as error:
-        raise ApiError(f"Could not reach {auth.api_url()}: {error.reason}", 0) from error
+        headers[LIBRARY_HEADER] = library
+    if etag:
+        headers["If-None-Match"] = etag
+
+    parts = urllib.parse.urlsplit(url)
+    scheme, host = parts.scheme, parts.netloc
+    target = _target(scheme, host, parts)
+    while True:
+        connection, reused = _pool.take(scheme, host)
+        try:
+            connection.request(method, target, body=data, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, OSError) as error:
+            connection.close()
+            if reused:
+                continue
+            reason = getattr(error, "reason", None) or error
+            raise ApiError(f"Could not reach {auth.api_url()}: {reason}", 0) from error
+        if response.will_close:
+            connection.close()
+        else:
+            _pool.give(scheme, host, connection)
+        return response.status, body, response.getheader("ETag")
 
 
 def request(method: str, route: str, payload: dict | None = None, **params) -> dict | list:
@@ -119,19 +301,31 @@ def request(method: str, route: str, payload: dict | None = None, **params) -> d
 
     Returns the decoded body. A 204 or an empty body is `{}` rather than `None`,
     so a caller never has to distinguish "no content" from "failed" — the
-    exceptions carry that.
+    exceptions carry that. A `GET` answered 304 returns the body kept from the
+    answer whose tag it sent, so a caller cannot tell the two apart either.
     """
     url = f"{auth.api_url()}{route}"
     if params:
         url = f"{url}?{urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})}"
 
-    status, body = _send(method, url, auth.id_token(), payload)
+    key = (url, _library())
+    held = _recall(key) if method == "GET" else None
+    etag = held[0] if held else None
+    status, body, tag = _send(method, url, auth.id_token(), payload, etag)
     if status == 401:
         # One retry, with a token refreshed against Cognito rather than read
         # from the file. If it 401s again the session is genuinely dead, and
         # `_raise` says what to do about it.
-        status, body = _send(method, url, auth.id_token(refresh=True), payload)
-
+        status, body, tag = _send(method, url, auth.id_token(refresh=True), payload, etag)
+
+    if status == 304 and held:
+        status, body = 200, held[1]
+    elif method == "GET" and status == 200 and tag:
+        _keep(key, tag, body)
+    # A 4xx changed nothing; a 5xx may have changed part of it, so it is told.
+    if method != "GET" and not 400 <= status < 500:
+        for listener in list(_listeners):
+            listener(method, route)
     if status >= 400:
         _raise(status, body)
     if not body:
@@ -0,0 +1,232 @@
+"""The blob cache: bytes this machine has already fetched, kept on disk by content.
+
+`store.read` and everything built on it — `store.download`, every run document,
+every contact sheet, `curate`'s hashing, a scene's shots — fetched a file's
+bytes through a freshly signed URL every time it was asked, so a reference image
+that four commands look at in an afternoon crossed the network four times. This
+keeps what was fetched under the user cache directory, beside the path cache,
+and answers from it when the same version of the same file is asked for again.
+
+## Named by version, stored by content
+
+An entry's key is the file's node id and its version, and the entry points at a
+blob named by the sha256 of its bytes. Two keys, one blob: a file copied, or
+rewritten with what it already held, costs its bytes once. The version is the
+node's `updated_at` — the catalog's stand-in for an ETag, which it deliberately
+does not expose — and how `store` decides which version it may trust without
+asking is written down there, beside the path cache it comes from. This module
+never decides whether bytes are current; it answers for the key it is given.
+
+Every read is checked against its digest, so a blob cut short by a full disk, or
+edited by hand, is a miss and fetched again rather than handed to a model.
+
+## Bounded, least recently used first
+
+`STUDIO_BLOB_CACHE_MB` is the most it holds, 2 GiB unless set, and `0` turns it
+off. Past that, blobs are evicted in the order they were last read until it fits
+— `studio cache prune` does the same on demand, and `studio cache stats` says
+where it stands. The index of keys is read on first use and written at exit,
+merged with whatever another command wrote in between; a blob is written beside
+its final name and renamed into place, so a reader never sees half of one.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# The size the cache is kept under unless `STUDIO_BLOB_CACHE_MB` says otherwise.
+DEFAULT_MB = 2048
+INDEX_FILE = "index.json"
+# A partial write older than this is a crashed command's, not one in progress.
+STALE_PARTIAL_SECONDS = 3600
+
+
+def limit_bytes() -> int:
+    """`STUDIO_BLOB_CACHE_MB` in bytes; 0 means the cache is off."""
+    return int(float(os.environ.get("STUDIO_BLOB_CACHE_MB", DEFAULT_MB)) * 1024 * 1024)
+
+
+class Blobs:
+    """One cache directory: `index.json`, and blobs under `<sha[:2]>/<sha>`."""
+
+    def __init__(self, root: Path, limit: int) -> None:
+        self.root = root
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] | None = None
+        self._changed = False
+
+    def _blob(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _index(self) -> dict[str, dict]:
+        """The entries, read off disk the first time. Call with the lock held."""
+        if self._entries is None:
+            self._entries = self._read_index()
+        return self._entries
+
+    def _read_index(self) -> dict[str, dict]:
+        try:
+            saved = json.loads((self.root / INDEX_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+        return saved if isinstance(saved, dict) else {}
+
+    def get(self, key: str) -> bytes | None:
+        """The bytes filed under `key`, or None — for a key never seen or a blob gone bad."""
+        with self._lock:
+            entry = self._index().get(key)
+        if entry is None:
+            return None
+        try:
+            body = self._blob(entry["sha256"]).read_bytes()
+        except OSError:
+            body = None
+        if body is None or hashlib.sha256(body).hexdigest() != entry["sha256"]:
+            with self._lock:
+                self._index().pop(key, None)
+                self._changed = True
+            return None
+        with self._lock:
+            entry["used"] = time.time()
+            self._changed = True
+        return body
+
+    def put(self, key: str, body: bytes) -> str:
+        """File `body` under `key`, and return its sha256. Never raises for a full disk."""
+        digest = hashlib.sha256(body).hexdigest()
+        target = self._blob(digest)
+        try:
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                partial = target.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+                partial.write_bytes(body)
+                os.replace(partial, target)
+        except OSError:
+            return digest
+        with self._lock:
+            self._index()[key] = {"sha256": digest, "size": len(body), "used": time.time()}
+            self._changed = True
+            over = sum(self._sizes().values()) > self.limit
+        if over:
+            self.prune(self.limit)
+        return digest
+
+    def _sizes(self) -> dict[str, int]:
+        """Each blob the index names, once, with its size. Call with the lock held."""
+        return {entry["sha256"]: entry["size"] for entry in self._index().values()}
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._merge()
+            sizes = self._sizes()
+            entries = len(self._index())
+        return {
+            "dir": str(self.root),
+            "entries": entries,
+            "blobs": len(sizes),
+            "bytes": sum(sizes.values()),
+            "limit_bytes": self.limit,
+        }
+
+    def prune(self, keep_bytes: int) -> dict:
+        """Evict the least recently read blobs until what is left fits `keep_bytes`.
+
+        Also sweeps what the index does not name — a blob whose entry another
+        command dropped, a partial write a crash left behind — so the directory
+        holds nothing the numbers do not count.
+        """
+        with self._lock:
+            self._merge()
+            entries = self._index()
+            last_read: dict[str, float] = {}
+            for entry in entries.values():
+                last_read[entry["sha256"]] = max(last_read.get(entry["sha256"], 0), entry["used"])
+            sizes = self._sizes()
+            total = sum(sizes.values())
+            evicted = set()
+            for digest in sorted(last_read, key=last_read.get):
+                if total <= keep_bytes:
+                    break
+                evicted.add(digest)
+                total -= sizes[digest]
+            for key in [key for key, entry in entries.items() if entry["sha256"] in evicted]:
+                del entries[key]
+            kept = set(sizes) - evicted
+            self._changed = True
+            self._write_index()
+        freed = 0
+        for path in self.root.glob("??/*"):
+            if path.name in kept:
+                continue
+            try:
+                status = path.stat()
+                if path.name.endswith(".tmp") and time.time() - status.st_mtime < STALE_PARTIAL_SECONDS:
+                    continue  # another command's write, still on its way
+                path.unlink()
+            except OSError:
+                continue  # gone already, or another command's to remove
+            freed += status.st_size
+        return {"evicted": len(evicted), "freed_bytes": freed, "bytes": total}
+
+    def _merge(self) -> None:
+        """Fold in what another command saved since this one read the index.
+
+        The later read wins for a key both hold. Call with the lock held.
+        """
+        entries = self._index()
+        for key, entry in self._read_index().items():
+            held = entries.get(key)
+            if held is None or (held["sha256"] == entry["sha256"] and held["used"] < entry["used"]):
+                entries[key] = entry
+
+    def _write_index(self) -> None:
+        """Write the index beside itself and rename it into place. Call with the lock held."""
+        if not self._changed:
+            return
+        target = self.root / INDEX_FILE
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            partial = target.with_name(f".{INDEX_FILE}.{os.getpid()}.tmp")
+            partial.write_text(json.dumps(self._index()))
+            os.replace(partial, target)
+        except OSError:
+            return
+        self._changed = False
+
+    def save(self) -> None:
+        """Write the index back, merged with what is on disk now. Never raises."""
+        with self._lock:
+            if self._entries is None or not self._changed:
+                return
+            self._merge()
+            self._write_index()
+
+
+_open: dict[Path, Blobs] = {}
+_open_lock = threading.Lock()
+
+
+def at(root: Path) -> Blobs | None:
+    """The cache in `root`, one per directory per process — or None when it is off."""
+    limit = limit_bytes()
+    if limit <= 0:
+        return None
+    with _open_lock:
+        cache = _open.get(root)
+        if cache is None:
+            cache = _open[root] = Blobs(root, limit)
+        cache.limit = limit
+        return cache
+
+
+@atexit.register
+def _save_all() -> None:
+    for cache in list(_open.values()):
+        cache.save()
@@ -144,6 +144,21 @@ def scan(ddb, **kwargs):
             yield from_item(item)
 
 
+def query(ddb, pk: str, **kwargs):
+    """Every item in one partition of the table, paginated.
+
+    The base table's own key, never an index: `scan`'s reason holds for the
+    indexes, and a partition the writer put there on purpose — the GC queue —
+    is read exactly as it was written.
+    """
+    paginator = ddb.get_paginator("query")
+    for page in paginator.paginate(
+            TableName=table(), KeyConditionExpression="pk = :pk",
+            ExpressionAttributeValues=to_item({":pk": pk}), ConsistentRead=True, **kwargs):
+        for item in page.get("Items", []):
+            yield from_item(item)
+
+
 def table_exists(ddb) -> bool:
     try:
         ddb.describe_table(TableName=table())
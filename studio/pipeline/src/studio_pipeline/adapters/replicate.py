@@ -12,7 +12,6 @@ way:
 """
 
 import json
-import time
 import urllib.error
 import urllib.request
 
@@ -60,43 +59,34 @@ def api_text(url: str, token: str) -> str:
         raise ReplicateError(f"GET {url} -> {e.code}: {e.read().decode()[:300]}")
 
 
-def download(url: str, local: str) -> str:
-    """Fetch an output file. Uses an explicit UA — see the note above."""
+def open_output(url: str):
+    """An output file, open for reading. Uses an explicit UA — see the note above.
+
+    A response rather than a path on disk: `submit` reads it straight into the
+    store, so an output is never written out only to be read back. The caller
+    closes it — it is a context manager — and `Content-Length`, which a presigned
+    PUT needs before its first byte, is in `.headers` when the delivery sent one.
+    """
     req = urllib.request.Request(url)
     req.add_header("User-Agent", UA)
-    with urllib.request.urlopen(req) as r, open(local, "wb") as f:
-        while chunk := r.read(1 << 20):
-            f.write(chunk)
-    return local
+    try:
+        return urllib.request.urlopen(req)
+    except urllib.error.HTTPError as e:
+        raise ReplicateError(f"GET {url.split('?')[0]} -> {e.code}")
+
 
+def create_prediction(model: str, payload: dict, token: str, webhook: str | None = None) -> dict:
+    """Start a prediction on `owner/name`. Bills. No `Prefer: wait` — see above.
 
-def create_prediction(model: str, payload: dict, token: str) -> dict:
-    """Start a prediction on `owner/name`. Bills. No `Prefer: wait` — see above."""
-    return api("POST", f"{API_ROOT}/models/{model}/predictions", token, {"input": payload})
+    `webhook` asks Replicate to POST the prediction there once it completes —
+    see `tracker` for what that is, and is not, trusted to mean.
+    """
+    body: dict = {"input": payload}
+    if webhook:
+        body.update(webhook=webhook, webhook_events_filter=["completed"])
+    return api("POST", f"{API_ROOT}/models/{model}/predictions", token, body)
 
 
 def predictions_endpoint(model: str) -> str:
     """The URL a payload will be POSTed to — shown in the approval render."""
     return f"{API_ROOT}/models/{model}/predictions"
-
-
-def poll(prediction_id: str, token: str, interval: int, timeout: int,
-         on_status=None) -> dict:
-    """Poll until the prediction settles. Raises TimeoutError past `timeout`.
-
-    Returns the final prediction body; the caller decides what a non-succeeded
-    status means, since it still has a run record to close out.
-    """
-    url = f"{API_ROOT}/predictions/{prediction_id}"
-    deadline = time.time() + timeout
-    cur = api("GET", url, token)
-    while cur.get("status") not in ("succeeded", "failed", "canceled"):
-        if time.time() > deadline:
-            raise TimeoutError(f"gave up after {timeout}s")
-        time.sleep(interval)
-        cur = api("GET", url, token)
-        if on_status:
-            on_status(cur.get("status"))
-    return cur
-
-
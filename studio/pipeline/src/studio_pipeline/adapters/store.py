@@ -28,7 +28,8 @@ time a node is renamed without its blob moving.
 ## Bytes do not go through the API
 
 `GET /api/nodes/<id>/download-url` and `POST /api/nodes/<id>/upload-url` return
-presigned URLs, and the bytes travel directly to S3. That is what keeps a video
+presigned URLs, and the bytes travel directly to S3 — as do the parts of a large
+`upload`, signed a part at a time by `/api/nodes/<id>/multipart/urls`. That is what keeps a video
 out of the Lambda's 6 MB request limit, and it is also **hard rule #3 intact**:
 anything handed to a model is an S3 object reached by a short-lived presigned
 URL, never an upload from disk.
@@ -68,20 +69,221 @@ looks like.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import json
+import math
+import os
 import re
+import threading
+import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from studio_pipeline.adapters import api
+from studio_pipeline.adapters import api, auth, blobs
 
 TIMEOUT_SECONDS = 300
 
+# Past this a file goes up in parts (`_upload_parts`) rather than one PUT. Low
+# enough that a rendered scene — the file a flaky connection actually loses —
+# is resumable; high enough that a still image is one request, as it always was.
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+# Parts in flight at once, and tries per part before the upload gives up. Each
+# worker holds one part in memory, so the first bounds memory as well as sockets.
+UPLOAD_WORKERS = 4
+PART_ATTEMPTS = 3
+
+
+# Where `_Paths` persists between commands, beside nothing else: the config
+# directory holds credentials, and a cache is safe to delete where they are not.
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "andreas-services"
+    / "studio"
+)
+# How many paths a persisted cache keeps, most recently cached last.
+PERSISTED_PATHS = 4096
+
 
 class StoreError(RuntimeError):
     """The store could not be read or written."""
 
 
+class _Paths:
+    """Which node each name path named, the last time this process looked.
+
+    **An id is what is cached, in effect, and nothing read off the node.** The
+    callers of `_node` want a node's id — to list it, sign it, write under it —
+    and an id is stable across a rename, a move and every write to the bytes.
+    What goes stale is the *path*: a node renamed or deleted since. `size`,
+    `updated_at` and the rest are never answered from here; `resolve` and
+    `size` always ask, because `characters.profile` compares `updated_at`
+    against what it read and a cached one would turn that check off.
+
+    One reader looks at `updated_at` without handing it on: `read`, to name the
+    version of a file whose bytes the blob cache may hold, and only off a node
+    this process learned itself (`learned`). That is the window this cache
+    already accepts for a path — every write this process makes is seen, and
+    another's is not until the command ends — and no wider: a node from the
+    persisted file is resolved again before its version names any bytes.
+
+    Kept true three ways: `write`, `upload` and `folder` record what they
+    created, listings record every child they return, and `api.on_write` drops
+    whatever a rename, move, transfer or delete could have changed — by the
+    node's id and everything cached beneath its path, or all of it for a route
+    this cannot read. A cached id that 404s anyway (someone else deleted it) is
+    dropped and the path resolved again, once.
+
+    **Persisted only when asked** (`STUDIO_PATH_CACHE_TTL_SECONDS`), one file
+    per API and library, read on first use and written at exit. A path from
+    the file is trusted for the TTL; one learned in this process, for the
+    process — the on-write hook sees every change this process makes, and
+    nothing sees another's, which is what the TTL bounds.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: dict[tuple, tuple[dict, float, float]] = {}
+        self._lock = threading.Lock()
+        self._loaded: set[tuple] = set()
+
+    @staticmethod
+    def _scope() -> tuple[str, str | None]:
+        return auth.api_url(), os.environ.get("STUDIO_LIBRARY_ID") or None
+
+    def get(self, path: str) -> dict | None:
+        scope = self._scope()
+        self._load(scope)
+        with self._lock:
+            held = self._nodes.get((scope, path))
+            if held is None:
+                return None
+            node, _, expires = held
+            if time.time() >= expires:
+                del self._nodes[(scope, path)]
+                return None
+            return node
+
+    def learned(self, path: str) -> dict | None:
+        """`get`, less what came from the persisted file — a node this process saw itself."""
+        node = self.get(path)
+        if node is None:
+            return None
+        with self._lock:
+            held = self._nodes.get((self._scope(), path))
+        return node if held is not None and held[2] == math.inf else None
+
+    def put(self, path: str, node: dict) -> None:
+        if not node.get("id"):
+            return
+        scope = self._scope()
+        with self._lock:
+            self._nodes[(scope, path)] = (node, time.time(), math.inf)
+
+    def drop(self, path: str) -> None:
+        """Forget a path and every path cached beneath it."""
+        scope = self._scope()
+        with self._lock:
+            self._drop(scope, path)
+
+    def drop_id(self, node_id: str) -> None:
+        scope = self._scope()
+        with self._lock:
+            named = [key[1] for key, (node, _, _) in self._nodes.items()
+                     if key[0] == scope and node.get("id") == node_id]
+            for path in named:
+                self._drop(scope, path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._nodes.clear()
+
+    def _drop(self, scope: tuple, path: str) -> None:
+        below = f"{path}/" if path else ""
+        for key in [key for key in self._nodes
+                    if key[0] == scope and (key[1] == path or key[1].startswith(below))]:
+            del self._nodes[key]
+
+    @staticmethod
+    def _ttl() -> int:
+        return int(os.environ.get("STUDIO_PATH_CACHE_TTL_SECONDS", "0"))
+
+    @staticmethod
+    def _file(scope: tuple) -> Path:
+        url, library = scope
+        digest = hashlib.sha256(url.encode()).hexdigest()[:12]
+        return CACHE_DIR / f"paths-{library or 'default'}-{digest}.json"
+
+    def _load(self, scope: tuple) -> None:
+        if scope in self._loaded:
+            return
+        self._loaded.add(scope)
+        ttl = self._ttl()
+        if ttl <= 0:
+            return
+        try:
+            saved = json.loads(self._file(scope).read_text())
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        with self._lock:
+            for path, (node, cached_at) in saved.items():
+                if now < cached_at + ttl:
+                    self._nodes.setdefault((scope, path), (node, cached_at, cached_at + ttl))
+
+    def save(self) -> None:
+        """Write each scope this process used back to its file. Never raises."""
+        if self._ttl() <= 0:
+            return
+        with self._lock:
+            held = sorted(self._nodes.items(), key=lambda item: item[1][1])
+        for scope in self._loaded:
+            entries = {key[1]: [node, cached_at] for key, (node, cached_at, _) in held
+                       if key[0] == scope}
+            kept = dict(list(entries.items())[-PERSISTED_PATHS:])
+            target = self._file(scope)
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                partial = target.with_suffix(f".{os.getpid()}.tmp")
+                partial.write_text(json.dumps(kept))
+                os.replace(partial, target)
+            except OSError:
+                pass
+
+
+_paths = _Paths()
+atexit.register(_paths.save)
+
+# `/api/nodes/<id>` and its transfer move or remove one node and its subtree.
+_NODE_CHANGED = re.compile(r"^/api/nodes/([^/]+)(?:/transfer)?$")
+# Writes that create, sign or fill a node in place — no path names a different
+# node afterwards. Anything not here and not above clears the cache outright.
+_NO_PATH_CHANGE = re.compile(
+    r"^/api/(?:nodes|runs|resolve/batch|presign/batch|text"
+    r"|nodes/[^/]+/(?:upload-url|confirm-upload|multipart(?:/urls|/complete)?))$"
+)
+
+
+def _on_write(method: str, route: str) -> None:
+    changed = _NODE_CHANGED.match(route)
+    if changed and method in ("PATCH", "DELETE", "POST"):
+        _paths.drop_id(changed.group(1))
+    elif not _NO_PATH_CHANGE.match(route):
+        _paths.clear()
+
+
+api.on_write(_on_write)
+
+
+def forget(path: str | None = None) -> None:
+    """Drop a cached path and everything beneath it — or, with no path, all of them."""
+    if path is None:
+        _paths.clear()
+    else:
+        _paths.drop(path.strip("/"))
+
+
 _NUM_RE = re.compile(r"(\d+)")
 
 
@@ -103,12 +305,62 @@ def natural_key(name: str):
 
 
 def resolve(path: str) -> dict:
-    """The node at a name path, or `api.NotFound`.
+    """The node at a name path, or `api.NotFound`. Always asks the API.
 
     An empty path is the library root — the one node no listing hands out, and
-    where a client starts.
+    where a client starts. Never answered from the path cache, because a caller
+    of this one reads the node's fields, not just its id; what it returns is
+    cached for the ones that only want the id.
+    """
+    clean = path.strip("/")
+    node = api.get("/api/resolve", path=clean)
+    _paths.put(clean, node)
+    return node
+
+
+def _node(path: str) -> tuple[dict, bool]:
+    """The node at a name path for its id, and whether it came from the cache."""
+    clean = path.strip("/")
+    cached = _paths.get(clean)
+    if cached is not None:
+        return cached, True
+    return resolve(clean), False
+
+
+def _with_node(path: str, call):
+    """`call(node)` on the node at `path`, resolving again once if a cached id has gone.
+
+    A 404 from a node the cache named means someone else renamed or deleted it
+    since; the path is asked about afresh and the call made once more. A 404
+    from a node just resolved is the answer, and propagates.
+    """
+    node, cached = _node(path)
+    try:
+        return call(node)
+    except api.NotFound:
+        if not cached:
+            raise
+        _paths.drop(path.strip("/"))
+        return call(resolve(path))
+
+
+def resolve_many(paths: list[str]) -> dict[str, dict | None]:
+    """The nodes at many name paths, keyed by the path as given; `None` where absent.
+
+    `POST /api/resolve/batch` walks every path a level at a time, so a folder's
+    worth of siblings costs a request and a handful of batched reads rather than
+    one `resolve` — and a `GetItem` per segment — each. A missing path is `None`
+    rather than `api.NotFound`, because one absent file in twenty is an answer
+    about that file and not a failure of the other nineteen.
     """
-    return api.get("/api/resolve", path=path.strip("/"))
+    if not paths:
+        return {}
+    answers = api.post("/api/resolve/batch", {"paths": [path.strip("/") for path in paths]})
+    found = {path: answer["node"] for path, answer in zip(paths, answers)}
+    for path, node in found.items():
+        if node is not None:
+            _paths.put(path.strip("/"), node)
+    return found
 
 
 def children(path: str) -> list:
@@ -118,9 +370,16 @@ def children(path: str) -> list:
     wanted it to build a key prefix, and that is the habit this module exists to
     end — walk with `resolve` on the path you actually mean.
     """
-    node = resolve(path)
-    listed = api.get("/api/nodes", parent=node["id"])
-    return listed if isinstance(listed, list) else []
+    listed = _with_node(path, lambda node: api.get("/api/nodes", parent=node["id"]))
+    if not isinstance(listed, list):
+        return []
+    # Every child is a path a caller is about to ask about — a walk descends
+    # into the folders, a `files` caller reads the files.
+    clean = path.strip("/")
+    for entry in listed:
+        if entry.get("name"):
+            _paths.put(f"{clean}/{entry['name']}" if clean else entry["name"], entry)
+    return listed
 
 
 def children_or_empty(path: str) -> list:
@@ -137,28 +396,66 @@ def children_or_empty(path: str) -> list:
         return []
 
 
+def descendants(path: str):
+    """Every node beneath a folder, flattened, each with its full name `path`.
+
+    One request a page — `GET /api/nodes/<id>/descendants` — rather than one
+    per folder, which is what a walk used to cost: a project of four hundred
+    runs was four hundred listings made one after another. Parents come before
+    what they hold, and siblings in no particular order; a caller that wants an
+    order sorts.
+
+    A generator, so a caller that stops early stops paging. A folder that is
+    not there has nothing beneath it, as `children_or_empty` says, and a 403
+    still raises. Every path it yields is one this module will be asked about
+    next — a `read` of a document found in a walk — so each is cached.
+    """
+    clean = path.strip("/")
+    try:
+        node, _ = _node(clean)
+    except api.NotFound:
+        return
+    cursor = None
+    while True:
+        page = api.get(f"/api/nodes/{node['id']}/descendants", cursor=cursor)
+        for entry in page["nodes"]:
+            entry = {**entry, "path": f"{clean}/{entry['path']}" if clean else entry["path"]}
+            _paths.put(entry["path"], entry)
+            yield entry
+        cursor = page.get("next_cursor")
+        if not cursor:
+            return
+
+
 def walk_files(path: str) -> list[str]:
-    """Every file path beneath a folder, depth first, natural order per level.
-
-    **The catalog has no prefix scan.** `list_objects_v2` took a prefix and
-    returned the whole subtree in pages; a listing here is per folder, because
-    that is the unit a node's library membership authorises. So the descent is
-    explicit and costs one request per folder rather than one per thousand
-    objects — worse for a wide shallow tree, and the price of the listing being
-    checked rather than assumed.
-
-    Only two callers want a subtree at all (`rewrite` and a character rename),
-    and both are maintenance-shaped. Anything reading one folder should use
-    `files`.
+    """Every file path beneath a folder, depth first, name order per level.
+
+    **One `descendants` read rather than a listing per folder.** The catalog
+    had no prefix scan when this was written, and a walk of `projects/` cost a
+    request per folder; the API now reads a subtree by its materialised path
+    and pages the answer. The order is rebuilt here from each entry's parent,
+    so it is still the order the per-folder walk produced — a folder's files
+    and subfolders by name, each subfolder's contents where it stands.
+
+    Only a few callers want a subtree at all (`rewrite`, a character rename,
+    a contact sheet's pool), and all are maintenance-shaped. Anything reading
+    one folder should use `files`.
     """
-    found: list[str] = []
-    for entry in children_or_empty(path):
-        child = f"{path.rstrip('/')}/{entry['name']}"
-        if entry.get("kind") == "folder":
-            found += walk_files(child)
-        else:
-            found.append(child)
-    return found
+    clean = path.strip("/")
+    held: dict[str, list[dict]] = {}
+    for entry in descendants(clean):
+        held.setdefault(entry["path"].rpartition("/")[0], []).append(entry)
+
+    def _below(folder: str) -> list[str]:
+        found: list[str] = []
+        for entry in sorted(held.get(folder, []), key=lambda entry: entry["name"]):
+            if entry.get("kind") == "folder":
+                found += _below(entry["path"])
+            else:
+                found.append(f"{path.rstrip('/')}{entry['path'][len(clean):]}")
+        return found
+
+    return _below(clean)
 
 
 def files(path: str) -> list[dict]:
@@ -192,9 +489,13 @@ def files(path: str) -> list[dict]:
 
 
 def exists(path: str) -> bool:
-    """Whether a node is there. Cheaper than fetching it, and never raises."""
+    """Whether a node is there. Cheaper than fetching it, and never raises.
+
+    Answered from the path cache when it can be — a shoot checks the same pose
+    plates for every slot.
+    """
     try:
-        resolve(path)
+        _node(path)
     except api.NotFound:
         return False
     return True
@@ -221,7 +522,7 @@ def folder(path: str) -> dict:
     """
     clean = path.strip("/")
     try:
-        node = resolve(clean)
+        node, _ = _node(clean)
     except api.NotFound:
         node = None
     if node is not None:
@@ -236,11 +537,13 @@ def folder(path: str) -> dict:
     parent_path, _, name = clean.rpartition("/")
     parent = folder(parent_path)
     try:
-        return api.post(
+        node = api.post(
             "/api/nodes", {"parent": parent["id"], "name": name, "kind": "folder"}
         )
     except api.Conflict:
         return resolve(clean)
+    _paths.put(clean, node)
+    return node
 
 
 def size(path: str) -> int:
@@ -258,10 +561,10 @@ def copy(source: str, destination: str, *, content_type: str) -> dict:
 
     **The bytes travel through this process**, which a server-side
     `CopyObject` did not. That is the cost, and it is accepted here rather than
-    hidden: the alternative is a second node pointing at one blob, which is
-    copy-on-write (#334, deferred) and carries a hazard already written into the
-    API's delete route — the day two rows share a key, deleting one destroys the
-    other's bytes.
+    hidden. The API's own copy route shares a counted blob between two rows and
+    moves no bytes at all, but it keeps the source's name — numbered on a
+    clash — and this copies to a path the caller chose, a board's panel key or
+    a scene's, which only a write can name.
 
     So this is a real copy: two blobs, two independent lifetimes. Fine for the
     images it is used for; reconsider before pointing it at video.
@@ -270,9 +573,43 @@ def copy(source: str, destination: str, *, content_type: str) -> dict:
 
 
 def read(path: str) -> bytes:
-    """The bytes of one file."""
-    signed = api.get(f"/api/nodes/{resolve(path)['id']}/download-url")
-    return _fetch(signed["url"])
+    """The bytes of one file, from the blob cache when this machine already has them.
+
+    The version the cache is asked for is the node's `updated_at`: off the path
+    cache when this process learned the node — a listing, a write or a resolve
+    earlier in the same command — and from a fresh `resolve` otherwise. So a
+    file read again within a command costs no request at all, one read again a
+    command later costs the resolve and no bytes, and a file changed since is a
+    different version and fetched. Reading the version before the bytes is
+    `characters.profile`'s order too, for its reason: bytes at least as new as
+    the version that names them.
+    """
+    clean = path.strip("/")
+    cache = blob_cache()
+    key = None
+    if cache is not None:
+        key = _blob_key(_paths.learned(clean) or resolve(clean))
+        body = cache.get(key) if key else None
+        if body is not None:
+            return body
+    signed = _with_node(path, lambda node: api.get(f"/api/nodes/{node['id']}/download-url"))
+    body = _fetch(signed["url"])
+    if key:
+        cache.put(key, body)
+    return body
+
+
+def blob_cache() -> blobs.Blobs | None:
+    """The blob cache beside the path cache, or None when `STUDIO_BLOB_CACHE_MB` is 0."""
+    return blobs.at(CACHE_DIR / "blobs")
+
+
+def _blob_key(node: dict) -> str | None:
+    """A file node's id and version, scoped to the API like `_Paths`; None without both."""
+    if node.get("kind", "file") != "file" or not node.get("id") or not node.get("updated_at"):
+        return None
+    api_url = hashlib.sha256(auth.api_url().encode()).hexdigest()[:12]
+    return f"{api_url}/{node['id']}@{node['updated_at']}"
 
 
 def download(path: str, destination: Path) -> Path:
@@ -289,8 +626,9 @@ def presign(path: str, *, disposition: str = "inline") -> str:
     against its own credentials, so the CLI hands out access it does not itself
     hold — which is the whole arrangement hard rule #3 describes.
     """
-    signed = api.get(
-        f"/api/nodes/{resolve(path)['id']}/download-url", disposition=disposition
+    signed = _with_node(
+        path,
+        lambda node: api.get(f"/api/nodes/{node['id']}/download-url", disposition=disposition),
     )
     return signed["url"]
 
@@ -304,29 +642,171 @@ def write(path: str, body: bytes, *, content_type: str) -> dict:
     skips and which is a row nobody sees; a failure after it would leave a row
     promising bytes that are not there.
     """
-    parent_path, _, name = path.strip("/").rpartition("/")
-    parent = resolve(parent_path)
+    written = _put_whole(path, body, len(body), content_type=content_type)
+    # The bytes are in hand and the node says which version they are, so the
+    # next read of what was just written — a run's `result.json`, a board's
+    # panel — is answered here rather than fetched back.
+    cache = blob_cache()
+    key = _blob_key(written) if cache is not None else None
+    if key:
+        cache.put(key, body)
+    return written
+
+
+def upload(path: str, source: Path, *, content_type: str) -> dict:
+    """Write a local file into the store, in parts when it is large.
+
+    Up to `MULTIPART_THRESHOLD` this is `write`. Past it the file goes through
+    the API's multipart routes: `UPLOAD_WORKERS` parts in flight, each read off
+    disk by offset rather than the whole file held at once, each retried
+    `PART_ATTEMPTS` times against a freshly signed URL — an expired signature is
+    the commonest reason a part fails, and re-sending to the same URL would fail
+    the same way.
+
+    **Running it again is the resume.** The API hands back the upload already
+    open on the node, listing the parts S3 holds; a held part whose MD5 matches
+    the local bytes is kept, and only the rest are sent. So a failure here
+    raises `StoreError` and leaves the upload open rather than aborting it —
+    aborting would throw away exactly the parts a retry wants.
+    """
+    total = source.stat().st_size
+    if total <= MULTIPART_THRESHOLD:
+        return write(path, source.read_bytes(), content_type=content_type)
+    with source.open("rb") as handle:
+        return _upload_parts(path, handle, total, content_type=content_type)
+
+
+def stream(path: str, source, *, size: int, content_type: str) -> dict:
+    """Write `size` bytes read off `source` into the store, with no copy on disk.
+
+    `upload` for bytes that are arriving rather than sitting in a file — a
+    model's output on its way from Replicate's delivery host. `source` is
+    anything with `read(n)`; it is read once, front to back, and never rewound.
+
+    **The size is not optional, because the signature is not.** A presigned PUT
+    is signed for one exact `Content-Length`, so the length has to be known
+    before the first byte goes, and a source that ends early or runs long would
+    either hang S3 waiting for bytes that never come or be cut off by it. Both
+    raise `StoreError` here instead. Past `MULTIPART_THRESHOLD` it goes up in
+    parts like `upload`, read in order off the one stream, but a failed part
+    cannot be resumed by running it again: the stream has moved on.
+    """
+    exact = _Exactly(source, size)
+    if size > MULTIPART_THRESHOLD:
+        return _upload_parts(path, exact, size, content_type=content_type)
+    return _put_whole(path, exact, size, content_type=content_type)
 
-    try:
-        node = api.post(
-            "/api/nodes", {"parent": parent["id"], "name": name, "kind": "file"}
-        )
-    except api.Conflict:
-        # Already there: this is a replace, and the node keeps its identity so
-        # every record naming it stays true.
-        node = resolve(path)
 
+def _put_whole(path: str, body, size: int, *, content_type: str) -> dict:
+    """Placeholder, signed PUT, confirm — the three calls `write` explains."""
+    node = _file_node(path)
     signed = api.post(
         f"/api/nodes/{node['id']}/upload-url",
-        {"size": len(body), "content_type": content_type},
+        {"size": size, "content_type": content_type},
     )
     _put(signed["url"], body, signed["headers"])
-    return api.post(f"/api/nodes/{node['id']}/confirm-upload")
+    if isinstance(body, _Exactly):
+        # Checked before the confirm, so a source that ran long leaves a
+        # placeholder nobody sees rather than a row holding its first `size` bytes.
+        body.finish()
+    written = api.post(f"/api/nodes/{node['id']}/confirm-upload")
+    _paths.put(path.strip("/"), written)
+    return written
 
 
-def upload(path: str, source: Path, *, content_type: str) -> dict:
-    """Write a local file into the store."""
-    return write(path, source.read_bytes(), content_type=content_type)
+def _upload_parts(path: str, handle, total: int, *, content_type: str) -> dict:
+    """The multipart half of `upload` and `stream`, reading parts in order off `handle`.
+
+    One reader, `UPLOAD_WORKERS` senders: a part is read only once there is room
+    for it, so no more than that many are held at once whether the bytes come
+    off a disk or a socket.
+    """
+    node = _file_node(path)
+    route = f"/api/nodes/{node['id']}/multipart"
+    opened = api.post(route, {"size": total, "content_type": content_type})
+    held = {part["number"]: part["etag"] for part in opened["parts"]}
+    part_bytes = opened["part_bytes"]
+
+    def _send(number: int, body: bytes) -> bool:
+        # A single part's ETag is the MD5 of its bytes.
+        if number in held and held[number] == hashlib.md5(body, usedforsecurity=False).hexdigest():
+            return True
+        for _ in range(PART_ATTEMPTS):
+            try:
+                signed = api.post(f"{route}/urls", {"parts": [number]})["parts"][0]
+                _put(signed["url"], body, signed["headers"])
+            except (StoreError, api.ApiError):
+                continue
+            return True
+        return False
+
+    room = threading.BoundedSemaphore(UPLOAD_WORKERS)
+    futures = []
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+        for number in range(1, opened["part_count"] + 1):
+            room.acquire()
+            body = handle.read(min(part_bytes, total - (number - 1) * part_bytes))
+            future = pool.submit(_send, number, body)
+            future.add_done_callback(lambda _: room.release())
+            futures.append(future)
+    if isinstance(handle, _Exactly):
+        handle.finish()
+    sent = [future.result() for future in futures]
+    if not all(sent):
+        raise StoreError(
+            f"{sent.count(False)} of {len(sent)} parts of {path.rsplit('/', 1)[-1]} did not "
+            "upload; run it again to resume from the parts that did."
+        )
+    written = api.post(f"{route}/complete")
+    _paths.put(path.strip("/"), written)
+    return written
+
+
+class _Exactly:
+    """`size` bytes off a stream, each `read` as long as asked for, or `StoreError`.
+
+    A socket hands back what has arrived, not what was asked for; a part, and
+    `http.client` sending a body, both want the full amount or the end.
+    """
+
+    def __init__(self, source, size: int) -> None:
+        self.source = source
+        self.size = size
+        self.left = size
+
+    def read(self, amount: int = -1) -> bytes:
+        want = self.left if amount is None or amount < 0 else min(amount, self.left)
+        chunks = []
+        while want:
+            chunk = self.source.read(want)
+            if not chunk:
+                raise StoreError(
+                    f"The source ended {self.left} bytes short of the {self.size} it promised."
+                )
+            chunks.append(chunk)
+            want -= len(chunk)
+            self.left -= len(chunk)
+        return b"".join(chunks)
+
+    def finish(self) -> None:
+        """Refuse a source with bytes left over once `size` have been sent."""
+        if self.source.read(1):
+            raise StoreError(f"The source ran past the {self.size} bytes it promised.")
+
+
+def _file_node(path: str) -> dict:
+    """The file node at a name path, created as a placeholder if it is not there."""
+    parent_path, _, name = path.strip("/").rpartition("/")
+
+    def _create(parent: dict) -> dict:
+        return api.post("/api/nodes", {"parent": parent["id"], "name": name, "kind": "file"})
+
+    try:
+        return _with_node(parent_path, _create)
+    except api.Conflict:
+        # Already there: this is a replace, and the node keeps its identity so
+        # every record naming it stays true.
+        return resolve(path)
 
 
 def shared_presign(key: str, *, disposition: str = "inline") -> str:
@@ -341,7 +821,12 @@ def shared_presign(key: str, *, disposition: str = "inline") -> str:
 
 
 def shared_read(key: str) -> bytes:
-    """The bytes of one shared file. See `shared_presign`."""
+    """The bytes of one shared file. See `shared_presign`.
+
+    Not through the blob cache: shared material has no node, so there is no
+    version to name its bytes by short of fetching them, and the one caller
+    reads one small file once a command.
+    """
     return _fetch(shared_presign(key))
 
 
@@ -0,0 +1,362 @@
+"""Every outstanding Replicate prediction, watched from one scheduler thread.
+
+`replicate.poll` asked about one prediction every `interval` seconds and slept
+in between, so each prediction in flight held a blocked thread of its own and
+a fixed rate of requests whether it was two seconds from done or two minutes.
+A shoot of twelve slots side by side was twelve threads asking the same
+question on the same clock.
+
+Here a prediction is registered once and the tracker decides when it is next
+asked about. One thread keeps every outstanding id on a heap by the time its
+next check is due, and hands the checks that come due to a few workers.
+
+    tracker = TRACK.shared(token)
+    watch = tracker.track(pid, model=entry["model"], interval=5, timeout=600)
+    final = watch.wait(on_status=print)        # or watch.future, to gather many
+
+WHEN A PREDICTION IS ASKED ABOUT
+--------------------------------
+Once straight after it is created, because a refusal — a plate the model reads
+as sensitive, a bad input — shows on the first check and should not wait. Then
+according to `next_check`, from the model's history and the time elapsed:
+
+* **The model's history.** Each succeeded prediction's wall time is kept per
+  model in `runtimes.json` under the store's cache directory, as a moving
+  average. Nothing is asked until most of that time has passed — no more than
+  `PATIENCE` intervals at a stretch, so a model that has got faster is not
+  noticed a whole stale average late. Around the expected finish the checks
+  come a tenth of the runtime apart; past it they back off with how overdue
+  the prediction is, up to the caller's `interval`. Fewer requests than asking
+  every interval, and a result seen sooner.
+* **No history.** Every `interval`, as `poll` did — there is nothing to adapt
+  to yet. A watch takes the history as it stood when it was registered, so
+  the quickest predictions of a batch settling first do not teach the rest of
+  the same batch a runtime that is too short.
+
+WEBHOOKS ARE A DOORBELL, NOT THE DELIVERY
+-----------------------------------------
+Set `STUDIO_WEBHOOK_URL` to an address Replicate can reach that forwards to
+`STUDIO_WEBHOOK_LISTEN` (`host:port`, default `127.0.0.1:8765`), and each
+prediction is created with that webhook. A callback for a tracked id
+only moves its next check to now. The body is never trusted as the answer.
+It is unauthenticated unless its signature is checked, and one spoofed
+"succeeded" with an output URL would be filed into a run as the real thing.
+The check that follows asks the API, which is the authority either way. An
+unknown id changes nothing.
+
+With a webhook, the schedule is the fallback rather than the way a result is
+noticed, so it runs on `PATIENCE` intervals instead of one. A callback that
+never comes — a tunnel that dropped — costs that much lateness and no result.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import heapq
+import http.server
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+
+from studio_pipeline import env_value
+from studio_pipeline.adapters import replicate as RA
+from studio_pipeline.adapters import store
+
+SETTLED = ("succeeded", "failed", "canceled")
+
+# The shortest gap between two checks of one prediction, unless the caller's
+# interval is shorter still.
+FLOOR = 1.0
+# The window opens at this fraction of the model's usual runtime: early enough
+# that a faster-than-usual prediction is still caught close to when it settles.
+EARLY = 0.8
+# In the window, checks come this fraction of the usual runtime apart.
+SPREAD = 0.1
+# Past the usual runtime, the gap is this fraction of how overdue it is.
+BACKOFF = 0.5
+# The longest single wait before the window, in intervals — and the gap at all
+# when a webhook will say sooner.
+PATIENCE = 4
+# Weight of the newest runtime in a model's moving average.
+RECENT = 0.3
+# Checks in flight at once. One thread decides; these make the requests, so a
+# moment when fifty come due is not fifty round trips end to end.
+CHECKERS = 4
+RUNTIMES_FILE = "runtimes.json"
+DEFAULT_LISTEN = "127.0.0.1:8765"
+
+
+def next_check(elapsed: float, expected: float | None, interval: float) -> float:
+    """Seconds until a prediction `elapsed` seconds old is next asked about.
+
+    `expected` is the model's usual runtime, or None when there is no history.
+    """
+    if not expected:
+        return interval
+    floor = min(FLOOR, interval)
+    opens = EARLY * expected
+    if elapsed < opens:
+        return max(floor, min(opens - elapsed, PATIENCE * interval))
+    return min(interval, max(floor, SPREAD * expected, BACKOFF * (elapsed - expected)))
+
+
+class Watch:
+    """One tracked prediction: a future for its final body, and its statuses.
+
+    `future` is what a caller gathering many waits on. `wait` is what a caller
+    with one does, and it is where `on_status` runs — on the thread that asked,
+    never the tracker's, so whatever that thread's output is routed to (a shoot
+    slot's block, say) is where the status lines land.
+    """
+
+    def __init__(self, prediction_id: str, model: str | None, interval: float,
+                 timeout: float, expected: float | None = None) -> None:
+        self.id = prediction_id
+        self.model = model
+        self.expected = expected
+        self.interval = interval
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.statuses: queue.SimpleQueue = queue.SimpleQueue()
+        self.due = self.started
+        self.checking = False
+        self.rung = False
+
+    def wait(self, on_status=None) -> dict:
+        """Block until the prediction settles; its final body, or what went wrong."""
+        while True:
+            status = self.statuses.get()
+            if status is None:
+                return self.future.result()
+            if on_status:
+                on_status(status)
+
+
+class _Doorbell(http.server.BaseHTTPRequestHandler):
+    """Replicate's webhook POSTs. Each rings for the id it names, and that is all."""
+
+    tracker: Tracker
+
+    def do_POST(self):  # noqa: N802 — the handler's naming, not ours
+        try:
+            sent = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+            prediction_id = sent.get("id") if isinstance(sent, dict) else None
+        except ValueError:
+            prediction_id = None
+        if isinstance(prediction_id, str):
+            self.tracker.ring(prediction_id)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *_):
+        pass
+
+
+class Tracker:
+    """Outstanding predictions for one token, on one schedule.
+
+    Threads start with the first prediction tracked, and `close` stops them.
+    With `webhook` (the public URL) and `listen` (`host:port`), a listener
+    takes Replicate's callbacks and `webhook` is what to create predictions with.
+    """
+
+    def __init__(self, token: str, *, webhook: str | None = None,
+                 listen: str | None = None) -> None:
+        self.token = token
+        self._watching: dict[str, Watch] = {}
+        self._due: list[tuple[float, int, str]] = []
+        self._order = itertools.count()
+        self._lock = threading.Condition()
+        self._closed = False
+        self._scheduler: threading.Thread | None = None
+        self._checkers: concurrent.futures.ThreadPoolExecutor | None = None
+        self._runtimes: dict[str, float] | None = None
+        self._listener: http.server.ThreadingHTTPServer | None = None
+        self.webhook = None
+        if webhook:
+            host, _, port = (listen or DEFAULT_LISTEN).rpartition(":")
+            handler = type("_Bell", (_Doorbell,), {"tracker": self})
+            self._listener = http.server.ThreadingHTTPServer((host, int(port)), handler)
+            threading.Thread(target=self._listener.serve_forever, daemon=True,
+                             name="prediction-webhooks").start()
+            self.webhook = webhook
+
+    # --- history ----------------------------------------------------------
+
+    def _history(self) -> dict[str, float]:
+        if self._runtimes is None:
+            try:
+                loaded = json.loads((store.CACHE_DIR / RUNTIMES_FILE).read_text())
+            except (OSError, ValueError):
+                loaded = {}
+            self._runtimes = {k: float(v) for k, v in loaded.items()
+                              if isinstance(v, (int, float))} if isinstance(loaded, dict) else {}
+        return self._runtimes
+
+    def expected(self, model: str | None) -> float | None:
+        """The model's usual runtime in seconds, or None with no history."""
+        with self._lock:
+            return self._history().get(model) if model else None
+
+    def _remember(self, model: str, seconds: float) -> None:
+        """Fold one runtime into the model's average and write the file through."""
+        with self._lock:
+            history = self._history()
+            old = history.get(model)
+            history[model] = seconds if old is None else RECENT * seconds + (1 - RECENT) * old
+            snapshot = dict(history)
+        path = store.CACHE_DIR / RUNTIMES_FILE
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f".{RUNTIMES_FILE}.{os.getpid()}.{threading.get_ident()}")
+            partial.write_text(json.dumps(snapshot, indent=2, sort_keys=True))
+            os.replace(partial, path)
+        except OSError:
+            # History is a hint. A read-only home costs the next run its
+            # head start, not its result.
+            pass
+
+    # --- registering ------------------------------------------------------
+
+    def track(self, prediction_id: str, *, model: str | None = None,
+              interval: float = 5, timeout: float = 600) -> Watch:
+        """Start watching a prediction that has just been created."""
+        watch = Watch(prediction_id, model, interval, timeout, self.expected(model))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("the prediction tracker is closed")
+            self._watching[prediction_id] = watch
+            self._schedule(watch, watch.started)
+            if self._scheduler is None:
+                self._checkers = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=CHECKERS, thread_name_prefix="prediction-check")
+                self._scheduler = threading.Thread(target=self._run, daemon=True,
+                                                   name="prediction-tracker")
+                self._scheduler.start()
+            self._lock.notify()
+        return watch
+
+    def ring(self, prediction_id: str) -> None:
+        """Check this prediction now, if it is one being watched."""
+        with self._lock:
+            watch = self._watching.get(prediction_id)
+            if watch is None:
+                return
+            if watch.checking:
+                # The answer already on its way may predate what rang.
+                watch.rung = True
+                return
+            self._schedule(watch, time.monotonic())
+            self._lock.notify()
+
+    def outstanding(self) -> int:
+        with self._lock:
+            return len(self._watching)
+
+    def close(self) -> None:
+        """Stop the threads. Anything still outstanding is left unresolved."""
+        with self._lock:
+            self._closed = True
+            self._lock.notify()
+        if self._checkers is not None:
+            self._checkers.shutdown(wait=False, cancel_futures=True)
+        if self._listener is not None:
+            self._listener.shutdown()
+            self._listener.server_close()
+
+    # --- the schedule -----------------------------------------------------
+
+    def _schedule(self, watch: Watch, when: float) -> None:
+        """Put `watch` on the heap for `when`. Caller holds the lock.
+
+        A rescheduled watch leaves its earlier entry behind; `_run` skips any
+        entry whose time is not the watch's current one.
+        """
+        watch.due = when
+        heapq.heappush(self._due, (when, next(self._order), watch.id))
+
+    def _run(self) -> None:
+        with self._lock:
+            while not self._closed:
+                if not self._due:
+                    self._lock.wait()
+                    continue
+                when, _, prediction_id = self._due[0]
+                now = time.monotonic()
+                if when > now:
+                    self._lock.wait(when - now)
+                    continue
+                heapq.heappop(self._due)
+                watch = self._watching.get(prediction_id)
+                if watch is None or watch.checking or watch.due != when:
+                    continue
+                watch.checking = True
+                self._checkers.submit(self._check, watch)
+
+    def _check(self, watch: Watch) -> None:
+        """Ask once, then settle the watch or put it back on the schedule."""
+        try:
+            current = RA.api("GET", f"{RA.API_ROOT}/predictions/{watch.id}", self.token)
+        except Exception as exc:  # noqa: BLE001 — it belongs to the one caller waiting
+            self._settle(watch, error=exc)
+            return
+        status = current.get("status")
+        watch.statuses.put(status)
+        elapsed = time.monotonic() - watch.started
+        if status in SETTLED:
+            if status == "succeeded" and watch.model:
+                self._remember(watch.model, elapsed)
+            self._settle(watch, body=current)
+        elif elapsed > watch.timeout:
+            self._settle(watch, error=TimeoutError(f"gave up after {watch.timeout}s"))
+        else:
+            interval = watch.interval * (PATIENCE if self.webhook else 1)
+            delay = next_check(elapsed, watch.expected, interval)
+            with self._lock:
+                watch.checking = False
+                if watch.rung:
+                    watch.rung, delay = False, 0.0
+                self._schedule(watch, time.monotonic() + delay)
+                self._lock.notify()
+
+    def _settle(self, watch: Watch, *, body: dict | None = None,
+                error: BaseException | None = None) -> None:
+        with self._lock:
+            self._watching.pop(watch.id, None)
+        if error is not None:
+            watch.future.set_exception(error)
+        else:
+            watch.future.set_result(body)
+        watch.statuses.put(None)
+
+
+_shared: dict[str, Tracker] = {}
+_shared_lock = threading.Lock()
+
+
+def shared(token: str) -> Tracker:
+    """The process's tracker for `token`, made on first use.
+
+    One per process is the point: every prediction a command has in flight, on
+    whatever thread created it, is on the same schedule.
+    """
+    with _shared_lock:
+        tracker = _shared.get(token)
+        if tracker is None:
+            tracker = _shared[token] = Tracker(
+                token, webhook=env_value("STUDIO_WEBHOOK_URL"),
+                listen=env_value("STUDIO_WEBHOOK_LISTEN"))
+        return tracker
+
+
+def close_shared() -> None:
+    """Stop every shared tracker; the next `shared` makes a fresh one."""
+    with _shared_lock:
+        trackers = list(_shared.values())
+        _shared.clear()
+    for tracker in trackers:
+        tracker.close()
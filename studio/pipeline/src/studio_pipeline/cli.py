@@ -34,8 +34,11 @@ from studio_pipeline.engine import board as _board
 from studio_pipeline.engine import runner as _runner
 from studio_pipeline.engine import shoot as _shoot
 from studio_pipeline.maintenance import catalog_gc as _catalog_gc
+from studio_pipeline.maintenance import catalog_listing as _catalog_listing
+from studio_pipeline.maintenance import catalog_refs as _catalog_refs
 from studio_pipeline.maintenance import catalog_seed as _catalog
 from studio_pipeline.maintenance import dev_seed as _dev_seed
+from studio_pipeline.objects import cache as _cache
 from studio_pipeline.objects import convert as _convert
 from studio_pipeline.session import commands as _session
 from studio_pipeline.objects import download as _download
@@ -58,7 +61,7 @@ class _Grouped(click.Group):
         ("records",     ["runs", "scenes", "movies", "frames", "projects"]),
         ("characters",  ["character", "curate", "contact-sheet"]),
         ("authoring",   ["prompt", "phrasebook"]),
-        ("objects",     ["upload", "download", "presign", "convert"]),
+        ("objects",     ["upload", "download", "presign", "convert", "cache"]),
         ("maintenance", ["rewrite", "catalog", "dev-seed"]),
     ]
 
@@ -141,6 +144,16 @@ _scenes.main.add_command(_board.cmd_check, "check")
 # twice.
 _catalog.main.add_command(_catalog_gc.cmd_gc, "gc")
 
+# `listing` is the check on the by-parent items' copy of each record, and the
+# backfill for items written before there was one. Its own module for the same
+# reason as `gc`: it writes to a table the seed only ever adds to.
+_catalog.main.add_command(_catalog_listing.cmd_listing, "listing")
+
+# `refs` rebuilds the blob reference counts copies share bytes by. Its own
+# module for `listing`'s reason, and the counts it writes are what let a row the
+# seed recorded be copied without copying its bytes.
+_catalog.main.add_command(_catalog_refs.cmd_refs, "refs")
+
 
 for _name, _cmd in [
     ("add-model", _add_model.add_model),
@@ -158,6 +171,7 @@ for _name, _cmd in [
     ("download", _download.download),
     ("presign", _presign.presign),
     ("convert", _convert.convert),
+    ("cache", _cache.main),
     ("rewrite", _rewrite.main),
     ("catalog", _catalog.main),
     ("dev-seed", _dev_seed.main),
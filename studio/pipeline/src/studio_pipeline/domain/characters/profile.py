@@ -233,7 +233,7 @@ def cmd_create(name, dry_run, from_profile, model, project, shoot):
         group="all", slot=(), identity="auto", identity_max=SHOOT.IDENTITY_MAX,
         pick=None, pick_tag=None, seed_pick=None, aspect_ratio=None, extra=None,
         review_sheet=None,
-        dest=None, expires=3600,
+        dest=None, expires=3600, jobs=1,
     )
     try:
         return SHOOT.run_shoot(name, opts)
@@ -194,10 +194,16 @@ def cmd_rename(old, new, apply, display_name):
     version = remote_version(old)
     # Resolved BEFORE anything is renamed: after the folder moves, these paths
     # do not exist to resolve. The ids do not change, which is the whole reason
-    # this is cheap.
-    nodes = {path: store.resolve(path) for path in object_moves
-             if os.path.basename(path) != os.path.basename(object_moves[path])}
-    character_node = store.resolve(P.character_prefix(old))
+    # this is cheap. One batched request for all of them, the character's own
+    # folder included, rather than a `resolve` per renamed image.
+    renaming = [path for path in object_moves
+                if os.path.basename(path) != os.path.basename(object_moves[path])]
+    found = store.resolve_many([*renaming, P.character_prefix(old)])
+    missing = [path for path, node in found.items() if node is None]
+    if missing:
+        raise api.NotFound(f"No such object: {missing[0]}", 404)
+    character_node = found.pop(P.character_prefix(old))
+    nodes = found
     was_display = data.get("display_name")
     data["name"] = new
     data["display_name"] = display_name
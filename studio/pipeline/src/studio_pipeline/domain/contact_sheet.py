@@ -42,21 +42,17 @@ def _pool_images(root: str) -> list[str]:
     reports the commonest invocation as an empty pool. `list_keys` was
     recursive by default and hid the decision; walking is now explicit.
 
-    `children_or_empty` is what makes a missing pool empty rather than an
+    `store.descendants` is what makes a missing pool empty rather than an
     error, and it distinguishes a 404 from a 403 — a refused pool must not read
-    as a character with no images.
+    as a character with no images. One read of the whole pool, where this was a
+    listing per purpose folder.
     """
-    found: list[str] = []
-
-    def walk(prefix: str) -> None:
-        for entry in store.children_or_empty(prefix):
-            path = f"{prefix}/{entry['name']}"
-            if entry.get("kind") == "folder":
-                walk(path)
-            elif os.path.splitext(entry["name"])[1].lower() in IMG_EXTS:
-                found.append(path[len(root) + 1:])
-
-    walk(root)
+    found = [
+        entry["path"][len(root.strip("/")) + 1:]
+        for entry in store.descendants(root)
+        if entry.get("kind") != "folder"
+        and os.path.splitext(entry["name"])[1].lower() in IMG_EXTS
+    ]
     return sorted(found, key=store.natural_key)
 
 
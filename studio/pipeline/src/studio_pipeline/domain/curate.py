@@ -369,13 +369,12 @@ def cmd_regroup(files, group, name, apply):
     check_name(name)
     root = ref_root(name)
     moves: list[tuple[str, str]] = []
-    nodes: dict[str, dict] = {}
-    for f in files:
-        f = f.strip().lstrip("/")
+    wanted = [f.strip().lstrip("/") for f in files]
+    # One batched lookup for every file named, not a `resolve` each.
+    nodes = store.resolve_many([root + f for f in wanted])
+    for f in wanted:
         src = root + f
-        try:
-            nodes[src] = store.resolve(src)
-        except api.NotFound:
+        if nodes[src] is None:
             die(f"{f!r} is not in {name}'s reference/")
         dst = root + f"{group}/{os.path.basename(f)}"
         if src != dst:
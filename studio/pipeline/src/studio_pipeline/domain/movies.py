@@ -173,10 +173,10 @@ def create(project: str, slug: str, refs: list[str],
         scene["n"] = n
         scene["scene_key"] = movie_key(project, movie_id, "scenes", f"scene-{n:02d}{ext}")
         # A read plus a write where this was a server-side `CopyObject`. Same
-        # trade `scenes.assemble` makes and for the same reason — a second node
-        # on one blob is copy-on-write (#334), and the API's delete route
-        # destroys the shared bytes when either row goes. The file is already
-        # local from the download above, so the cost is one PUT per scene.
+        # trade `scenes.assemble` makes and for the same reason — the API's
+        # blob-sharing copy keeps the source's name, and this names its
+        # destination (`store.copy`). The file is already local from the
+        # download above, so the cost is one PUT per scene.
         store.upload(scene["scene_key"], pathlib.Path(lp),
                      content_type=mimetypes.guess_type(lp)[0] or "application/octet-stream")
         print(f"  scene {n}: {scene['scene']}")
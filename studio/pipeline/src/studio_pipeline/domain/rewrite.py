@@ -69,10 +69,10 @@ def is_document(key: str) -> bool:
 def all_documents() -> list[str]:
     """Every path-bearing document in the tree.
 
-    `store.walk_files` descends folder by folder where this was one paginated
-    `list_objects_v2` — see its docstring for why the catalog has no prefix
-    scan. This is the widest walk in the package and it is a maintenance
-    command; nothing on a hot path does it.
+    `store.walk_files` reads the whole of `projects/` through the API's
+    `descendants` route, a page at a time, where it used to descend folder by
+    folder — a request per run. This is the widest walk in the package and it
+    is a maintenance command; nothing on a hot path does it.
     """
     return [path for path in store.walk_files(P.PROJECTS) if is_document(path)]
 
@@ -343,10 +343,24 @@ def upload_output(project: str, run_id: str, local: str, name: str | None = None
     return path
 
 
+def stream_output(project: str, run_id: str, source, name: str, *, size: int) -> str:
+    """`upload_output` for an artifact read off a stream rather than a file.
+
+    `size` is what the source says it will send; see `store.stream` for why it
+    has to be known before anything is. The content type comes from `name`, as
+    `upload_output`'s comes from the file it was given.
+    """
+    path = run_key(project, run_id, "output", name)
+    store.folder(run_key(project, run_id, "output"))
+    ct = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    store.stream(path, source, size=size, content_type=ct)
+    return path
+
+
 def record_result(
     project: str, run_id: str, *, prediction_id: str | None, status: str,
     outputs: list[str] | None = None, source_urls: list[str] | None = None,
-    error=None, extra: dict | None = None,
+    sha256: dict[str, str] | None = None, error=None, extra: dict | None = None,
 ) -> str:
     outputs = outputs or []
     media_types = sorted({mimetypes.guess_type(k)[0] or "application/octet-stream" for k in outputs})
@@ -359,6 +373,7 @@ def record_result(
         "media_types": media_types,
         "outputs": outputs,            # S3 keys inside this run
         "source_urls": source_urls or [],   # transient Replicate URLs, for debugging
+        "sha256": sha256 or {},        # output key -> digest of the bytes as they arrived
         "error": error,
         **(extra or {}),
     }
@@ -49,8 +49,8 @@ THE STORE IS THE ONLY ORIGIN
 Shots were server-side copies within the bucket. They are a download plus an
 upload now, so every shot's bytes travel through this process — for a scene that
 is video, and a 200 MB clip is the ordinary case. `assemble` says why the copy
-has to be real: a second node pointing at one blob is copy-on-write (#334), and
-the API's delete route destroys the shared bytes when either row goes. Nothing
+is a write: the API's blob-sharing copy keeps the source's name, and a shot is
+stored under a key the manifest chooses (`store.copy`). Nothing
 is fetched from outside, and no presigned URL is ever stored — `scene.json`
 holds paths, exactly as `request.json` does.
 
@@ -343,10 +343,10 @@ def assemble(project: str, scene_id: str, refs: tuple[str, ...] = (),
         # **This was a server-side `CopyObject` and is now a read plus a write**,
         # so the bytes travel through this process — and for a scene they are
         # video, which is the case `store.copy` says to reconsider before
-        # reaching for. It is accepted here for the reason the alternative is
-        # worse: a second node pointing at one blob is copy-on-write (#334), and
-        # the API's delete route destroys the shared bytes when either row goes.
-        # The upload is already local, so the extra cost is one PUT per shot.
+        # reaching for. It is accepted here because the API's blob-sharing copy
+        # keeps the source's name and a shot's key is the manifest's to choose
+        # (`store.copy`). The upload is already local, so the extra cost is one
+        # PUT per shot.
         store.upload(shot["shot_key"], pathlib.Path(lp),
                      content_type=mimetypes.guess_type(lp)[0] or "application/octet-stream")
         print(f"  shot {n}: {shot['run']}")
@@ -616,8 +616,8 @@ def run_board(ref: str, opts) -> int:
         # The run keeps its own output; the board holds a copy of the panel as it
         # was when approved. This was a server-side CopyObject and is now a read
         # and a write through the API, so the bytes travel through this process —
-        # see `store.copy`. A shared blob would have been cheaper and is #334's
-        # hazard, not this one's.
+        # see `store.copy`, which says why the API's blob-sharing copy does not
+        # fit a destination path.
         store.copy(src, dest, content_type="image/png")
         panel.update(run=f"{owner}/{run_id}", source_key=src, key=dest,
                      boarded=R._now(), stale=False)
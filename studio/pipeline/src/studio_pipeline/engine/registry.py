@@ -112,6 +112,31 @@ def field(entry: dict, path: str, default=None):
     return default if cur is None else cur
 
 
+#: How many predictions of one model a batch keeps in flight when its entry
+#: says nothing. Low on purpose: Replicate queues a burst rather than refusing
+#: it, so a higher number buys little wall time and spends the account's rate
+#: limit on one command.
+DEFAULT_CONCURRENCY = 4
+
+
+def concurrency(entry: dict) -> int:
+    """How many predictions of this model may run at once, from `concurrency`.
+
+    A batch (`character shoot --jobs`) asks for up to this many side by side and
+    no more, whatever its own worker count. It is a property of the model and
+    not of the command: a model that cold-boots on a single GPU gains nothing
+    from a second request but a place in its queue, and one the owner throttles
+    fails the extra ones outright.
+    """
+    value = field(entry, "concurrency", DEFAULT_CONCURRENCY)
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise RegistryError(
+            f"{entry.get('key', entry.get('model'))}: `concurrency` must be a positive "
+            f"integer, not {value!r}"
+        )
+    return value
+
+
 def accepts_ext(entry: dict) -> set[str]:
     """The image extensions this model will take, as a set."""
     return set(field(entry, "images.accepts_ext", []) or [])
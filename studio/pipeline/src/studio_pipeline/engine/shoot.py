@@ -15,6 +15,7 @@ dependency arrow `cli → domain → adapters` stays intact, and importing
     studio character shoot <name> --project <p> --dry-run     # nine payloads, no spend
     studio character shoot <name> --project <p> --group face
     studio character shoot <name> --project <p> --slot body_back --model nano-banana-pro
+    studio character shoot <name> --project <p> --jobs 6      # slots side by side
 
 NOTHING SUBMITS WITHOUT APPROVAL. Every payload is rendered as the two-document
 PROMPT / INPUT review first, and the batch then needs one explicit confirmation
@@ -54,11 +55,14 @@ TWO HUMAN GATES, AND WHY THEY ARE SEPARATE
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
 import os
 import pathlib
 import string
 import sys
+import threading
+import time
 from types import SimpleNamespace
 
 import click
@@ -607,6 +611,133 @@ def prepare(slot: dict, spec: dict, profile: dict, name: str, opts):
 # filing the result
 # --------------------------------------------------------------------------
 
+# --------------------------------------------------------------------------
+# running the slots
+# --------------------------------------------------------------------------
+
+class _SlotStream:
+    """`sys.stdout` or `sys.stderr` while slots run side by side.
+
+    `submit.execute` narrates as it goes — the run it recorded, each status the
+    poll sees, the JSON summary — and twelve of those written at once would be
+    one unreadable interleave. A worker thread registers a list to hold its
+    slot's writes, and they are replayed as one block once every earlier slot
+    has been shown. Any thread that registered nothing, the one driving the
+    shoot included, writes straight through.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, real) -> None:
+        self.real = real
+
+    @classmethod
+    def hold(cls, held: list | None) -> None:
+        cls._local.held = held
+
+    def write(self, text: str) -> int:
+        held = getattr(self._local, "held", None)
+        if held is None:
+            return self.real.write(text)
+        held.append((self.real, text))
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, "held", None) is None:
+            self.real.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.real, name)
+
+
+def _submit_slot(slot, entry, args, payload, bindings, token) -> str | None:
+    """One slot through `submit.execute`. Why it failed, or None when it rendered."""
+    try:
+        code = SUB.execute(entry, payload, bindings, token, args)
+        if code != 0:
+            raise SUB.SubmitError(f"exited {code}")
+    except (SUB.SubmitError, RA.ReplicateError) as exc:
+        print(f"  FAILED — {exc}", file=sys.stderr)
+        return str(exc)
+    return None
+
+
+def _submit_one_by_one(prepared, token) -> list[str | None]:
+    """Every slot in turn, narrating live. What `--jobs 1` means."""
+    outcomes = []
+    for slot, entry, args, payload, bindings in prepared:
+        print(f"\n----- {slot['id']} -----", file=sys.stderr)
+        outcomes.append(_submit_slot(slot, entry, args, payload, bindings, token))
+    return outcomes
+
+
+def _submit_side_by_side(prepared, token, jobs: int) -> list[str | None]:
+    """Up to `jobs` slots at once, each model held to its registry `concurrency`.
+
+    The wall time of a shoot is then close to its slowest prediction rather than
+    the sum of all of them: almost all of a slot is waiting on Replicate, and
+    waiting does not need a turn. The cap per model is taken alongside the
+    worker count rather than instead of it, because it is the model that
+    decides what a second request buys — see `registry.concurrency`.
+
+    Output stays in slot order. A line goes out as each slot settles so a long
+    shoot is visibly moving, and each slot's own narration follows as a block
+    once every slot before it has been shown. A failure is that slot's alone,
+    exactly as it is one by one. Anything else a slot raises is a bug rather
+    than a refusal, and it is raised once the others have finished and been
+    reported, so their spend is not lost from the screen.
+    """
+    limits = {
+        key: threading.BoundedSemaphore(min(jobs, REG.concurrency(entry)))
+        for key, entry in {p[1]["key"]: p[1] for p in prepared}.items()
+    }
+
+    def work(index: int):
+        slot, entry, args, payload, bindings = prepared[index]
+        held: list = []
+        _SlotStream.hold(held)
+        try:
+            with limits[entry["key"]]:
+                started = time.monotonic()
+                try:
+                    return _submit_slot(slot, entry, args, payload, bindings, token), None, \
+                        held, time.monotonic() - started
+                except Exception as exc:  # noqa: BLE001 — re-raised below, after the rest
+                    return str(exc), exc, held, time.monotonic() - started
+        finally:
+            _SlotStream.hold(None)
+
+    outcomes: list = [None] * len(prepared)
+    settled: dict[int, tuple] = {}
+    shown = 0
+    real_out, real_err = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _SlotStream(real_out), _SlotStream(real_err)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(jobs, len(prepared)), thread_name_prefix="shoot-slot",
+        ) as pool:
+            futures = {pool.submit(work, i): i for i in range(len(prepared))}
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                settled[index] = future.result()
+                why, _bug, _held, seconds = settled[index]
+                print(f"  [{len(settled)}/{len(prepared)}] {prepared[index][0]['id']}: "
+                      f"{'FAILED' if why else 'rendered'} after {seconds:.0f}s",
+                      file=sys.stderr)
+                while shown in settled:
+                    print(f"\n----- {prepared[shown][0]['id']} -----", file=sys.stderr)
+                    for stream, text in settled[shown][2]:
+                        stream.write(text)
+                    outcomes[shown] = settled[shown][0]
+                    shown += 1
+    finally:
+        sys.stdout, sys.stderr = real_out, real_err
+    bugs = [settled[i][1] for i in sorted(settled) if settled[i][1] is not None]
+    if bugs:
+        raise bugs[0]
+    return outcomes
+
+
 # --------------------------------------------------------------------------
 # the command
 # --------------------------------------------------------------------------
@@ -616,6 +747,8 @@ def run_shoot(name: str, opts) -> int:
     CHARACTER.check_name(name)
     opts.project = PROJ.require_project(opts.project)
 
+    if getattr(opts, "jobs", 1) < 1:
+        raise ShootError(f"--jobs must be at least 1, not {opts.jobs}.")
     spec = load_spec()
     slots = select_slots(spec, opts.group, tuple(opts.slot or ()))
     profile = CHARACTER.load_profile(name)
@@ -650,7 +783,10 @@ def run_shoot(name: str, opts) -> int:
     # GATE 1 — every payload, in full, before anything bills.
     sheet_cache: dict[str, str] = {}
     for slot, entry, args, payload, bindings in prepared:
-        run = f"{opts.project}/{R.new_run_id(args.slug)}"
+        # Named now, so the run shown here is the run that gets written and the
+        # shoot never has to ask which one it made — see `submit.execute`.
+        args.run_id = R.new_run_id(args.slug)
+        run = f"{opts.project}/{args.run_id}"
         print(f"\n===== slot {slot['id']}  ->  run output (NOT yet a reference) =====")
         print(SUB.render(entry, run, payload, bindings, False))
         if opts.review_sheet:
@@ -677,20 +813,16 @@ def run_shoot(name: str, opts) -> int:
     # live shoot six healthy slots because the refusing slot happened to sort
     # first: seven asked for, `0 slot(s) completed`. So every slot is attempted
     # and the failures are reported together at the end.
+    jobs = getattr(opts, "jobs", 1)
+    outcomes = (_submit_one_by_one(prepared, token) if jobs == 1 or len(prepared) == 1
+                else _submit_side_by_side(prepared, token, jobs))
     runrefs: dict[str, str] = {}
     failed: list[tuple[str, str]] = []
-    for slot, entry, args, payload, bindings in prepared:
-        print(f"\n----- {slot['id']} -----", file=sys.stderr)
-        try:
-            code = SUB.execute(entry, payload, bindings, token, args)
-            if code != 0:
-                raise SUB.SubmitError(f"exited {code}")
-        except (SUB.SubmitError, RA.ReplicateError) as exc:
-            print(f"  FAILED — {exc}", file=sys.stderr)
-            failed.append((slot["id"], str(exc)))
-            continue
-        _project, run_id = R.resolve_run(f"{opts.project}/latest", opts.project)
-        runrefs[slot["id"]] = f"{opts.project}/{run_id}#1"
+    for (slot, _entry, args, _payload, _bindings), why in zip(prepared, outcomes):
+        if why is None:
+            runrefs[slot["id"]] = f"{opts.project}/{args.run_id}#1"
+        else:
+            failed.append((slot["id"], why))
 
     # GATE 2 — the results stay in their runs. Putting a generated image into
     # `characters/<name>/reference/` changes who that character IS, and that is a
@@ -737,6 +869,9 @@ SHOOT_OPTIONS = [
                        "auto (seed when it has any).")),
     click.option("--identity-max", type=int, default=IDENTITY_MAX,
                  help=f"How many identity images to send per slot (default {IDENTITY_MAX})."),
+    click.option("--jobs", type=int, default=1,
+                 help=("Submit up to this many slots at once (default 1: one after "
+                       "another). Each model's registry `concurrency` caps it further.")),
     click.option("--model", help="Override the spec's model for every slot. See `models`."),
     # Comma-separated, not repeatable — same shape as `refs --pick`. Saying so
     # matters: repeating the flag is not an error, it just keeps the last one,
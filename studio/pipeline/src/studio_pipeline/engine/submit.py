@@ -11,8 +11,9 @@ here once:
                                                   failure is still history)
       -> presign at the last moment              (never stored)
       -> create the prediction                   (this is what bills)
-      -> poll                                    (never `Prefer: wait`)
-      -> archive the output into the run
+      -> poll, on the shared tracker             (never `Prefer: wait`)
+      -> archive the outputs into the run        (streamed, side by side,
+                                                  hashed on the way)
       -> record the result
 
 Every invariant the two originals defended is defended here, and the places
@@ -21,13 +22,17 @@ image may not be generated imageless by accident — are `KIND` below, not
 branches scattered through the flow.
 """
 
+import hashlib
 import json
 import os
+import shutil
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from studio_pipeline.adapters import replicate as RA
 from studio_pipeline.adapters import store
+from studio_pipeline.adapters import tracker as TRACK
 from studio_pipeline.domain import runs as R
 from studio_pipeline.engine import refs as REFS
 from studio_pipeline.engine import registry as REG
@@ -52,6 +57,12 @@ KIND = {
 }
 
 
+#: Outputs moved into the run at once. A video prediction returns up to four,
+#: and each one in flight is a socket to Replicate's delivery host and another
+#: to S3 — more if it is large enough to go up in parts.
+TRANSFERS = 4
+
+
 class SubmitError(Exception):
     """Anything that should stop the run before it bills."""
 
@@ -354,7 +365,10 @@ def execute(entry: dict, payload: dict, bindings: dict, token: str, args) -> int
     kind = entry["kind"]
     d = defaults(kind)
     project = args.project
-    run_id = R.new_run_id(args.slug)
+    # A caller that has to know which run it made names it up front. A shoot
+    # does: with slots running side by side, reading `latest` back afterwards
+    # answers with whichever slot happened to record last.
+    run_id = getattr(args, "run_id", None) or R.new_run_id(args.slug)
     run = f"{project}/{run_id}"
 
     prompt_source = json.load(open(args.prompt_json)) if getattr(args, "prompt_json", None) else None
@@ -383,22 +397,28 @@ def execute(entry: dict, payload: dict, bindings: dict, token: str, args) -> int
     if bindings:
         print(f"minted presigned URL(s) for {sorted(bindings)}", file=sys.stderr)
 
-    created = RA.create_prediction(entry["model"], payload, token)
+    polling = d["always_poll"] or getattr(args, "poll", False)
+    # The shared tracker: every prediction this process has in flight, on one
+    # schedule — a shoot's slots side by side, or a board's shots one by one.
+    tracker = TRACK.shared(token) if polling else None
+    created = RA.create_prediction(entry["model"], payload, token,
+                                   webhook=tracker.webhook if tracker else None)
     pid = created.get("id")
     if not pid:
         R.record_result(project, run_id, prediction_id=None, status="failed",
                         error="no prediction id returned")
         raise SubmitError(f"no prediction id returned: {json.dumps(created)[:400]}")
 
-    if not (d["always_poll"] or getattr(args, "poll", False)):
+    if not polling:
         print(json.dumps({"run": run, "id": pid, "status": created.get("status")}, indent=2))
         print("not polling — re-run with --poll, or archive later with the prediction id.",
               file=sys.stderr)
         return 0
 
+    watch = tracker.track(pid, model=entry["model"], interval=args.interval,
+                          timeout=args.timeout)
     try:
-        cur = RA.poll(pid, token, args.interval, args.timeout,
-                      on_status=lambda s: print(f"  {s}", file=sys.stderr))
+        cur = watch.wait(on_status=lambda s: print(f"  {s}", file=sys.stderr))
     except TimeoutError as e:
         R.record_result(project, run_id, prediction_id=pid, status="timeout", error=str(e))
         raise SubmitError(f"{e}; prediction {pid} may still be running.")
@@ -416,23 +436,94 @@ def execute(entry: dict, payload: dict, bindings: dict, token: str, args) -> int
         raise SubmitError("prediction succeeded but returned no output.")
 
     # --- the run OWNS its output; medium is an attribute, not a folder -------
-    staged = tempfile.mkdtemp(prefix=d["tmp"])
-    out_keys = []
-    for i, u in enumerate(urls, start=1):
-        ext = os.path.splitext(u.split("?")[0])[1] or d["default_ext"]
-        base = f"{R.slugify(args.slug)}{'' if len(urls) == 1 else f'-{i}'}{ext}"
-        local = RA.download(u, os.path.join(staged, base))
-        out_keys.append(R.upload_output(project, run_id, local, base))
-        if getattr(args, "dest", None):
-            os.makedirs(args.dest, exist_ok=True)
-            os.replace(local, os.path.join(args.dest, base))
-        else:
-            os.remove(local)
+    digests = archive(urls, project, run_id, args.slug, kind,
+                      dest=getattr(args, "dest", None))
+    out_keys = list(digests)
 
     R.record_result(project, run_id, prediction_id=pid, status="succeeded",
-                    outputs=out_keys, source_urls=urls)
+                    outputs=out_keys, source_urls=urls, sha256=digests)
     print(json.dumps({
         "run": run, "runref": f"{run}#1", "model": entry["model"],
         "status": "succeeded", "outputs": out_keys,
     }, indent=2))
     return 0
+
+
+def archive(urls: list[str], project: str, run_id: str, slug: str, kind: str, *,
+            dest: str | None = None) -> dict[str, str]:
+    """Move a prediction's outputs into its run: {output key: sha256}, in output order.
+
+    Up to `TRANSFERS` at once, each one streamed by `_transfer`. The names are
+    the slug, numbered when there is more than one, with the extension the URL
+    carries — or the medium's, for a URL that carries none. A failed transfer
+    raises once the others have finished, and nothing is recorded.
+    """
+    default_ext = defaults(kind)["default_ext"]
+    names = [f"{R.slugify(slug)}{'' if len(urls) == 1 else f'-{i}'}"
+             f"{os.path.splitext(u.split('?')[0])[1] or default_ext}"
+             for i, u in enumerate(urls, start=1)]
+    if dest:
+        os.makedirs(dest, exist_ok=True)
+    spool = defaults(kind)["tmp"]
+    with ThreadPoolExecutor(max_workers=min(len(urls), TRANSFERS)) as pool:
+        moved = list(pool.map(
+            lambda u, name: _transfer(u, project, run_id, name, dest=dest, spool=spool),
+            urls, names))
+    return dict(moved)
+
+
+class _Hashed:
+    """A readable that hashes what is read through it, and copies it to `copy` if given."""
+
+    def __init__(self, source, copy=None) -> None:
+        self.source = source
+        self.copy = copy
+        self.digest = hashlib.sha256()
+
+    def read(self, amount: int = -1) -> bytes:
+        chunk = self.source.read(amount)
+        self.digest.update(chunk)
+        if self.copy is not None:
+            self.copy.write(chunk)
+        return chunk
+
+
+def _transfer(url: str, project: str, run_id: str, name: str, *,
+              dest: str | None, spool: str) -> tuple[str, str]:
+    """One output, from Replicate's delivery host into the run. Returns (key, sha256).
+
+    Read off the response and written into the presigned PUT as it arrives, so a
+    four-output video is never on disk twice over — it used to be downloaded
+    whole, then read back to upload, one output after another. The digest is
+    taken on the way through, of exactly the bytes that were stored, and `dest`
+    gets its copy the same way: written beside the target and moved into place
+    once the store has the file, so a failed transfer leaves no half a video
+    that looks like a whole one.
+
+    The one thing a stream cannot do is sign a PUT before it knows its length.
+    Replicate's delivery sends `Content-Length`; a response that arrives without
+    one is spooled to an unnamed temporary file first, and sent from there.
+    """
+    target = os.path.join(dest, name) if dest else None
+    copy = open(f"{target}.part", "wb") if target else None
+    try:
+        with RA.open_output(url) as response:
+            hashed = _Hashed(response, copy)
+            length = response.headers.get("Content-Length")
+            if length is not None:
+                key = R.stream_output(project, run_id, hashed, name, size=int(length))
+            else:
+                with tempfile.TemporaryFile(prefix=spool) as spooled:
+                    shutil.copyfileobj(hashed, spooled)
+                    size = spooled.tell()
+                    spooled.seek(0)
+                    key = R.stream_output(project, run_id, spooled, name, size=size)
+    except BaseException:
+        if copy is not None:
+            copy.close()
+            os.remove(f"{target}.part")
+        raise
+    if copy is not None:
+        copy.close()
+        os.replace(f"{target}.part", target)
+    return key, hashed.digest.hexdigest()
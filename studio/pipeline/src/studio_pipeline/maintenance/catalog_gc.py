@@ -16,7 +16,7 @@ half the library.
 WHAT MAY BE COLLECTED IS AN ALLOWLIST
 -------------------------------------
 `COLLECTABLE_PREFIXES` names the three prefixes a blob has ever been written
-under. Everything else is left alone, referenced or not, and the list has to fail
+under, and `derived/`, where the API keeps the previews it makes of them. Everything else is left alone, referenced or not, and the list has to fail
 in that direction: `config/` and `phrasebook/` are shared material that sits
 outside the catalog deliberately (`catalog_seed.py` records no node for either),
 so no row will ever name one and a denylist would hold only until someone adds a
@@ -24,6 +24,11 @@ fourth kind of shared material. `config/pose/` holds the framing plates a
 reference shoot binds — collecting those is the most expensive mistake available
 here.
 
+A preview is `derived/<blob_key>/<width>.jpg`, and no row names it; it is
+referenced exactly when a row names the blob it was made of, which is read off
+its key (`source_of`). So it goes when its source has gone, and never before —
+the rule above, one step removed.
+
 Empty-folder markers are never collected either. They carry no bytes, no row
 names one, and deleting one destroys the only evidence that an empty folder
 exists.
@@ -41,9 +46,43 @@ A delete is a tombstone. The bucket is versioned and nothing here is granted
 `s3:DeleteObjectVersion`, so the bytes survive — but a tombstone still hides
 media from the app until someone restores it by hand, which is not the same as
 undoing a mistake.
+
+`--queue`: WHAT DELETES RELEASED, RATHER THAN EVERYTHING THAT EXISTS
+-------------------------------------------------------------------
+The pass above scans the whole table and lists the whole bucket, so it costs
+what the library holds however little has changed since it last ran. `--queue`
+costs what has been *deleted* since. The API's release of a blob — the
+conditional delete of its `BLOB#` count, in `services/catalog.py::_release` —
+puts the key on a `GCQ#<shard>` partition in the same transaction, and this
+mode reads those sixteen partitions instead of the table and the bucket:
+
+    counted      the key has a count again — re-referenced since its release.
+                 Taken off the queue; the next release queues it afresh.
+    gone         no bytes behind it. The API deleted them, as it nearly always
+                 does straight after a release. Taken off the queue.
+    kept         a marker, or outside the allowlist. Never collected, whatever
+                 queued it. Taken off the queue; the audit reports it.
+    QUEUED       released, uncounted and still in the bucket: the delete that
+                 should have followed the release failed or never ran.
+
+Each key is decided by a point read of its count and a `HeadObject`, never by
+its absence from a listing. **`--apply` here needs no dry run first**, and that
+is the difference between the modes rather than an exception to the rule
+above: the audit's input is an inference from absence that a person must read
+before it is acted on, and this mode's input is a record the API wrote at the
+moment the last reference went. It is meant to run unattended, and often.
+
+The queue trusts the counts, so it is only as good as they are. A key rows
+name and nothing counts reads as unreferenced here; the API never queues one
+another row still names — a copy of an uncounted key copies the bytes — but a
+row written by hand could. `studio catalog refs` sets the counts from the rows,
+and the full pass, which decides from the rows alone, stays the audit: run it
+on a schedule measured in weeks, and `--queue` on one measured in minutes.
 """
 from __future__ import annotations
 
+import hashlib
+
 import click
 
 from studio_pipeline.adapters import ddb as ddbc
@@ -67,7 +106,18 @@ from studio_pipeline.maintenance.catalog_seed import (
 # nothing in the package reads a bucket prefix any more — so the caveat is
 # dropped rather than kept as a warning about a knob that does not exist. The
 # listing below is still of the raw bucket, which is the part that mattered.
-COLLECTABLE_PREFIXES = ("blobs/", "characters/", "projects/")
+COLLECTABLE_PREFIXES = ("blobs/", "characters/", "projects/", "derived/")
+
+# `clients/aws/s3.py::DERIVED_PREFIX` in the API, spelled out for the reason
+# above. Nothing releases a preview through the queue — its source is what is
+# released — so only the full pass ever collects one.
+DERIVED_PREFIX = "derived/"
+
+# The queue's partitions, `GCQ#0` to `GCQ#f`. `services/catalog.py::
+# GC_QUEUE_SHARDS` is the writer's copy; spelled out here rather than imported,
+# as everything this package knows of the API's schema is. A shard missing from
+# this list is a queue nothing drains, which the audit pass still catches.
+QUEUE_SHARDS = "0123456789abcdef"
 
 # `DeleteObjects` takes a thousand keys and no more.
 BATCH = 1000
@@ -92,6 +142,13 @@ def referenced_keys(ddb) -> set[str]:
     return {item["blob_key"] for item in ddbc.scan(ddb) if item.get("blob_key")}
 
 
+def source_of(key: str) -> str:
+    """The key a row would name for this object to be referenced: its own, or a preview's source."""
+    if key.startswith(DERIVED_PREFIX) and key.count("/") >= 2:
+        return key[len(DERIVED_PREFIX):key.rindex("/")]
+    return key
+
+
 def survey(s3, referenced: set[str]) -> dict:
     """Every object in the bucket, sorted into exactly one bucket of reasons."""
     found = {"orphans": [], "referenced": [], "shared": [], "outside": [],
@@ -111,7 +168,7 @@ def survey(s3, referenced: set[str]) -> dict:
                 # The split below only makes the report say which kind it is.
                 (found["shared"] if key.startswith(SHARED_PREFIXES)
                  else found["outside"]).append(key)
-            elif key in referenced:
+            elif source_of(key) in referenced:
                 found["referenced"].append(key)
             else:
                 found["orphans"].append(key)
@@ -159,16 +216,135 @@ def collect(s3, keys: list[str]) -> dict:
     return {"deleted": sorted(deleted), "failed": failed}
 
 
+def queued(ddb) -> list[dict]:
+    """Every key on the queue, with the `queued_at` its release wrote."""
+    entries = []
+    for shard in QUEUE_SHARDS:
+        for item in ddbc.query(ddb, f"GCQ#{shard}"):
+            entries.append({"blob_key": item["sk"], "queued_at": item.get("queued_at")})
+    return sorted(entries, key=lambda entry: entry["blob_key"])
+
+
+def _shard(blob_key: str) -> str:
+    return hashlib.md5(blob_key.encode()).hexdigest()[0]
+
+
+def _counted(ddb, blob_key: str) -> bool:
+    item = ddb.get_item(TableName=ddbc.table(), ConsistentRead=True,
+                        Key=ddbc.to_item({"pk": f"BLOB#{blob_key}", "sk": "META"})).get("Item")
+    return item is not None and ddbc.from_item(item).get("refs", 0) > 0
+
+
+def _size(s3, blob_key: str) -> int | None:
+    """The object's size, or None when nothing is there to delete."""
+    try:
+        return s3.head_object(Bucket=s3c.bucket(), Key=blob_key).get("ContentLength", 0)
+    except s3.exceptions.ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+
+
+def triage(s3, ddb, entries: list[dict]) -> dict:
+    """Each queued key, sorted into exactly one bucket of reasons.
+
+    The allowlist first, for the reason `survey` tests it first; then the count,
+    so a re-referenced key is never so much as looked for in the bucket.
+    """
+    found = {"queued": [], "counted": [], "gone": [], "kept": [], "sizes": {}}
+    for entry in entries:
+        blob_key = entry["blob_key"]
+        if blob_key.endswith("/") or not blob_key.startswith(COLLECTABLE_PREFIXES):
+            found["kept"].append(entry)
+        elif _counted(ddb, blob_key):
+            found["counted"].append(entry)
+        elif (size := _size(s3, blob_key)) is None:
+            found["gone"].append(entry)
+        else:
+            found["sizes"][blob_key] = size
+            found["queued"].append(entry)
+    return found
+
+
+def dequeue(ddb, entries: list[dict]) -> int:
+    """Take these off the queue; how many were still as this run read them.
+
+    Conditional on `queued_at`, one transaction each, so a key released again
+    after this run read it — counted, then released by another delete — keeps
+    the newer entry and is looked at afresh next run.
+    """
+    taken = 0
+    for entry in entries:
+        key = ddbc.to_item({"pk": f"GCQ#{_shard(entry['blob_key'])}", "sk": entry["blob_key"]})
+        taken += ddbc.transact(ddb, [{"Delete": {
+            "TableName": ddbc.table(), "Key": key,
+            "ConditionExpression": "queued_at = :seen",
+            "ExpressionAttributeValues": ddbc.to_item({":seen": entry["queued_at"]})}}])
+    return taken
+
+
+def report_queue(found: dict) -> None:
+    print(f"{'counted':<12} {len(found['counted']):>6}  re-referenced since its release")
+    print(f"{'gone':<12} {len(found['gone']):>6}  released and already deleted by the API")
+    print(f"{'kept':<12} {len(found['kept']):>6}  a marker, or under none of "
+          f"{', '.join(COLLECTABLE_PREFIXES)} — never collected")
+    print(f"{'QUEUED':<12} {len(found['queued']):>6}  "
+          f"{sum(found['sizes'].values()):,} bytes, released and still in the bucket")
+    for entry in found["queued"][:SHOWN]:
+        print(f"             {entry['blob_key']}")
+    if len(found["queued"]) > SHOWN:
+        print(f"             … and {len(found['queued']) - SHOWN} more")
+
+
+def drain(s3, ddb, *, apply: bool, journal: str | None) -> None:
+    """`--queue`: decide each released key by point reads, and collect what is left."""
+    found = triage(s3, ddb, queued(ddb))
+    print(f"[{'APPLY' if apply else 'dry run'}] bucket {s3c.bucket()}, "
+          f"table {ddbc.table()}, GC queue\n")
+    report_queue(found)
+    if not apply:
+        print("\nnothing deleted. `--queue --apply` removes what is QUEUED above.")
+        return
+
+    res = collect(s3, [entry["blob_key"] for entry in found["queued"]])
+    deleted = set(res["deleted"])
+    # A key whose delete failed stays queued, and is the next run's to try.
+    settled = found["counted"] + found["gone"] + found["kept"] + [
+        entry for entry in found["queued"] if entry["blob_key"] in deleted]
+    taken = dequeue(ddb, settled)
+    print(f"\n{'deleted':<12} {len(res['deleted']):>6}  tombstoned; the versions remain")
+    print(f"{'dequeued':<12} {taken:>6}")
+    for entry in res["failed"]:
+        print(f"FAILED       {entry}")
+
+    jpath = journal_path(journal)
+    doc = load_journal(jpath)
+    doc["gc_queue"] = {"bucket": s3c.bucket(), "table": ddbc.table(),
+                       "deleted": res["deleted"], "failed": res["failed"],
+                       "counted": [entry["blob_key"] for entry in found["counted"]],
+                       "kept": [entry["blob_key"] for entry in found["kept"]]}
+    save_journal(jpath, doc)
+    print(f"journal: {jpath}")
+    if res["failed"]:
+        raise SystemExit(1)
+
+
 @click.command("gc", help=__doc__,
                short_help="delete blobs no node references (dry run by default)")
 @click.option("--apply", is_flag=True, help="actually do it (default is a dry run)")
 @click.option("--journal", help="journal file name (default: the newest)")
-def cmd_gc(apply, journal):
+@click.option("--queue", is_flag=True,
+              help="collect only what deletes released since the last run, "
+                   "rather than auditing the whole bucket")
+def cmd_gc(apply, journal, queue):
     """List the blobs nothing references; remove them with `--apply`."""
     ddb = ddbc.client()
     if not ddbc.table_exists(ddb):
         die(f"no table '{ddbc.table()}' — the references live in it. Apply the "
             "infra first, or set STUDIO_CATALOG_TABLE.")
+    if queue:
+        drain(s3c.client(), ddb, apply=apply, journal=journal)
+        return
 
     referenced = referenced_keys(ddb)
     # The guard that matters most, and the cheapest. An empty or wrong table
@@ -0,0 +1,195 @@
+"""`studio catalog listing` — check the by-parent items against the records.
+
+A node is two items: `NODE#<node_id>`/`META`, the record, and
+`NODE#<parent_id>`/`NAME#<name>`, the by-parent item a folder listing reads.
+The second carries a copy of what a listing renders — `kind`, `created_at`,
+`blob_key`, `size`, `content_type`, `updated_at` — so the folder view is one
+query instead of a query and a batched read of every record. A copy can drift,
+and this is the command that says whether it has.
+
+**THE RECORD IS RIGHT.** Every difference is reported as the by-parent item
+being wrong, and `--apply` copies the record's values onto it and never the
+other way round. The API writes both halves in one transaction, so drift means
+a row was written by hand, by a tool that predates the projection, or by a
+write path that forgot the second half — and in every one of those the record
+is the half that was written on purpose.
+
+WHAT IT REPORTS
+---------------
+    unlisted     a by-parent item with no `updated_at`: written before the
+                 listing fields were projected. The API reads the record for
+                 these, so they are slow rather than wrong. `--apply` fills
+                 them in — this is the backfill.
+    drift        a listed field, or `lib` or `path`, that differs from the
+                 record. Wrong in every folder view until repaired.
+    misplaced    a by-parent item whose partition or name disagrees with the
+                 record's `parent_id` or `name` — a move or rename half-done.
+    no_record    a by-parent item naming a node with no record.
+    no_index     a record, not a library root, with no by-parent item.
+
+Only `unlisted` and `drift` are repaired. The other three are a node in two
+places or in none, and which place is right is a question for a person; the
+API's own `move_node` and `delete_node` are the tools for the answer.
+
+A repair is a transaction that checks the record's `updated_at` is still the one
+this scan read. An API write landing between the scan and the repair makes the
+check fail, and that item is reported as `moved on` and left for the next run
+rather than overwritten with what the record said a moment ago.
+"""
+from __future__ import annotations
+
+import click
+
+from studio_pipeline.adapters import ddb as ddbc
+from studio_pipeline.errors import die
+
+# What the by-parent item copies from the record, and what a difference in is
+# `drift`. The same list as `services/catalog.py` in the backend — its
+# `LISTED_FIELDS` plus the three that were always there — spelled out rather
+# than imported, because the pipeline does not import the API.
+COPIED_FIELDS = ("lib", "kind", "path", "created_at",
+                 "blob_key", "size", "content_type", "updated_at")
+
+# Enough of each list to judge it by.
+SHOWN = 20
+
+
+def survey(ddb) -> dict:
+    """Every by-parent item sorted into what is wrong with it, from one scan.
+
+    A scan rather than per-folder queries, for the reason `catalog_seed.verify`
+    scans: the point is to find rows the API's own reads would not.
+    """
+    metas, names = {}, []
+    for item in ddbc.scan(ddb):
+        pk, sk = item.get("pk", ""), item.get("sk", "")
+        if not pk.startswith("NODE#"):
+            continue
+        if sk == "META":
+            metas[item["node_id"]] = item
+        elif sk.startswith("NAME#"):
+            names.append(item)
+
+    found = {"unlisted": [], "drift": [], "misplaced": [], "no_record": [],
+             "no_index": [], "ok": 0}
+    listed = set()
+    for item in names:
+        node_id = item.get("node_id")
+        record = metas.get(node_id)
+        where = f"{item['pk']}/{item['sk']}"
+        if record is None:
+            found["no_record"].append(where)
+            continue
+        listed.add(node_id)
+        if (item["pk"] != f"NODE#{record.get('parent_id')}"
+                or item["sk"] != f"NAME#{record.get('name')}"):
+            found["misplaced"].append(f"{where}: record says "
+                                      f"{record.get('parent_id')}/{record.get('name')}")
+            continue
+        fields = [field for field in COPIED_FIELDS if item.get(field) != record.get(field)]
+        if not fields:
+            found["ok"] += 1
+            continue
+        entry = {"pk": item["pk"], "sk": item["sk"], "node_id": node_id,
+                 "fields": fields, "record": record}
+        found["unlisted" if "updated_at" not in item else "drift"].append(entry)
+
+    for node_id, record in metas.items():
+        if record.get("parent_id") and node_id not in listed:
+            found["no_index"].append(node_id)
+    for reason in ("misplaced", "no_record", "no_index"):
+        found[reason].sort()
+    return found
+
+
+def repair_action(entry: dict) -> list[dict]:
+    """The transaction that copies the record onto one by-parent item.
+
+    `SET` for what the record has and `REMOVE` for what it does not — a size
+    the record has lost is a size the listing must lose too. Guarded twice: the
+    record must still carry the `updated_at` the scan read, and the by-parent
+    item must still exist, so a repair never resurrects a renamed-away name.
+    """
+    record = entry["record"]
+    names, values, sets, removes = {}, {}, [], []
+    for index, field in enumerate(COPIED_FIELDS):
+        names[f"#{index}"] = field
+        if record.get(field) is None:
+            removes.append(f"#{index}")
+        else:
+            values[f":{index}"] = record[field]
+            sets.append(f"#{index} = :{index}")
+    expression = "SET " + ", ".join(sets)
+    if removes:
+        expression += " REMOVE " + ", ".join(removes)
+    check = {"TableName": ddbc.table(),
+             "Key": ddbc.to_item({"pk": f"NODE#{entry['node_id']}", "sk": "META"})}
+    if record.get("updated_at") is None:
+        check["ConditionExpression"] = "attribute_exists(pk) AND attribute_not_exists(updated_at)"
+    else:
+        check["ConditionExpression"] = "updated_at = :seen"
+        check["ExpressionAttributeValues"] = ddbc.to_item({":seen": record["updated_at"]})
+    return [
+        {"ConditionCheck": check},
+        {"Update": {
+            "TableName": ddbc.table(),
+            "Key": ddbc.to_item({"pk": entry["pk"], "sk": entry["sk"]}),
+            "UpdateExpression": expression,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": ddbc.to_item(values),
+            "ConditionExpression": "attribute_exists(pk)",
+        }},
+    ]
+
+
+def repair(ddb, entries: list[dict]) -> dict:
+    """Copy each record onto its by-parent item; one transaction per item."""
+    repaired, moved_on = [], []
+    for entry in entries:
+        wrote = ddbc.transact(ddb, repair_action(entry))
+        (repaired if wrote else moved_on).append(entry["node_id"])
+    return {"repaired": repaired, "moved_on": moved_on}
+
+
+def report(found: dict) -> None:
+    print(f"{'ok':<12} {found['ok']:>6}  by-parent item agrees with its record")
+    for reason, note in (("unlisted", "written before the listing fields — slow, not wrong"),
+                         ("drift", "a copied field differs from the record")):
+        print(f"{reason:<12} {len(found[reason]):>6}  {note}")
+        for entry in found[reason][:SHOWN]:
+            print(f"             {entry['pk']}/{entry['sk']}: {', '.join(entry['fields'])}")
+        if len(found[reason]) > SHOWN:
+            print(f"             … and {len(found[reason]) - SHOWN} more")
+    for reason, note in (("misplaced", "partition or name disagrees — not repaired"),
+                         ("no_record", "names a node with no record — not repaired"),
+                         ("no_index", "a record nothing lists — not repaired")):
+        print(f"{reason:<12} {len(found[reason]):>6}  {note}")
+        for line in found[reason][:SHOWN]:
+            print(f"             {line}")
+
+
+@click.command("listing", help=__doc__,
+               short_help="check by-parent items against their records (dry run by default)")
+@click.option("--apply", is_flag=True, help="actually do it (default is a dry run)")
+def cmd_listing(apply):
+    """Report listing drift; copy the records across with `--apply`."""
+    ddb = ddbc.client()
+    if not ddbc.table_exists(ddb):
+        die(f"no table '{ddbc.table()}'. Apply the infra first, or set "
+            "STUDIO_CATALOG_TABLE.")
+
+    found = survey(ddb)
+    print(f"[{'APPLY' if apply else 'dry run'}] table {ddbc.table()}\n")
+    report(found)
+
+    stale = found["unlisted"] + found["drift"]
+    if not apply:
+        if stale:
+            print(f"\nnothing written. `--apply` copies {len(stale)} record(s) "
+                  "onto their by-parent items.")
+        return
+
+    res = repair(ddb, stale)
+    print(f"\n{'repaired':<12} {len(res['repaired']):>6}")
+    print(f"{'moved on':<12} {len(res['moved_on']):>6}  written by the API since "
+          "the scan — run again")
@@ -0,0 +1,149 @@
+"""`studio catalog refs` — rebuild the blob reference counts from the rows.
+
+A copy made through the API shares its source's blob rather than copying the
+bytes, and the table keeps one `BLOB#<blob_key>`/`META` item per blob holding
+`refs`: how many node records name that key. The API moves the count in the
+same transaction as the rows that change it, so a delete can tell whether it
+took the last reference and the bytes may go. This is the command that says
+whether the counts still agree with the rows, and sets them from the rows when
+they do not.
+
+**THE ROWS ARE RIGHT.** A count is derived — the number of `NODE#…`/`META`
+items carrying that `blob_key` — and `--apply` writes that number and never
+reasons the other way. Counts are wrong when rows arrive without them: the
+seed writes straight into the table, and every row written before the counts
+existed has none.
+
+**An uncounted key is safe, not broken.** The API never shares one — a copy of
+it copies the bytes — and deleting its row releases it, which is what every
+delete did before there were counts. It only costs a `CopyObject` per copy.
+Run this after `studio catalog seed --apply`, and once after the first deploy
+with counts, so those copies share too.
+
+WHAT IT REPORTS
+---------------
+    uncounted    a key rows name with no count at all. `--apply` writes one.
+    wrong        a count that differs from the rows naming its key.
+                 `--apply` sets it to what the rows say.
+    stale        a count no row's key matches — left by a delete interrupted
+                 between removing its rows and releasing the key, or by a row
+                 removed by hand. `--apply` deletes the count. The bytes are
+                 `studio catalog gc`'s, which decides from the rows alone.
+
+Every write is conditional on the count this scan read — `refs` still equal to
+it, or the item still absent — so an API write landing between the scan and the
+repair makes the condition fail, and that key is reported as `moved on` and
+left for the next run rather than overwritten with a number that is already
+out of date.
+"""
+from __future__ import annotations
+
+import collections
+
+import click
+
+from studio_pipeline.adapters import ddb as ddbc
+from studio_pipeline.errors import die
+
+PREFIX = "BLOB#"
+
+# Enough of each list to judge it by.
+SHOWN = 20
+
+
+def survey(ddb) -> dict:
+    """Every blob key sorted by whether its count agrees with the rows, from one scan.
+
+    Only node *records* count. The by-parent item carries `blob_key` too, as a
+    listing copy, and counting it would double every key; a job row and a
+    library row carry none.
+    """
+    named: collections.Counter = collections.Counter()
+    counts: dict[str, int] = {}
+    for item in ddbc.scan(ddb):
+        pk, sk = item.get("pk", ""), item.get("sk", "")
+        if pk.startswith(PREFIX) and sk == "META":
+            counts[pk[len(PREFIX):]] = item.get("refs", 0)
+        elif pk.startswith("NODE#") and sk == "META" and item.get("blob_key"):
+            named[item["blob_key"]] += 1
+
+    found = {"uncounted": [], "wrong": [], "stale": [], "ok": 0}
+    for blob_key, refs in sorted(named.items()):
+        if blob_key not in counts:
+            found["uncounted"].append({"blob_key": blob_key, "refs": refs, "seen": None})
+        elif counts[blob_key] != refs:
+            found["wrong"].append({"blob_key": blob_key, "refs": refs,
+                                   "seen": counts[blob_key]})
+        else:
+            found["ok"] += 1
+    for blob_key, seen in sorted(counts.items()):
+        if blob_key not in named:
+            found["stale"].append({"blob_key": blob_key, "refs": 0, "seen": seen})
+    return found
+
+
+def repair_action(entry: dict) -> list[dict]:
+    """The one-item transaction that sets a count to what the rows say.
+
+    A put for a key the rows name and a delete for one they do not, each
+    guarded by the value the scan read.
+    """
+    key = ddbc.to_item({"pk": f"{PREFIX}{entry['blob_key']}", "sk": "META"})
+    if entry["seen"] is None:
+        guard = {"ConditionExpression": "attribute_not_exists(pk)"}
+    else:
+        guard = {"ConditionExpression": "refs = :seen",
+                 "ExpressionAttributeValues": ddbc.to_item({":seen": entry["seen"]})}
+    if entry["refs"] == 0:
+        return [{"Delete": {"TableName": ddbc.table(), "Key": key, **guard}}]
+    return [{"Put": {"TableName": ddbc.table(),
+                     "Item": {**key, **ddbc.to_item({"refs": entry["refs"]})},
+                     **guard}}]
+
+
+def repair(ddb, entries: list[dict]) -> dict:
+    """Set each count from the rows; one transaction per key."""
+    repaired, moved_on = [], []
+    for entry in entries:
+        wrote = ddbc.transact(ddb, repair_action(entry))
+        (repaired if wrote else moved_on).append(entry["blob_key"])
+    return {"repaired": repaired, "moved_on": moved_on}
+
+
+def report(found: dict) -> None:
+    print(f"{'ok':<12} {found['ok']:>6}  count agrees with the rows naming its key")
+    for reason, note in (("uncounted", "rows name it, nothing counts it — copies copy bytes"),
+                         ("wrong", "count differs from the rows naming its key"),
+                         ("stale", "a count no row's key matches")):
+        print(f"{reason:<12} {len(found[reason]):>6}  {note}")
+        for entry in found[reason][:SHOWN]:
+            seen = "none" if entry["seen"] is None else entry["seen"]
+            print(f"             {entry['blob_key']}: {seen} -> {entry['refs']}")
+        if len(found[reason]) > SHOWN:
+            print(f"             … and {len(found[reason]) - SHOWN} more")
+
+
+@click.command("refs", help=__doc__,
+               short_help="rebuild blob reference counts from the rows (dry run by default)")
+@click.option("--apply", is_flag=True, help="actually do it (default is a dry run)")
+def cmd_refs(apply):
+    """Report count drift; set the counts from the rows with `--apply`."""
+    ddb = ddbc.client()
+    if not ddbc.table_exists(ddb):
+        die(f"no table '{ddbc.table()}'. Apply the infra first, or set "
+            "STUDIO_CATALOG_TABLE.")
+
+    found = survey(ddb)
+    print(f"[{'APPLY' if apply else 'dry run'}] table {ddbc.table()}\n")
+    report(found)
+
+    stale = found["uncounted"] + found["wrong"] + found["stale"]
+    if not apply:
+        if stale:
+            print(f"\nnothing written. `--apply` sets {len(stale)} count(s) from the rows.")
+        return
+
+    res = repair(ddb, stale)
+    print(f"\n{'repaired':<12} {len(res['repaired']):>6}")
+    print(f"{'moved on':<12} {len(res['moved_on']):>6}  written by the API since "
+          "the scan — run again")
@@ -350,15 +350,20 @@ def meta_item(node: dict) -> dict:
 def index_item(node: dict) -> dict:
     """`NODE#<parent_id>` / `NAME#<name>` — the by-parent listing item.
 
-    Deliberately narrow: `node_id, lib, kind, path, created_at` and nothing
-    else. `size` and `content_type` are mutable, so duplicating them here would
-    put every rename, move and text edit in the business of keeping two copies
-    in step. A listing that wants file metadata queries children and then
-    `BatchGetItem`s the `META` rows — 1 + ceil(n/100) round trips, not an N+1.
+    `node_id, lib, kind, path, created_at`, and then a copy of what a folder
+    listing renders — `blob_key`, `size`, `content_type`, `updated_at` — so the
+    API lists a folder in one query rather than a query and a `BatchGetItem` of
+    the `META` rows. The API keeps the copy in step on every write;
+    `catalog_listing.py` is the check that it has, and the backfill for items
+    this command wrote before it projected them.
     """
-    return {"pk": f"NODE#{node['parent_id']}", "sk": f"NAME#{node['name']}",
+    item = {"pk": f"NODE#{node['parent_id']}", "sk": f"NAME#{node['name']}",
             "node_id": node["node_id"], "lib": node["lib"], "kind": node["kind"],
             "path": node["path"], "created_at": node["created_at"]}
+    for field in ("blob_key", "size", "content_type", "updated_at"):
+        if node.get(field) is not None:
+            item[field] = node[field]
+    return item
 
 
 def already_seeded(ddb, lib: str) -> tuple[bool, set[str]]:
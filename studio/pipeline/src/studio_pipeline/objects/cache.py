@@ -0,0 +1,63 @@
+"""`studio cache` — the local copies of files this machine has already fetched.
+
+  studio cache stats
+  studio cache prune --max-mb 500
+  studio cache prune --all
+
+Reads go through a blob cache under ~/.cache/andreas-services/studio/blobs,
+named by each file's version and kept least recently used first under
+STUDIO_BLOB_CACHE_MB (2048 unless set; 0 turns it off). `stats` says how full
+it is; `prune` evicts down to --max-mb, or the limit, or with --all to nothing.
+Deleting the directory by hand is as safe — it is a cache, and holds nothing
+the library does not.
+"""
+import json
+
+import click
+
+from studio_pipeline.adapters import blobs, store
+
+
+def _cache() -> blobs.Blobs:
+    cache = store.blob_cache()
+    if cache is None:
+        raise click.ClickException("the blob cache is off (STUDIO_BLOB_CACHE_MB=0).")
+    return cache
+
+
+def _mib(size: int) -> str:
+    return f"{size / 1048576:.1f} MiB"
+
+
+@click.group(help=__doc__)
+def main():
+    pass
+
+
+@main.command("stats")
+@click.option("--json", "json_", is_flag=True, help="Emit JSON instead of text.")
+def do_stats(json_):
+    """How many files the cache holds, and how much of its limit they take."""
+    stats = _cache().stats()
+    if json_:
+        print(json.dumps(stats, indent=2))
+        return
+    print(f"{stats['dir']}\n"
+          f"  {stats['blobs']} blob(s) for {stats['entries']} file version(s), "
+          f"{_mib(stats['bytes'])} of {_mib(stats['limit_bytes'])}")
+
+
+@main.command("prune")
+@click.option("--all", "all_", is_flag=True, help="Empty the cache.")
+@click.option("--json", "json_", is_flag=True, help="Emit JSON instead of text.")
+@click.option("--max-mb", type=float, help="Evict down to this many MiB (default: the limit).")
+def do_prune(all_, json_, max_mb):
+    """Evict the least recently read files until the cache fits."""
+    cache = _cache()
+    keep = 0 if all_ else int(max_mb * 1048576) if max_mb is not None else cache.limit
+    pruned = cache.prune(keep)
+    if json_:
+        print(json.dumps(pruned, indent=2))
+        return
+    print(f"evicted {pruned['evicted']} blob(s), freed {_mib(pruned['freed_bytes'])}; "
+          f"{_mib(pruned['bytes'])} left")
@@ -56,6 +56,38 @@ def _no_live_dynamodb():
         yield
 
 
+@pytest.fixture(autouse=True)
+def _no_remembered_paths(monkeypatch, tmp_path_factory):
+    """Every test starts with `store`'s path cache empty and nothing on disk.
+
+    The cache lives for the process, and the process here is the whole suite: a
+    path one test's fake API answered would otherwise be the answer in the next
+    test's, with a node id that fake never issued.
+    """
+    from studio_pipeline.adapters import store as _store
+
+    monkeypatch.setattr(_store, "CACHE_DIR", tmp_path_factory.mktemp("cache"))
+    monkeypatch.delenv("STUDIO_PATH_CACHE_TTL_SECONDS", raising=False)
+    _store.forget()
+    yield
+    _store.forget()
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_tracker():
+    """Every test gets a fresh prediction tracker, and none outlives it.
+
+    `tracker.shared` is one per process for the same reason the path cache is,
+    and a tracker made under one test's fake Replicate — its webhook listener
+    bound, its scheduler thread running — has no business in the next.
+    """
+    from studio_pipeline.adapters import tracker as _tracker
+
+    _tracker.close_shared()
+    yield
+    _tracker.close_shared()
+
+
 def _json(doc: dict) -> bytes:
     """A fixture record, built rather than hand-concatenated.
 
@@ -329,6 +361,32 @@ def _aim_store_at(s3, monkeypatch):
         ]
         return entries
 
+    def _descendants(path):
+        """`GET /api/nodes/<id>/descendants`, from one undelimited listing.
+
+        The one place S3 is the better fit: a prefix listing IS a subtree. What
+        it lacks is folders, so each is made up from the keys beneath it and
+        handed out before the first of them, the parents-first order the route
+        promises. A prefix with nothing under it is a folder that is not there,
+        which yields nothing, as the real one does.
+        """
+        clean = path.strip("/")
+        prefix = clean + "/" if clean else ""
+        seen = set()
+        for page in s3.get_paginator("list_objects_v2").paginate(Bucket=BUCKET, Prefix=prefix):
+            for item in page.get("Contents", []):
+                if item["Key"].endswith("/"):
+                    continue
+                parts = item["Key"][len(prefix):].split("/")
+                for depth in range(1, len(parts)):
+                    folder = prefix + "/".join(parts[:depth])
+                    if folder not in seen:
+                        seen.add(folder)
+                        yield {"id": folder, "name": parts[depth - 1], "kind": "folder",
+                               "path": folder}
+                yield {"id": item["Key"], "name": parts[-1], "kind": "file",
+                       "size": item["Size"], "path": item["Key"]}
+
     def _read(path):
         """Bytes, or `api.NotFound` — the failure the real store raises.
 
@@ -357,6 +415,11 @@ def _aim_store_at(s3, monkeypatch):
     def _upload(path, source, *, content_type):
         return _write(path, pathlib.Path(source).read_bytes(), content_type=content_type)
 
+    def _stream(path, source, *, size, content_type):
+        body = source.read(size)
+        assert len(body) == size and not source.read(1), "the source broke its promise"
+        return _write(path, body, content_type=content_type)
+
     def _copy(source, destination, *, content_type):
         return _write(destination, _read(source), content_type=content_type)
 
@@ -440,6 +503,15 @@ def _aim_store_at(s3, monkeypatch):
 
     monkeypatch.setattr(_api, "patch", _move_or_rename)
     monkeypatch.setattr(_api, "delete", _delete)
+    def _resolve_many(paths):
+        found = {}
+        for path in paths:
+            try:
+                found[path] = _resolve(path)
+            except _api.NotFound:
+                found[path] = None
+        return found
+
     def _shared_read(key):
         """Shared material, addressed by key.
 
@@ -455,8 +527,11 @@ def _aim_store_at(s3, monkeypatch):
         return _presign(key, disposition=disposition)
 
     for name, value in [
-        ("resolve", _resolve), ("children", _children), ("read", _read),
+        ("resolve", _resolve), ("resolve_many", _resolve_many),
+        ("children", _children), ("descendants", _descendants),
+        ("read", _read),
         ("download", _download), ("write", _write), ("upload", _upload),
+        ("stream", _stream),
         ("copy", _copy), ("exists", _exists), ("size", _size), ("presign", _presign),
         ("folder", _folder), ("shared_read", _shared_read),
         ("shared_presign", _shared_presign),
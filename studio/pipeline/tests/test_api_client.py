@@ -1,38 +1,88 @@
 """`adapters/api` — the one transport every CLI call goes through (#301).
 
-**Stubbed at `urlopen`, not at `_send`.** Stubbing the private sender would skip
-the half most likely to be wrong: `urllib` raises `HTTPError` for any 4xx/5xx, and
-that exception *is* the response — letting it close unread throws away the only
-message the API sent. These tests drive that path.
+**Stubbed at the connection, not at `_send`.** Stubbing the private sender would
+skip the half most likely to be wrong: reading an error's body before the
+connection is reused, handing a connection back only when the answer is whole,
+and telling a stale pooled connection from an API that is not there. These tests
+drive that path through a fake `http.client` connection; the last few drive it
+against a real local server, because what they assert is how many sockets it
+took.
 """
 
 from __future__ import annotations
 
-import io
+import http.client
+import http.server
 import json
-import urllib.error
+import threading
+import urllib.request
 
 import pytest
 
 from studio_pipeline.adapters import api, auth
 
 
-class _Response(io.BytesIO):
+class _Response:
     """The subset of an `http.client.HTTPResponse` that `_send` touches."""
 
-    def __init__(self, status: int, body: bytes) -> None:
-        super().__init__(body)
+    def __init__(
+        self, status: int, body: bytes, etag: str | None = None, *, will_close: bool = False
+    ) -> None:
         self.status = status
+        self.body = body
+        self.etag = etag
+        self.will_close = will_close
 
-    def __enter__(self):
-        return self
+    def read(self) -> bytes:
+        return self.body
 
-    def __exit__(self, *_):
-        return False
+    def getheader(self, name: str) -> str | None:
+        return self.etag if name == "ETag" else None
 
 
-def _http_error(status: int, body: bytes) -> urllib.error.HTTPError:
-    return urllib.error.HTTPError("https://x/api/nodes", status, "err", {}, io.BytesIO(body))
+class _Connection:
+    """One fake connection, answering from a queue shared by every connection."""
+
+    def __init__(self, scheme, host, queue, seen):
+        self.scheme, self.host = scheme, host
+        self.queue, self.seen = queue, seen
+        self.closed = False
+        self._pending = None
+
+    def request(self, method, target, body=None, headers=None):
+        item = self.queue.pop(0)
+        if isinstance(item, BaseException):
+            raise item
+        # Recorded as a `Request` so assertions read headers the way `urllib`
+        # spelled them when this was the transport.
+        self.seen.append(
+            urllib.request.Request(
+                f"{self.scheme}://{self.host}{target}", data=body, headers=headers or {},
+                method=method,
+            )
+        )
+        self._pending = item
+
+    def getresponse(self):
+        return self._pending
+
+    def close(self):
+        self.closed = True
+
+
+class _Seen(list):
+    """The requests sent, and `connections`: every connection opened, in order."""
+
+    def __init__(self):
+        super().__init__()
+        self.connections = []
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    api.disconnect()
+    yield
+    api.disconnect()
 
 
 @pytest.fixture(autouse=True)
@@ -49,22 +99,22 @@ def _signed_in(monkeypatch):
     monkeypatch.setattr(auth, "id_token", _id_token)
     monkeypatch.setattr(auth, "api_url", lambda: "https://studio-api.example")
     monkeypatch.delenv("STUDIO_LIBRARY_ID", raising=False)
-    return calls
+    api.forget()
+    yield calls
+    api.forget()
 
 
 def _serve(monkeypatch, *responses):
     """Answer successive calls with the given responses; record the requests."""
-    seen = []
+    seen = _Seen()
     queue = list(responses)
 
-    def _urlopen(request, timeout=None):  # noqa: ARG001
-        seen.append(request)
-        item = queue.pop(0)
-        if isinstance(item, urllib.error.HTTPError):
-            raise item
-        return item
+    def _connect(scheme, host):
+        connection = _Connection(scheme, host, queue, seen)
+        seen.connections.append(connection)
+        return connection
 
-    monkeypatch.setattr(api.urllib.request, "urlopen", _urlopen)
+    monkeypatch.setattr(api, "_connect", _connect)
     return seen
 
 
@@ -95,7 +145,7 @@ def test_the_library_header_is_sent_when_set(monkeypatch):
 def test_a_401_refreshes_once_and_retries(monkeypatch, _signed_in):
     seen = _serve(
         monkeypatch,
-        _http_error(401, b'{"message": "Unauthorized"}'),
+        _Response(401, b'{"message": "Unauthorized"}'),
         _Response(200, b'{"ok": true}'),
     )
 
@@ -107,8 +157,8 @@ def test_a_401_refreshes_once_and_retries(monkeypatch, _signed_in):
 def test_a_second_401_says_what_to_do(monkeypatch, _signed_in):
     _serve(
         monkeypatch,
-        _http_error(401, b'{"message": "Unauthorized"}'),
-        _http_error(401, b'{"message": "Unauthorized"}'),
+        _Response(401, b'{"message": "Unauthorized"}'),
+        _Response(401, b'{"message": "Unauthorized"}'),
     )
 
     with pytest.raises(api.ApiError) as caught:
@@ -123,7 +173,7 @@ def test_a_second_401_says_what_to_do(monkeypatch, _signed_in):
 
 def test_a_403_is_its_own_type(monkeypatch):
     """403 and 401 say opposite things — signing in again does not help here."""
-    _serve(monkeypatch, _http_error(403, b'{"error": "You are not a member of lib-2."}'))
+    _serve(monkeypatch, _Response(403, b'{"error": "You are not a member of lib-2."}'))
 
     with pytest.raises(api.Forbidden) as caught:
         api.get("/api/nodes/node-1")
@@ -133,21 +183,21 @@ def test_a_403_is_its_own_type(monkeypatch):
 
 def test_a_409_is_its_own_type(monkeypatch):
     """The UI keeps the rename field open on this; the CLI prompts rather than retries."""
-    _serve(monkeypatch, _http_error(409, b'{"error": "\'characters\' already exists here"}'))
+    _serve(monkeypatch, _Response(409, b'{"error": "\'characters\' already exists here"}'))
 
     with pytest.raises(api.Conflict):
         api.post("/api/nodes", {"parent": "node-root", "name": "characters"})
 
 
 def test_a_404_is_its_own_type(monkeypatch):
-    _serve(monkeypatch, _http_error(404, b'{"error": "No such object: node-nope"}'))
+    _serve(monkeypatch, _Response(404, b'{"error": "No such object: node-nope"}'))
 
     with pytest.raises(api.NotFound):
         api.get("/api/nodes/node-nope")
 
 
 def test_a_5xx_surfaces_the_apis_message(monkeypatch):
-    _serve(monkeypatch, _http_error(502, b'{"error": "Could not read the catalog"}'))
+    _serve(monkeypatch, _Response(502, b'{"error": "Could not read the catalog"}'))
 
     with pytest.raises(api.ApiError) as caught:
         api.get("/api/libraries")
@@ -164,8 +214,8 @@ def test_a_non_json_gateway_body_falls_back_to_the_status(monkeypatch):
     """
     _serve(
         monkeypatch,
-        _http_error(401, b"<html>Unauthorized</html>"),
-        _http_error(401, b"<html>Unauthorized</html>"),
+        _Response(401, b"<html>Unauthorized</html>"),
+        _Response(401, b"<html>Unauthorized</html>"),
     )
 
     with pytest.raises(api.ApiError) as caught:
@@ -176,10 +226,7 @@ def test_a_non_json_gateway_body_falls_back_to_the_status(monkeypatch):
 
 
 def test_an_unreachable_api_is_not_a_traceback(monkeypatch):
-    def _urlopen(request, timeout=None):  # noqa: ARG001
-        raise urllib.error.URLError("Connection refused")
-
-    monkeypatch.setattr(api.urllib.request, "urlopen", _urlopen)
+    _serve(monkeypatch, ConnectionRefusedError("Connection refused"))
 
     with pytest.raises(api.ApiError) as caught:
         api.get("/api/libraries")
@@ -199,3 +246,211 @@ def test_libraries_returns_a_list_even_if_the_api_is_odd(monkeypatch):
     _serve(monkeypatch, _Response(200, json.dumps([{"id": "lib-1"}]).encode()))
 
     assert api.libraries() == [{"id": "lib-1"}]
+
+
+# ──────────────────────────── revalidation ────────────────────────────
+#
+# A tagged GET is kept and revalidated; nothing else is.
+
+
+def test_a_tagged_listing_is_revalidated_and_a_304_answers_from_what_was_kept(monkeypatch):
+    seen = _serve(
+        monkeypatch,
+        _Response(200, b'[{"id": "node-1"}]', etag='W/"node-root.3"'),
+        _Response(304, b""),
+    )
+
+    first = api.get("/api/nodes", parent="node-root")
+    again = api.get("/api/nodes", parent="node-root")
+
+    assert again == first == [{"id": "node-1"}]
+    assert seen[0].get_header("If-none-match") is None
+    assert seen[1].get_header("If-none-match") == 'W/"node-root.3"'
+
+
+def test_a_changed_listing_replaces_what_was_kept(monkeypatch):
+    seen = _serve(
+        monkeypatch,
+        _Response(200, b"[]", etag='W/"node-root.3"'),
+        _Response(200, b'[{"id": "node-2"}]', etag='W/"node-root.4"'),
+        _Response(200, b'[{"id": "node-2"}]', etag='W/"node-root.4"'),
+    )
+
+    api.get("/api/nodes", parent="node-root")
+    assert api.get("/api/nodes", parent="node-root") == [{"id": "node-2"}]
+    api.get("/api/nodes", parent="node-root")
+
+    assert seen[2].get_header("If-none-match") == 'W/"node-root.4"'
+
+
+def test_a_kept_answer_is_per_library(monkeypatch):
+    seen = _serve(
+        monkeypatch,
+        _Response(200, b"[]", etag='W/"node-root.3"'),
+        _Response(200, b"[]", etag='W/"node-root.3"'),
+    )
+
+    api.get("/api/nodes", parent="node-root")
+    monkeypatch.setenv("STUDIO_LIBRARY_ID", "lib-2")
+    api.get("/api/nodes", parent="node-root")
+
+    assert seen[1].get_header("If-none-match") is None
+
+
+def test_untagged_answers_and_writes_are_never_kept(monkeypatch):
+    seen = _serve(
+        monkeypatch,
+        _Response(200, b'{"id": "node-1"}'),
+        _Response(200, b'{"id": "node-1"}', etag='W/"x"'),
+        _Response(200, b'{"id": "node-1"}'),
+        _Response(200, b'{"id": "node-1"}'),
+    )
+
+    api.get("/api/resolve", path="a")
+    api.post("/api/nodes", {"name": "a"})
+    api.get("/api/resolve", path="a")
+    api.post("/api/nodes", {"name": "a"})
+
+    assert [request.get_header("If-none-match") for request in seen] == [None] * 4
+
+
+def test_the_kept_answers_are_bounded(monkeypatch):
+    monkeypatch.setattr(api, "HELD_RESPONSES", 2)
+    seen = _serve(
+        monkeypatch,
+        *[_Response(200, b"[]", etag=f'W/"{name}"') for name in "abc"],
+        _Response(200, b"[]"),
+        _Response(304, b""),
+    )
+
+    for name in "abc":
+        api.get("/api/nodes", parent=name)
+    api.get("/api/nodes", parent="a")
+    api.get("/api/nodes", parent="c")
+
+    # `a` was the least recently used when `c` arrived; `c` is still held.
+    assert seen[3].get_header("If-none-match") is None
+    assert seen[4].get_header("If-none-match") == 'W/"c"'
+
+
+# ──────────────────────────── the pool ────────────────────────────
+
+
+def test_successive_calls_share_one_connection(monkeypatch):
+    seen = _serve(monkeypatch, *[_Response(200, b"{}") for _ in range(3)])
+
+    for _ in range(3):
+        api.get("/api/libraries")
+
+    assert len(seen) == 3
+    assert len(seen.connections) == 1
+
+
+def test_an_error_answer_leaves_the_connection_reusable(monkeypatch):
+    """The body is read either way, so a 404 does not cost the next call a handshake."""
+    seen = _serve(monkeypatch, _Response(404, b'{"error": "gone"}'), _Response(200, b"{}"))
+
+    with pytest.raises(api.NotFound):
+        api.get("/api/nodes/node-gone")
+    api.get("/api/libraries")
+
+    assert len(seen.connections) == 1
+
+
+def test_a_connection_the_server_will_close_is_not_kept(monkeypatch):
+    seen = _serve(
+        monkeypatch, _Response(200, b"{}", will_close=True), _Response(200, b"{}")
+    )
+
+    api.get("/api/libraries")
+    api.get("/api/libraries")
+
+    assert len(seen.connections) == 2
+    assert seen.connections[0].closed
+
+
+def test_a_stale_pooled_connection_is_retried_on_a_new_one(monkeypatch):
+    """The far end closed it while idle: a fact about the pool, not the call."""
+    seen = _serve(
+        monkeypatch,
+        _Response(200, b"{}"),
+        http.client.RemoteDisconnected("Remote end closed connection"),
+        _Response(200, b'{"id": "node-1"}'),
+    )
+
+    api.get("/api/libraries")
+    assert api.post("/api/nodes", {"name": "a"}) == {"id": "node-1"}
+
+    assert len(seen.connections) == 2
+    assert seen.connections[0].closed
+    # Sent once: the stale connection failed before the request left.
+    assert [request.get_method() for request in seen] == ["GET", "POST"]
+
+
+def test_a_new_connection_that_fails_is_not_retried(monkeypatch):
+    seen = _serve(monkeypatch, ConnectionResetError("reset"), _Response(200, b"{}"))
+
+    with pytest.raises(api.ApiError):
+        api.get("/api/libraries")
+
+    assert len(seen.connections) == 1
+
+
+class _Echo(http.server.BaseHTTPRequestHandler):
+    """Answers every GET with its own path and the client port it arrived from."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body leave as two writes; with Nagle on, a kept-alive socket
+    # waits out the client's delayed ACK between them — 40 ms a call that is the
+    # stand-in's, not the transport's.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802 — the handler's naming, not ours
+        body = json.dumps({"path": self.path, "port": self.client_address[1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def local_api(monkeypatch):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Echo)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(auth, "api_url", lambda: f"http://127.0.0.1:{server.server_port}")
+    for name in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    yield
+    api.disconnect()
+    server.shutdown()
+    server.server_close()
+
+
+def test_a_walk_over_a_real_server_is_one_socket(local_api):
+    ports = {api.get("/api/nodes", parent=f"node-{n}")["port"] for n in range(20)}
+
+    assert len(ports) == 1
+
+
+def test_concurrent_callers_each_get_their_own_answer(local_api):
+    """Each thread holds a connection for one exchange, so no answer crosses over."""
+    answers: dict[int, list] = {}
+
+    def _walk(worker):
+        answers[worker] = [
+            api.get("/api/nodes", parent=f"w{worker}-{n}")["path"] for n in range(25)
+        ]
+
+    workers = [threading.Thread(target=_walk, args=(w,)) for w in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    for worker, paths in answers.items():
+        assert paths == [f"/api/nodes?parent=w{worker}-{n}" for n in range(25)]
@@ -0,0 +1,213 @@
+"""The blob cache, and `store.read` going through it.
+
+Stubbed at `api` and at `urlopen`, as `test_store_adapter` is, so every request
+a read makes is counted where it would leave the machine — the claim worth
+pinning is how many of them a cached read does not make.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from studio_pipeline import cli
+from studio_pipeline.adapters import api, auth, blobs, store
+
+
+class _Response(io.BytesIO):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+class _Library:
+    """Files by path, each with a version that moves when its bytes do."""
+
+    def __init__(self, monkeypatch) -> None:
+        self.files: dict[str, tuple[bytes, int]] = {}
+        self.calls: list[str] = []
+        monkeypatch.setattr(auth, "api_url", lambda: "https://api.test")
+        monkeypatch.setattr(api, "get", self.get)
+        monkeypatch.setattr(api, "post", self.post)
+        monkeypatch.setattr(store.urllib.request, "urlopen", self.urlopen)
+
+    def put(self, path: str, body: bytes) -> None:
+        version = self.files.get(path, (b"", 0))[1] + 1
+        self.files[path] = (body, version)
+
+    def _node(self, path: str) -> dict:
+        if path == "":
+            return {"id": "root", "kind": "folder"}
+        if path not in self.files:
+            raise api.NotFound(path, 404)
+        body, version = self.files[path]
+        return {"id": f"node-{path}", "kind": "file", "size": len(body),
+                "updated_at": f"2026-10-17T12:00:00.{version:06d}"}
+
+    def get(self, route, **params):
+        self.calls.append(route)
+        if route == "/api/resolve":
+            return self._node(params["path"])
+        path = route.split("/")[3][len("node-"):]
+        return {"url": f"https://s3.test/{path}"}
+
+    def post(self, route, payload=None, **params):
+        self.calls.append(route)
+        if route == "/api/nodes":
+            return {"id": "node-new"}
+        if route.endswith("/upload-url"):
+            return {"url": "https://s3.test/new", "headers": {}}
+        if route.endswith("/confirm-upload"):
+            self.put("new.json", self.sent)
+            return self._node("new.json")
+        raise AssertionError(route)
+
+    def urlopen(self, request, timeout=None):  # noqa: ARG002
+        if getattr(request, "data", None) is not None:
+            self.calls.append("PUT")
+            self.sent = request.data
+            return _Response()
+        self.calls.append("S3")
+        return _Response(self.files[request.rsplit("/", 1)[1]][0])
+
+
+@pytest.fixture
+def library(monkeypatch):
+    return _Library(monkeypatch)
+
+
+# --- through `store.read` --------------------------------------------------
+
+def test_a_file_read_again_in_the_same_command_makes_no_request(library):
+    library.put("face.png", b"face")
+    assert store.read("face.png") == b"face"
+    assert library.calls == ["/api/resolve", "/api/nodes/node-face.png/download-url", "S3"]
+
+    library.calls.clear()
+    assert store.read("face.png") == b"face"
+    assert library.calls == []
+
+
+def test_a_later_command_asks_for_the_version_and_fetches_no_bytes(library):
+    library.put("face.png", b"face")
+    store.read("face.png")
+    store.forget()  # what a new command starts with
+    library.calls.clear()
+
+    assert store.read("face.png") == b"face"
+    assert library.calls == ["/api/resolve"]
+
+
+def test_a_file_changed_since_is_fetched_again(library):
+    library.put("face.png", b"face")
+    store.read("face.png")
+    library.put("face.png", b"retouched")
+    store.forget()
+
+    assert store.read("face.png") == b"retouched"
+    assert library.calls[-1] == "S3"
+
+
+def test_a_node_from_the_persisted_path_cache_is_asked_about(library, monkeypatch):
+    """A path remembered between commands names the node, not its current version."""
+    monkeypatch.setenv("STUDIO_PATH_CACHE_TTL_SECONDS", "3600")
+    library.put("face.png", b"face")
+    store.read("face.png")
+    store._paths.save()
+    store.forget()
+    store._paths._loaded.clear()
+    library.put("face.png", b"retouched")
+
+    assert store.read("face.png") == b"retouched"
+
+
+def test_what_a_command_writes_it_reads_back_without_fetching(library):
+    store.write("new.json", b"{}", content_type="application/json")
+    library.calls.clear()
+
+    assert store.read("new.json") == b"{}"
+    assert library.calls == []
+
+
+def test_download_goes_through_it_too(library, tmp_path):
+    library.put("clip.mp4", b"frames")
+    store.download("clip.mp4", tmp_path / "one.mp4")
+    library.calls.clear()
+
+    assert store.download("clip.mp4", tmp_path / "two.mp4").read_bytes() == b"frames"
+    assert library.calls == []
+
+
+def test_off_at_zero_and_every_read_fetches(library, monkeypatch):
+    monkeypatch.setenv("STUDIO_BLOB_CACHE_MB", "0")
+    library.put("face.png", b"face")
+    store.read("face.png")
+    library.calls.clear()
+
+    store.read("face.png")
+    assert library.calls == ["/api/nodes/node-face.png/download-url", "S3"]
+
+
+# --- the cache itself ------------------------------------------------------
+
+@pytest.fixture
+def cache(tmp_path):
+    return blobs.Blobs(tmp_path / "blobs", limit=10)
+
+
+def test_the_same_bytes_are_kept_once(cache):
+    cache.put("a@1", b"same")
+    cache.put("b@1", b"same")
+
+    assert cache.get("a@1") == cache.get("b@1") == b"same"
+    assert cache.stats()["blobs"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_the_least_recently_read_goes_first(cache):
+    cache.put("a@1", b"aaaa")
+    cache.put("b@1", b"bbbb")
+    cache.get("a@1")
+    cache.put("c@1", b"cccc")  # twelve bytes against a limit of ten
+
+    assert cache.get("b@1") is None
+    assert cache.get("a@1") == b"aaaa"
+    assert cache.get("c@1") == b"cccc"
+    assert cache.stats()["bytes"] == 8
+
+
+def test_a_blob_gone_bad_is_a_miss(cache):
+    digest = cache.put("a@1", b"good")
+    (cache.root / digest[:2] / digest).write_bytes(b"bad!")
+
+    assert cache.get("a@1") is None
+
+
+def test_another_command_reads_what_this_one_saved(cache):
+    cache.put("a@1", b"kept")
+    cache.save()
+
+    assert blobs.Blobs(cache.root, limit=10).get("a@1") == b"kept"
+
+
+# --- `studio cache` --------------------------------------------------------
+
+def test_stats_and_prune(library):
+    library.put("face.png", b"face")
+    store.read("face.png")
+    runner = CliRunner()
+
+    stats = json.loads(runner.invoke(cli.main, ["cache", "stats", "--json"]).output)
+    assert (stats["blobs"], stats["bytes"]) == (1, 4)
+
+    pruned = json.loads(runner.invoke(cli.main, ["cache", "prune", "--all", "--json"]).output)
+    assert (pruned["evicted"], pruned["freed_bytes"], pruned["bytes"]) == (1, 4, 0)
+    store.forget()
+    library.calls.clear()
+    store.read("face.png")
+    assert library.calls[-1] == "S3"
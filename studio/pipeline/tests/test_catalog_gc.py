@@ -172,6 +172,19 @@ def test_a_row_whose_blob_is_gone_is_not_an_orphan(media_bucket, catalog_table):
     assert _survey(media_bucket, catalog_table)["orphans"] == []
 
 
+def test_a_preview_lives_exactly_as_long_as_its_source(media_bucket, catalog_table):
+    """No row names a preview; a row names the blob it was made of, or none does."""
+    _seeded(media_bucket, catalog_table)
+    kept = f"derived/{LEGACY_KEY}/480.jpg"
+    stale = f"derived/{MODERN_KEY}/960.jpg"
+    _put(media_bucket, kept)
+    _put(media_bucket, stale, b"poster-bytes")
+
+    found = _survey(media_bucket, catalog_table)
+    assert kept in found["referenced"]
+    assert found["orphans"] == [stale]
+
+
 # ── deleting ────────────────────────────────────────────────────────────────
 
 def test_a_delete_never_names_a_version(media_bucket):
@@ -321,3 +334,116 @@ def test_gc_refuses_when_the_bucket_is_unset(monkeypatch):
     finally:
         monkeypatch.setenv("STUDIO_S3_BUCKET", "studio-prod-media-us-east-1")
         importlib.reload(s3c)
+
+
+# ── `--queue`: what deletes released ────────────────────────────────────────
+
+QUEUED_AT = "2026-10-17T09:00:00.000000+00:00"
+
+
+def _enqueue(ddb, blob_key, queued_at=QUEUED_AT):
+    """The item `services/catalog.py::_release` writes beside a count's delete."""
+    ddb.put_item(TableName=ddbc.table(), Item=ddbc.to_item(
+        {"pk": f"GCQ#{cg._shard(blob_key)}", "sk": blob_key, "queued_at": queued_at}))
+
+
+def _queue(ddb):
+    return [entry["blob_key"] for entry in cg.queued(ddb)]
+
+
+def test_a_released_blob_still_in_the_bucket_is_queued_and_a_dry_run_keeps_it(
+        media_bucket, catalog_table):
+    _put(media_bucket, MODERN_KEY)
+    _enqueue(catalog_table, MODERN_KEY)
+
+    result = _run("--queue")
+    assert result.exit_code == 0, result.output
+    assert MODERN_KEY in result.output
+    assert "nothing deleted" in result.output
+    assert media_bucket.head_object(Bucket=s3c.BUCKET, Key=MODERN_KEY)
+    assert _queue(catalog_table) == [MODERN_KEY]
+
+
+def test_queue_apply_collects_and_dequeues_without_a_dry_run(media_bucket, catalog_table,
+                                                              journalled):
+    """The queue is the API's record of a release, not an inference to read first."""
+    _put(media_bucket, MODERN_KEY)
+    _enqueue(catalog_table, MODERN_KEY)
+
+    applied = _run("--queue", "--apply")
+    assert applied.exit_code == 0, applied.output
+    with pytest.raises(Exception):
+        media_bucket.head_object(Bucket=s3c.BUCKET, Key=MODERN_KEY)
+    assert _queue(catalog_table) == []
+    assert cs.load_journal(cs.journal_path(None))["gc_queue"]["deleted"] == [MODERN_KEY]
+
+
+def test_a_key_counted_again_is_dequeued_and_kept(media_bucket, catalog_table, journalled):
+    _put(media_bucket, MODERN_KEY)
+    _enqueue(catalog_table, MODERN_KEY)
+    catalog_table.put_item(TableName=ddbc.table(), Item=ddbc.to_item(
+        {"pk": f"BLOB#{MODERN_KEY}", "sk": "META", "refs": 1}))
+
+    assert _run("--queue", "--apply").exit_code == 0
+    assert media_bucket.head_object(Bucket=s3c.BUCKET, Key=MODERN_KEY)
+    assert _queue(catalog_table) == []
+
+
+def test_a_key_the_api_already_deleted_is_dequeued_without_a_delete(
+        media_bucket, catalog_table, journalled, monkeypatch):
+    """A `DeleteObjects` on a missing key still writes a tombstone in a versioned bucket."""
+    _enqueue(catalog_table, MODERN_KEY)
+    asked = []
+    monkeypatch.setattr(cg, "collect", lambda s3, keys: asked.append(keys) or
+                        {"deleted": [], "failed": []})
+
+    assert _run("--queue", "--apply").exit_code == 0
+    assert asked == [[]]
+    assert _queue(catalog_table) == []
+
+
+@pytest.mark.parametrize("key", ["config/pose/body/standing.png",
+                                 "phrasebook/en.json", "blobs/"])
+def test_a_queued_key_outside_the_allowlist_is_never_collected(
+        shared_objects, catalog_table, journalled, key):
+    _put(shared_objects, key)
+    _enqueue(catalog_table, key)
+
+    found = cg.triage(shared_objects, catalog_table, cg.queued(catalog_table))
+    assert [entry["blob_key"] for entry in found["kept"]] == [key]
+    assert _run("--queue", "--apply").exit_code == 0
+    assert shared_objects.head_object(Bucket=s3c.BUCKET, Key=key)
+
+
+def test_a_failed_delete_stays_queued(media_bucket, catalog_table, journalled, monkeypatch):
+    _put(media_bucket, MODERN_KEY)
+    _enqueue(catalog_table, MODERN_KEY)
+    monkeypatch.setattr(cg, "collect", lambda s3, keys: {
+        "deleted": [], "failed": [f"{key}: AccessDenied" for key in keys]})
+
+    assert _run("--queue", "--apply").exit_code == 1
+    assert _queue(catalog_table) == [MODERN_KEY]
+
+
+def test_a_key_released_again_since_the_read_keeps_its_newer_entry(media_bucket,
+                                                                   catalog_table):
+    _enqueue(catalog_table, MODERN_KEY)
+    (entry,) = cg.queued(catalog_table)
+    _enqueue(catalog_table, MODERN_KEY, queued_at="2026-10-17T09:05:00.000000+00:00")
+
+    assert cg.dequeue(catalog_table, [entry]) == 0
+    assert _queue(catalog_table) == [MODERN_KEY]
+
+
+def test_the_queue_reads_neither_the_table_nor_the_bucket_whole(
+        media_bucket, catalog_table, journalled, monkeypatch):
+    """What makes it cost the churn: no scan, no listing — and so no empty-table refusal,
+    which guards an inference from absence this mode never makes."""
+    monkeypatch.setattr(cg, "referenced_keys", lambda ddb: pytest.fail("scanned"))
+    monkeypatch.setattr(cg, "survey", lambda s3, referenced: pytest.fail("listed"))
+    _put(media_bucket, MODERN_KEY)
+    _enqueue(catalog_table, MODERN_KEY)
+
+    applied = _run("--queue", "--apply")
+    assert applied.exit_code == 0, applied.output
+    assert _queue(catalog_table) == []
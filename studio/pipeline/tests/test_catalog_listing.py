@@ -0,0 +1,138 @@
+"""`studio catalog listing` — the by-parent items checked against their records.
+
+The catalog is seeded from the moto bucket by `catalog_seed`, so a clean report
+means the seed writes the projection the API reads, and each test then breaks
+one item by hand — the way drift actually arrives — and asks whether the
+command sees it, repairs what it may, and leaves alone what it may not.
+"""
+
+from click.testing import CliRunner
+
+from studio_pipeline import cli
+from studio_pipeline.adapters import ddb as ddbc
+from studio_pipeline.maintenance import catalog_listing as cl
+from studio_pipeline.maintenance import catalog_seed as cs
+
+OWNER_SUB = "11111111-2222-3333-4444-555555555555"
+
+
+def _seeded(s3, ddb):
+    plan = cs.build_plan(s3)
+    cs.phase_seed(ddb, plan, owner_sub=OWNER_SUB, library_name="Studio", apply=True)
+    return plan
+
+
+def _a_file(plan):
+    return next(node for node in plan["nodes"] if node["kind"] == "file")
+
+
+def _key(node):
+    return ddbc.to_item({"pk": f"NODE#{node['parent_id']}", "sk": f"NAME#{node['name']}"})
+
+
+def _by_parent(ddb, node):
+    return ddbc.from_item(ddb.get_item(TableName=ddbc.table(), Key=_key(node))["Item"])
+
+
+def _run(*args):
+    return CliRunner().invoke(cli.main, ["catalog", "listing", *args])
+
+
+def test_a_fresh_seed_has_nothing_to_report(media_bucket, catalog_table):
+    plan = _seeded(media_bucket, catalog_table)
+    found = cl.survey(catalog_table)
+
+    assert found["ok"] == len(plan["nodes"]) - 1  # the root has no by-parent item
+    for reason in ("unlisted", "drift", "misplaced", "no_record", "no_index"):
+        assert found[reason] == [], reason
+
+
+def test_an_item_written_before_the_projection_is_unlisted_and_backfilled(
+        media_bucket, catalog_table):
+    node = _a_file(_seeded(media_bucket, catalog_table))
+    catalog_table.update_item(
+        TableName=ddbc.table(), Key=_key(node),
+        UpdateExpression="REMOVE blob_key, #size, content_type, updated_at",
+        ExpressionAttributeNames={"#size": "size"})
+
+    found = cl.survey(catalog_table)
+    assert [entry["node_id"] for entry in found["unlisted"]] == [node["node_id"]]
+
+    res = cl.repair(catalog_table, found["unlisted"])
+    assert res == {"repaired": [node["node_id"]], "moved_on": []}
+    assert _by_parent(catalog_table, node)["size"] == node["size"]
+    assert cl.survey(catalog_table)["unlisted"] == []
+
+
+def test_drift_is_repaired_from_the_record_and_never_the_other_way(
+        media_bucket, catalog_table):
+    node = _a_file(_seeded(media_bucket, catalog_table))
+    catalog_table.update_item(
+        TableName=ddbc.table(), Key=_key(node),
+        UpdateExpression="SET #size = :size", ExpressionAttributeNames={"#size": "size"},
+        ExpressionAttributeValues={":size": {"N": "999999"}})
+
+    (entry,) = cl.survey(catalog_table)["drift"]
+    assert entry["fields"] == ["size"]
+
+    cl.repair(catalog_table, [entry])
+    assert _by_parent(catalog_table, node)["size"] == node["size"]
+    meta = catalog_table.get_item(TableName=ddbc.table(), Key=ddbc.to_item(
+        {"pk": f"NODE#{node['node_id']}", "sk": "META"}))["Item"]
+    assert ddbc.from_item(meta)["size"] == node["size"]
+
+
+def test_a_repair_does_not_overwrite_a_record_written_since_the_scan(
+        media_bucket, catalog_table):
+    """The API wrote both halves after the scan; the scan's copy is the stale one."""
+    node = _a_file(_seeded(media_bucket, catalog_table))
+    catalog_table.update_item(
+        TableName=ddbc.table(), Key=_key(node),
+        UpdateExpression="SET #size = :size", ExpressionAttributeNames={"#size": "size"},
+        ExpressionAttributeValues={":size": {"N": "1"}})
+    (entry,) = cl.survey(catalog_table)["drift"]
+
+    for key in (_key(node), ddbc.to_item({"pk": f"NODE#{node['node_id']}", "sk": "META"})):
+        catalog_table.update_item(
+            TableName=ddbc.table(), Key=key,
+            UpdateExpression="SET #size = :size, updated_at = :now",
+            ExpressionAttributeNames={"#size": "size"},
+            ExpressionAttributeValues={":size": {"N": "42"},
+                                       ":now": {"S": "2030-01-01T00:00:00.000000+00:00"}})
+
+    assert cl.repair(catalog_table, [entry]) == {"repaired": [], "moved_on": [node["node_id"]]}
+    assert _by_parent(catalog_table, node)["size"] == 42
+
+
+def test_a_half_done_move_is_reported_and_left_alone(media_bucket, catalog_table):
+    node = _a_file(_seeded(media_bucket, catalog_table))
+    catalog_table.update_item(
+        TableName=ddbc.table(),
+        Key=ddbc.to_item({"pk": f"NODE#{node['node_id']}", "sk": "META"}),
+        UpdateExpression="SET parent_id = :elsewhere",
+        ExpressionAttributeValues={":elsewhere": {"S": "node-elsewhere"}})
+
+    found = cl.survey(catalog_table)
+    assert len(found["misplaced"]) == 1
+    assert found["drift"] == found["unlisted"] == []
+
+
+def test_the_command_is_a_dry_run_until_told(media_bucket, catalog_table):
+    node = _a_file(_seeded(media_bucket, catalog_table))
+    catalog_table.update_item(
+        TableName=ddbc.table(), Key=_key(node), UpdateExpression="REMOVE updated_at")
+
+    dry = _run()
+    assert dry.exit_code == 0, dry.output
+    assert "nothing written" in dry.output
+    assert "updated_at" not in _by_parent(catalog_table, node)
+
+    applied = _run("--apply")
+    assert applied.exit_code == 0, applied.output
+    assert _by_parent(catalog_table, node)["updated_at"] == node["updated_at"]
+
+
+def test_it_refuses_when_the_table_does_not_exist():
+    result = _run()
+    assert result.exit_code == 1
+    assert ddbc.table() in result.output
@@ -0,0 +1,129 @@
+"""`studio catalog refs` — the blob reference counts rebuilt from the rows.
+
+The catalog is seeded from the moto bucket by `catalog_seed`, which writes rows
+and no counts, so a fresh seed is the "every key uncounted" case the command
+exists for. Each test then does what the API would — a count written, a copy
+sharing a key, a delete that never released — and asks whether the command
+sets the count from the rows and only from them.
+"""
+
+from click.testing import CliRunner
+
+from studio_pipeline import cli
+from studio_pipeline.adapters import ddb as ddbc
+from studio_pipeline.maintenance import catalog_refs as cr
+from studio_pipeline.maintenance import catalog_seed as cs
+
+OWNER_SUB = "11111111-2222-3333-4444-555555555555"
+
+
+def _seeded(s3, ddb):
+    plan = cs.build_plan(s3)
+    cs.phase_seed(ddb, plan, owner_sub=OWNER_SUB, library_name="Studio", apply=True)
+    return plan
+
+
+def _files(plan):
+    return [node for node in plan["nodes"] if node["kind"] == "file"]
+
+
+def _count_key(blob_key):
+    return ddbc.to_item({"pk": f"BLOB#{blob_key}", "sk": "META"})
+
+
+def _refs(ddb, blob_key):
+    item = ddb.get_item(TableName=ddbc.table(), Key=_count_key(blob_key)).get("Item")
+    return None if item is None else ddbc.from_item(item)["refs"]
+
+
+def _set(ddb, blob_key, refs):
+    ddb.put_item(TableName=ddbc.table(),
+                 Item={**_count_key(blob_key), **ddbc.to_item({"refs": refs})})
+
+
+def _run(*args):
+    return CliRunner().invoke(cli.main, ["catalog", "refs", *args])
+
+
+def test_a_fresh_seed_is_every_key_uncounted_and_apply_counts_them(
+        media_bucket, catalog_table):
+    files = _files(_seeded(media_bucket, catalog_table))
+
+    found = cr.survey(catalog_table)
+    assert [entry["blob_key"] for entry in found["uncounted"]] == sorted(
+        node["blob_key"] for node in files)
+    assert found["wrong"] == found["stale"] == []
+
+    cr.repair(catalog_table, found["uncounted"])
+    assert _refs(catalog_table, files[0]["blob_key"]) == 1
+    assert cr.survey(catalog_table)["ok"] == len(files)
+
+
+def test_a_by_parent_item_is_not_counted_as_a_reference(media_bucket, catalog_table):
+    """It carries `blob_key` as a listing copy; counting it would double every key."""
+    node = _files(_seeded(media_bucket, catalog_table))[0]
+
+    (entry,) = [entry for entry in cr.survey(catalog_table)["uncounted"]
+                if entry["blob_key"] == node["blob_key"]]
+    assert entry["refs"] == 1
+
+
+def test_a_shared_key_with_a_wrong_count_is_set_from_the_rows(media_bucket, catalog_table):
+    first, second = _files(_seeded(media_bucket, catalog_table))[:2]
+    catalog_table.update_item(
+        TableName=ddbc.table(),
+        Key=ddbc.to_item({"pk": f"NODE#{second['node_id']}", "sk": "META"}),
+        UpdateExpression="SET blob_key = :shared",
+        ExpressionAttributeValues=ddbc.to_item({":shared": first["blob_key"]}))
+    _set(catalog_table, first["blob_key"], 1)
+
+    (entry,) = cr.survey(catalog_table)["wrong"]
+    assert (entry["blob_key"], entry["seen"], entry["refs"]) == (first["blob_key"], 1, 2)
+
+    assert cr.repair(catalog_table, [entry]) == {"repaired": [first["blob_key"]],
+                                                  "moved_on": []}
+    assert _refs(catalog_table, first["blob_key"]) == 2
+
+
+def test_a_count_nothing_names_is_stale_and_dropped(media_bucket, catalog_table):
+    _seeded(media_bucket, catalog_table)
+    _set(catalog_table, "blobs/node-gone", 0)
+
+    (entry,) = cr.survey(catalog_table)["stale"]
+    assert entry["blob_key"] == "blobs/node-gone"
+
+    cr.repair(catalog_table, [entry])
+    assert _refs(catalog_table, "blobs/node-gone") is None
+
+
+def test_a_repair_does_not_overwrite_a_count_moved_since_the_scan(
+        media_bucket, catalog_table):
+    """The API counted a copy after the scan; the scan's number is the stale one."""
+    node = _files(_seeded(media_bucket, catalog_table))[0]
+    _set(catalog_table, node["blob_key"], 5)
+    (entry,) = cr.survey(catalog_table)["wrong"]
+
+    _set(catalog_table, node["blob_key"], 6)
+
+    assert cr.repair(catalog_table, [entry]) == {"repaired": [],
+                                                  "moved_on": [node["blob_key"]]}
+    assert _refs(catalog_table, node["blob_key"]) == 6
+
+
+def test_the_command_is_a_dry_run_until_told(media_bucket, catalog_table):
+    node = _files(_seeded(media_bucket, catalog_table))[0]
+
+    dry = _run()
+    assert dry.exit_code == 0, dry.output
+    assert "nothing written" in dry.output
+    assert _refs(catalog_table, node["blob_key"]) is None
+
+    applied = _run("--apply")
+    assert applied.exit_code == 0, applied.output
+    assert _refs(catalog_table, node["blob_key"]) == 1
+
+
+def test_it_refuses_when_the_table_does_not_exist():
+    result = _run()
+    assert result.exit_code == 1
+    assert ddbc.table() in result.output
@@ -187,13 +187,15 @@ def test_a_node_is_two_items_and_the_root_is_one(media_bucket, catalog_table):
     assert len(items) == 2 + len(plan["nodes"]) + (len(plan["nodes"]) - 1)
 
 
-def test_the_by_parent_item_carries_no_mutable_file_metadata(media_bucket):
-    """Widening this projection would put every rename in the metadata business."""
+def test_the_by_parent_item_carries_what_a_listing_renders(media_bucket):
+    """The API lists a folder from this item alone, so it copies the record's file fields."""
     plan = cs.build_plan(media_bucket)
     node = next(n for n in plan["nodes"] if n["kind"] == "file")
 
     item = cs.index_item(node)
-    assert set(item) == {"pk", "sk", "node_id", "lib", "kind", "path", "created_at"}
+    assert set(item) == {"pk", "sk", "node_id", "lib", "kind", "path", "created_at",
+                         "blob_key", "size", "content_type", "updated_at"}
+    assert all(item[field] == node[field] for field in ("blob_key", "size", "updated_at"))
     assert item["sk"] == f"NAME#{node['name']}"
     assert item["pk"] == f"NODE#{node['parent_id']}"
 
@@ -46,16 +46,23 @@ def test_command_runs(media_bucket, argv, expected):
     )
 
 
-def test_every_subcommand_dispatches(media_bucket):
+def test_every_subcommand_dispatches(media_bucket, monkeypatch, tmp_path):
     """No subcommand may fail on a missing handler.
 
     Walks the whole tree and invokes each leaf with no arguments. A command
     that needs arguments exits 2 (usage) — that is fine, it proves Click routed
     to it. What must never happen is an AttributeError or a KeyError, which is
     what a missing dispatch entry raises.
+
+    The `catalog` commands get far enough to open their journal, so it
+    goes to `tmp_path` and not `studio/local/migrations` in the source tree.
     """
     import click
 
+    from studio_pipeline.maintenance import catalog_seed
+
+    monkeypatch.setattr(catalog_seed, "JOURNAL_DIR", str(tmp_path))
+
     def leaves(cmd, path):
         if isinstance(cmd, click.Group):
             for name, sub in cmd.commands.items():
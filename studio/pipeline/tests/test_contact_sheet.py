@@ -69,13 +69,14 @@ def test_a_pool_that_is_not_there_says_so(media_bucket, tmp_path):
 def test_a_refused_pool_is_not_an_empty_one(media_bucket, monkeypatch, tmp_path):
     """A 403 must not read as "this character has no images".
 
-    `children_or_empty` swallows a 404 and only a 404 — the distinction three
+    `descendants` swallows a 404 and only a 404 — the distinction three
     modules lost by catching bare `Exception`.
     """
     def refused(_path):
         raise api.Forbidden("not a member of this library", 403)
+        yield
 
-    monkeypatch.setattr(store, "children", refused)
+    monkeypatch.setattr(store, "descendants", refused)
 
     with pytest.raises(api.Forbidden):
         SHEET._gather_from_store(NAME, "reference", str(tmp_path))
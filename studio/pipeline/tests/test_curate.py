@@ -136,6 +136,16 @@ class Catalog:
             return sorted((dict(n) for n in self.nodes.values()
                            if n["parent"] == params["parent"]),
                           key=lambda n: n["name"])
+        found = re.fullmatch(r"/api/nodes/(\w+)/descendants", route)
+        if found:
+            # One page, parents first — `rewrite` walking `projects/` for the
+            # documents that cite a moved image.
+            base = self.path_of(found.group(1))
+            below = [n for n in self.nodes.values()
+                     if self.path_of(n["id"]).startswith(f"{base}/")]
+            below.sort(key=lambda n: self.path_of(n["id"]).count("/"))
+            return {"nodes": [{**n, "path": self.path_of(n["id"])[len(base) + 1:]}
+                              for n in below], "next_cursor": None}
         found = re.fullmatch(r"/api/nodes/(\w+)/download-url", route)
         if found:
             self.fetched.append(found.group(1))
@@ -148,6 +158,14 @@ class Catalog:
             if self._child(payload["parent"], payload["name"]):
                 raise api.Conflict(f"{payload['name']} already exists", 409)
             return dict(self._new(payload["parent"], payload["name"], payload["kind"]))
+        if route == "/api/resolve/batch":
+            answers = []
+            for path in payload["paths"]:
+                try:
+                    answers.append({"path": path, "node": self.resolve(path)})
+                except api.NotFound:
+                    answers.append({"path": path, "node": None})
+            return answers
         found = re.fullmatch(r"/api/nodes/(\w+)/upload-url", route)
         if found:
             return {"url": f"blob:{found.group(1)}", "headers": {}}
@@ -261,6 +279,21 @@ def test_regroup_reparents_and_writes_no_image(catalog):
     assert cited["bindings"]["image_input"] == [f"{FACE}/{NAME}_5.webp"]
 
 
+def test_regroup_looks_up_every_file_named_in_one_request(catalog):
+    result = run("regroup", f"{NAME}_5.webp", f"face/{NAME}_face_1.webp", "side", NAME)
+    assert result.exit_code == 0, result.output
+
+    assert catalog.calls.count(("POST", "/api/resolve/batch")) == 1
+    # The one single lookup left is `rewrite` finding `projects/` to walk.
+    assert catalog.calls.count(("GET", "/api/resolve")) == 1
+
+
+def test_regroup_of_a_file_not_there_names_it(catalog):
+    result = run("regroup", f"{NAME}_5.webp", "nope.webp", "side", NAME)
+    assert result.exit_code != 0
+    assert "'nope.webp' is not in" in result.output
+
+
 # ── dedupe: the cheap test first ────────────────────────────────────────────
 
 def test_duplicate_pairs_compares_size_before_reading_bytes(catalog):
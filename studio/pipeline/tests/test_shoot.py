@@ -18,9 +18,12 @@ fail silently rather than loudly:
 
 from __future__ import annotations
 
+import http.server
 import json
 import os
 import re
+import threading
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -970,3 +973,210 @@ def test_a_start_frame_is_format_checked_like_every_other_image(monkeypatch):
     # A legal start frame, with no references at all, still passes.
     args.start_key = "projects/p/input/p_in_1.png"
     assert SUB.gather(entry, args)[images["start"]].endswith(".png")
+
+
+# --- slots side by side ----------------------------------------------------
+#
+# Against a stand-in for Replicate on loopback rather than stubs of `replicate`,
+# so what is timed is the real create / poll / download round trips each slot
+# makes, and the stand-in alone decides how long each prediction takes.
+
+class _Replicate(http.server.BaseHTTPRequestHandler):
+    """Predictions that settle after a set delay, chosen by the plate they carry.
+
+    `plan` maps a pose plate's key to `(seconds, status)`; a prediction
+    whose input names none of them takes `latency` and succeeds. `spans` keeps,
+    per prediction, when it was created and when it was first seen settled —
+    what a test reads to tell how many were in flight at once.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    plan: dict[str, tuple[float, str]] = {}
+    latency = 0.3
+    predictions: dict[str, dict] = {}
+    spans: dict[str, list[float]] = {}
+    lock = threading.Lock()
+
+    def _answer(self, status: int, body: bytes, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # noqa: N802 — the handler's naming, not ours
+        sent = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        text = json.dumps(sent["input"])
+        seconds, status = next(
+            (how for plate, how in self.plan.items() if plate in text), (self.latency, "succeeded")
+        )
+        with self.lock:
+            pid = f"p-{len(self.predictions)}"
+            self.predictions[pid] = {"due": time.monotonic() + seconds, "status": status}
+            self.spans[pid] = [time.monotonic()]
+        self._answer(201, json.dumps({"id": pid, "status": "starting"}).encode())
+
+    def do_GET(self):  # noqa: N802
+        if self.path.startswith("/output/"):
+            return self._answer(200, b"rendered", "image/png")
+        pid = self.path.rsplit("/", 1)[1]
+        prediction = self.predictions[pid]
+        if time.monotonic() < prediction["due"]:
+            body = {"id": pid, "status": "processing"}
+        else:
+            with self.lock:
+                if len(self.spans[pid]) == 1:
+                    self.spans[pid].append(time.monotonic())
+            body = {"id": pid, "status": prediction["status"],
+                    "output": [f"{self.base}/output/{pid}.png"],
+                    "error": None if prediction["status"] == "succeeded" else "refused"}
+        self._answer(200, json.dumps(body).encode())
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def replicate(monkeypatch, media_bucket, spec):
+    """The stand-in, with `replicate` pointed at it and a shoot ready to submit."""
+    from studio_pipeline.adapters import replicate as RA
+
+    _seed_plates(media_bucket, spec)
+    entry = REG.get(spec["defaults"]["model"])
+    props = {f: {} for f in ("prompt", "aspect_ratio", "output_format", "quality",
+                             "moderation", entry["images"]["refs"])}
+    monkeypatch.setattr("studio_pipeline.engine.schema.fetch", lambda *a, **k: (props, {}))
+    monkeypatch.setenv("REPLICATE_API_TOKEN", "r8-test")
+    # The poll interval is what a slot waits between checks; at its real value
+    # it would be most of what this measures.
+    monkeypatch.setitem(SUB.KIND["image"], "interval", 0.02)
+
+    # `POST /api/runs` is the one write `media_bucket` leaves to the API. It is
+    # answered the way that fixture answers the rest: the parent's id is its
+    # path, and the run's documents are objects under it.
+    from studio_pipeline.adapters import api, store
+
+    def _record(route, payload=None, **params):
+        assert route == "/api/runs", route
+        for name, body in payload["documents"].items():
+            store.write(f"{payload['parent']}/{payload['name']}/{name}", body.encode(),
+                        content_type=R.DOCUMENT_TYPE)
+        return {"id": f"{payload['parent']}/{payload['name']}"}
+
+    monkeypatch.setattr(api, "post", _record)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Replicate)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(RA, "API_ROOT", base)
+    monkeypatch.setattr(_Replicate, "base", base, raising=False)
+    monkeypatch.setattr(_Replicate, "plan", {})
+    monkeypatch.setattr(_Replicate, "predictions", {})
+    monkeypatch.setattr(_Replicate, "spans", {})
+    yield _Replicate
+    server.shutdown()
+    server.server_close()
+
+
+def _plate(slot: dict) -> str:
+    """What of a slot's input the stand-in can tell it apart by: its own plate."""
+    return slot["pose_image"]
+
+
+def _summary(output: str) -> dict:
+    """The JSON a shoot ends on, out of everything else it printed."""
+    start = output.rindex('{\n  "character"')
+    return json.loads(output[start:output.index("\n}\n", start) + 2])
+
+
+def _shoot_timed(monkeypatch, slots, *extra):
+    """A confirmed shoot of `slots`; the result, and the seconds after the yes."""
+    import click
+
+    answered = []
+    monkeypatch.setattr(click, "confirm", lambda *a, **k: answered.append(time.monotonic()) or True)
+    argv = ["character", "shoot", "subject-a", "--project", "subject-a", *extra]
+    for slot in slots:
+        argv += ["--slot", slot["id"]]
+    result = CliRunner().invoke(cli.main, argv)
+    return result, time.monotonic() - answered[0]
+
+
+def test_side_by_side_a_shoot_takes_its_slowest_slot_not_the_sum(replicate, spec, monkeypatch):
+    """The reason `--jobs` exists: six predictions waited on at once, not in turn."""
+    slots = spec["slots"][:6]
+    latencies = [1.2, 1.0, 0.8, 0.6, 0.8, 1.0]
+    replicate.plan = {_plate(s): (t, "succeeded") for s, t in zip(slots, latencies)}
+
+    result, seconds = _shoot_timed(monkeypatch, slots, "--jobs", "6")
+    assert result.exit_code == 0, f"{result.output}\n{result.exception!r}"
+    assert seconds >= max(latencies)
+    # 5.4 s in turn; the recording and filing around each prediction is the
+    # rest, and it is the slack here.
+    assert seconds < max(latencies) + 0.5 * (sum(latencies) - max(latencies)), seconds
+    assert list(_summary(result.output)["rendered"]) == [s["id"] for s in slots]
+
+
+def test_side_by_side_output_comes_back_in_slot_order(replicate, spec, monkeypatch):
+    """The first slot finishes last, and its narration is still shown first."""
+    slots = spec["slots"][:3]
+    replicate.plan = {_plate(slots[0]): (0.6, "succeeded")}
+
+    result, _ = _shoot_timed(monkeypatch, slots, "--jobs", "3")
+    assert result.exit_code == 0, f"{result.output}\n{result.exception!r}"
+    headers = [result.output.index(f"----- {s['id']} -----") for s in slots]
+    assert headers == sorted(headers)
+    for here, after, slot in zip(headers, [*headers[1:], len(result.output)], slots):
+        block = result.output[here:after]
+        assert f"_ref-{slot['id'].replace('_', '-')}" in block, block
+    # A line as each slot settles, so the first one settling last is visible.
+    assert f"[3/3] {slots[0]['id']}: rendered" in result.output
+
+
+def test_side_by_side_one_refused_slot_does_not_stop_the_others(replicate, spec, monkeypatch):
+    slots = spec["slots"][:4]
+    replicate.plan = {_plate(slots[1]): (0.1, "failed")}
+
+    result, _ = _shoot_timed(monkeypatch, slots, "--jobs", "4")
+    assert result.exception is None, f"{result.output}\n{result.exception!r}"
+    summary = _summary(result.output)
+    assert list(summary["failed"]) == [slots[1]["id"]]
+    assert list(summary["rendered"]) == [s["id"] for s in slots if s is not slots[1]]
+    # Each runref names the run its own slot recorded, not whichever was latest.
+    for slot_id, ref in summary["rendered"].items():
+        run_id = ref.split("/", 1)[1].split("#")[0]
+        assert run_id.endswith(f"_ref-{slot_id.replace('_', '-')}")
+        record = R.run_record("subject-a", run_id)
+        assert record["result"]["status"] == "succeeded"
+        assert record["request"]["reference_slot"] == slot_id
+
+
+def test_a_models_registry_concurrency_caps_the_workers(replicate, spec, monkeypatch):
+    """`--jobs 4` on a model that takes two at a time keeps two in flight."""
+    slots = spec["slots"][:4]
+    monkeypatch.setattr(REG, "concurrency", lambda entry: 2)
+
+    result, seconds = _shoot_timed(monkeypatch, slots, "--jobs", "4")
+    assert result.exit_code == 0, f"{result.output}\n{result.exception!r}"
+    spans = list(replicate.spans.values())
+    most = max(sum(1 for start, end in spans if start <= moment < end) for moment, _ in spans)
+    assert most == 2
+    assert seconds >= 2 * replicate.latency
+
+
+def test_jobs_must_be_at_least_one(media_bucket, spec):
+    _seed_plates(media_bucket, spec)
+    result = CliRunner().invoke(cli.main, [
+        "character", "shoot", "subject-a", "--project", "subject-a", "--jobs", "0",
+        "--dry-run"])
+    assert result.exit_code != 0
+    assert "--jobs" in result.output
+
+
+def test_registry_concurrency_defaults_and_refuses_nonsense():
+    entry = REG.get("gpt-image-2")
+    assert REG.concurrency(entry) == REG.DEFAULT_CONCURRENCY
+    assert REG.concurrency({**entry, "concurrency": 1}) == 1
+    with pytest.raises(REG.RegistryError):
+        REG.concurrency({**entry, "concurrency": 0})
@@ -9,17 +9,26 @@ stubbed `store` itself would assert nothing about either.
 from __future__ import annotations
 
 import io
+import json
+import re
+import threading
+import time
 import urllib.error
+import urllib.parse
+from collections import Counter
 
+import boto3
 import pytest
+from moto import mock_s3
 
-from studio_pipeline.adapters import api, store
+from studio_pipeline.adapters import api, auth, store
 
 
 class _Response(io.BytesIO):
     def __init__(self, body: bytes = b"") -> None:
         super().__init__(body)
         self.status = 200
+        self.headers = {}
 
     def __enter__(self):
         return self
@@ -61,6 +70,34 @@ def test_resolve_asks_the_api_for_a_name_path(apis):
     assert calls[0][2] == {"path": "characters/<name>/reference/face_01.png"}
 
 
+def test_resolve_many_is_one_request_keyed_by_the_paths_given(apis):
+    calls, table = apis
+    table[("POST", "/api/resolve/batch")] = [
+        {"path": "characters/<name>/a.png", "node": {"id": "node-a"}},
+        {"path": "characters/<name>/b.png", "node": None, "missing": "characters/<name>/b.png"},
+    ]
+
+    found = store.resolve_many(["/characters/<name>/a.png", "characters/<name>/b.png"])
+
+    assert found == {
+        "/characters/<name>/a.png": {"id": "node-a"},
+        "characters/<name>/b.png": None,
+    }
+    assert calls == [
+        (
+            "POST",
+            "/api/resolve/batch",
+            {"paths": ["characters/<name>/a.png", "characters/<name>/b.png"]},
+        )
+    ]
+
+
+def test_resolve_many_of_nothing_asks_nothing(apis):
+    calls, _ = apis
+    assert store.resolve_many([]) == {}
+    assert calls == []
+
+
 def test_read_fetches_the_presigned_url_not_the_api(apis, monkeypatch):
     """Bytes never travel through the API — that is what keeps a video out of the Lambda."""
     _, table = apis
@@ -186,8 +223,8 @@ def test_resolve_goes_through_the_real_api_signature(monkeypatch):
     so `resolve` raised `TypeError` on every call — and the suite was green,
     because no test drove the real signature.
 
-    This one stubs `urlopen` instead, so the signature is part of what is
-    asserted.
+    This one stubs the connection `api` opens instead, so the signature is part
+    of what is asserted.
     """
     from studio_pipeline.adapters import auth
 
@@ -195,11 +232,21 @@ def test_resolve_goes_through_the_real_api_signature(monkeypatch):
     monkeypatch.setattr(auth, "api_url", lambda: "https://api.example")
     seen = {}
 
-    def _urlopen(request, timeout=None):  # noqa: ARG001
-        seen["url"] = request.full_url
-        return _Response(b'{"id": "node-1"}')
+    class _Connection:
+        def request(self, method, target, body=None, headers=None):  # noqa: ARG002
+            seen["url"] = target
 
-    monkeypatch.setattr(api.urllib.request, "urlopen", _urlopen)
+        def getresponse(self):
+            response = _Response(b'{"id": "node-1"}')
+            response.will_close = True
+            response.getheader = lambda name: None
+            return response
+
+        def close(self):
+            pass
+
+    api.disconnect()
+    monkeypatch.setattr(api, "_connect", lambda scheme, host: _Connection())
 
     assert store.resolve("characters/<name>/reference")["id"] == "node-1"
     assert "path=characters" in seen["url"]
@@ -343,3 +390,586 @@ def test_a_folder_that_is_not_there_lists_as_empty(apis, monkeypatch):
     monkeypatch.setattr(api, "get", _get)
 
     assert store.files("projects/<project>/input") == []
+
+
+# ──────────────────────── multipart upload (large files) ────────────────────────
+#
+# End to end against moto's multipart upload rather than a scripted table: the
+# assertions that matter — which parts S3 holds, and whether the object it
+# assembles is the file — are about the store, and a table would only echo
+# back what the test told it. `_MultipartApi` answers the four routes the way
+# `routes/nodes.py` does, and `_urlopen` stands in for S3 serving a part URL,
+# failing on cue. moto is not thread-safe and the parts arrive from a pool, so
+# every call into it holds one lock.
+
+PART = 256
+
+
+class _MultipartApi:
+    def __init__(self, s3, monkeypatch):
+        self.s3 = s3
+        self.lock = threading.Lock()
+        self.upload = None
+        self.signed = []
+        self.put = []
+        self.failures = {}
+        monkeypatch.setattr(api, "get", self.get)
+        monkeypatch.setattr(api, "post", self.post)
+        monkeypatch.setattr(store.urllib.request, "urlopen", self.urlopen)
+
+    def get(self, _route, **params):
+        return {"id": "node-renders", "kind": "folder"}
+
+    def post(self, _route, payload=None, **params):
+        with self.lock:
+            if _route == "/api/nodes":
+                return {"id": "node-clip"}
+            if _route.endswith("/multipart"):
+                return self._open(payload)
+            if _route.endswith("/urls"):
+                return self._sign(payload["parts"])
+            if _route.endswith("/complete"):
+                return self._complete()
+        raise AssertionError(_route)
+
+    def _open(self, payload):
+        if self.upload is None or self.upload["size"] != payload["size"]:
+            created = self.s3.create_multipart_upload(Bucket=BUCKET, Key=KEY)
+            self.upload = {"id": created["UploadId"], "size": payload["size"]}
+        size = self.upload["size"]
+        return {
+            "id": "node-clip",
+            "upload_id": self.upload["id"],
+            "size": size,
+            "part_bytes": PART,
+            "part_count": -(-size // PART),
+            "parts": self._parts(),
+        }
+
+    def _parts(self):
+        listed = self.s3.list_parts(Bucket=BUCKET, Key=KEY, UploadId=self.upload["id"])
+        return [
+            {"number": part["PartNumber"], "size": part["Size"], "etag": part["ETag"].strip('"')}
+            for part in listed.get("Parts", [])
+        ]
+
+    def _sign(self, numbers):
+        self.signed += numbers
+        return {"parts": [
+            {"number": n, "url": f"https://s3.test/part/{n}", "headers": {}} for n in numbers
+        ]}
+
+    def _complete(self):
+        parts = self.s3.list_parts(Bucket=BUCKET, Key=KEY, UploadId=self.upload["id"])["Parts"]
+        self.s3.complete_multipart_upload(
+            Bucket=BUCKET, Key=KEY, UploadId=self.upload["id"],
+            MultipartUpload={"Parts": [
+                {"PartNumber": part["PartNumber"], "ETag": part["ETag"]} for part in parts
+            ]},
+        )
+        self.upload = None
+        return {"id": "node-clip", "size": self.s3.head_object(Bucket=BUCKET, Key=KEY)["ContentLength"]}
+
+    def urlopen(self, request, timeout=None):  # noqa: ARG002
+        number = int(request.full_url.rsplit("/", 1)[1])
+        with self.lock:
+            if self.failures.get(number, 0) > 0:
+                self.failures[number] -= 1
+                raise urllib.error.URLError("connection reset")
+            self.put.append(number)
+            self.s3.upload_part(
+                Bucket=BUCKET, Key=KEY, UploadId=self.upload["id"],
+                PartNumber=number, Body=request.data,
+            )
+        return _Response()
+
+    def stored(self):
+        return self.s3.get_object(Bucket=BUCKET, Key=KEY)["Body"].read()
+
+
+BUCKET = "multipart-test"
+KEY = "blobs/node-clip"
+
+
+@pytest.fixture
+def multipart(monkeypatch):
+    import moto.s3.models
+
+    monkeypatch.setattr(moto.s3.models, "S3_UPLOAD_PART_MIN_SIZE", PART)
+    monkeypatch.setattr(store, "MULTIPART_THRESHOLD", PART)
+    with mock_s3():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+        yield _MultipartApi(s3, monkeypatch)
+
+
+def _render(tmp_path, parts=5, tail=17, seed=b"frame"):
+    """A file of `parts` full parts and a short last one, every part different."""
+    body = b"".join(seed + bytes([n]) * (PART - len(seed)) for n in range(parts)) + b"t" * tail
+    source = tmp_path / "scene.mp4"
+    source.write_bytes(body)
+    return source, body
+
+
+def test_a_large_file_goes_up_in_parts_and_a_failed_part_is_retried(multipart, tmp_path):
+    source, body = _render(tmp_path)
+    multipart.failures = {2: 1, 5: 2}
+
+    node = store.upload("projects/<project>/renders/scene.mp4", source, content_type="video/mp4")
+
+    assert node["size"] == len(body)
+    assert multipart.stored() == body
+    # Re-signed on every attempt: a failed part's URL may be the expired thing.
+    assert sorted(multipart.signed) == [1, 2, 2, 3, 4, 5, 5, 5, 6]
+
+
+def test_a_failed_upload_resumes_from_the_parts_s3_holds(multipart, tmp_path):
+    source, body = _render(tmp_path)
+    multipart.failures = {4: store.PART_ATTEMPTS}
+
+    with pytest.raises(store.StoreError, match="1 of 6 parts"):
+        store.upload("projects/<project>/renders/scene.mp4", source, content_type="video/mp4")
+    assert sorted(multipart.put) == [1, 2, 3, 5, 6]
+
+    multipart.put.clear()
+    store.upload("projects/<project>/renders/scene.mp4", source, content_type="video/mp4")
+
+    assert multipart.put == [4]
+    assert multipart.stored() == body
+
+
+def test_a_held_part_of_different_bytes_is_sent_again(multipart, tmp_path):
+    """Same size is not same file: a held part is kept only when its MD5 matches."""
+    source, _ = _render(tmp_path)
+    multipart.failures = {1: store.PART_ATTEMPTS}
+    with pytest.raises(store.StoreError):
+        store.upload("projects/<project>/renders/scene.mp4", source, content_type="video/mp4")
+
+    source, body = _render(tmp_path, seed=b"recut")
+    multipart.put.clear()
+    store.upload("projects/<project>/renders/scene.mp4", source, content_type="video/mp4")
+
+    # Parts 1-5 changed with the recut; the tail did not, and is kept.
+    assert sorted(multipart.put) == [1, 2, 3, 4, 5]
+    assert multipart.stored() == body
+
+
+def test_a_small_file_is_still_one_put(apis, monkeypatch, tmp_path):
+    calls, table = apis
+    table[("GET", "/api/resolve")] = {"id": "node-renders"}
+    table[("POST", "/api/nodes")] = {"id": "node-new"}
+    table[("POST", "/api/nodes/node-new/upload-url")] = {"url": "https://s3/signed", "headers": {}}
+    table[("POST", "/api/nodes/node-new/confirm-upload")] = {"id": "node-new"}
+    monkeypatch.setattr(store.urllib.request, "urlopen", lambda *a, **k: _Response())
+    source = tmp_path / "still.png"
+    source.write_bytes(b"x" * 10)
+
+    store.upload("projects/<project>/renders/still.png", source, content_type="image/png")
+
+    assert not [call for call in calls if "multipart" in call[1]]
+
+
+# ──────────────────────── streaming (no file on disk) ────────────────────────
+
+def test_a_large_stream_goes_up_in_parts_read_in_order(multipart, tmp_path):
+    _, body = _render(tmp_path)
+    source = io.BytesIO(body)
+
+    node = store.stream("projects/<project>/renders/scene.mp4", source,
+                        size=len(body), content_type="video/mp4")
+
+    assert node["size"] == len(body)
+    assert multipart.stored() == body
+
+
+class _Trickle(io.BytesIO):
+    """A socket's way of reading: never more than a few bytes at a time."""
+
+    def read(self, amount=-1):
+        return super().read(min(amount, 3) if amount and amount > 0 else 3)
+
+
+def test_a_stream_is_one_put_of_exactly_its_size(library):
+    store.stream("characters/subject-a/seed/three.png", _Trickle(b"three bytes"),
+                 size=11, content_type="image/png")
+
+    assert library.blobs[library.find("characters/subject-a/seed/three.png")["id"]] == b"three bytes"
+    assert library.total("POST", "/api/nodes/<id>/confirm-upload") == 1
+
+
+@pytest.mark.parametrize("body, says", [(b"short", "ended 6 bytes short"),
+                                        (b"eleven bytes!", "ran past the 11")])
+def test_a_stream_that_breaks_its_promise_is_never_confirmed(library, body, says):
+    """A signed PUT is for one length; a source that disagrees writes nothing a reader sees."""
+    with pytest.raises(store.StoreError, match=says):
+        store.stream("characters/subject-a/seed/three.png", io.BytesIO(body),
+                     size=11, content_type="image/png")
+    assert library.total("POST", "/api/nodes/<id>/confirm-upload") == 0
+
+
+# ──────────────────────────── the path cache ────────────────────────────
+#
+# Stubbed one layer lower than the tests above: `_Library` answers `api._send`,
+# so the real `api.request` runs in front of it — and that is where the hook
+# that keeps the cache honest lives. A node is a row with a parent, as in the
+# catalog, so a rename or a move changes every path beneath it the way the real
+# one does, and ids are opaque, so nothing can pass a path off as one.
+
+class _Library:
+    def __init__(self, files: dict[str, bytes], monkeypatch):
+        self.nodes = {"node-root": {"id": "node-root", "name": "", "kind": "folder", "parent": None}}
+        self.blobs: dict[str, bytes] = {}
+        self.calls: Counter = Counter()
+        self.page = 1000
+        for path, body in files.items():
+            self.make(path, body)
+        monkeypatch.setattr(auth, "api_url", lambda: "https://api.test")
+        monkeypatch.setattr(auth, "id_token", lambda **_: "token")
+        monkeypatch.setattr(api, "_send", self.send)
+        monkeypatch.setattr(store.urllib.request, "urlopen", self.urlopen)
+
+    def find(self, path: str) -> dict | None:
+        node = self.nodes["node-root"]
+        for name in filter(None, path.strip("/").split("/")):
+            node = next((child for child in self.nodes.values()
+                         if child["parent"] == node["id"] and child["name"] == name), None)
+            if node is None:
+                return None
+        return node
+
+    def make(self, path: str, body: bytes | None = None) -> dict:
+        parent = self.nodes["node-root"]
+        names = path.strip("/").split("/")
+        for depth, name in enumerate(names, start=1):
+            found = self.find("/".join(names[:depth]))
+            if found is None:
+                last = depth == len(names) and body is not None
+                found = self._add(parent["id"], name, "file" if last else "folder")
+            parent = found
+        if body is not None:
+            self.blobs[parent["id"]] = body
+        return parent
+
+    def total(self, method: str | None = None, route: str | None = None) -> int:
+        return sum(count for (m, r), count in self.calls.items()
+                   if method in (None, m) and route in (None, r))
+
+    def _add(self, parent: str, name: str, kind: str) -> dict:
+        node = {"id": f"node-{len(self.nodes):04d}", "name": name, "kind": kind, "parent": parent}
+        self.nodes[node["id"]] = node
+        return node
+
+    def _view(self, node: dict) -> dict:
+        view = dict(node)
+        if node["kind"] == "file":
+            view["size"] = len(self.blobs.get(node["id"], b""))
+        return view
+
+    def send(self, method, url, token, payload, etag=None):  # noqa: ARG002
+        parts = urllib.parse.urlsplit(url)
+        query = dict(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
+        self.calls[(method, re.sub(r"^/api/nodes/[^/]+", "/api/nodes/<id>", parts.path))] += 1
+        try:
+            answer = self._answer(method, parts.path, query, payload)
+        except KeyError:
+            return 404, b'{"error": "not found"}', None
+        except api.Conflict:
+            return 409, b'{"error": "already there"}', None
+        return 200, json.dumps(answer).encode(), None
+
+    def _answer(self, method, route, query, payload):
+        node_id = route.split("/")[3] if route.startswith("/api/nodes/") else None
+        if (method, route) == ("GET", "/api/resolve"):
+            found = self.find(query["path"])
+            if found is None:
+                raise KeyError(query["path"])
+            return self._view(found)
+        if (method, route) == ("GET", "/api/nodes"):
+            self.nodes[query["parent"]]
+            return sorted((self._view(n) for n in self.nodes.values()
+                           if n["parent"] == query["parent"]), key=lambda n: n["name"])
+        if (method, route) == ("POST", "/api/nodes"):
+            return self._view(self._create(payload["parent"], payload["name"], payload["kind"]))
+        if (method, route) == ("POST", "/api/runs"):
+            run = self._create(payload["parent"], payload["name"], "folder")
+            for name, text in payload["documents"].items():
+                self.blobs[self._add(run["id"], name, "file")["id"]] = text.encode()
+            return self._view(run)
+        if route.endswith("/descendants"):
+            return self._descendants(node_id, int(query.get("cursor") or 0))
+        if route.endswith(("/download-url", "/upload-url")):
+            return {"url": f"https://s3.test/{self.nodes[node_id]['id']}", "headers": {}}
+        if route.endswith("/confirm-upload"):
+            return self._view(self.nodes[node_id])
+        if method == "PATCH":
+            self.nodes[node_id].update(payload)
+            return self._view(self.nodes[node_id])
+        if method == "DELETE":
+            self.remove(node_id)
+            return {}
+        raise AssertionError(f"{method} {route}")
+
+    def _descendants(self, node_id: str, offset: int) -> dict:
+        """Parents first, `page` rows a page, the cursor an offset — shape, not cost."""
+        below, level = [], [node_id]
+        while level:
+            level = [n["id"] for n in self.nodes.values() if n["parent"] in level]
+            below += level
+        base = self.path(node_id)
+        rows = [{**self._view(self.nodes[n]), "path": self.path(n)[len(base):].lstrip("/")}
+                for n in below]
+        end = offset + self.page
+        return {"nodes": rows[offset:end], "next_cursor": str(end) if end < len(rows) else None}
+
+    def path(self, node_id: str) -> str:
+        names = []
+        while self.nodes[node_id]["parent"] is not None:
+            names.append(self.nodes[node_id]["name"])
+            node_id = self.nodes[node_id]["parent"]
+        return "/".join(reversed(names))
+
+    def _create(self, parent: str, name: str, kind: str) -> dict:
+        self.nodes[parent]
+        if any(n["parent"] == parent and n["name"] == name for n in self.nodes.values()):
+            raise api.Conflict(name, 409)
+        return self._add(parent, name, kind)
+
+    def remove(self, node_id: str) -> None:
+        for child in [n for n in self.nodes.values() if n["parent"] == node_id]:
+            self.remove(child["id"])
+        del self.nodes[node_id]
+
+    def urlopen(self, request, timeout=None):  # noqa: ARG002
+        # `_fetch` opens a signed URL as a string; `_put` sends a `Request`.
+        url = getattr(request, "full_url", request)
+        node_id = url.rsplit("/", 1)[1]
+        data = getattr(request, "data", None)
+        if data is not None:
+            self.blobs[node_id] = data.read() if hasattr(data, "read") else data
+            return _Response()
+        return _Response(self.blobs[node_id])
+
+
+@pytest.fixture
+def library(monkeypatch):
+    return _Library({
+        "characters/subject-a/seed/one.png": b"one",
+        "characters/subject-a/seed/two.png": b"two",
+    }, monkeypatch)
+
+
+def test_a_path_resolved_once_is_not_asked_about_again(library):
+    for _ in range(3):
+        store.presign("characters/subject-a/seed/one.png")
+        assert store.exists("characters/subject-a/seed/one.png")
+
+    assert library.total("GET", "/api/resolve") == 1
+    assert library.total("GET", "/api/nodes/<id>/download-url") == 3
+
+
+def test_a_listing_caches_every_child_it_returns(library):
+    store.children("characters/subject-a/seed")
+    library.calls.clear()
+
+    assert store.read("characters/subject-a/seed/two.png") == b"two"
+    assert library.total("GET", "/api/resolve") == 0
+
+
+def test_resolve_and_size_always_ask(library):
+    """`updated_at` and `size` are read off the node, so the node is read."""
+    store.resolve("characters/subject-a/seed/one.png")
+    library.blobs[library.find("characters/subject-a/seed/one.png")["id"]] = b"longer"
+
+    assert store.size("characters/subject-a/seed/one.png") == len(b"longer")
+    assert library.total("GET", "/api/resolve") == 2
+
+
+def test_a_write_caches_what_it_created(library):
+    store.folder("projects/p/runs/r")
+    store.write("projects/p/runs/r/result.json", b"{}", content_type="application/json")
+    library.calls.clear()
+
+    assert store.read("projects/p/runs/r/result.json") == b"{}"
+    assert library.total("GET", "/api/resolve") == 0
+
+
+def test_a_rename_through_the_api_drops_the_old_path_and_everything_under_it(library):
+    seed = store.folder("characters/subject-a/seed")
+    store.presign("characters/subject-a/seed/one.png")
+
+    api.patch(f"/api/nodes/{seed['id']}", {"name": "kept"})
+
+    assert not store.exists("characters/subject-a/seed/one.png")
+    assert store.read("characters/subject-a/kept/one.png") == b"one"
+
+
+def test_a_delete_through_the_api_drops_the_path(library):
+    node = store.resolve("characters/subject-a/seed/one.png")
+    api.delete(f"/api/nodes/{node['id']}")
+
+    assert not store.exists("characters/subject-a/seed/one.png")
+
+
+def test_a_write_to_a_route_it_cannot_read_clears_the_whole_cache(library, monkeypatch):
+    store.presign("characters/subject-a/seed/one.png")
+    with monkeypatch.context() as patched:
+        patched.setattr(library, "_answer", lambda *a: {})
+        api.post("/api/libraries/lib-shared/import", {})
+    library.calls.clear()
+
+    store.presign("characters/subject-a/seed/one.png")
+    assert library.total("GET", "/api/resolve") == 1
+
+
+def test_a_cached_id_someone_else_removed_is_resolved_again_once(library):
+    """No hook sees another process's delete; the 404 it causes is the signal."""
+    store.presign("characters/subject-a/seed/one.png")
+    library.remove(library.find("characters/subject-a/seed/one.png")["id"])
+    library.make("characters/subject-a/seed/one.png", b"again")
+
+    assert store.read("characters/subject-a/seed/one.png") == b"again"
+    assert library.total("GET", "/api/resolve") == 2
+
+
+def test_a_path_that_is_gone_everywhere_still_raises(library):
+    store.presign("characters/subject-a/seed/one.png")
+    library.remove(library.find("characters/subject-a/seed/one.png")["id"])
+
+    with pytest.raises(api.NotFound):
+        store.presign("characters/subject-a/seed/one.png")
+
+
+def test_nothing_is_persisted_unless_a_ttl_is_set(library):
+    store.presign("characters/subject-a/seed/one.png")
+    store._paths.save()
+
+    assert not list(store.CACHE_DIR.iterdir())
+
+
+def test_a_persisted_path_is_trusted_for_the_ttl_and_not_after(library, monkeypatch):
+    monkeypatch.setenv("STUDIO_PATH_CACHE_TTL_SECONDS", "60")
+    earlier = store._Paths()
+    monkeypatch.setattr(store, "_paths", earlier)
+    store.presign("characters/subject-a/seed/one.png")
+    earlier.save()
+    (saved,) = store.CACHE_DIR.iterdir()
+    assert saved.name.startswith("paths-default-")
+
+    monkeypatch.setattr(store, "_paths", store._Paths())
+    library.calls.clear()
+    store.presign("characters/subject-a/seed/one.png")
+    assert library.total("GET", "/api/resolve") == 0
+
+    later = time.time() + 61
+    monkeypatch.setattr(store.time, "time", lambda: later)
+    monkeypatch.setattr(store, "_paths", store._Paths())
+    store.presign("characters/subject-a/seed/one.png")
+    assert library.total("GET", "/api/resolve") == 1
+
+
+def test_each_library_persists_to_its_own_file(library, monkeypatch):
+    monkeypatch.setenv("STUDIO_PATH_CACHE_TTL_SECONDS", "60")
+    paths = store._Paths()
+    monkeypatch.setattr(store, "_paths", paths)
+    store.presign("characters/subject-a/seed/one.png")
+    monkeypatch.setenv("STUDIO_LIBRARY_ID", "lib-shared")
+    store.presign("characters/subject-a/seed/one.png")
+    paths.save()
+
+    assert sorted(p.name.split("-")[1] for p in store.CACHE_DIR.iterdir()) == ["default", "lib"]
+    assert library.total("GET", "/api/resolve") == 2
+
+
+def test_a_walk_is_a_request_a_page_not_a_request_a_folder(library):
+    for run in range(6):
+        library.make(f"projects/p/runs/run-{run}/output/{run}.png", b"png")
+        library.make(f"projects/p/runs/run-{run}/request.json", b"{}")
+    library.page = 10
+    library.calls.clear()
+
+    walked = store.walk_files("projects/p")
+
+    assert walked == [
+        path for run in range(6)
+        for path in (f"projects/p/runs/run-{run}/output/{run}.png",
+                     f"projects/p/runs/run-{run}/request.json")
+    ]
+    assert library.total("GET", "/api/nodes") == 0
+    # 25 nodes beneath `projects/p`, ten to a page.
+    assert library.total("GET", "/api/nodes/<id>/descendants") == 3
+    library.calls.clear()
+    assert store.read("projects/p/runs/run-5/request.json") == b"{}"
+    assert library.total("GET", "/api/resolve") == 0
+
+
+def test_walking_a_folder_that_is_not_there_finds_nothing(library):
+    assert store.walk_files("projects/nowhere") == []
+    assert list(store.descendants("projects/nowhere")) == []
+
+
+def _shoot(files, monkeypatch, slots, *, cached=True) -> _Library:
+    """A real `studio character shoot` of `slots`, Replicate aside, against a fresh library."""
+    from click.testing import CliRunner
+
+    from studio_pipeline import cli
+    from studio_pipeline.adapters import replicate as RA
+
+    store.forget()
+    library = _Library(files, monkeypatch)
+    if not cached:
+        monkeypatch.setattr(store._paths, "get", lambda path: None)
+
+    def _open_output(url):
+        response = _Response(b"rendered")
+        response.headers = {"Content-Length": "8"}
+        return response
+
+    monkeypatch.setattr(RA, "create_prediction",
+                        lambda *a, **k: {"id": "p-1", "status": "starting"})
+    # What the tracker asks about the prediction; it has settled the first time.
+    monkeypatch.setattr(RA, "api", lambda *a, **k: {
+        "status": "succeeded", "output": ["https://replicate.test/out.png"]})
+    monkeypatch.setattr(RA, "open_output", _open_output)
+    argv = ["character", "shoot", "subject-a", "--project", "subject-a"]
+    for slot in slots:
+        argv += ["--slot", slot]
+    result = CliRunner().invoke(cli.main, argv, input="y\n")
+    assert result.exit_code == 0, f"{result.output}\n{result.exception!r}"
+    assert '"failed": {}' in result.output
+    return library
+
+
+def test_a_twelve_slot_shoot_makes_far_fewer_api_calls(monkeypatch):
+    """The cache's reason to exist, counted on the command it was built for.
+
+    Every slot presigns the same identity images and its own plate and files
+    into the same runs folder — paths the shoot has already resolved, asked
+    about again for each slot without the cache. What the cache may not cut is anything but a resolve: every sign,
+    write and listing is still made.
+    """
+    from studio_pipeline.engine import registry as REG
+    from studio_pipeline.engine import shoot as SHOOT
+    from tests.conftest import FIXTURE_OBJECTS
+
+    spec = SHOOT.load_spec()
+    slots = [slot["id"] for slot in spec["slots"]][:12]
+    assert len(slots) == 12
+    files = dict(FIXTURE_OBJECTS)
+    for slot in spec["slots"]:
+        for key in SHOOT.plate_keys(slot):
+            files[key] = b"png"
+    entry = REG.get(spec["defaults"]["model"])
+    props = {f: {} for f in ("prompt", "aspect_ratio", "output_format", "quality",
+                             "moderation", entry["images"]["refs"])}
+    monkeypatch.setattr("studio_pipeline.engine.schema.fetch", lambda *a, **k: (props, {}))
+
+    with_cache = _shoot(files, monkeypatch, slots)
+    without = _shoot(files, monkeypatch, slots, cached=False)
+
+    resolves = with_cache.total("GET", "/api/resolve")
+    # 40 against 114 when this was written. What is left is mostly each slot's
+    # run folder and its `output/`, both new since the shoot began.
+    assert resolves * 2 < without.total("GET", "/api/resolve")
+    assert with_cache.total() < without.total() * 0.75
+    assert (with_cache.total() - resolves
+            == without.total() - without.total("GET", "/api/resolve"))
@@ -0,0 +1,154 @@
+"""`submit.execute`'s last stage: a prediction's outputs, moved into its run.
+
+Against a stand-in for Replicate's delivery host on loopback, because what is
+pinned is how the bytes travel — several at once, straight from the response
+into the store, and hashed on the way — and a stub of `open_output` would hand
+back whatever the test gave it, at whatever pace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.server
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from studio_pipeline.adapters import api, store
+from studio_pipeline.adapters import replicate as RA
+from studio_pipeline.domain import runs as R
+from studio_pipeline.engine import registry as REG
+from studio_pipeline.engine import submit as SUB
+from tests.conftest import BUCKET
+
+PROJECT = "subject-a"
+
+
+class _Delivery(http.server.BaseHTTPRequestHandler):
+    """Output files, each sent after `delay` seconds; `unsized` ones with no length.
+
+    A name in `missing` is an output the prediction reports and the host 404s.
+
+    HTTP/1.0, so a response without `Content-Length` ends when the connection
+    does — the shape of a chunked delivery, as far as the client can tell.
+    """
+
+    protocol_version = "HTTP/1.0"
+    bodies: dict[str, bytes] = {}
+    unsized: set[str] = set()
+    missing: list[str] = []
+    delay = 0.0
+    sending = 0
+    most = 0
+    lock = threading.Lock()
+
+    def do_GET(self):  # noqa: N802 — the handler's naming, not ours
+        name = self.path.rsplit("/", 1)[1]
+        if name not in self.bodies:
+            self.send_error(404)
+            return
+        cls = type(self)
+        with self.lock:
+            cls.sending += 1
+            cls.most = max(cls.most, cls.sending)
+        time.sleep(self.delay)
+        with self.lock:
+            cls.sending -= 1
+        self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        if name not in self.unsized:
+            self.send_header("Content-Length", str(len(self.bodies[name])))
+        self.end_headers()
+        self.wfile.write(self.bodies[name])
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def delivery(monkeypatch, media_bucket):
+    """The stand-in, and a prediction that has settled with its files as outputs."""
+    # `POST /api/runs` is the one write `media_bucket` leaves to the API; see
+    # the same shim in `test_shoot`.
+    def _record(route, payload=None, **params):
+        assert route == "/api/runs", route
+        for name, body in payload["documents"].items():
+            store.write(f"{payload['parent']}/{payload['name']}/{name}", body.encode(),
+                        content_type=R.DOCUMENT_TYPE)
+        return {"id": f"{payload['parent']}/{payload['name']}"}
+
+    monkeypatch.setattr(api, "post", _record)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Delivery)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}/out"
+    monkeypatch.setattr(_Delivery, "bodies", {})
+    monkeypatch.setattr(_Delivery, "unsized", set())
+    monkeypatch.setattr(_Delivery, "missing", [])
+    monkeypatch.setattr(_Delivery, "delay", 0.0)
+    monkeypatch.setattr(_Delivery, "most", 0)
+    monkeypatch.setattr(RA, "create_prediction",
+                        lambda *a, **k: {"id": "p-1", "status": "starting"})
+    monkeypatch.setattr(RA, "api", lambda *a, **k: {
+        "status": "succeeded",
+        "output": [f"{base}/{name}" for name in [*_Delivery.bodies, *_Delivery.missing]],
+    })
+    yield _Delivery
+    server.shutdown()
+    server.server_close()
+
+
+def _execute(dest=None) -> dict:
+    """A video submit of nothing in particular; the run's `result.json`."""
+    args = SimpleNamespace(project=PROJECT, slug="clip", run_id="2026-10-17_12-00-00_clip",
+                           character=None, expires=3600, interval=0.02, timeout=10,
+                           poll=True, dest=dest)
+    assert SUB.execute(REG.get("kling"), {"prompt": "x"}, {}, "r8-test", args) == 0
+    return R.read_json(R.run_key(PROJECT, args.run_id, "result.json"))
+
+
+def _stored(media_bucket, key: str) -> bytes:
+    return media_bucket.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+
+
+def test_outputs_travel_side_by_side_and_are_hashed_on_the_way(delivery, media_bucket):
+    delivery.bodies = {f"take-{n}.mp4": bytes([n]) * (200_000 + n) for n in range(1, 5)}
+    delivery.delay = 0.3
+
+    started = time.monotonic()
+    result = _execute()
+    took = time.monotonic() - started
+
+    # One after another this is 1.2 s of waiting alone; together, one delay.
+    assert delivery.most == 4
+    assert took < 0.9, took
+    assert [key.rsplit("/", 1)[1] for key in result["outputs"]] == [
+        "clip-1.mp4", "clip-2.mp4", "clip-3.mp4", "clip-4.mp4"]
+    for key, body in zip(result["outputs"], delivery.bodies.values()):
+        assert _stored(media_bucket, key) == body
+        assert result["sha256"][key] == hashlib.sha256(body).hexdigest()
+
+
+def test_an_output_sent_without_a_length_is_still_stored(delivery, media_bucket):
+    """A PUT is signed for a length; with none given, it is counted first."""
+    delivery.bodies = {"take.mp4": b"frames" * 1000}
+    delivery.unsized = {"take.mp4"}
+
+    result = _execute()
+
+    [key] = result["outputs"]
+    assert _stored(media_bucket, key) == delivery.bodies["take.mp4"]
+    assert result["sha256"][key] == hashlib.sha256(delivery.bodies["take.mp4"]).hexdigest()
+
+
+def test_dest_gets_a_copy_and_a_failed_output_leaves_no_part_of_one(delivery, tmp_path):
+    delivery.bodies = {"take-1.mp4": b"one" * 1000, "take-2.mp4": b"two" * 1000}
+    _execute(dest=str(tmp_path / "kept"))
+    assert (tmp_path / "kept" / "clip-2.mp4").read_bytes() == delivery.bodies["take-2.mp4"]
+
+    delivery.missing = ["gone.mp4"]
+    with pytest.raises(RA.ReplicateError):
+        _execute(dest=str(tmp_path / "failed"))
+    assert not [p for p in (tmp_path / "failed").iterdir() if p.suffix == ".part"]
+
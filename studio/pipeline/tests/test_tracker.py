@@ -0,0 +1,236 @@
+"""The prediction tracker: one schedule for every prediction in flight.
+
+What is pinned here is what would go wrong quietly: a schedule that asks too
+often (it costs requests and nothing fails), one that asks too rarely (results
+arrive late and nothing fails), a webhook body taken at its word, and a slow
+prediction holding a thread of its own again.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.request
+
+import pytest
+
+from studio_pipeline.adapters import replicate as RA
+from studio_pipeline.adapters import store
+from studio_pipeline.adapters import tracker as TRACK
+
+
+class _Predictions:
+    """`replicate.api` for GETs on predictions that settle at set times."""
+
+    def __init__(self, monkeypatch) -> None:
+        self.due: dict[str, tuple[float, str]] = {}
+        self.asked: dict[str, int] = {}
+        self.lock = threading.Lock()
+        monkeypatch.setattr(RA, "api", self)
+
+    def add(self, prediction_id: str, seconds: float, status: str = "succeeded") -> None:
+        self.due[prediction_id] = (time.monotonic() + seconds, status)
+
+    def __call__(self, method, url, token, body=None):
+        assert method == "GET", method
+        prediction_id = url.rsplit("/", 1)[1]
+        with self.lock:
+            self.asked[prediction_id] = self.asked.get(prediction_id, 0) + 1
+        when, status = self.due[prediction_id]
+        if time.monotonic() < when:
+            return {"id": prediction_id, "status": "processing"}
+        return {"id": prediction_id, "status": status, "output": [f"{prediction_id}.png"]}
+
+
+@pytest.fixture
+def predictions(monkeypatch):
+    return _Predictions(monkeypatch)
+
+
+@pytest.fixture
+def tracker():
+    tracker = TRACK.Tracker("r8-test")
+    yield tracker
+    tracker.close()
+
+
+# --- the schedule ----------------------------------------------------------
+
+def test_without_history_every_check_is_an_interval_apart():
+    assert {TRACK.next_check(elapsed, None, 5) for elapsed in (0, 2, 10, 600)} == {5}
+
+
+def test_with_history_nothing_is_asked_until_the_window_opens():
+    # A model that usually takes 100 s: nothing until 80, no more than four
+    # intervals at a stretch, then a tenth of the runtime apart — capped by the
+    # interval — and backing off once overdue.
+    assert TRACK.next_check(1, 100, 5) == 4 * 5
+    assert TRACK.next_check(70, 100, 5) == pytest.approx(10)
+    assert TRACK.next_check(80, 20, 5) == 5
+    assert TRACK.next_check(16, 20, 5) == 2
+    assert TRACK.next_check(21, 20, 5) == 2
+    assert TRACK.next_check(26, 20, 5) == 3
+    assert TRACK.next_check(300, 20, 5) == 5
+
+
+def test_the_window_is_bounded_by_the_floor_and_the_interval():
+    # A two-second model would be asked every 0.2 s; the floor says 1 s.
+    assert TRACK.next_check(1.7, 2, 5) == TRACK.FLOOR
+    # And an interval shorter than both wins.
+    assert TRACK.next_check(1.7, 2, 0.05) == 0.05
+
+
+# --- the tracker -----------------------------------------------------------
+
+def test_many_predictions_share_one_scheduler(predictions, tracker):
+    """Twenty predictions in flight are one thread deciding, not twenty sleeping."""
+    for i in range(20):
+        predictions.add(f"p-{i}", 0.05 * (i % 5))
+    before = {t.name for t in threading.enumerate()}
+    watches = [tracker.track(f"p-{i}", interval=0.05, timeout=10) for i in range(20)]
+    started = {t.name for t in threading.enumerate()} - before
+
+    assert [w.wait()["status"] for w in watches] == ["succeeded"] * 20
+    assert sum(name == "prediction-tracker" for name in started) == 1
+    assert len(started) <= 1 + TRACK.CHECKERS
+    assert tracker.outstanding() == 0
+
+
+def test_a_refusal_is_seen_on_the_first_check(predictions, tracker):
+    """Asked straight away, however long the model usually takes."""
+    tracker._history()["owner/slow"] = 600
+    predictions.add("p-refused", 0, "failed")
+    watch = tracker.track("p-refused", model="owner/slow", interval=5, timeout=600)
+    assert watch.future.result(timeout=2)["status"] == "failed"
+    assert predictions.asked["p-refused"] == 1
+
+
+def test_statuses_reach_the_waiting_thread_not_the_trackers(predictions, tracker):
+    predictions.add("p-1", 0.15)
+    seen = []
+    watch = tracker.track("p-1", interval=0.05, timeout=10)
+    watch.wait(on_status=lambda s: seen.append((s, threading.current_thread().name)))
+    assert seen[-1][0] == "succeeded"
+    assert {name for _, name in seen} == {threading.current_thread().name}
+
+
+def test_a_prediction_past_its_timeout_raises_and_the_rest_go_on(predictions, tracker):
+    predictions.add("p-stuck", 60)
+    predictions.add("p-fine", 0.1)
+    stuck = tracker.track("p-stuck", interval=0.05, timeout=0.2)
+    fine = tracker.track("p-fine", interval=0.05, timeout=10)
+    with pytest.raises(TimeoutError):
+        stuck.wait()
+    assert fine.wait()["status"] == "succeeded"
+
+
+def test_a_failed_check_belongs_to_its_prediction_alone(predictions, tracker, monkeypatch):
+    predictions.add("p-fine", 0)
+
+    def api(method, url, token, body=None):
+        if url.endswith("/p-broken"):
+            raise RA.ReplicateError("GET -> 500")
+        return predictions(method, url, token, body)
+
+    monkeypatch.setattr(RA, "api", api)
+    broken = tracker.track("p-broken", interval=0.05, timeout=10)
+    fine = tracker.track("p-fine", interval=0.05, timeout=10)
+    with pytest.raises(RA.ReplicateError):
+        broken.wait()
+    assert fine.wait()["status"] == "succeeded"
+
+
+def test_runtimes_are_remembered_per_model_and_shape_the_next_wait(predictions):
+    predictions.add("p-1", 0.2)
+    first = TRACK.Tracker("r8-test")
+    try:
+        first.track("p-1", model="owner/model", interval=0.05, timeout=10).wait()
+    finally:
+        first.close()
+    saved = json.loads((store.CACHE_DIR / TRACK.RUNTIMES_FILE).read_text())
+    assert saved["owner/model"] == pytest.approx(0.2, abs=0.15)
+
+    # A fresh tracker — the next command — reads it back.
+    second = TRACK.Tracker("r8-test")
+    try:
+        assert second.expected("owner/model") == saved["owner/model"]
+        assert second.expected("owner/other") is None
+    finally:
+        second.close()
+
+
+def test_history_asks_less_than_the_interval_alone(predictions, monkeypatch):
+    """The same prediction, asked about with and without its model's history."""
+    monkeypatch.setattr(TRACK, "FLOOR", 0.05)
+
+    def asked(model: str) -> int:
+        tracker = TRACK.Tracker("r8-test")
+        tracker._history().update({"owner/known": 1.2})
+        pid = f"p-{len(predictions.due)}"
+        predictions.add(pid, 1.2)
+        try:
+            tracker.track(pid, model=model, interval=0.1, timeout=10).wait()
+        finally:
+            tracker.close()
+        return predictions.asked[pid]
+
+    assert asked("owner/known") * 1.5 < asked("owner/unknown")
+
+
+# --- webhooks --------------------------------------------------------------
+
+def _ring(url: str, body: bytes) -> None:
+    request = urllib.request.Request(url, data=body, method="POST",
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=5) as answer:
+        assert answer.status == 204
+
+
+def test_a_webhook_brings_the_next_check_forward(predictions):
+    tracker = TRACK.Tracker("r8-test", webhook="https://hooks.test/studio",
+                            listen="127.0.0.1:0")
+    try:
+        port = tracker._listener.server_port
+        predictions.add("p-1", 0.2)
+        # A long interval: left to the schedule, the settle would be seen late.
+        watch = tracker.track("p-1", interval=30, timeout=60)
+        time.sleep(0.3)
+        rung = time.monotonic()
+        _ring(f"http://127.0.0.1:{port}/", json.dumps({"id": "p-1"}).encode())
+        assert watch.future.result(timeout=5)["status"] == "succeeded"
+        assert time.monotonic() - rung < 1
+    finally:
+        tracker.close()
+
+
+def test_a_webhook_body_is_never_taken_as_the_answer(predictions):
+    """A callback saying `succeeded` for a prediction still running changes nothing
+    but when the API is asked — and the API says it is still running."""
+    tracker = TRACK.Tracker("r8-test", webhook="https://hooks.test/studio",
+                            listen="127.0.0.1:0")
+    try:
+        port = tracker._listener.server_port
+        predictions.add("p-1", 60)
+        watch = tracker.track("p-1", interval=30, timeout=120)
+        time.sleep(0.1)
+        spoof = {"id": "p-1", "status": "succeeded", "output": ["https://evil.test/x.png"]}
+        _ring(f"http://127.0.0.1:{port}/", json.dumps(spoof).encode())
+        _ring(f"http://127.0.0.1:{port}/", b"not json")
+        time.sleep(0.3)
+        assert not watch.future.done()
+        assert predictions.asked["p-1"] == 2
+    finally:
+        tracker.close()
+
+
+def test_predictions_are_created_with_the_webhook(monkeypatch):
+    sent = {}
+    monkeypatch.setattr(RA, "api", lambda method, url, token, body=None: sent.update(body) or {})
+    RA.create_prediction("owner/model", {"prompt": "x"}, "r8-test",
+                         webhook="https://hooks.test/studio")
+    assert sent == {"input": {"prompt": "x"}, "webhook": "https://hooks.test/studio",
+                    "webhook_events_filter": ["completed"]}
+    sent.clear()
+    RA.create_prediction("owner/model", {"prompt": "x"}, "r8-test")
+    assert sent == {"input": {"prompt": "x"}}
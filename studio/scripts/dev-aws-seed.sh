@@ -356,23 +356,24 @@ node_items() {
   # exists under one key and not the other either cannot be listed or cannot be
   # opened.
   #
-  # The `NAME#` item is deliberately narrow — `node_id, lib, kind, path,
-  # created_at` and nothing else. `size` and `content_type` are mutable, so
-  # duplicating them here would put every rename, move and text edit in the
-  # business of keeping two copies in step.
+  # The `NAME#` item repeats what a folder listing renders — `blob_key`,
+  # `size`, `content_type`, `updated_at` — beside `node_id, lib, kind, path,
+  # created_at`, so the API lists a folder in one query. The same values as the
+  # record, attribute for attribute: `studio catalog listing` reports any
+  # difference as drift.
   jq -c -n --arg table "$1" --arg lib "$2" --arg node "$3" --arg parent "$4" \
     --arg name "$5" --arg kind "$6" --arg path "$7" --arg created "$8" \
     --arg content_type "$9" --argjson size "${10}" \
     "$DDB_JQ_DEFS"'
     ($kind == "file") as $is_file
+    | { created_at: $created, updated_at: $created,
+        blob_key: (if $is_file then "blobs/\($node)" else null end),
+        size: (if $is_file then $size else null end),
+        content_type: (if $is_file then $content_type else null end) } as $listed
     | [ put({pk: "NODE#\($node)", sk: "META", node_id: $node, parent_id: $parent,
-             lib: $lib, name: $name, kind: $kind, path: $path,
-             created_at: $created, updated_at: $created,
-             blob_key: (if $is_file then "blobs/\($node)" else null end),
-             size: (if $is_file then $size else null end),
-             content_type: (if $is_file then $content_type else null end)}),
+             lib: $lib, name: $name, kind: $kind, path: $path} + $listed),
         put({pk: "NODE#\($parent)", sk: "NAME#\($name)", node_id: $node,
-             lib: $lib, kind: $kind, path: $path, created_at: $created}) ]'
+             lib: $lib, kind: $kind, path: $path} + $listed) ]'
 }
 
 ddb_transaction() {